@@ -0,0 +1,118 @@
+"""Benchmark of the per-publish cost of PaymentClosedEvents on SNS
+
+Compares the previous approach, which built an AIOBoto3Session and opened a
+resource("sns") for every event, with publishing through the long-lived
+AWSClients registry. A local HTTP server answers the SNS API, so the numbers
+measure the client side cost only: service model loading, credential
+resolution and connection setup.
+
+Usage:
+    python -m benchmarks.aws_publish_cost [--events 200]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from aioboto3 import Session as AIOBoto3Session
+from aiobotocore.config import AioConfig
+from aiohttp import web
+
+from payment_api.adapters.out import BotoPaymentClosedPublisher
+from payment_api.domain.events import PaymentClosedEvent
+from payment_api.infrastructure.config import PaymentClosedPublisherSettings
+
+TOPIC_ARN = "arn:aws:sns:us-east-1:000000000000:payment-closed.fifo"
+PUBLISH_RESPONSE = (
+    '<PublishResponse xmlns="http://sns.amazonaws.com/doc/2010-03-31/">'
+    "<PublishResult><MessageId>00000000-0000-0000-0000-000000000000</MessageId>"
+    "</PublishResult><ResponseMetadata><RequestId>benchmark</RequestId>"
+    "</ResponseMetadata></PublishResponse>"
+)
+SETTINGS = PaymentClosedPublisherSettings(
+    TOPIC_ARN=TOPIC_ARN, GROUP_ID="payment-closed", _env_file=None
+)
+
+
+async def _sns_stub(_: web.Request) -> web.Response:
+    return web.Response(text=PUBLISH_RESPONSE, content_type="text/xml")
+
+
+def _session() -> AIOBoto3Session:
+    return AIOBoto3Session(
+        aws_access_key_id="benchmark",
+        aws_secret_access_key="benchmark",
+        region_name="us-east-1",
+    )
+
+
+async def per_event_session(endpoint_url: str, events: list[PaymentClosedEvent]):
+    """Publish every event with a new session and SNS resource"""
+    timings = []
+    for event in events:
+        start = time.perf_counter()
+        async with _session().resource("sns", endpoint_url=endpoint_url) as sns:
+            topic = await sns.Topic(TOPIC_ARN)
+            await topic.publish(
+                Subject="payment-closed",
+                Message=event.model_dump_json(),
+                MessageGroupId=SETTINGS.GROUP_ID,
+                MessageDeduplicationId=str(event.id),
+            )
+
+        timings.append(time.perf_counter() - start)
+
+    return timings
+
+
+async def long_lived_client(endpoint_url: str, events: list[PaymentClosedEvent]):
+    """Publish every event with the same long-lived SNS client"""
+    timings = []
+    async with _session().client(
+        "sns", endpoint_url=endpoint_url, config=AioConfig(max_pool_connections=10)
+    ) as sns_client:
+        publisher = BotoPaymentClosedPublisher(sns_client=sns_client, settings=SETTINGS)
+        for event in events:
+            start = time.perf_counter()
+            await publisher.publish(event)
+            timings.append(time.perf_counter() - start)
+
+    return timings
+
+
+def _report(name: str, timings: list[float]):
+    timings_ms = sorted(timing * 1000 for timing in timings)
+    p99 = timings_ms[max(0, int(len(timings_ms) * 0.99) - 1)]
+    print(
+        f"{name:<20} mean={statistics.mean(timings_ms):8.3f}ms "
+        f"p50={statistics.median(timings_ms):8.3f}ms p99={p99:8.3f}ms"
+    )
+
+
+async def main(events_count: int):
+    """Run both approaches against a local SNS stub and print their timings"""
+    app = web.Application()
+    app.router.add_post("/", _sns_stub)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    endpoint_url = f"http://127.0.0.1:{port}"
+
+    try:
+        events = [
+            PaymentClosedEvent(payment_id=f"B{index:05d}")
+            for index in range(events_count)
+        ]
+        _report("per-event session", await per_event_session(endpoint_url, events))
+        _report("long-lived client", await long_lived_client(endpoint_url, events))
+    finally:
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=200)
+    asyncio.run(main(parser.parse_args().events))
@@ -0,0 +1,119 @@
+"""Benchmark of the requests per second of the payment find and webhook routes
+
+The application is served in-process through httpx's ASGI transport, on a
+single event loop like one worker, with the use cases and adapters replaced by
+in-memory stubs, so the numbers measure the routing, validation and JSON
+serialization done by the REST adapter.
+
+Usage:
+    python -m benchmarks.payment_response_throughput [--requests 5000]
+"""
+
+import argparse
+import asyncio
+import time
+
+from httpx import ASGITransport, AsyncClient
+
+from payment_api.adapters.inbound.rest.dependencies.auth import (
+    validate_mercado_pago_notification,
+)
+from payment_api.adapters.inbound.rest.dependencies.core import (
+    LazyDependency,
+    finalize_payment_by_mercado_pago_payment_id_use_case,
+    find_payment_by_id_use_case,
+    find_payment_version_by_id_use_case,
+    mercado_pago_notification_deduplicator,
+    mercado_pago_notification_inbox,
+)
+from payment_api.domain.entities import PaymentOut
+from payment_api.domain.value_objects import PaymentStatus
+from payment_api.entrypoints.api import app
+
+PAYMENT = PaymentOut(
+    id="A048",
+    external_id="MP123456",
+    payment_status=PaymentStatus.CLOSED,
+    total_order_value=100.0,
+    qr_code="00020101021243650016COM.MERCADOLIBRE020130636",
+    expiration="2024-12-31T23:59:59",
+    created_at="2024-01-01T12:00:00Z",
+    timestamp="2024-01-02T12:00:00Z",
+)
+WEBHOOK = {"action": "payment.created", "type": "payment", "data": {"id": "123"}}
+
+
+class StubUseCase:
+    """Use case stub that returns the sample payment"""
+
+    async def execute(self, command):  # pylint: disable=W0613
+        """Return the sample payment"""
+        return PAYMENT
+
+
+class StubDeduplicator:
+    """Notification deduplicator stub that never sees duplicates"""
+
+    async def is_duplicate(self, resource_id: str) -> bool:  # pylint: disable=W0613
+        """Return False"""
+        return False
+
+    async def mark_processed(self, resource_id: str):
+        """Do nothing"""
+
+    def remember(self, resource_id: str):
+        """Do nothing"""
+
+
+async def _lazy(value):
+    return value
+
+
+async def _measure(client: AsyncClient, name: str, request, requests: int):
+    for _ in range(min(100, requests)):
+        await request(client)
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        response = await request(client)
+        assert response.status_code == 200, response.text
+
+    elapsed = time.perf_counter() - start
+    print(
+        f"{name:<8} {requests / elapsed:8.0f} req/s {elapsed / requests * 1e6:7.1f}us"
+    )
+
+
+async def main(requests: int):
+    """Send requests to the find and webhook routes and print their throughput"""
+    use_case = StubUseCase()
+    deduplicator = StubDeduplicator()
+    app.dependency_overrides = {
+        validate_mercado_pago_notification: lambda: None,
+        find_payment_by_id_use_case: lambda: use_case,
+        find_payment_version_by_id_use_case: lambda: use_case,
+        finalize_payment_by_mercado_pago_payment_id_use_case: lambda: LazyDependency(
+            lambda: _lazy(use_case)
+        ),
+        mercado_pago_notification_inbox: lambda: None,
+        mercado_pago_notification_deduplicator: lambda: LazyDependency(
+            lambda: _lazy(deduplicator)
+        ),
+    }
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        await _measure(client, "find", lambda c: c.get("/v1/payment/A048"), requests)
+        await _measure(
+            client,
+            "webhook",
+            lambda c: c.post("/v1/payment/notifications/mercado-pago", json=WEBHOOK),
+            requests,
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5000)
+    asyncio.run(main(parser.parse_args().requests))
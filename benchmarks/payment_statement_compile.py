@@ -0,0 +1,138 @@
+"""Benchmark of the CPU spent by SAPaymentRepository preparing its hot queries
+
+Every execution builds the statement, generates its cache key and looks it up
+in SQLAlchemy's compiled cache before anything is sent to Postgres. This
+measures that work with the asyncpg dialect, for statements built on every
+call as SAPaymentRepository did before and for the statements it builds once.
+The server-side prepare saved by asyncpg's prepared statement cache is not
+measured, as it needs a database.
+
+Usage:
+    python -m benchmarks.payment_statement_compile [--executions 20000]
+"""
+
+import argparse
+import time
+from typing import Callable
+
+from sqlalchemy import exists, false, func, literal_column, select, update
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.util import LRUCache
+
+from payment_api.adapters.out import sa_payment_repository
+from payment_api.adapters.out.sa_payment_repository import (
+    EXISTS_BY_EXTERNAL_ID,
+    EXISTS_BY_ID,
+    FINALIZE_IF_OPEN,
+    FIND_BY_ID,
+    SAVE,
+)
+from payment_api.domain.entities import PaymentIn
+from payment_api.domain.ports import SaveMode
+from payment_api.domain.value_objects import PaymentStatus
+from payment_api.infrastructure.orm.models import Payment as PaymentModel
+
+DIALECT = postgresql.asyncpg.dialect()
+PAYMENT = PaymentIn(
+    id="A048",
+    external_id="empty-A048",
+    payment_status=PaymentStatus.OPENED,
+    total_order_value=100.0,
+    qr_code="00020101021243650016COM.MERCADOLIBRE020130636",
+    expiration="2024-12-31T23:59:59",
+)
+
+
+def fresh_upsert():
+    """Build the upsert the way SAPaymentRepository.save did on every call"""
+    table = PaymentModel.__table__
+    values = {
+        PaymentModel.__mapper__.columns[key]: value
+        for key, value in PAYMENT.model_dump().items()
+    }
+    statement = postgresql.insert(table).values(values)
+    statement = statement.on_conflict_do_update(
+        index_elements=[table.c.id],
+        set_={
+            **{
+                column: statement.excluded[column.name]
+                for column in values
+                if column is not table.c.id
+            },
+            table.c.timestamp: func.now(),  # pylint: disable=E1102
+        },
+    )
+    # pylint: disable=W0212
+    return sa_payment_repository._saved(statement, literal_column("xmax = 0"))
+
+
+def fresh_finalize():
+    """Build the finalize update the way SAPaymentRepository did on every call"""
+    table = PaymentModel.__table__
+    columns = PaymentModel.__mapper__.columns
+    statement = (
+        update(table)
+        .where(
+            table.c.id == PAYMENT.id,
+            columns["payment_status"] == PaymentStatus.OPENED,
+        )
+        .values(
+            {
+                columns["external_id"]: "MP123456",
+                columns["payment_status"]: PaymentStatus.CLOSED,
+            }
+        )
+    )
+    return sa_payment_repository._saved(statement, false())  # pylint: disable=W0212
+
+
+QUERIES = {
+    "find_by_id": (
+        lambda: select(PaymentModel).where(PaymentModel.id == PAYMENT.id),
+        FIND_BY_ID,
+    ),
+    "exists_by_id": (
+        lambda: select(exists().where(PaymentModel.id == PAYMENT.id)),
+        EXISTS_BY_ID,
+    ),
+    "exists_by_external_id": (
+        lambda: select(exists().where(PaymentModel.external_id == PAYMENT.id)),
+        EXISTS_BY_EXTERNAL_ID,
+    ),
+    "upsert": (fresh_upsert, SAVE[SaveMode.UPSERT]),
+    "finalize_if_open": (fresh_finalize, FINALIZE_IF_OPEN),
+}
+
+
+def _measure(build: Callable, executions: int) -> float:
+    """Return the CPU microseconds per execution spent preparing the statement"""
+    compiled_cache = LRUCache(500)
+    started_at = time.process_time()
+    for _ in range(executions):
+        # pylint: disable=W0212
+        build()._compile_w_cache(
+            dialect=DIALECT,
+            compiled_cache=compiled_cache,
+            column_keys=[],
+            for_executemany=False,
+            schema_translate_map=None,
+        )
+
+    return (time.process_time() - started_at) / executions * 1_000_000
+
+
+def main(executions: int):
+    """Prepare every hot query both ways and print the CPU time per execution"""
+    for name, (fresh, prebuilt) in QUERIES.items():
+        fresh_time = _measure(fresh, executions)
+        prebuilt_time = _measure(lambda statement=prebuilt: statement, executions)
+        print(
+            f"{name:<22} fresh={fresh_time:7.1f}us prebuilt={prebuilt_time:6.1f}us "
+            f"saved={fresh_time - prebuilt_time:7.1f}us per query"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--executions", type=int, default=20000)
+    main(parser.parse_args().executions)
@@ -0,0 +1,102 @@
+"""Benchmark of the event loop lag caused by concurrent QR code renders
+
+Renders QR codes concurrently through ExecutorQRCodeRenderer with each executor
+backend while a probe task sleeps in short intervals and records how late it
+wakes up. The lateness is the time every other request handled by the worker
+would wait while QR codes are rendered.
+
+Usage:
+    python -m benchmarks.qr_render_event_loop_lag [--renders 200] [--concurrency 16]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from payment_api.infrastructure.qr_code_renderer import (
+    ExecutorQRCodeRenderer,
+    QRCodeExecutor,
+    QRCodeRenderer,
+    create_qr_code_executor,
+)
+
+PROBE_INTERVAL = 0.001
+QR_DATA = (
+    "00020101021243650016COM.MERCADOLIBRE02013063638f1192a-5fd1-4180-a180-"
+    "8bcae3556bc35204000053039865802BR5925IZABEL AAAA DE MELO6007BARUERI62070503"
+)
+
+
+async def _probe(lags: list[float], stop: asyncio.Event):
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(PROBE_INTERVAL)
+        lags.append(time.perf_counter() - start - PROBE_INTERVAL)
+
+
+async def run(executor: QRCodeExecutor, renders: int, concurrency: int, workers: int):
+    """Render QR codes with the given executor and return the probe lags and the
+    elapsed time"""
+    renderer = ExecutorQRCodeRenderer(
+        renderer=QRCodeRenderer(),
+        executor=create_qr_code_executor(executor, max_workers=workers),
+        max_pending=renders,
+        timeout=60.0,
+    )
+
+    # Warm up the workers so pool start up is not measured
+    await asyncio.gather(
+        *(renderer.render_async(f"{QR_DATA}-{index}") for index in range(workers))
+    )
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def render(index: int):
+        async with semaphore:
+            await renderer.render_async(f"{QR_DATA}-{index}")
+
+    lags: list[float] = []
+    stop = asyncio.Event()
+    probe = asyncio.create_task(_probe(lags, stop))
+    start = time.perf_counter()
+    try:
+        await asyncio.gather(*(render(index) for index in range(renders)))
+    finally:
+        elapsed = time.perf_counter() - start
+        stop.set()
+        await probe
+        await renderer.close()
+
+    return lags, elapsed
+
+
+def _report(name: str, lags: list[float], elapsed: float, renders: int):
+    lags_ms = sorted(lag * 1000 for lag in lags)
+    p99 = lags_ms[max(0, int(len(lags_ms) * 0.99) - 1)]
+    print(
+        f"{name:<12} lag mean={statistics.mean(lags_ms):8.3f}ms "
+        f"p99={p99:8.3f}ms max={lags_ms[-1]:8.3f}ms "
+        f"throughput={renders / elapsed:8.1f} renders/s"
+    )
+
+
+async def main(renders: int, concurrency: int, workers: int):
+    """Run the benchmark with every available executor and print the results"""
+    for executor in QRCodeExecutor:
+        try:
+            lags, elapsed = await run(executor, renders, concurrency, workers)
+        except RuntimeError as error:
+            print(f"{executor.value:<12} skipped: {error}")
+            continue
+
+        _report(executor.value, lags, elapsed, renders)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--renders", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--workers", type=int, default=4)
+    arguments = parser.parse_args()
+    asyncio.run(main(arguments.renders, arguments.concurrency, arguments.workers))
@@ -0,0 +1,77 @@
+"""Benchmark of QR code render time and payload size across output formats
+
+Compares the previous renderer, which drew the image with PIL through
+qrcode's PilImage factory, with QRCodeRenderer writing 1-bit PNGs at several
+zlib levels and SVGs straight from the QR code modules.
+
+Usage:
+    python -m benchmarks.qr_render_formats [--renders 200]
+"""
+
+import argparse
+import statistics
+import time
+from io import BytesIO
+from typing import Callable
+
+from qrcode import QRCode
+from qrcode.image.pil import PilImage
+
+from payment_api.application.use_cases.ports import QRCodeFormat, QRCodeOptions
+from payment_api.infrastructure.qr_code_renderer import QRCodeRenderer
+
+QR_DATA = (
+    "00020101021243650016COM.MERCADOLIBRE02013063638f1192a-5fd1-4180-a180-"
+    "8bcae3556bc35204000053039865802BR5925IZABEL AAAA DE MELO6007BARUERI62070503"
+    "***63044B2C"
+)
+
+
+def pil_render(data: str) -> bytes:
+    """Render a QR code the way the renderer did before, with PIL"""
+    qr_code = QRCode(image_factory=PilImage)
+    qr_code.add_data(data)
+    buffer = BytesIO()
+    qr_code.make_image().save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def _measure(render: Callable[[str], bytes], renders: int) -> tuple[list[float], int]:
+    timings = []
+    payload = b""
+    for index in range(renders):
+        start = time.perf_counter()
+        payload = render(f"{QR_DATA}{index:04d}")
+        timings.append(time.perf_counter() - start)
+
+    return timings, len(payload)
+
+
+def _report(name: str, timings: list[float], size: int):
+    timings_ms = sorted(timing * 1000 for timing in timings)
+    p99 = timings_ms[max(0, int(len(timings_ms) * 0.99) - 1)]
+    print(
+        f"{name:<20} mean={statistics.mean(timings_ms):7.3f}ms "
+        f"p99={p99:7.3f}ms size={size:6d} bytes"
+    )
+
+
+def main(renders: int):
+    """Render QR codes with every format and print their timings and sizes"""
+    svg = QRCodeOptions(format=QRCodeFormat.SVG)
+    candidates = {
+        "pil png": pil_render,
+        "1-bit png level 1": lambda data: QRCodeRenderer(compress_level=1).render(data),
+        "1-bit png level 6": lambda data: QRCodeRenderer(compress_level=6).render(data),
+        "1-bit png level 9": lambda data: QRCodeRenderer(compress_level=9).render(data),
+        "svg": lambda data: QRCodeRenderer().render(data, svg),
+    }
+
+    for name, render in candidates.items():
+        _report(name, *_measure(render, renders))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--renders", type=int, default=200)
+    main(parser.parse_args().renders)
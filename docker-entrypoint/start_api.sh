@@ -1,3 +1,6 @@
 #!/bin/sh
 
+# Split the database connection budget between the gunicorn workers
+export DATABASE_PROCESSES=${DATABASE_PROCESSES:-${GUNICORN_WORKERS:-4}}
+
 gunicorn payment_api.entrypoints.api:app -w ${GUNICORN_WORKERS:-4} -k uvicorn.workers.UvicornWorker -b 0.0.0.0:8000 --log-config logging.ini
@@ -0,0 +1,3 @@
+#!/bin/sh
+
+python -m payment_api.entrypoints.mercado_pago_notification_listener
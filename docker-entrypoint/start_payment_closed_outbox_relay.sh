@@ -0,0 +1,3 @@
+#!/bin/sh
+
+python -m payment_api.entrypoints.payment_closed_outbox_relay
@@ -1,9 +1,21 @@
 """Init file for listeners module"""
 
+from .mercado_pago_notification import (
+    MercadoPagoNotificationHandler,
+    MercadoPagoNotificationListener,
+)
 from .order_created import (
     OrderCreatedHandler,
     OrderCreatedListener,
     OrderCreatedMessage,
 )
+from .payment_closed_outbox_relay import PaymentClosedOutboxRelay
 
-__all__ = ["OrderCreatedListener", "OrderCreatedMessage", "OrderCreatedHandler"]
+__all__ = [
+    "OrderCreatedListener",
+    "OrderCreatedMessage",
+    "OrderCreatedHandler",
+    "MercadoPagoNotificationListener",
+    "MercadoPagoNotificationHandler",
+    "PaymentClosedOutboxRelay",
+]
@@ -0,0 +1,144 @@
+"""Listener for Mercado Pago notifications stored in the inbox"""
+
+import asyncio
+import logging
+from typing import Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from payment_api.application.commands import (
+    FinalizePaymentByMercadoPagoPaymentIdCommand,
+)
+from payment_api.application.use_cases import (
+    FinalizePaymentByMercadoPagoPaymentIdUseCase,
+)
+from payment_api.application.use_cases.ports import (
+    MercadoPagoNotification,
+    MercadoPagoNotificationInbox,
+    MPClientError,
+)
+from payment_api.domain.exceptions import NotFound, PersistenceError
+from payment_api.infrastructure.config import MercadoPagoNotificationInboxSettings
+from payment_api.infrastructure.orm import SessionManager
+
+logger = logging.getLogger(__name__)
+
+
+class MercadoPagoNotificationHandler:
+    """Handler for processing Mercado Pago notifications claimed from the inbox"""
+
+    def __init__(
+        self,
+        session_manager: SessionManager,
+        use_case_factory: Callable[
+            [AsyncSession], FinalizePaymentByMercadoPagoPaymentIdUseCase
+        ],
+        inbox_factory: Callable[[AsyncSession], MercadoPagoNotificationInbox],
+    ):
+        self.session_manager = session_manager
+        self.use_case_factory = use_case_factory
+        self.inbox_factory = inbox_factory
+
+    async def handle(self, notification: MercadoPagoNotification):
+        """Finalize the payment of the notification and update it in the inbox"""
+
+        resource_id = notification.resource_id
+        logger.info(
+            "Processing Mercado Pago notification for MP payment ID %s, attempt %d",
+            resource_id,
+            notification.attempts,
+        )
+
+        async with self.session_manager.session() as db_session:
+            use_case = self.use_case_factory(db_session)
+            inbox = self.inbox_factory(db_session)
+            command = FinalizePaymentByMercadoPagoPaymentIdCommand(
+                payment_id=resource_id
+            )
+
+            try:
+                await use_case.execute(command=command)
+
+            except (NotFound, ValueError) as error:
+                logger.error(
+                    "Discarding Mercado Pago notification for MP payment ID %s: %s",
+                    resource_id,
+                    str(error),
+                )
+
+                await db_session.rollback()
+                await inbox.mark_failed(resource_id, error=str(error), retry=False)
+                return
+
+            except (MPClientError, PersistenceError) as error:
+                logger.error(
+                    "Failed to process Mercado Pago notification for MP payment ID %s",
+                    resource_id,
+                    exc_info=True,
+                )
+
+                await db_session.rollback()
+                await inbox.mark_failed(resource_id, error=str(error), retry=True)
+                return
+
+            await inbox.mark_processed(resource_id)
+            logger.info(
+                "Successfully processed Mercado Pago notification for MP payment ID %s",
+                resource_id,
+            )
+
+
+class MercadoPagoNotificationListener:
+    """Listener for claiming and processing Mercado Pago notifications from the
+    inbox"""
+
+    def __init__(
+        self,
+        session_manager: SessionManager,
+        handler: MercadoPagoNotificationHandler,
+        inbox_factory: Callable[[AsyncSession], MercadoPagoNotificationInbox],
+        settings: MercadoPagoNotificationInboxSettings,
+    ):
+        self.session_manager = session_manager
+        self.handler = handler
+        self.inbox_factory = inbox_factory
+        self.batch_size = settings.BATCH_SIZE
+        self.concurrency = settings.CONCURRENCY
+        self.poll_interval = settings.POLL_INTERVAL_SECONDS
+
+    async def listen(self, shutdown_event=None):
+        """Listen for Mercado Pago notifications and process them"""
+
+        logger.info("Listening for Mercado Pago notifications in the inbox")
+        semaphore = asyncio.Semaphore(self.concurrency)
+        while True:
+            if shutdown_event and shutdown_event.shutdown:
+                logger.info("Shutdown requested, stopping listener")
+                break
+
+            notifications = await self._consume(semaphore=semaphore)
+            if not notifications:
+                logger.debug("No notifications to process in the inbox")
+                await asyncio.sleep(self.poll_interval)
+
+    async def _consume(
+        self, semaphore: asyncio.Semaphore
+    ) -> list[MercadoPagoNotification]:
+        async with self.session_manager.session() as db_session:
+            inbox = self.inbox_factory(db_session)
+            notifications = await inbox.claim(limit=self.batch_size)
+
+        async def handle(notification: MercadoPagoNotification):
+            async with semaphore:
+                try:
+                    await self.handler.handle(notification=notification)
+                except Exception:  # pylint: disable=W0718
+                    logger.error(
+                        "Failed to process Mercado Pago notification for MP payment "
+                        "ID %s, it will be claimed again after its lock times out",
+                        notification.resource_id,
+                        exc_info=True,
+                    )
+
+        await asyncio.gather(*(handle(notification) for notification in notifications))
+        return notifications
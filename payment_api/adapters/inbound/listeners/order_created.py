@@ -4,7 +4,6 @@ import json
 import logging
 from typing import Callable
 
-from aioboto3 import Session as AIOBoto3Session
 from botocore.exceptions import ClientError as BotoCoreClientError
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -63,15 +62,19 @@ class OrderCreatedHandler:
 
 
 class OrderCreatedListener:
-    """Listener for handling order created events from SQS"""
+    """Listener for handling order created events from SQS
+
+    The SQS resource is long-lived and owned by the caller, usually the
+    AWSClients registry.
+    """
 
     def __init__(
         self,
-        session: AIOBoto3Session,
+        sqs,
         handler: OrderCreatedHandler,
         settings: OrderCreatedListenerSettings,
     ):
-        self.session = session
+        self.sqs = sqs
         self.handler = handler
         self.queue_name = settings.QUEUE_NAME
         self.wait_time = settings.WAIT_TIME_SECONDS
@@ -81,18 +84,17 @@ class OrderCreatedListener:
     async def listen(self, shutdown_event=None):
         """Listen for order created events and process them"""
 
-        async with self.session.resource("sqs") as sqs_client:
-            logger.info("Listening for messages on queue: %s", self.queue_name)
-            queue = await sqs_client.get_queue_by_name(QueueName=self.queue_name)
-            while True:
-                if shutdown_event and shutdown_event.shutdown:
-                    logger.info("Shutdown requested, stopping listener")
-                    break
-
-                messages = await self._consume(queue=queue)
-                if not messages:
-                    logger.debug("No messages received in %d seconds", self.wait_time)
-                    continue
+        logger.info("Listening for messages on queue: %s", self.queue_name)
+        queue = await self.sqs.get_queue_by_name(QueueName=self.queue_name)
+        while True:
+            if shutdown_event and shutdown_event.shutdown:
+                logger.info("Shutdown requested, stopping listener")
+                break
+
+            messages = await self._consume(queue=queue)
+            if not messages:
+                logger.debug("No messages received in %d seconds", self.wait_time)
+                continue
 
     async def _consume(self, queue):
         try:
@@ -0,0 +1,111 @@
+"""Relay for PaymentClosedEvents stored in the outbox"""
+
+import asyncio
+import logging
+import time
+from typing import Callable
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from payment_api.domain.exceptions import EventPublishingError, PersistenceError
+from payment_api.domain.ports import PaymentClosedOutbox, PaymentClosedPublisher
+from payment_api.infrastructure.config import PaymentClosedOutboxSettings
+from payment_api.infrastructure.orm import SessionManager
+
+logger = logging.getLogger(__name__)
+
+
+class PaymentClosedOutboxRelay:
+    """Relay for publishing PaymentClosedEvents stored in the outbox
+
+    While the outbox is idle, sent events past their retention period are
+    purged, at most once every purge interval.
+    """
+
+    def __init__(
+        self,
+        session_manager: SessionManager,
+        outbox_factory: Callable[[AsyncSession], PaymentClosedOutbox],
+        publisher: PaymentClosedPublisher,
+        settings: PaymentClosedOutboxSettings,
+    ):
+        self.session_manager = session_manager
+        self.outbox_factory = outbox_factory
+        self.publisher = publisher
+        self.batch_size = settings.BATCH_SIZE
+        self.poll_interval = settings.POLL_INTERVAL_SECONDS
+        self.purge_interval = settings.PURGE_INTERVAL_SECONDS
+        self.purge_batch_size = settings.PURGE_BATCH_SIZE
+        self._next_purge = 0.0
+
+    async def run(self, shutdown_event=None):
+        """Relay PaymentClosedEvents from the outbox until shutdown is requested"""
+
+        logger.info("Relaying PaymentClosedEvents from the outbox")
+        while True:
+            if shutdown_event and shutdown_event.shutdown:
+                logger.info("Shutdown requested, stopping relay")
+                break
+
+            try:
+                relayed = await self._relay_batch()
+            except (PersistenceError, EventPublishingError):
+                logger.error("Failed to relay PaymentClosedEvents", exc_info=True)
+                relayed = 0
+
+            if not relayed:
+                logger.debug("No PaymentClosedEvents to relay in the outbox")
+                await self._purge_sent()
+                await asyncio.sleep(self.poll_interval)
+
+    async def _purge_sent(self) -> None:
+        if time.monotonic() < self._next_purge:
+            return
+
+        self._next_purge = time.monotonic() + self.purge_interval
+        purged = 0
+        try:
+            async with self.session_manager.session() as db_session:
+                outbox = self.outbox_factory(db_session)
+                while True:
+                    batch = await outbox.purge_sent(limit=self.purge_batch_size)
+                    purged += batch
+                    if batch < self.purge_batch_size:
+                        break
+
+        except PersistenceError:
+            logger.error("Failed to purge sent PaymentClosedEvents", exc_info=True)
+
+        if purged:
+            logger.info("Purged %d sent PaymentClosedEvents", purged)
+
+    async def _relay_batch(self) -> int:
+        async with self.session_manager.session() as db_session:
+            outbox = self.outbox_factory(db_session)
+            events = await outbox.claim(limit=self.batch_size)
+            if not events:
+                return 0
+
+            results = await self.publisher.publish_many(events)
+
+            sent: list[UUID] = []
+            for result in results:
+                if result.succeeded:
+                    sent.append(result.event_id)
+                    continue
+
+                logger.error(
+                    "Failed to publish PaymentClosedEvent %s, it will be retried "
+                    "after its lock times out: %s",
+                    result.event_id,
+                    result.error,
+                )
+
+                await outbox.mark_failed(result.event_id, error=result.error or "")
+
+            await outbox.mark_sent(sent)
+            if sent:
+                logger.info("Relayed %d PaymentClosedEvents", len(sent))
+
+            return len(events)
@@ -1,27 +1,67 @@
 """Core dependencies for the REST adapter"""
 
 import logging
-from typing import Annotated, AsyncIterator
+from contextlib import AsyncExitStack
+from typing import Annotated, AsyncIterator, Awaitable, Callable, Generic, TypeVar
 
-from aioboto3 import Session as AIOBoto3Session
 from fastapi import Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from payment_api.application.commands import FindPaymentByIdCommand
 from payment_api.application.use_cases import (
     FinalizePaymentByMercadoPagoPaymentIdUseCase,
     FindPaymentByIdUseCase,
+    FindPaymentsByIdsUseCase,
+    FindPaymentVersionByIdUseCase,
     RenderQRCodeUseCase,
 )
 from payment_api.application.use_cases.ports import (
-    AbstractMercadoPagoClient,
+    AbstractMercadoPagoNotificationDeduplicator,
     AbstractQRCodeRenderer,
+    MercadoPagoNotificationInbox,
+    QRCodeFileStore,
+    QRCodeImageRepository,
 )
-from payment_api.domain.ports import PaymentClosedPublisher, PaymentRepository
+from payment_api.domain.entities import PaymentVersion
+from payment_api.domain.ports import PaymentRepository
 from payment_api.infrastructure import factory
+from payment_api.infrastructure.config import QRCodeSettings
 from payment_api.infrastructure.mercado_pago import MercadoPagoAPIClient
+from payment_api.infrastructure.orm import SessionManager
+from payment_api.infrastructure.payment_cache import PaymentCache
+from payment_api.infrastructure.payment_status_notifications import (
+    PaymentStatusNotifications,
+)
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+
+class LazyDependency(Generic[T]):
+    """A dependency built on its first use and reused for the rest of the request
+
+    FastAPI resolves every dependency of an endpoint before running it, so the
+    adapters behind a lazy dependency are only built if the endpoint asks for
+    them, and requests discarded early do not pay for them.
+    """
+
+    def __init__(self, build: Callable[[], Awaitable[T]]):
+        self._build = build
+        self._value: T | None = None
+        self._built = False
+
+    async def get(self) -> T:
+        """Build the dependency on the first call and return it
+
+        :return: The dependency instance
+        """
+        if not self._built:
+            self._value = await self._build()
+            self._built = True
+
+        return self._value  # type: ignore[return-value]
+
 
 async def db_session(request: Request) -> AsyncIterator[AsyncSession]:
     """Dependency that provides a database session"""
@@ -32,16 +72,56 @@ async def db_session(request: Request) -> AsyncIterator[AsyncSession]:
         yield session
 
 
-def get_aws_session(request: Request) -> AIOBoto3Session:
-    """Dependency that provides an AIOBoto3Session instance"""
-    logger.debug("Providing AIOBoto3Session via dependency")
-    return factory.get_aws_session(settings=request.app.state.aws_settings)
+async def readonly_db_session(request: Request) -> AsyncIterator[AsyncSession]:
+    """Dependency that provides a read-only database session, which may be bound
+    to a read replica"""
+    async with factory.get_db_session(
+        session_manager=request.app.state.session_manager, readonly=True
+    ) as session:
+        logger.debug("Providing new read-only database session via dependency")
+        yield session
+
+
+def session_manager(request: Request) -> SessionManager:
+    """Dependency that provides the application SessionManager instance"""
+    return request.app.state.session_manager
+
+
+async def lazy_db_session(
+    request: Request,
+) -> AsyncIterator[LazyDependency[AsyncSession]]:
+    """Dependency that provides a database session opened on its first use and
+    closed at the end of the request"""
+    async with AsyncExitStack() as exit_stack:
+
+        async def build() -> AsyncSession:
+            logger.debug("Opening lazy database session")
+            return await exit_stack.enter_async_context(
+                factory.get_db_session(
+                    session_manager=request.app.state.session_manager
+                )
+            )
 
+        yield LazyDependency(build)
 
-def qr_code_renderer() -> AbstractQRCodeRenderer:
-    """Dependency that provides a QRCodeRenderer instance"""
+
+def qr_code_renderer(request: Request) -> AbstractQRCodeRenderer:
+    """Dependency that provides the application QRCodeRenderer instance"""
     logger.debug("Providing QRCodeRenderer via dependency")
-    return factory.get_qr_code_renderer()
+    return request.app.state.qr_code_renderer
+
+
+def qr_code_settings(request: Request) -> QRCodeSettings:
+    """Dependency that provides the application QRCodeSettings instance"""
+    logger.debug("Providing QRCodeSettings via dependency")
+    return request.app.state.qr_code_settings
+
+
+def qr_code_file_store(request: Request) -> QRCodeFileStore | None:
+    """Dependency that provides the application QRCodeFileStore instance, or None
+    when QR codes are not stored as files"""
+    logger.debug("Providing QRCodeFileStore via dependency")
+    return request.app.state.qr_code_file_store
 
 
 def mercado_pago_api_client(request: Request) -> MercadoPagoAPIClient:
@@ -54,108 +134,254 @@ def mercado_pago_api_client(request: Request) -> MercadoPagoAPIClient:
 
 
 DBSessionDep = Annotated[AsyncSession, Depends(db_session)]
+LazyDBSessionDep = Annotated[LazyDependency[AsyncSession], Depends(lazy_db_session)]
+ReadOnlyDBSessionDep = Annotated[AsyncSession, Depends(readonly_db_session)]
+SessionManagerDep = Annotated[SessionManager, Depends(session_manager)]
 QRCodeRendererDep = Annotated[AbstractQRCodeRenderer, Depends(qr_code_renderer)]
-AWSSessionDep = Annotated[AIOBoto3Session, Depends(get_aws_session)]
+QRCodeSettingsDep = Annotated[QRCodeSettings, Depends(qr_code_settings)]
+QRCodeFileStoreDep = Annotated[QRCodeFileStore | None, Depends(qr_code_file_store)]
 MercadoPagoAPIClientDep = Annotated[
     MercadoPagoAPIClient, Depends(mercado_pago_api_client)
 ]
 
 
-def mercado_pago_client(
-    api_client: MercadoPagoAPIClientDep,
-) -> AbstractMercadoPagoClient:
-    """Dependency that provides a MercadoPagoClient instance"""
-    logger.debug("Providing MercadoPagoClient via dependency")
-    return factory.get_mercado_pago_client(mercado_pago_api_client=api_client)
+def payment_cache(request: Request) -> PaymentCache | None:
+    """Dependency that provides the PaymentCache, or None when the payment cache
+    is disabled"""
+    return request.app.state.payment_cache
+
+
+PaymentCacheDep = Annotated[PaymentCache | None, Depends(payment_cache)]
+
 
+def payment_status_notifications(request: Request) -> PaymentStatusNotifications | None:
+    """Dependency that provides the PaymentStatusNotifications, or None when the
+    payment events are disabled"""
+    return request.app.state.payment_status_notifications
 
-MercadoPagoClientDep = Annotated[
-    AbstractMercadoPagoClient, Depends(mercado_pago_client)
+
+PaymentStatusNotificationsDep = Annotated[
+    PaymentStatusNotifications | None, Depends(payment_status_notifications)
 ]
 
 
-def payment_repository(session: DBSessionDep) -> PaymentRepository:
-    """Dependency that provides a PaymentRepository instance"""
-    logger.debug("Providing PaymentRepository via dependency")
-    return factory.get_payment_repository(session=session)
+def payment_version_reader(
+    request: Request,
+) -> Callable[[str], Awaitable[PaymentVersion]]:
+    """Dependency that provides a function reading the version of a payment in
+    its own database session, for long-lived responses that must not hold a
+    pooled connection while they are open"""
 
+    async def read(payment_id: str) -> PaymentVersion:
+        async with factory.get_db_session(
+            session_manager=request.app.state.session_manager, readonly=True
+        ) as session:
+            repository = factory.get_payment_repository(
+                session=session, payment_cache=request.app.state.payment_cache
+            )
+
+            use_case = factory.get_find_payment_version_by_id_use_case(
+                payment_repository=repository
+            )
+
+            return await use_case.execute(
+                command=FindPaymentByIdCommand(payment_id=payment_id)
+            )
+
+    return read
+
+
+PaymentVersionReaderDep = Annotated[
+    Callable[[str], Awaitable[PaymentVersion]], Depends(payment_version_reader)
+]
 
-def payment_closed_publisher_dep(
-    request: Request, session: AWSSessionDep
-) -> PaymentClosedPublisher:
-    """Dependency that provides a PaymentClosedPublisher instance"""
-    logger.debug("Providing PaymentClosedPublisher via dependency")
-    return factory.get_payment_closed_publisher(
-        settings=request.app.state.payment_closed_publisher_settings,
-        aio_boto3_session=session,
-    )
 
+def readonly_payment_repository(
+    session: ReadOnlyDBSessionDep, cache: PaymentCacheDep
+) -> PaymentRepository:
+    """Dependency that provides a PaymentRepository instance for lookups, which
+    may read from a read replica"""
+    logger.debug("Providing read-only PaymentRepository via dependency")
+    return factory.get_payment_repository(session=session, payment_cache=cache)
 
-PaymentRepositoryDep = Annotated[PaymentRepository, Depends(payment_repository)]
-PaymentClosedPublisherDep = Annotated[
-    PaymentClosedPublisher, Depends(payment_closed_publisher_dep)
+
+def qr_code_image_repository(
+    request: Request, session: ReadOnlyDBSessionDep
+) -> QRCodeImageRepository | None:
+    """Dependency that provides a QRCodeImageRepository instance, or None when
+    QR codes are not pre-rendered"""
+    if not request.app.state.qr_code_settings.PRE_RENDER_ENABLED:
+        return None
+
+    logger.debug("Providing QRCodeImageRepository via dependency")
+    return factory.get_qr_code_image_repository(session=session)
+
+
+def mercado_pago_notification_inbox(
+    request: Request, session: LazyDBSessionDep
+) -> LazyDependency[MercadoPagoNotificationInbox] | None:
+    """Dependency that provides a lazy MercadoPagoNotificationInbox instance, or
+    None when the notification inbox is disabled"""
+    settings = request.app.state.mercado_pago_notification_inbox_settings
+    if not settings.ENABLED:
+        return None
+
+    async def build() -> MercadoPagoNotificationInbox:
+        logger.debug("Providing MercadoPagoNotificationInbox via dependency")
+        return factory.get_mercado_pago_notification_inbox(
+            session=await session.get(), settings=settings
+        )
+
+    return LazyDependency(build)
+
+
+def mercado_pago_notification_deduplicator(
+    request: Request, session: LazyDBSessionDep
+) -> LazyDependency[AbstractMercadoPagoNotificationDeduplicator]:
+    """Dependency that provides a lazy MercadoPagoNotificationDeduplicator
+    instance"""
+
+    async def build() -> AbstractMercadoPagoNotificationDeduplicator:
+        logger.debug("Providing MercadoPagoNotificationDeduplicator via dependency")
+        inbox = factory.get_mercado_pago_notification_inbox(
+            session=await session.get(),
+            settings=request.app.state.mercado_pago_notification_inbox_settings,
+        )
+
+        return factory.get_mercado_pago_notification_deduplicator(
+            inbox=inbox, recently_seen=request.app.state.recently_seen_notifications
+        )
+
+    return LazyDependency(build)
+
+
+ReadOnlyPaymentRepositoryDep = Annotated[
+    PaymentRepository, Depends(readonly_payment_repository)
+]
+QRCodeImageRepositoryDep = Annotated[
+    QRCodeImageRepository | None, Depends(qr_code_image_repository)
+]
+LazyMercadoPagoNotificationInboxDep = Annotated[
+    LazyDependency[MercadoPagoNotificationInbox] | None,
+    Depends(mercado_pago_notification_inbox),
+]
+LazyMercadoPagoNotificationDeduplicatorDep = Annotated[
+    LazyDependency[AbstractMercadoPagoNotificationDeduplicator],
+    Depends(mercado_pago_notification_deduplicator),
 ]
 
 
 def find_payment_by_id_use_case(
-    repository: PaymentRepositoryDep,
+    repository: ReadOnlyPaymentRepositoryDep,
 ) -> FindPaymentByIdUseCase:
     """Dependency that provides a FindPaymentByIdUseCase instance"""
     logger.debug("Providing FindPaymentByIdUseCase via dependency")
     return factory.get_find_payment_by_id_use_case(payment_repository=repository)
 
 
+def find_payment_version_by_id_use_case(
+    repository: ReadOnlyPaymentRepositoryDep,
+) -> FindPaymentVersionByIdUseCase:
+    """Dependency that provides a FindPaymentVersionByIdUseCase instance"""
+    logger.debug("Providing FindPaymentVersionByIdUseCase via dependency")
+    return factory.get_find_payment_version_by_id_use_case(
+        payment_repository=repository
+    )
+
+
+def find_payments_by_ids_use_case(
+    repository: ReadOnlyPaymentRepositoryDep,
+) -> FindPaymentsByIdsUseCase:
+    """Dependency that provides a FindPaymentsByIdsUseCase instance"""
+    logger.debug("Providing FindPaymentsByIdsUseCase via dependency")
+    return factory.get_find_payments_by_ids_use_case(payment_repository=repository)
+
+
 def render_qr_code_use_case(
-    repository: PaymentRepositoryDep, renderer: QRCodeRendererDep
+    repository: ReadOnlyPaymentRepositoryDep,
+    renderer: QRCodeRendererDep,
+    image_repository: QRCodeImageRepositoryDep,
+    file_store: QRCodeFileStoreDep,
 ) -> RenderQRCodeUseCase:
     """Dependency that provides a RenderQRCodeUseCase instance"""
     logger.debug("Providing RenderQRCodeUseCase via dependency")
     return factory.get_render_qr_code_use_case(
-        payment_repository=repository, qr_code_renderer=renderer
+        payment_repository=repository,
+        qr_code_renderer=renderer,
+        qr_code_image_repository=image_repository,
+        qr_code_file_store=file_store,
     )
 
 
 def finalize_payment_by_mercado_pago_payment_id_use_case(
-    repository: PaymentRepositoryDep,
-    mp_client: MercadoPagoClientDep,
-    payment_closed_publisher: PaymentClosedPublisherDep,
-) -> FinalizePaymentByMercadoPagoPaymentIdUseCase:
-    """Dependency that provides a
+    request: Request, session: LazyDBSessionDep
+) -> LazyDependency[FinalizePaymentByMercadoPagoPaymentIdUseCase]:
+    """Dependency that provides a lazy
     FinalizePaymentByMercadoPagoPaymentIdUseCase instance"""
-    logger.debug(
-        "Providing FinalizePaymentByMercadoPagoPaymentIdUseCase via dependency"
-    )
 
-    return factory.get_finalize_payment_by_mercado_pago_payment_id_use_case(
-        payment_repository=repository,
-        mercado_pago_client=mp_client,
-        payment_closed_publisher=payment_closed_publisher,
-    )
+    async def build() -> FinalizePaymentByMercadoPagoPaymentIdUseCase:
+        logger.debug(
+            "Providing FinalizePaymentByMercadoPagoPaymentIdUseCase via dependency"
+        )
+
+        use_case_factory = (
+            factory.finalize_payment_by_mercado_pago_payment_id_use_case_factory(
+                mercado_pago_settings=request.app.state.mercado_pago_settings,
+                http_client=request.app.state.http_client,
+                payment_closed_outbox_settings=(
+                    request.app.state.payment_closed_outbox_settings
+                ),
+                payment_cache=request.app.state.payment_cache,
+            )
+        )
+
+        return use_case_factory(await session.get())
+
+    return LazyDependency(build)
 
 
 FindPaymentByIdUseCaseDep = Annotated[
     FindPaymentByIdUseCase, Depends(find_payment_by_id_use_case)
 ]
 
+FindPaymentVersionByIdUseCaseDep = Annotated[
+    FindPaymentVersionByIdUseCase, Depends(find_payment_version_by_id_use_case)
+]
+
+FindPaymentsByIdsUseCaseDep = Annotated[
+    FindPaymentsByIdsUseCase, Depends(find_payments_by_ids_use_case)
+]
+
 RenderQRCodeUseCaseDep = Annotated[
     RenderQRCodeUseCase, Depends(render_qr_code_use_case)
 ]
 
-FinalizePaymentByMercadoPagoPaymentIdUseCaseDep = Annotated[
-    FinalizePaymentByMercadoPagoPaymentIdUseCase,
+LazyFinalizePaymentByMercadoPagoPaymentIdUseCaseDep = Annotated[
+    LazyDependency[FinalizePaymentByMercadoPagoPaymentIdUseCase],
     Depends(finalize_payment_by_mercado_pago_payment_id_use_case),
 ]
 
 
 __all__ = [
+    "LazyDependency",
     "DBSessionDep",
+    "LazyDBSessionDep",
+    "ReadOnlyDBSessionDep",
+    "SessionManagerDep",
     "QRCodeRendererDep",
-    "AWSSessionDep",
+    "QRCodeSettingsDep",
+    "QRCodeFileStoreDep",
     "MercadoPagoAPIClientDep",
-    "MercadoPagoClientDep",
-    "PaymentRepositoryDep",
-    "PaymentClosedPublisherDep",
+    "PaymentCacheDep",
+    "PaymentStatusNotificationsDep",
+    "PaymentVersionReaderDep",
+    "ReadOnlyPaymentRepositoryDep",
+    "QRCodeImageRepositoryDep",
+    "LazyMercadoPagoNotificationInboxDep",
+    "LazyMercadoPagoNotificationDeduplicatorDep",
     "FindPaymentByIdUseCaseDep",
+    "FindPaymentVersionByIdUseCaseDep",
+    "FindPaymentsByIdsUseCaseDep",
     "RenderQRCodeUseCaseDep",
-    "FinalizePaymentByMercadoPagoPaymentIdUseCaseDep",
+    "LazyFinalizePaymentByMercadoPagoPaymentIdUseCaseDep",
 ]
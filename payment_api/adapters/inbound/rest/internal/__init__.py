@@ -0,0 +1,6 @@
+"""Internal REST adapter package for operational endpoints"""
+
+from . import schemas
+from .router import router as internal_router
+
+__all__ = ["schemas", "internal_router"]
@@ -0,0 +1,55 @@
+"""Internal REST API endpoint module
+
+These endpoints expose the counters of the process serving the request for
+operations. They are kept out of the public /v1/payment namespace and of the
+OpenAPI schema, and must not be routed to from outside the cluster.
+"""
+
+import logging
+from typing import Annotated
+
+from fastapi import APIRouter, HTTPException, Query
+
+from payment_api.adapters.inbound.rest.dependencies.core import (
+    PaymentCacheDep,
+    SessionManagerDep,
+)
+from payment_api.adapters.inbound.rest.internal.schemas import (
+    DatabasePoolStatsResponse,
+    PaymentCacheStatsResponse,
+)
+
+logger = logging.getLogger(__name__)
+router = APIRouter(
+    prefix="/internal/metrics", tags=["internal"], include_in_schema=False
+)
+
+
+@router.get("/payment-cache", response_model=PaymentCacheStatsResponse)
+async def payment_cache_stats(cache: PaymentCacheDep):
+    """Return the hit ratio and eviction counters of the payment cache"""
+
+    if cache is None:
+        raise HTTPException(status_code=404, detail="Payment cache is disabled")
+
+    stats = cache.stats()
+    return PaymentCacheStatsResponse(**stats.model_dump(), hit_ratio=stats.hit_ratio)
+
+
+@router.get("/database-pool", response_model=DatabasePoolStatsResponse)
+async def database_pool_stats(
+    session_manager: SessionManagerDep,
+    pool: Annotated[
+        str, Query(description="The pool, primary, background or replica-<n>")
+    ] = "primary",
+):
+    """Return the connection and checkout wait counters of a database pool of
+    the process serving the request"""
+
+    if pool not in session_manager.pool_names:
+        raise HTTPException(status_code=404, detail=f"No database pool named {pool}")
+
+    stats = session_manager.pool_stats(pool)
+    return DatabasePoolStatsResponse(
+        **stats.model_dump(), average_wait_time=stats.average_wait_time
+    )
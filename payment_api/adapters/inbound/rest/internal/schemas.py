@@ -0,0 +1,32 @@
+"""Schemas of the internal REST API"""
+
+from pydantic import BaseModel, Field
+
+
+class PaymentCacheStatsResponse(BaseModel):
+    """Schema representing the counters of the in-process payment cache"""
+
+    size: int = Field(description="Number of cached payment lookups")
+    max_size: int = Field(description="Maximum number of cached payment lookups")
+    hits: int = Field(description="Lookups served by fresh entries")
+    stale_hits: int = Field(description="Lookups served by stale entries")
+    misses: int = Field(description="Lookups not served by the cache")
+    evictions: int = Field(description="Entries evicted because the cache was full")
+    invalidations: int = Field(description="Entries invalidated by payment updates")
+    hit_ratio: float = Field(description="Share of the lookups served by the cache")
+
+
+class DatabasePoolStatsResponse(BaseModel):
+    """Schema representing the counters of the database connection pool of the
+    process"""
+
+    size: int = Field(description="Connections kept open by the pool")
+    max_overflow: int = Field(description="Connections allowed over the size")
+    checked_in: int = Field(description="Idle connections in the pool")
+    checked_out: int = Field(description="Connections in use")
+    overflow: int = Field(description="Connections open over the size")
+    checkouts: int = Field(description="Connections handed out by the pool")
+    timeouts: int = Field(description="Checkouts that timed out waiting")
+    wait_time: float = Field(description="Seconds spent waiting for checkouts")
+    max_wait_time: float = Field(description="Longest checkout wait in seconds")
+    average_wait_time: float = Field(description="Average checkout wait in seconds")
@@ -1,46 +1,133 @@
 """V1 Payment REST API endpoint module"""
 
+import asyncio
+import hashlib
 import logging
+import os
+from typing import Annotated, AsyncIterator, Literal
 
-from fastapi import APIRouter, Depends, HTTPException, Request
-from fastapi.responses import Response
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request
+from fastapi.responses import FileResponse, Response, StreamingResponse
 from pydantic import ValidationError
 
 from payment_api.adapters.inbound.rest.dependencies.auth import (
     validate_mercado_pago_notification,
 )
 from payment_api.adapters.inbound.rest.dependencies.core import (
-    FinalizePaymentByMercadoPagoPaymentIdUseCaseDep,
     FindPaymentByIdUseCaseDep,
+    FindPaymentsByIdsUseCaseDep,
+    FindPaymentVersionByIdUseCaseDep,
+    LazyFinalizePaymentByMercadoPagoPaymentIdUseCaseDep,
+    LazyMercadoPagoNotificationDeduplicatorDep,
+    LazyMercadoPagoNotificationInboxDep,
+    PaymentStatusNotificationsDep,
+    PaymentVersionReaderDep,
+    QRCodeSettingsDep,
     RenderQRCodeUseCaseDep,
 )
-from payment_api.adapters.inbound.rest.v1.schemas import MercadoPagoWebhookV1, PaymentV1
+from payment_api.adapters.inbound.rest.v1.schemas import (
+    MercadoPagoWebhookV1,
+    PaymentBatchLookupRequestV1,
+    PaymentBatchLookupV1,
+    PaymentV1,
+)
 from payment_api.application.commands import (
     FinalizePaymentByMercadoPagoPaymentIdCommand,
     FindPaymentByIdCommand,
+    FindPaymentsByIdsCommand,
+    QRCodeOptionsDTO,
     RenderQRCodeCommand,
 )
-from payment_api.application.use_cases.ports import MPClientError
-from payment_api.domain.exceptions import (
-    EventPublishingError,
-    NotFound,
-    PersistenceError,
+from payment_api.application.use_cases.ports import (
+    AbstractMercadoPagoNotificationDeduplicator,
+    MPClientError,
+    QRCodeFormat,
+    QRCodeImage,
+    QRCodeRendererUnavailable,
+)
+from payment_api.domain.entities import PaymentOut, PaymentVersion
+from payment_api.domain.exceptions import NotFound, PersistenceError
+from payment_api.domain.value_objects import PaymentStatus
+from payment_api.infrastructure.config import QRCodeSettings
+from payment_api.infrastructure.payment_status_notifications import (
+    PaymentStatusNotifications,
 )
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/v1/payment", tags=["payment"])
 
+# Opened payments may be cached but must be revalidated with their ETag, while
+# closed and expired payments never change and can be cached for a long time
+OPENED_PAYMENT_CACHE_CONTROL = "no-cache"
+TERMINAL_PAYMENT_CACHE_CONTROL = "public, max-age=86400, immutable"
+QR_CODE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+QR_CODE_MEDIA_TYPES = (QRCodeFormat.PNG, QRCodeFormat.SVG)
+MAX_QR_CODE_SIZE = 20
+MAX_QR_CODE_BORDER = 10
+
+
+@router.post("/batch-lookup", response_model=PaymentBatchLookupV1)
+async def batch_lookup(
+    lookup: PaymentBatchLookupRequestV1, use_case: FindPaymentsByIdsUseCaseDep
+):
+    """Find many payments by their IDs with a single query
+
+    The payments found are returned in request order, along with the requested
+    IDs that have no payment.
+    """
+
+    logger.info("Received request to look up %s payments", len(lookup.ids))
+    try:
+        payments = await use_case.execute(
+            command=FindPaymentsByIdsCommand(payment_ids=lookup.ids)
+        )
+
+    except PersistenceError as error:
+        logger.error(
+            "Persistence error occurred while looking up payments", exc_info=True
+        )
+
+        raise HTTPException(
+            status_code=500, detail="An error occurred while processing your request"
+        ) from error
+
+    found_ids = {payment.id for payment in payments}
+    lookup_result = PaymentBatchLookupV1(
+        found=[PaymentV1.model_validate(payment) for payment in payments],
+        missing=[
+            payment_id
+            for payment_id in dict.fromkeys(lookup.ids)
+            if payment_id not in found_ids
+        ],
+    )
+    return Response(
+        content=lookup_result.model_dump_json(), media_type="application/json"
+    )
+
 
 @router.get("/{payment_id}", response_model=PaymentV1)
 async def find(
     payment_id: str,
     use_case: FindPaymentByIdUseCaseDep,
+    version_use_case: FindPaymentVersionByIdUseCaseDep,
+    if_none_match: Annotated[str | None, Header()] = None,
 ):
-    """Find a payment by its ID"""
+    """Find a payment by its ID
+
+    Responses carry an ETag derived from the payment status and last update. When
+    the If-None-Match header matches it, only the payment version is read and 304
+    is returned without a body.
+    """
 
     logger.info("Received request to find payment with ID: %s", payment_id)
     command = FindPaymentByIdCommand(payment_id=payment_id)
     try:
+        if if_none_match is not None:
+            version = await version_use_case.execute(command=command)
+            if _etag_matches(if_none_match, _payment_etag(version)):
+                logger.info("Payment with ID %s was not modified", payment_id)
+                return Response(status_code=304, headers=_cache_headers(version))
+
         payment = await use_case.execute(command=command)
 
     except NotFound as error:
@@ -58,20 +145,126 @@ async def find(
             status_code=500, detail="An error occurred while processing your request"
         ) from error
 
-    return PaymentV1.model_validate(payment.model_dump())
+    return _payment_response(
+        payment, headers=_cache_headers(PaymentVersion.model_validate(payment))
+    )
+
+
+def _payment_response(
+    payment: PaymentOut, headers: dict[str, str] | None = None
+) -> Response:
+    """Serialize a payment straight to a JSON response
+
+    The payment is validated into PaymentV1 from its attributes and dumped to
+    JSON once, skipping the dict round trip and the response_model validation
+    FastAPI applies to returned models. The response_model of the routes is
+    kept for the OpenAPI schema.
+    """
+
+    return Response(
+        content=PaymentV1.model_validate(payment).model_dump_json(),
+        media_type="application/json",
+        headers=headers,
+    )
+
+
+def _payment_etag(version: PaymentVersion) -> str:
+    key = f"{version.id}:{version.payment_status.value}:{version.timestamp.isoformat()}"
+    return f'"{hashlib.blake2b(key.encode(), digest_size=8).hexdigest()}"'
 
 
-@router.get("/{payment_id}/qr")
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+
+    return etag in {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+
+
+def _cache_headers(version: PaymentVersion) -> dict[str, str]:
+    cache_control = (
+        OPENED_PAYMENT_CACHE_CONTROL
+        if version.payment_status == PaymentStatus.OPENED
+        else TERMINAL_PAYMENT_CACHE_CONTROL
+    )
+
+    return {"ETag": _payment_etag(version), "Cache-Control": cache_control}
+
+
+@router.api_route("/{payment_id}/qr", methods=["GET", "HEAD"])
 async def render_qr_code(
     payment_id: str,
+    request: Request,
     use_case: RenderQRCodeUseCaseDep,
+    settings: QRCodeSettingsDep,
+    size: Annotated[
+        int, Query(ge=1, le=MAX_QR_CODE_SIZE, description="Pixels per module")
+    ] = 10,
+    border: Annotated[
+        int, Query(ge=0, le=MAX_QR_CODE_BORDER, description="Quiet zone modules")
+    ] = 4,
+    error_correction: Annotated[
+        Literal["L", "M", "Q", "H"], Query(description="Error correction level")
+    ] = "M",
+    accept: Annotated[str | None, Header()] = None,
+    if_none_match: Annotated[str | None, Header()] = None,
 ):
-    """Render QR code for a payment"""
+    """Render QR code for a payment
+
+    The image is a 1-bit PNG, or an SVG when the Accept header prefers
+    image/svg+xml. The QR code of a payment never changes, so responses carry
+    an ETag derived from the QR code data and the image options and are
+    cacheable forever. HEAD requests and requests whose If-None-Match header
+    matches the ETag are answered without rendering, unless a HEAD request
+    needs the image to know its length. Images stored as files are sent from
+    the file, or by a fronting nginx through X-Accel-Redirect, and sent inline
+    if their file was evicted in the meantime.
+    """
 
     logger.info("Received request to render QR code for payment ID: %s", payment_id)
-    command = RenderQRCodeCommand(payment_id=payment_id)
+    options = QRCodeOptionsDTO(
+        format=_negotiate_media_type(accept, QR_CODE_MEDIA_TYPES),
+        box_size=size,
+        border=border,
+        error_correction=error_correction,
+    )
+
     try:
+        if if_none_match is not None or request.method == "HEAD":
+            qr_code = await use_case.execute(
+                command=RenderQRCodeCommand(
+                    payment_id=payment_id, options=options, render=False
+                )
+            )
+
+            headers = _qr_code_headers(qr_code)
+            if if_none_match is not None and _etag_matches(
+                if_none_match, headers["ETag"]
+            ):
+                logger.info("QR code of payment ID %s was not modified", payment_id)
+                headers.pop("Content-Length", None)
+                return Response(status_code=304, headers=headers)
+
+            length = (
+                await _qr_code_length(qr_code, settings)
+                if request.method == "HEAD"
+                else None
+            )
+            if length is not None:
+                headers["Content-Length"] = str(length)
+                return Response(media_type=options.format.value, headers=headers)
+
+        command = RenderQRCodeCommand(payment_id=payment_id, options=options)
         qr_code = await use_case.execute(command=command)
+        response = await _qr_code_response(qr_code, options.format.value, settings)
+        if response is None:
+            # The file was evicted after it was found, so the image is rendered
+            # again, or found stored again by another request
+            logger.warning("QR code file %s was evicted", qr_code.file_name)
+            qr_code = await use_case.execute(command=command)
+            response = await _qr_code_response(qr_code, options.format.value, settings)
+
+        if response is not None:
+            return response
 
     except NotFound as error:
         logger.error("Cannot find payment with ID %s to render QR code", payment_id)
@@ -97,7 +290,217 @@ async def render_qr_code(
 
         raise HTTPException(status_code=400, detail=str(error)) from error
 
-    return Response(content=qr_code, media_type="image/png")
+    except QRCodeRendererUnavailable as error:
+        logger.warning(
+            "QR code renderer is unavailable for payment ID %s: %s", payment_id, error
+        )
+
+        raise HTTPException(
+            status_code=503,
+            detail="The QR code cannot be rendered right now",
+            headers={"Retry-After": "1"},
+        ) from error
+
+    logger.warning("QR code file %s was evicted again", qr_code.file_name)
+    raise HTTPException(
+        status_code=503,
+        detail="The QR code cannot be sent right now",
+        headers={"Retry-After": "1"},
+    )
+
+
+def _negotiate_media_type(
+    accept: str | None, media_types: tuple[QRCodeFormat, ...]
+) -> QRCodeFormat:
+    """Pick the media type the Accept header prefers, the first one on ties"""
+
+    if not accept:
+        return media_types[0]
+
+    qualities = dict.fromkeys(media_types, 0.0)
+    for media_range in accept.split(","):
+        media_range, _, parameters = media_range.strip().partition(";")
+        quality = 1.0
+        for parameter in parameters.split(";"):
+            name, _, value = parameter.strip().partition("=")
+            if name == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+
+        for media_type in media_types:
+            if media_range in (media_type, f"{media_type.split('/')[0]}/*", "*/*"):
+                qualities[media_type] = max(qualities[media_type], quality)
+
+    return max(media_types, key=lambda media_type: qualities[media_type])
+
+
+def _qr_code_headers(qr_code: QRCodeImage) -> dict[str, str]:
+    headers = {
+        "ETag": f'"{qr_code.digest}"',
+        "Cache-Control": QR_CODE_CACHE_CONTROL,
+        "Vary": "Accept",
+    }
+    if qr_code.content is not None:
+        headers["Content-Length"] = str(len(qr_code.content))
+
+    return headers
+
+
+async def _qr_code_length(qr_code: QRCodeImage, settings: QRCodeSettings) -> int | None:
+    """Return the length of the image, or None if it is not known without
+    rendering it"""
+
+    if qr_code.content is not None:
+        return len(qr_code.content)
+
+    if qr_code.file_name is None:
+        return None
+
+    stat_result = await _stat_qr_code_file(qr_code.file_name, settings)
+    return None if stat_result is None else stat_result.st_size
+
+
+async def _stat_qr_code_file(
+    file_name: str, settings: QRCodeSettings
+) -> os.stat_result | None:
+    try:
+        return await asyncio.to_thread(
+            os.stat, os.path.join(settings.FILE_STORE_DIRECTORY, file_name)
+        )
+    except FileNotFoundError:
+        return None
+
+
+async def _qr_code_response(
+    qr_code: QRCodeImage, media_type: str, settings: QRCodeSettings
+) -> Response | None:
+    """Return a response sending the image from its file or inline, or None if
+    its file was evicted and it was not rendered"""
+
+    if qr_code.file_name is not None:
+        response = await _qr_code_file_response(
+            qr_code, qr_code.file_name, media_type, settings
+        )
+        if response is not None:
+            return response
+
+    if qr_code.content is None:
+        return None
+
+    return Response(
+        content=qr_code.content,
+        media_type=media_type,
+        headers=_qr_code_headers(qr_code),
+    )
+
+
+async def _qr_code_file_response(
+    qr_code: QRCodeImage, file_name: str, media_type: str, settings: QRCodeSettings
+) -> Response | None:
+    """Return a response sending the file of the image, or None if the file was
+    evicted"""
+
+    stat_result = await _stat_qr_code_file(file_name, settings)
+    if stat_result is None:
+        return None
+
+    headers = _qr_code_headers(qr_code)
+    headers.pop("Content-Length", None)
+    if settings.FILE_STORE_DELIVERY == "x-accel-redirect":
+        headers["X-Accel-Redirect"] = (
+            f"{settings.FILE_STORE_ACCEL_REDIRECT_PREFIX.rstrip('/')}/{file_name}"
+        )
+        response = Response(media_type=media_type, headers=headers)
+        # nginx sends the length of the file, not of this empty body
+        del response.headers["Content-Length"]
+        return response
+
+    return FileResponse(
+        os.path.join(settings.FILE_STORE_DIRECTORY, file_name),
+        media_type=media_type,
+        headers=headers,
+        stat_result=stat_result,
+    )
+
+
+@router.get("/{payment_id}/events")
+async def payment_events(
+    payment_id: str,
+    request: Request,
+    notifications: PaymentStatusNotificationsDep,
+    read_version: PaymentVersionReaderDep,
+):
+    """Stream the status changes of a payment as server-sent events
+
+    The current status is sent first, followed by every status change, and the
+    stream ends once the payment is closed or expired.
+    """
+
+    if notifications is None:
+        raise HTTPException(status_code=404, detail="Payment events are disabled")
+
+    logger.info("Received request to stream events of payment ID: %s", payment_id)
+
+    # Subscribe before reading the current version so no change is missed
+    queue = notifications.subscribe(payment_id)
+    try:
+        version = await read_version(payment_id)
+
+    except NotFound as error:
+        notifications.unsubscribe(payment_id, queue)
+        logger.error("Cannot find payment with ID %s to stream events", payment_id)
+        raise HTTPException(status_code=404, detail="Payment not found") from error
+
+    except PersistenceError as error:
+        notifications.unsubscribe(payment_id, queue)
+        logger.error(
+            "Persistence error occurred while streaming events of payment ID %s",
+            payment_id,
+            exc_info=True,
+        )
+
+        raise HTTPException(
+            status_code=500, detail="An error occurred while processing your request"
+        ) from error
+
+    return StreamingResponse(
+        _payment_status_events(request, notifications, queue, version),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _payment_status_events(
+    request: Request,
+    notifications: PaymentStatusNotifications,
+    queue: asyncio.Queue,
+    version: PaymentVersion,
+) -> AsyncIterator[str]:
+    try:
+        yield _status_event(version)
+        while version.payment_status == PaymentStatus.OPENED:
+            try:
+                change = await asyncio.wait_for(
+                    queue.get(), timeout=notifications.keepalive_interval
+                )
+            except TimeoutError:
+                if await request.is_disconnected():
+                    return
+
+                yield ": keep-alive\n\n"
+                continue
+
+            if change.payment_status != version.payment_status:
+                version = change
+                yield _status_event(version)
+    finally:
+        notifications.unsubscribe(version.id, queue)
+
+
+def _status_event(version: PaymentVersion) -> str:
+    return f"event: payment-status\ndata: {version.model_dump_json()}\n\n"
 
 
 @router.post(
@@ -107,9 +510,17 @@ async def render_qr_code(
 )
 async def mercado_pago_webhook(
     request: Request,
-    use_case: FinalizePaymentByMercadoPagoPaymentIdUseCaseDep,
+    use_case: LazyFinalizePaymentByMercadoPagoPaymentIdUseCaseDep,
+    inbox: LazyMercadoPagoNotificationInboxDep,
+    deduplicator: LazyMercadoPagoNotificationDeduplicatorDep,
 ):
-    """Handle MercadoPago webhook notifications"""
+    """Handle MercadoPago webhook notifications
+
+    Duplicated notifications are answered right away, without calling Mercado Pago.
+    When the notification inbox is enabled, accepted notifications are stored in
+    the inbox and processed later by the notification listener. The dependencies
+    are lazy, so discarded notifications do not build any adapter.
+    """
 
     body = await request.body()
     logger.info("Received Mercado Pago webhook with body: %s", body.decode())
@@ -132,10 +543,68 @@ async def mercado_pago_webhook(
 
         return Response(status_code=204)
 
+    notification_deduplicator = await deduplicator.get()
+    try:
+        duplicated = await notification_deduplicator.is_duplicate(
+            resource_id=webhook.data.id
+        )
+
+    except PersistenceError as error:
+        logger.error(
+            "Persistence error occurred while checking MercadoPago webhook for "
+            "MP payment ID %s",
+            webhook.data.id,
+            exc_info=True,
+        )
+
+        raise HTTPException(
+            status_code=500, detail="An error occurred while processing the webhook"
+        ) from error
+
+    if duplicated:
+        logger.info(
+            "Discarding duplicated Mercado Pago webhook for MP payment ID %s",
+            webhook.data.id,
+        )
+
+        return Response(status_code=200)
+
     logger.info("Accepted Mercado Pago webhook for payment ID: %s", webhook.data.id)
+    if inbox is not None:
+        notification_inbox = await inbox.get()
+        try:
+            enqueued = await notification_inbox.enqueue(resource_id=webhook.data.id)
+
+        except PersistenceError as error:
+            logger.error(
+                "Persistence error occurred while storing MercadoPago webhook for "
+                "MP payment ID %s in the inbox",
+                webhook.data.id,
+                exc_info=True,
+            )
+
+            raise HTTPException(
+                status_code=500, detail="An error occurred while processing the webhook"
+            ) from error
+
+        if enqueued:
+            logger.info(
+                "Stored Mercado Pago webhook for MP payment ID %s in the inbox",
+                webhook.data.id,
+            )
+        else:
+            logger.info(
+                "Mercado Pago webhook for MP payment ID %s is already in the inbox",
+                webhook.data.id,
+            )
+
+        notification_deduplicator.remember(resource_id=webhook.data.id)
+        return Response(status_code=200)
+
     command = FinalizePaymentByMercadoPagoPaymentIdCommand(payment_id=webhook.data.id)
+    finalize_use_case = await use_case.get()
     try:
-        payment = await use_case.execute(command=command)
+        payment = await finalize_use_case.execute(command=command)
 
     except NotFound as error:
         logger.error(
@@ -169,24 +638,6 @@ async def mercado_pago_webhook(
             status_code=502, detail="Error communicating with MercadoPago"
         ) from error
 
-    except EventPublishingError:
-        logger.error(
-            "Event publishing error occurred while processing MercadoPago webhook for "
-            "MP payment ID %s. Payment finalized but event not published, so we "
-            "respond 204 to avoid retries",
-            webhook.data.id,
-            exc_info=True,
-        )
-
-        logger.warning(
-            "Webhook with MP payment ID %s finalized but PaymentClosedEvent "
-            "not published",
-            webhook.data.id,
-        )
-        # TODO: Implement some mechanism to retry publishing the event later
-
-        return Response(status_code=204)
-
     except ValueError as error:
         logger.error(
             "Value error occurred while processing MercadoPago webhook for"
@@ -197,4 +648,22 @@ async def mercado_pago_webhook(
 
         raise HTTPException(status_code=400, detail=str(error)) from error
 
-    return PaymentV1.model_validate(payment.model_dump())
+    await _mark_notification_processed(notification_deduplicator, webhook.data.id)
+    return _payment_response(payment)
+
+
+async def _mark_notification_processed(
+    deduplicator: AbstractMercadoPagoNotificationDeduplicator, resource_id: str
+):
+    """Record a Mercado Pago notification as processed. The payment is already
+    finalized at this point, so a failure is only logged"""
+
+    try:
+        await deduplicator.mark_processed(resource_id=resource_id)
+
+    except PersistenceError:
+        logger.warning(
+            "Failed to record Mercado Pago webhook for MP payment ID %s as processed",
+            resource_id,
+            exc_info=True,
+        )
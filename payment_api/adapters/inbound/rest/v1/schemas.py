@@ -2,14 +2,18 @@
 
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from payment_api.domain.value_objects import PaymentStatus
 
+MAX_BATCH_LOOKUP_SIZE = 100
+
 
 class PaymentV1(BaseModel):
     """Payment schema representing a payment record"""
 
+    model_config = ConfigDict(from_attributes=True)
+
     id: str = Field(description="Unique identifier for the payment")
     external_id: str = Field(description="External identifier for the payment")
     payment_status: PaymentStatus = Field(description="Current status of the payment")
@@ -22,6 +26,23 @@ class PaymentV1(BaseModel):
     )
 
 
+class PaymentBatchLookupRequestV1(BaseModel):
+    """Schema representing a request to look up many payments at once"""
+
+    ids: list[str] = Field(
+        min_length=1,
+        max_length=MAX_BATCH_LOOKUP_SIZE,
+        description="IDs of the payments to look up",
+    )
+
+
+class PaymentBatchLookupV1(BaseModel):
+    """Schema representing the result of a batch payment lookup"""
+
+    found: list[PaymentV1] = Field(description="Payments found, in request order")
+    missing: list[str] = Field(description="Requested IDs without a payment")
+
+
 class MercadoPagoWebhookDataV1(BaseModel):
     """Schema representing the data field in a MercadoPago webhook payload"""
 
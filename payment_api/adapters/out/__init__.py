@@ -1,7 +1,25 @@
 """Outbound adapters package"""
 
 from .boto_payment_closed_publisher import BotoPaymentClosedPublisher
+from .buffered_payment_closed_publisher import BufferedPaymentClosedPublisher
+from .cached_payment_repository import CachedPaymentRepository
+from .local_qr_code_file_store import LocalQRCodeFileStore
 from .mp_payment_gateway import MPPaymentGateway
+from .sa_mercado_pago_notification_inbox import SAMercadoPagoNotificationInbox
+from .sa_mercado_pago_pos_lease_manager import SAMercadoPagoPOSLeaseManager
+from .sa_payment_closed_outbox import SAPaymentClosedOutbox
 from .sa_payment_repository import SAPaymentRepository
+from .sa_qr_code_image_repository import SAQRCodeImageRepository
 
-__all__ = ["SAPaymentRepository", "MPPaymentGateway", "BotoPaymentClosedPublisher"]
+__all__ = [
+    "SAPaymentRepository",
+    "CachedPaymentRepository",
+    "SAMercadoPagoNotificationInbox",
+    "SAMercadoPagoPOSLeaseManager",
+    "SAPaymentClosedOutbox",
+    "SAQRCodeImageRepository",
+    "LocalQRCodeFileStore",
+    "MPPaymentGateway",
+    "BotoPaymentClosedPublisher",
+    "BufferedPaymentClosedPublisher",
+]
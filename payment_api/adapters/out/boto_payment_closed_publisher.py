@@ -1,29 +1,92 @@
 """A AIOBoto3 implementation of the AWS SNS Publisher port"""
 
 import logging
+import zlib
+from enum import Enum, unique
 
-from aioboto3 import Session as AIOBoto3Session
+from botocore.exceptions import BotoCoreError
 from botocore.exceptions import ClientError as BotoCoreClientError
 
 from payment_api.domain.events import PaymentClosedEvent
 from payment_api.domain.exceptions import EventPublishingError
-from payment_api.domain.ports.payment_closed_publisher import PaymentClosedPublisher
+from payment_api.domain.ports.payment_closed_publisher import (
+    PaymentClosedPublisher,
+    PublishResult,
+)
 from payment_api.infrastructure.config import PaymentClosedPublisherSettings
 
 logger = logging.getLogger(__name__)
 
+SNS_MAX_BATCH_SIZE = 10
+
+
+@unique
+class MessageGroupStrategy(str, Enum):
+    """Strategies to pick the FIFO message group of an event
+
+    SNS FIFO topics deliver the messages of a group in order and one group at
+    a time, so the group decides which events are ordered relative to each
+    other and how many consumers can work in parallel.
+
+    - CONSTANT: every event goes to GROUP_ID. Events are totally ordered and
+      consumed by one consumer at a time.
+    - PAYMENT_ID: each payment gets its own group. Events of the same payment
+      are ordered, events of different payments are not, and consumers scale
+      with the number of payments.
+    - HASHED: payments are hashed into GROUP_BUCKETS groups. Events of the same
+      payment are ordered, and at most GROUP_BUCKETS consumers work in parallel.
+    """
+
+    CONSTANT = "constant"
+    PAYMENT_ID = "payment_id"
+    HASHED = "hashed"
+
+
+@unique
+class DeduplicationStrategy(str, Enum):
+    """Strategies to pick the FIFO deduplication ID of an event
+
+    SNS drops a message whose deduplication ID was already published in the
+    last five minutes.
+
+    - EVENT_ID: retries of the same event are dropped, which is what the outbox
+      relay needs when an event is published but not marked as sent.
+    - PAYMENT_ID: any other event of the same payment published in the window
+      is dropped too, for consumers that must see only one close per payment.
+    """
+
+    EVENT_ID = "event_id"
+    PAYMENT_ID = "payment_id"
+
 
 class BotoPaymentClosedPublisher(PaymentClosedPublisher):
-    """A AIOBoto3 implementation of the AWS SNS Publisher port"""
+    """A AIOBoto3 implementation of the AWS SNS Publisher port
+
+    The SNS client is long-lived and owned by the caller, usually the AWSClients
+    registry, so publishing reuses its pooled connections. The message group
+    and deduplication ID of each event follow the strategies in the settings.
+    Every group strategy keeps the events of a payment in the same group, so
+    they are always delivered in order.
+    """
+
+    def __init__(self, sns_client, settings: PaymentClosedPublisherSettings):
+        if not 1 <= settings.BATCH_SIZE <= SNS_MAX_BATCH_SIZE:
+            raise ValueError(
+                f"The batch size must be between 1 and {SNS_MAX_BATCH_SIZE}"
+            )
+
+        if settings.GROUP_BUCKETS < 1:
+            raise ValueError("The number of group buckets must be at least 1")
 
-    def __init__(
-        self,
-        aio_boto3_session: AIOBoto3Session,
-        settings: PaymentClosedPublisherSettings,
-    ):
         self.topic_arn = settings.TOPIC_ARN
         self.group_id = settings.GROUP_ID
-        self.aio_boto3_session = aio_boto3_session
+        self.group_strategy = MessageGroupStrategy(settings.GROUP_STRATEGY)
+        self.group_buckets = settings.GROUP_BUCKETS
+        self.deduplication_strategy = DeduplicationStrategy(
+            settings.DEDUPLICATION_STRATEGY
+        )
+        self.batch_size = settings.BATCH_SIZE
+        self.sns_client = sns_client
 
     async def publish(self, event: PaymentClosedEvent) -> None:
         """Publish a payment closed event
@@ -32,20 +95,95 @@ class BotoPaymentClosedPublisher(PaymentClosedPublisher):
         :return: None
         :raises EventPublishingError: If an error occurs while publishing the event
         """
-        async with self.aio_boto3_session.resource("sns") as sns:
-            topic = await sns.Topic(self.topic_arn)
-            try:
-                response = await topic.publish(
-                    Subject="payment-closed",
-                    Message=event.model_dump_json(),
-                    MessageGroupId=self.group_id,
-                    MessageDeduplicationId=str(event.id),
-                )
-
-                message_id = response["MessageId"]
-                logger.debug("Published message ID=%s, topic=%s", message_id, topic.arn)
-
-            except BotoCoreClientError as error:
-                raise EventPublishingError(
-                    "Error publishing message to SNS topic"
-                ) from error
+        try:
+            response = await self.sns_client.publish(
+                TopicArn=self.topic_arn, **self._message(event)
+            )
+
+            message_id = response["MessageId"]
+            logger.debug(
+                "Published message ID=%s, topic=%s", message_id, self.topic_arn
+            )
+
+        except (BotoCoreClientError, BotoCoreError) as error:
+            raise EventPublishingError(
+                "Error publishing message to SNS topic"
+            ) from error
+
+    async def publish_many(
+        self, events: list[PaymentClosedEvent]
+    ) -> list[PublishResult]:
+        """Publish payment closed events with PublishBatch calls of up to
+        BATCH_SIZE entries
+
+        :param events: The payment closed events to publish
+        :return: One result per event, in the same order as the events
+        """
+        if not events:
+            return []
+
+        results: list[PublishResult] = []
+        for start in range(0, len(events), self.batch_size):
+            batch = events[start : start + self.batch_size]
+            results.extend(await self._publish_batch(batch))
+
+        return results
+
+    async def _publish_batch(
+        self, events: list[PaymentClosedEvent]
+    ) -> list[PublishResult]:
+        try:
+            response = await self.sns_client.publish_batch(
+                TopicArn=self.topic_arn,
+                PublishBatchRequestEntries=[
+                    {"Id": str(event.id), **self._message(event)} for event in events
+                ],
+            )
+
+        except (BotoCoreClientError, BotoCoreError) as error:
+            logger.error("Error publishing batch to SNS topic", exc_info=True)
+            return [
+                PublishResult(event_id=event.id, error=str(error)) for event in events
+            ]
+
+        failed = {
+            entry["Id"]: f"{entry['Code']}: {entry.get('Message', '')}"
+            for entry in response.get("Failed", [])
+        }
+
+        logger.debug(
+            "Published batch of %d messages with %d failures, topic=%s",
+            len(events),
+            len(failed),
+            self.topic_arn,
+        )
+
+        return [
+            PublishResult(event_id=event.id, error=failed.get(str(event.id)))
+            for event in events
+        ]
+
+    def _message(self, event: PaymentClosedEvent) -> dict:
+        return {
+            "Subject": "payment-closed",
+            "Message": event.model_dump_json(),
+            "MessageGroupId": self._message_group_id(event),
+            "MessageDeduplicationId": self._deduplication_id(event),
+        }
+
+    def _message_group_id(self, event: PaymentClosedEvent) -> str:
+        if self.group_strategy == MessageGroupStrategy.PAYMENT_ID:
+            return f"{self.group_id}-{event.payment_id}"
+
+        if self.group_strategy == MessageGroupStrategy.HASHED:
+            # crc32 is stable across processes, unlike the built-in hash
+            bucket = zlib.crc32(event.payment_id.encode()) % self.group_buckets
+            return f"{self.group_id}-{bucket}"
+
+        return self.group_id
+
+    def _deduplication_id(self, event: PaymentClosedEvent) -> str:
+        if self.deduplication_strategy == DeduplicationStrategy.PAYMENT_ID:
+            return event.payment_id
+
+        return str(event.id)
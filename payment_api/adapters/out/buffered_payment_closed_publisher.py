@@ -0,0 +1,116 @@
+"""A buffering decorator for PaymentClosedPublisher implementations"""
+
+import asyncio
+import logging
+
+from payment_api.domain.events import PaymentClosedEvent
+from payment_api.domain.exceptions import EventPublishingError
+from payment_api.domain.ports.payment_closed_publisher import (
+    PaymentClosedPublisher,
+    PublishResult,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class BufferedPaymentClosedPublisher(PaymentClosedPublisher):
+    """Groups events published concurrently into publish_many calls
+
+    Events are buffered until the buffer holds max_batch_size events or until
+    flush_interval seconds passed since the first buffered event. Each caller
+    waits only for the result of its own events.
+    """
+
+    def __init__(
+        self,
+        publisher: PaymentClosedPublisher,
+        max_batch_size: int = 10,
+        flush_interval: float = 0.005,
+    ):
+        self.publisher = publisher
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval
+        self._buffer: list[tuple[PaymentClosedEvent, asyncio.Future]] = []
+        self._timer: asyncio.Task | None = None
+        self._flushes: set[asyncio.Task] = set()
+
+    async def publish(self, event: PaymentClosedEvent) -> None:
+        """Publish a payment closed event in the next batch
+
+        :param event: The payment closed event to publish
+        :return: None
+        :raises EventPublishingError: If an error occurs while publishing the event
+        """
+        (result,) = await self._enqueue([event])
+        if not result.succeeded:
+            raise EventPublishingError(
+                f"Error publishing message to SNS topic: {result.error}"
+            )
+
+    async def publish_many(
+        self, events: list[PaymentClosedEvent]
+    ) -> list[PublishResult]:
+        """Publish payment closed events in the next batches
+
+        :param events: The payment closed events to publish
+        :return: One result per event, in the same order as the events
+        """
+        return await self._enqueue(events)
+
+    async def close(self) -> None:
+        """Flush the buffered events and close the wrapped publisher
+
+        :return: None
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        self._flush_buffer()
+        await asyncio.gather(*self._flushes)
+        await self.publisher.close()
+
+    async def _enqueue(self, events: list[PaymentClosedEvent]) -> list[PublishResult]:
+        loop = asyncio.get_running_loop()
+        futures = []
+        for event in events:
+            future = loop.create_future()
+            self._buffer.append((event, future))
+            futures.append(future)
+            if len(self._buffer) >= self.max_batch_size:
+                self._flush_buffer()
+
+        if self._buffer and self._timer is None:
+            self._timer = asyncio.create_task(self._flush_later())
+
+        return list(await asyncio.gather(*futures))
+
+    async def _flush_later(self):
+        await asyncio.sleep(self.flush_interval)
+        self._timer = None
+        self._flush_buffer()
+
+    def _flush_buffer(self):
+        if not self._buffer:
+            return
+
+        entries, self._buffer = self._buffer, []
+        flush = asyncio.create_task(self._flush(entries))
+        self._flushes.add(flush)
+        flush.add_done_callback(self._flushes.discard)
+
+    async def _flush(self, entries: list[tuple[PaymentClosedEvent, asyncio.Future]]):
+        events = [event for event, _ in entries]
+        try:
+            results = await self.publisher.publish_many(events)
+        except Exception as error:  # pylint: disable=W0718
+            logger.error(
+                "Error flushing %d buffered events", len(events), exc_info=True
+            )
+            results = [
+                PublishResult(event_id=event.id, error=str(error)) for event in events
+            ]
+
+        for (_, future), result in zip(entries, results):
+            if not future.done():
+                future.set_result(result)
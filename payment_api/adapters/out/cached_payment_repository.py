@@ -0,0 +1,93 @@
+"""A read-through caching decorator for PaymentRepository implementations"""
+
+from payment_api.domain.entities import PaymentIn, PaymentOut, PaymentVersion
+from payment_api.domain.exceptions import NotFound
+from payment_api.domain.ports import PaymentRepository, SaveMode
+from payment_api.domain.value_objects import PaymentStatus
+from payment_api.infrastructure.payment_cache import PaymentCache
+
+
+class CachedPaymentRepository(PaymentRepository):
+    """Serves find_by_id, find_many_by_ids and find_version_by_id from a
+    PaymentCache and fills it on find_by_id and find_many_by_ids misses
+
+    Saved and finalized payments are invalidated in the cache, so the next
+    lookup in this process reads them again from the wrapped repository.
+    """
+
+    def __init__(self, repository: PaymentRepository, cache: PaymentCache):
+        self.repository = repository
+        self.cache = cache
+
+    async def find_by_id(self, payment_id: str) -> PaymentOut:
+        entry = self.cache.get(payment_id)
+        if entry is not None:
+            if entry.payment is None:
+                raise NotFound(f"No payment found with ID: {payment_id}")
+
+            return entry.payment
+
+        try:
+            payment = await self.repository.find_by_id(payment_id)
+        except NotFound:
+            self.cache.put_not_found(payment_id)
+            raise
+
+        self.cache.put(payment)
+        return payment
+
+    async def find_many_by_ids(self, payment_ids: list[str]) -> list[PaymentOut]:
+        payments = []
+        uncached_ids = []
+        for payment_id in payment_ids:
+            entry = self.cache.get(payment_id)
+            if entry is None:
+                uncached_ids.append(payment_id)
+            elif entry.payment is not None:
+                payments.append(entry.payment)
+
+        if not uncached_ids:
+            return payments
+
+        loaded = await self.repository.find_many_by_ids(uncached_ids)
+        for payment in loaded:
+            self.cache.put(payment)
+
+        for payment_id in set(uncached_ids) - {payment.id for payment in loaded}:
+            self.cache.put_not_found(payment_id)
+
+        return payments + loaded
+
+    async def find_version_by_id(self, payment_id: str) -> PaymentVersion:
+        entry = self.cache.get(payment_id)
+        if entry is None:
+            return await self.repository.find_version_by_id(payment_id)
+
+        if entry.payment is None:
+            raise NotFound(f"No payment found with ID: {payment_id}")
+
+        return PaymentVersion.model_validate(entry.payment)
+
+    async def exists_by_id(self, payment_id: str) -> bool:
+        return await self.repository.exists_by_id(payment_id)
+
+    async def exists_by_external_id(self, external_id: str) -> bool:
+        return await self.repository.exists_by_external_id(external_id)
+
+    async def save(
+        self, payment: PaymentIn, mode: SaveMode = SaveMode.UPSERT
+    ) -> PaymentOut:
+        try:
+            return await self.repository.save(payment, mode)
+        finally:
+            self.cache.invalidate(payment.id)
+
+    async def finalize_if_open(
+        self, payment_id: str, external_id: str, payment_status: PaymentStatus
+    ) -> PaymentOut:
+        try:
+            return await self.repository.finalize_if_open(
+                payment_id, external_id, payment_status
+            )
+        finally:
+            self.cache.invalidate(payment_id)
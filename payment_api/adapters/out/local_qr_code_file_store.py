@@ -0,0 +1,174 @@
+"""A QRCodeFileStore implementation on a local or mounted directory"""
+
+import asyncio
+import logging
+import os
+import tempfile
+import time
+
+from payment_api.application.use_cases.ports import QRCodeFileStore, QRCodeFormat
+from payment_api.domain.exceptions import PersistenceError
+
+logger = logging.getLogger(__name__)
+
+FILE_EXTENSIONS = {QRCodeFormat.PNG: "png", QRCodeFormat.SVG: "svg"}
+# Readable by other users, such as a fronting nginx serving X-Accel-Redirects
+FILE_MODE = 0o644
+# Files found are touched at most once per interval, to spare metadata writes
+TOUCH_INTERVAL = 60.0
+
+
+class LocalQRCodeFileStore(QRCodeFileStore):
+    """Stores QR code images as files named after their digest
+
+    Files are content addressed, so a file never changes once written and the
+    same directory can be shared by every process, even across hosts when it
+    is mounted from shared storage. Files are written to a temporary file and
+    renamed, so readers never see partial images. Finding a file touches it,
+    so its modification time tracks its last use. Files unused for max_age
+    seconds are evicted, and then the least recently used files until the
+    directory holds at most max_bytes, every eviction_interval seconds once
+    started.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_age: float = 7 * 24 * 3600.0,
+        max_bytes: int = 256 * 1024 * 1024,
+        eviction_interval: float = 300.0,
+    ):
+        if max_bytes <= 0:
+            raise ValueError("The QR code file store size must be positive")
+
+        self.directory = os.path.abspath(directory)
+        self.max_age = max_age
+        self.max_bytes = max_bytes
+        self.eviction_interval = eviction_interval
+        self._eviction: asyncio.Task | None = None
+
+    def path(self, file_name: str) -> str:
+        """Return the absolute path of a stored file
+
+        :param file_name: The name of the file relative to the store
+        :return: The absolute path of the file
+        """
+        return os.path.join(self.directory, file_name)
+
+    async def find(self, digest: str, image_format: QRCodeFormat) -> str | None:
+        file_name = self._file_name(digest, image_format)
+        found = await asyncio.to_thread(self._touch, self.path(file_name))
+        return file_name if found else None
+
+    async def save(
+        self, digest: str, image_format: QRCodeFormat, content: bytes
+    ) -> str:
+        file_name = self._file_name(digest, image_format)
+        try:
+            await asyncio.to_thread(self._write, self.path(file_name), content)
+        except OSError as error:
+            raise PersistenceError(
+                f"Error storing QR code file {file_name}: {str(error)}"
+            ) from error
+
+        return file_name
+
+    async def start(self) -> None:
+        """Start evicting files periodically
+
+        :return: None
+        """
+        if self._eviction is None:
+            self._eviction = asyncio.create_task(self._evict_periodically())
+
+    async def close(self) -> None:
+        """Stop evicting files
+
+        :return: None
+        """
+        if self._eviction is not None:
+            self._eviction.cancel()
+            await asyncio.gather(self._eviction, return_exceptions=True)
+            self._eviction = None
+
+    async def evict(self) -> int:
+        """Evict the files unused for max_age and then the least recently used
+        files over max_bytes
+
+        :return: The number of evicted files
+        """
+        return await asyncio.to_thread(self._evict)
+
+    @staticmethod
+    def _file_name(digest: str, image_format: QRCodeFormat) -> str:
+        # Spread the files over subdirectories to keep directories small
+        return f"{digest[:2]}/{digest}.{FILE_EXTENSIONS[QRCodeFormat(image_format)]}"
+
+    @staticmethod
+    def _touch(path: str) -> bool:
+        try:
+            modified_at = os.stat(path).st_mtime
+            if time.time() - modified_at >= TOUCH_INTERVAL:
+                os.utime(path)
+        except FileNotFoundError:
+            return False
+
+        return True
+
+    @staticmethod
+    def _write(path: str, content: bytes) -> None:
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        descriptor, temporary_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                file.write(content)
+                # mkstemp creates the file readable by its owner only
+                os.fchmod(file.fileno(), FILE_MODE)
+
+            os.replace(temporary_path, path)
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
+
+    def _evict(self) -> int:
+        files = []
+        for root, _, names in os.walk(self.directory):
+            for name in names:
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+
+                files.append((stat.st_mtime, stat.st_size, path))
+
+        files.sort()
+        total_bytes = sum(size for _, size, _ in files)
+        expired_before = time.time() - self.max_age
+        evicted = 0
+        for modified_at, size, path in files:
+            if modified_at >= expired_before and total_bytes <= self.max_bytes:
+                break
+
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+
+            total_bytes -= size
+            evicted += 1
+
+        return evicted
+
+    async def _evict_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.eviction_interval)
+            try:
+                evicted = await self.evict()
+            except OSError:
+                logger.warning("Failed to evict QR code files", exc_info=True)
+                continue
+
+            if evicted:
+                logger.info("Evicted %d QR code files", evicted)
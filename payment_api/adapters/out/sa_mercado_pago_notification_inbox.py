@@ -0,0 +1,187 @@
+"""SQL Alchemy implementation of the MercadoPagoNotificationInbox port"""
+
+from datetime import timedelta
+
+from sqlalchemy import and_, case, func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from payment_api.application.use_cases.ports import (
+    MercadoPagoNotification,
+    MercadoPagoNotificationInbox,
+    MercadoPagoNotificationStatus,
+)
+from payment_api.domain.exceptions import PersistenceError
+from payment_api.infrastructure.orm.models import (
+    MercadoPagoNotification as MercadoPagoNotificationModel,
+)
+
+
+class SAMercadoPagoNotificationInbox(MercadoPagoNotificationInbox):
+    """A SQL Alchemy implementation of the MercadoPagoNotificationInbox port"""
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        lock_timeout: float = 60.0,
+        max_attempts: int = 5,
+    ):
+        self.session = session
+        self.lock_timeout = lock_timeout
+        self.max_attempts = max_attempts
+
+    async def enqueue(self, resource_id: str) -> bool:
+        try:
+            result = await self.session.execute(
+                insert(MercadoPagoNotificationModel)
+                .values(
+                    resource_id=resource_id,
+                    status=MercadoPagoNotificationStatus.PENDING,
+                    attempts=0,
+                )
+                .on_conflict_do_nothing(
+                    index_elements=[MercadoPagoNotificationModel.resource_id]
+                )
+                .returning(MercadoPagoNotificationModel.resource_id)
+            )
+
+            enqueued = result.scalar() is not None
+            await self.session.commit()
+            return enqueued
+
+        except (SQLAlchemyError, OSError) as error:
+            raise PersistenceError(
+                f"Error enqueuing Mercado Pago notification {resource_id}: {str(error)}"
+            ) from error
+
+    async def claim(self, limit: int) -> list[MercadoPagoNotification]:
+        model = MercadoPagoNotificationModel
+        now = func.now()  # pylint: disable=E1102
+        stale_lock = now - timedelta(seconds=self.lock_timeout)
+        stale = and_(
+            model.status == MercadoPagoNotificationStatus.PROCESSING,
+            model.locked_at < stale_lock,
+        )
+
+        claimable = (
+            select(model.resource_id)
+            .where(
+                or_(
+                    model.status == MercadoPagoNotificationStatus.PENDING,
+                    and_(stale, model.attempts < self.max_attempts),
+                )
+            )
+            .order_by(model.created_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+
+        try:
+            # Notifications whose every attempt crashed or hung the worker are
+            # failed instead of being claimed again every lock timeout
+            await self.session.execute(
+                update(model)
+                .where(stale, model.attempts >= self.max_attempts)
+                .values(
+                    status=MercadoPagoNotificationStatus.FAILED,
+                    error=f"Lock timed out after {self.max_attempts} attempts",
+                    locked_at=None,
+                )
+            )
+
+            result = await self.session.execute(
+                update(model)
+                .where(model.resource_id.in_(claimable.scalar_subquery()))
+                .values(
+                    status=MercadoPagoNotificationStatus.PROCESSING,
+                    attempts=model.attempts + 1,
+                    locked_at=now,
+                )
+                .returning(model)
+            )
+
+            notifications = [
+                MercadoPagoNotification.model_validate(notification)
+                for notification in result.scalars().all()
+            ]
+
+            await self.session.commit()
+            return notifications
+
+        except (SQLAlchemyError, OSError) as error:
+            raise PersistenceError(
+                f"Error claiming Mercado Pago notifications: {str(error)}"
+            ) from error
+
+    async def is_processed(self, resource_id: str) -> bool:
+        model = MercadoPagoNotificationModel
+        try:
+            result = await self.session.execute(
+                select(model.resource_id).where(
+                    model.resource_id == resource_id,
+                    model.status == MercadoPagoNotificationStatus.PROCESSED,
+                )
+            )
+
+            return result.scalar() is not None
+
+        except (SQLAlchemyError, OSError) as error:
+            raise PersistenceError(
+                f"Error checking Mercado Pago notification {resource_id}: {str(error)}"
+            ) from error
+
+    async def mark_processed(self, resource_id: str) -> None:
+        model = MercadoPagoNotificationModel
+        statement = insert(model).values(
+            resource_id=resource_id,
+            status=MercadoPagoNotificationStatus.PROCESSED,
+            attempts=1,
+        )
+
+        try:
+            await self.session.execute(
+                statement.on_conflict_do_update(
+                    index_elements=[model.resource_id],
+                    set_={
+                        "st_notificacao": statement.excluded.st_notificacao,
+                        "ds_erro": None,
+                        "dt_bloqueio": None,
+                        "timestamp": func.now(),  # pylint: disable=E1102
+                    },
+                )
+            )
+
+            await self.session.commit()
+
+        except (SQLAlchemyError, OSError) as error:
+            raise PersistenceError(
+                f"Error marking Mercado Pago notification {resource_id} as processed: "
+                f"{str(error)}"
+            ) from error
+
+    async def mark_failed(self, resource_id: str, error: str, retry: bool) -> None:
+        model = MercadoPagoNotificationModel
+        max_attempts = self.max_attempts if retry else 0
+        status = case(
+            (
+                model.attempts < max_attempts,
+                MercadoPagoNotificationStatus.PENDING.value,
+            ),
+            else_=MercadoPagoNotificationStatus.FAILED.value,
+        )
+
+        try:
+            await self.session.execute(
+                update(model)
+                .where(model.resource_id == resource_id)
+                .values(status=status, error=error, locked_at=None)
+            )
+
+            await self.session.commit()
+
+        except (SQLAlchemyError, OSError) as db_error:
+            raise PersistenceError(
+                f"Error marking Mercado Pago notification {resource_id} as failed: "
+                f"{str(db_error)}"
+            ) from db_error
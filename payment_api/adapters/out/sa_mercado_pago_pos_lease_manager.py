@@ -0,0 +1,104 @@
+"""SQL Alchemy implementation of the MercadoPagoPOSLeaseManager port"""
+
+from datetime import datetime, timezone
+
+from sqlalchemy import and_, or_, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from payment_api.application.use_cases.ports import (
+    MercadoPagoPOSLeaseManager,
+    MercadoPagoPOSLeaseStrategy,
+)
+from payment_api.domain.exceptions import PersistenceError
+from payment_api.infrastructure.orm.models import (
+    MercadoPagoPOSLease as MercadoPagoPOSLeaseModel,
+)
+
+
+class SAMercadoPagoPOSLeaseManager(MercadoPagoPOSLeaseManager):
+    """A SQL Alchemy implementation of the MercadoPagoPOSLeaseManager port
+
+    Leases are stored in one row per point of sale, so they are shared by every
+    replica. Round robin leases the free point of sale that was leased the
+    longest ago, and least loaded leases the one that was leased the fewest times.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        pos_ids: list[str],
+        strategy: MercadoPagoPOSLeaseStrategy = MercadoPagoPOSLeaseStrategy.ROUND_ROBIN,
+    ):
+        if not pos_ids:
+            raise ValueError("The point of sale pool cannot be empty")
+
+        self.session = session
+        self.pos_ids = list(dict.fromkeys(pos_ids))
+        self.strategy = strategy
+
+    async def acquire(self, payment_id: str, expires_at: datetime) -> str | None:
+        model = MercadoPagoPOSLeaseModel
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        order_by = [model.leased_at.asc().nulls_first(), model.pos]
+        if self.strategy == MercadoPagoPOSLeaseStrategy.LEAST_LOADED:
+            order_by.insert(0, model.leases.asc())
+
+        free = (
+            select(model.pos)
+            .where(
+                and_(
+                    model.pos.in_(self.pos_ids),
+                    or_(model.payment_id.is_(None), model.expires_at < now),
+                )
+            )
+            .order_by(*order_by)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        )
+
+        try:
+            await self.session.execute(
+                insert(model)
+                .values([{"pos": pos, "leases": 0} for pos in self.pos_ids])
+                .on_conflict_do_nothing(index_elements=[model.pos])
+            )
+
+            result = await self.session.execute(
+                update(model)
+                .where(model.pos.in_(free.scalar_subquery()))
+                .values(
+                    payment_id=payment_id,
+                    leases=model.leases + 1,
+                    leased_at=now,
+                    expires_at=expires_at.astimezone(timezone.utc).replace(tzinfo=None),
+                )
+                .returning(model.pos)
+            )
+
+            pos = result.scalar()
+            await self.session.commit()
+            return pos
+
+        except (SQLAlchemyError, OSError) as error:
+            raise PersistenceError(
+                f"Error leasing a point of sale to payment {payment_id}: {str(error)}"
+            ) from error
+
+    async def release(self, payment_id: str) -> None:
+        model = MercadoPagoPOSLeaseModel
+        try:
+            await self.session.execute(
+                update(model)
+                .where(model.payment_id == payment_id)
+                .values(payment_id=None, expires_at=None)
+            )
+
+            await self.session.commit()
+
+        except (SQLAlchemyError, OSError) as error:
+            raise PersistenceError(
+                f"Error releasing the point of sale leased to payment {payment_id}: "
+                f"{str(error)}"
+            ) from error
@@ -0,0 +1,184 @@
+"""SQL Alchemy implementation of the PaymentClosedOutbox port"""
+
+from datetime import timedelta
+from uuid import UUID
+
+from sqlalchemy import and_, case, delete, func, insert, or_, select, update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from payment_api.domain.events import PaymentClosedEvent
+from payment_api.domain.exceptions import PersistenceError
+from payment_api.domain.ports import PaymentClosedOutbox
+from payment_api.infrastructure.orm.models import (
+    OutboxEventStatus,
+)
+from payment_api.infrastructure.orm.models import (
+    PaymentClosedOutboxEvent as PaymentClosedOutboxEventModel,
+)
+
+
+class SAPaymentClosedOutbox(PaymentClosedOutbox):
+    """A SQL Alchemy implementation of the PaymentClosedOutbox port"""
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        lock_timeout: float = 60.0,
+        max_attempts: int = 10,
+        sent_retention: float = 7 * 24 * 3600.0,
+    ):
+        self.session = session
+        self.lock_timeout = lock_timeout
+        self.max_attempts = max_attempts
+        self.sent_retention = sent_retention
+
+    async def add(self, event: PaymentClosedEvent) -> None:
+        try:
+            await self.session.execute(
+                insert(PaymentClosedOutboxEventModel).values(
+                    id=str(event.id),
+                    payment_id=event.payment_id,
+                    payload=event.model_dump_json(),
+                    status=OutboxEventStatus.PENDING,
+                    attempts=0,
+                )
+            )
+
+        except (SQLAlchemyError, OSError) as error:
+            raise PersistenceError(
+                f"Error adding PaymentClosedEvent {event.id} to the outbox: "
+                f"{str(error)}"
+            ) from error
+
+    async def claim(self, limit: int) -> list[PaymentClosedEvent]:
+        model = PaymentClosedOutboxEventModel
+        now = func.now()  # pylint: disable=E1102
+        stale_lock = now - timedelta(seconds=self.lock_timeout)
+        stale = and_(
+            model.status == OutboxEventStatus.PENDING,
+            model.locked_at < stale_lock,
+        )
+
+        claimable = (
+            select(model.id)
+            .where(
+                or_(
+                    and_(
+                        model.status == OutboxEventStatus.PENDING,
+                        model.locked_at.is_(None),
+                    ),
+                    and_(stale, model.attempts < self.max_attempts),
+                )
+            )
+            .order_by(model.created_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+
+        try:
+            # Events whose every attempt crashed or hung the relay are failed
+            # instead of being claimed again every lock timeout
+            await self.session.execute(
+                update(model)
+                .where(stale, model.attempts >= self.max_attempts)
+                .values(
+                    status=OutboxEventStatus.FAILED,
+                    error=f"Lock timed out after {self.max_attempts} attempts",
+                    locked_at=None,
+                )
+            )
+
+            result = await self.session.execute(
+                update(model)
+                .where(model.id.in_(claimable.scalar_subquery()))
+                .values(attempts=model.attempts + 1, locked_at=now)
+                .returning(model.payload, model.created_at)
+            )
+
+            events = [
+                PaymentClosedEvent.model_validate_json(payload)
+                for payload, _ in sorted(result.all(), key=lambda row: row[1])
+            ]
+
+            await self.session.commit()
+            return events
+
+        except (SQLAlchemyError, OSError) as error:
+            raise PersistenceError(
+                f"Error claiming PaymentClosedEvents from the outbox: {str(error)}"
+            ) from error
+
+    async def mark_sent(self, event_ids: list[UUID]) -> None:
+        if not event_ids:
+            return
+
+        model = PaymentClosedOutboxEventModel
+        try:
+            await self.session.execute(
+                update(model)
+                .where(model.id.in_([str(event_id) for event_id in event_ids]))
+                .values(
+                    status=OutboxEventStatus.SENT,
+                    error=None,
+                    locked_at=None,
+                    sent_at=func.now(),  # pylint: disable=E1102
+                )
+            )
+
+            await self.session.commit()
+
+        except (SQLAlchemyError, OSError) as error:
+            raise PersistenceError(
+                f"Error marking PaymentClosedEvents as sent: {str(error)}"
+            ) from error
+
+    async def purge_sent(self, limit: int) -> int:
+        model = PaymentClosedOutboxEventModel
+        sent_before = func.now() - timedelta(  # pylint: disable=E1102
+            seconds=self.sent_retention
+        )
+
+        purgeable = (
+            select(model.id)
+            .where(model.status == OutboxEventStatus.SENT, model.sent_at < sent_before)
+            .limit(limit)
+        )
+
+        try:
+            result = await self.session.execute(
+                delete(model)
+                .where(model.id.in_(purgeable.scalar_subquery()))
+                .returning(model.id)
+            )
+
+            purged = len(result.all())
+            await self.session.commit()
+            return purged
+
+        except (SQLAlchemyError, OSError) as error:
+            raise PersistenceError(
+                f"Error purging sent PaymentClosedEvents: {str(error)}"
+            ) from error
+
+    async def mark_failed(self, event_id: UUID, error: str) -> None:
+        model = PaymentClosedOutboxEventModel
+        status = case(
+            (model.attempts < self.max_attempts, OutboxEventStatus.PENDING.value),
+            else_=OutboxEventStatus.FAILED.value,
+        )
+
+        try:
+            await self.session.execute(
+                update(model)
+                .where(model.id == str(event_id))
+                .values(status=status, error=error)
+            )
+
+            await self.session.commit()
+
+        except (SQLAlchemyError, OSError) as db_error:
+            raise PersistenceError(
+                f"Error marking PaymentClosedEvent {event_id} as failed: "
+                f"{str(db_error)}"
+            ) from db_error
@@ -1,13 +1,128 @@
 """SQL Alchemy implementation of the PaymentRepository port"""
 
-from sqlalchemy import exists, insert, select, update
-from sqlalchemy.exc import NoResultFound, SQLAlchemyError
+from sqlalchemy import (
+    BindParameter,
+    Column,
+    Select,
+    Table,
+    Text,
+    bindparam,
+    case,
+    cast,
+    exists,
+    false,
+    func,
+    insert,
+    literal_column,
+    null,
+    select,
+    true,
+    update,
+)
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import IntegrityError, NoResultFound, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from payment_api.domain.entities import PaymentIn, PaymentOut
+from payment_api.domain.entities import PaymentIn, PaymentOut, PaymentVersion
 from payment_api.domain.exceptions import NotFound, PersistenceError
-from payment_api.domain.ports import PaymentRepository
+from payment_api.domain.ports import PaymentRepository, SaveMode
+from payment_api.domain.value_objects import PaymentStatus
 from payment_api.infrastructure.orm.models import Payment as PaymentModel
+from payment_api.infrastructure.payment_status_notifications import (
+    PAYMENT_STATUS_CHANNEL,
+)
+
+
+def _saved(statement, inserted) -> Select:
+    """Wrap a payment INSERT or UPDATE in a CTE that returns the saved payment
+    and notifies its new version unless it was inserted"""
+
+    saved = statement.returning(
+        *(column.label(key) for key, column in PaymentModel.__mapper__.columns.items()),
+        inserted.label("inserted"),
+    ).cte("saved")
+
+    version = func.json_build_object(
+        "id",
+        saved.c.id,
+        "payment_status",
+        saved.c.payment_status,
+        "timestamp",
+        saved.c.timestamp,
+    )
+
+    notification = case(
+        (saved.c.inserted, null()),
+        else_=func.pg_notify(PAYMENT_STATUS_CHANNEL, cast(version, Text)),
+    )
+
+    return select(saved, notification.label("notification"))
+
+
+def _save_statements() -> dict[SaveMode, Select]:
+    table: Table = PaymentModel.__table__  # type: ignore[assignment]
+    columns = PaymentModel.__mapper__.columns
+    values: dict[Column, BindParameter] = {
+        columns[key]: bindparam(key) for key in PaymentIn.model_fields
+    }
+
+    upsert = postgresql.insert(table).values(values)
+    upsert = upsert.on_conflict_do_update(
+        index_elements=[table.c.id],
+        set_={
+            **{
+                column: upsert.excluded[column.name]
+                for column in values
+                if column is not table.c.id
+            },
+            table.c.timestamp: func.now(),  # pylint: disable=E1102
+        },
+    )
+
+    return {
+        SaveMode.INSERT: _saved(insert(table).values(values), true()),
+        SaveMode.UPDATE: _saved(
+            update(table).where(table.c.id == bindparam("id")).values(values),
+            false(),
+        ),
+        # xmax is only zero on rows inserted by the statement
+        SaveMode.UPSERT: _saved(upsert, literal_column("xmax = 0")),
+    }
+
+
+def _finalize_statement() -> Select:
+    table: Table = PaymentModel.__table__  # type: ignore[assignment]
+    columns = PaymentModel.__mapper__.columns
+    statement = (
+        update(table)
+        .where(
+            table.c.id == bindparam("payment_id"),
+            columns["payment_status"] == PaymentStatus.OPENED,
+        )
+        .values(
+            {
+                columns["external_id"]: bindparam("external_id"),
+                columns["payment_status"]: bindparam("payment_status"),
+            }
+        )
+    )
+
+    return _saved(statement, false())
+
+
+# The statements are built once, so executing them only binds their parameters
+# and SQLAlchemy finds them in its compiled cache without generating their cache
+# keys again, and asyncpg reuses the statements it prepared on each connection
+FIND_BY_ID = select(PaymentModel).where(PaymentModel.id == bindparam("payment_id"))
+FIND_VERSION_BY_ID = select(
+    PaymentModel.id, PaymentModel.payment_status, PaymentModel.timestamp
+).where(PaymentModel.id == bindparam("payment_id"))
+EXISTS_BY_ID = select(exists().where(PaymentModel.id == bindparam("payment_id")))
+EXISTS_BY_EXTERNAL_ID = select(
+    exists().where(PaymentModel.external_id == bindparam("external_id"))
+)
+SAVE = _save_statements()
+FINALIZE_IF_OPEN = _finalize_statement()
 
 
 class SAPaymentRepository(PaymentRepository):
@@ -18,9 +133,7 @@ class SAPaymentRepository(PaymentRepository):
 
     async def find_by_id(self, payment_id: str) -> PaymentOut:
         try:
-            result = await self.session.execute(
-                select(PaymentModel).where(PaymentModel.id == payment_id)
-            )
+            result = await self.session.execute(FIND_BY_ID, {"payment_id": payment_id})
 
             return PaymentOut.model_validate(result.scalars().one())
 
@@ -32,10 +145,42 @@ class SAPaymentRepository(PaymentRepository):
                 f"Error finding payment by ID {payment_id}: {str(error)}"
             ) from error
 
+    async def find_many_by_ids(self, payment_ids: list[str]) -> list[PaymentOut]:
+        if not payment_ids:
+            return []
+
+        try:
+            result = await self.session.execute(
+                select(PaymentModel).where(PaymentModel.id.in_(payment_ids))
+            )
+
+            return [PaymentOut.model_validate(row) for row in result.scalars()]
+
+        except (SQLAlchemyError, OSError) as error:
+            raise PersistenceError(
+                f"Error finding payments by IDs: {str(error)}"
+            ) from error
+
+    async def find_version_by_id(self, payment_id: str) -> PaymentVersion:
+        try:
+            result = await self.session.execute(
+                FIND_VERSION_BY_ID, {"payment_id": payment_id}
+            )
+
+            return PaymentVersion.model_validate(result.one())
+
+        except NoResultFound as error:
+            raise NotFound(f"No payment found with ID: {payment_id}") from error
+
+        except (SQLAlchemyError, OSError) as error:
+            raise PersistenceError(
+                f"Error finding payment version by ID {payment_id}: {str(error)}"
+            ) from error
+
     async def exists_by_id(self, payment_id: str) -> bool:
         try:
             result = await self.session.execute(
-                select(exists().where(PaymentModel.id == payment_id))
+                EXISTS_BY_ID, {"payment_id": payment_id}
             )
 
             return result.scalar()
@@ -48,7 +193,7 @@ class SAPaymentRepository(PaymentRepository):
     async def exists_by_external_id(self, external_id: str) -> bool:
         try:
             result = await self.session.execute(
-                select(exists().where(PaymentModel.external_id == external_id))
+                EXISTS_BY_EXTERNAL_ID, {"external_id": external_id}
             )
 
             return result.scalar()
@@ -59,63 +204,98 @@ class SAPaymentRepository(PaymentRepository):
                 f"{str(error)}"
             ) from error
 
-    async def save(self, payment: PaymentIn) -> PaymentOut:
-        """Save a payment into the repository
+    async def save(
+        self, payment: PaymentIn, mode: SaveMode = SaveMode.UPSERT
+    ) -> PaymentOut:
+        """Save a payment into the repository with a single statement
+
+        Upserts run INSERT ... ON CONFLICT (id) DO UPDATE, so concurrent writers
+        of the same payment never race between checking and writing it. When a
+        payment is updated, its new version is notified on the payment status
+        channel by the same statement, and Postgres delivers the notification
+        to the listeners on commit.
+
         :param payment: Payment to be saved
         :type payment: PaymentIn
+        :param mode: Whether the payment is inserted, updated or either
+        :type mode: SaveMode
         :return: Saved Payment
         :rtype: PaymentOut
+        :raises NotFound: If the payment does not exist and mode is UPDATE
+        :raises PersistenceError: If the payment cannot be saved
         """
 
-        if await self.exists_by_id(payment_id=payment.id):
-            return await self._update(payment=payment)
-        return await self._insert(payment=payment)
-
-    async def _insert(self, payment: PaymentIn) -> PaymentOut:
-        """Insert a new payment into the repository
-
-        :param payment: Payment to be inserted
-        :type payment: PaymentIn
-        :return: Inserted Payment
-        :rtype: PaymentOut
-        """
         try:
             result = await self.session.execute(
-                insert(PaymentModel)
-                .values(**payment.model_dump())
-                .returning(PaymentModel)
+                SAVE[SaveMode(mode)], payment.model_dump()
             )
-
-            inserted_payment = PaymentOut.model_validate(result.scalars().one())
+            saved_payment = PaymentOut.model_validate(result.one())
             await self.session.commit()
-            return inserted_payment
+            return saved_payment
+
+        except NoResultFound as error:
+            raise NotFound(f"No payment found with ID: {payment.id}") from error
 
         except (SQLAlchemyError, OSError) as error:
             raise PersistenceError(
-                f"Error inserting payment {payment.id}: {str(error)}"
+                f"Error saving payment {payment.id}: {str(error)}"
             ) from error
 
-    async def _update(self, payment: PaymentIn) -> PaymentOut:
-        """Update an existing payment in the repository
+    async def finalize_if_open(
+        self, payment_id: str, external_id: str, payment_status: PaymentStatus
+    ) -> PaymentOut:
+        """Finalize a payment with a compare-and-set UPDATE
 
-        :param payment: Payment to be updated
-        :type payment: PaymentIn
-        :return: Updated Payment
+        The payment is only updated while its status is still OPENED, so of
+        concurrent finalizations of the same payment exactly one succeeds. The
+        new version is notified on the payment status channel by the same
+        statement. The payment is only read again when it was not updated, to
+        tell a missing payment from a finalized one.
+
+        :param payment_id: ID of the payment to be finalized
+        :type payment_id: str
+        :param external_id: External ID to set on the payment
+        :type external_id: str
+        :param payment_status: Final status of the payment
+        :type payment_status: PaymentStatus
+        :return: Finalized Payment
         :rtype: PaymentOut
+        :raises NotFound: If the payment does not exist
+        :raises ValueError: If the payment is not opened anymore, if the final
+            status is OPENED or if another payment has the external ID
+        :raises PersistenceError: If the payment cannot be finalized
         """
+
+        if payment_status == PaymentStatus.OPENED:
+            raise ValueError(f"Unable to finalize payment {payment_id} as OPENED")
+
         try:
             result = await self.session.execute(
-                update(PaymentModel)
-                .where(PaymentModel.id == payment.id)
-                .values(**payment.model_dump())
-                .returning(PaymentModel)
+                FINALIZE_IF_OPEN,
+                {
+                    "payment_id": payment_id,
+                    "external_id": external_id,
+                    "payment_status": payment_status,
+                },
             )
+            row = result.one_or_none()
+            if row is not None:
+                finalized_payment = PaymentOut.model_validate(row)
+                await self.session.commit()
+                return finalized_payment
 
-            updated_payment = PaymentOut.model_validate(result.scalars().one())
-            await self.session.commit()
-            return updated_payment
+        except IntegrityError as error:
+            raise ValueError(
+                f"Payment with external ID {external_id} already exists"
+            ) from error
 
         except (SQLAlchemyError, OSError) as error:
             raise PersistenceError(
-                f"Error updating payment {payment.id}: {str(error)}"
+                f"Error finalizing payment {payment_id}: {str(error)}"
             ) from error
+
+        version = await self.find_version_by_id(payment_id=payment_id)
+        raise ValueError(
+            f"Unable to update a payment status from {version.payment_status.value} "
+            f"to {payment_status.value}"
+        )
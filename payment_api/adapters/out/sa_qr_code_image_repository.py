@@ -0,0 +1,64 @@
+"""SQL Alchemy implementation of the QRCodeImageRepository port"""
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from payment_api.application.use_cases.ports import (
+    QRCodeImage,
+    QRCodeImageRepository,
+)
+from payment_api.domain.exceptions import PersistenceError
+from payment_api.infrastructure.orm.models import (
+    PaymentQRCodeImage as PaymentQRCodeImageModel,
+)
+
+
+class SAQRCodeImageRepository(QRCodeImageRepository):
+    """A SQL Alchemy implementation of the QRCodeImageRepository port"""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def find(self, payment_id: str) -> QRCodeImage | None:
+        try:
+            result = await self.session.execute(
+                select(
+                    PaymentQRCodeImageModel.digest, PaymentQRCodeImageModel.content
+                ).where(PaymentQRCodeImageModel.payment_id == payment_id)
+            )
+
+            row = result.one_or_none()
+            if row is None:
+                return None
+
+            return QRCodeImage(digest=row.digest, content=row.content)
+
+        except (SQLAlchemyError, OSError) as error:
+            raise PersistenceError(
+                f"Error finding QR code image of payment {payment_id}: {str(error)}"
+            ) from error
+
+    async def save(self, payment_id: str, image: QRCodeImage) -> None:
+        try:
+            statement = insert(PaymentQRCodeImageModel).values(
+                payment_id=payment_id, digest=image.digest, content=image.content
+            )
+
+            await self.session.execute(
+                statement.on_conflict_do_update(
+                    index_elements=[PaymentQRCodeImageModel.payment_id],
+                    set_={
+                        "cd_digest": statement.excluded.cd_digest,
+                        "bn_imagem": statement.excluded.bn_imagem,
+                    },
+                )
+            )
+
+            await self.session.commit()
+
+        except (SQLAlchemyError, OSError) as error:
+            raise PersistenceError(
+                f"Error saving QR code image of payment {payment_id}: {str(error)}"
+            ) from error
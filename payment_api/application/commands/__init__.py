@@ -5,12 +5,15 @@ from .finalize_payment_by_mercado_pago_payment_id import (
     FinalizePaymentByMercadoPagoPaymentIdCommand,
 )
 from .find_payment_by_id import FindPaymentByIdCommand
-from .render_qr_code import RenderQRCodeCommand
+from .find_payments_by_ids import FindPaymentsByIdsCommand
+from .render_qr_code import QRCodeOptionsDTO, RenderQRCodeCommand
 
 __all__ = [
     "CreatePaymentFromOrderCommand",
     "FindPaymentByIdCommand",
+    "FindPaymentsByIdsCommand",
     "RenderQRCodeCommand",
+    "QRCodeOptionsDTO",
     "FinalizePaymentByMercadoPagoPaymentIdCommand",
     "ProductDTO",
 ]
@@ -0,0 +1,11 @@
+"""Module defining the command to find many payments by their IDs"""
+
+from pydantic import BaseModel, Field
+
+
+class FindPaymentsByIdsCommand(BaseModel):
+    """Command to find many payments by their IDs"""
+
+    payment_ids: list[str] = Field(
+        ..., min_length=1, description="Unique identifiers for the payments"
+    )
@@ -1,9 +1,35 @@
 """Command to render a QR code for a payment"""
 
+from typing import Literal
+
 from pydantic import BaseModel, Field
 
+from payment_api.domain.value_objects import QRCodeFormat
+
+
+class QRCodeOptionsDTO(BaseModel):
+    """Data transfer object for the options of a rendered QR code image"""
+
+    format: QRCodeFormat = Field(
+        QRCodeFormat.PNG, description="Media type of the image"
+    )
+    box_size: int = Field(10, ge=1, description="Size in pixels of each module")
+    border: int = Field(4, ge=0, description="Width in modules of the quiet zone")
+    error_correction: Literal["L", "M", "Q", "H"] = Field(
+        "M", description="Error correction level of the code"
+    )
+
 
 class RenderQRCodeCommand(BaseModel):
     """Command to render a QR code for a payment"""
 
     payment_id: str = Field(..., description="The unique identifier of the payment")
+    options: QRCodeOptionsDTO = Field(
+        default_factory=lambda: QRCodeOptionsDTO(),
+        description="The options of the image",
+    )
+    render: bool = Field(
+        True,
+        description="Whether to render the QR code, or only return it if it was "
+        "already rendered",
+    )
@@ -5,11 +5,15 @@ from .finalize_payment_by_mercado_pago_payment_id import (
     FinalizePaymentByMercadoPagoPaymentIdUseCase,
 )
 from .find_payment_by_id import FindPaymentByIdUseCase
+from .find_payment_version_by_id import FindPaymentVersionByIdUseCase
+from .find_payments_by_ids import FindPaymentsByIdsUseCase
 from .render_qr_code import RenderQRCodeUseCase
 
 __all__ = [
     "CreatePaymentFromOrderUseCase",
     "FindPaymentByIdUseCase",
+    "FindPaymentVersionByIdUseCase",
+    "FindPaymentsByIdsUseCase",
     "RenderQRCodeUseCase",
     "FinalizePaymentByMercadoPagoPaymentIdUseCase",
 ]
@@ -4,9 +4,14 @@ import logging
 from datetime import datetime, timedelta, timezone
 
 from payment_api.application.commands import CreatePaymentFromOrderCommand
+from payment_api.application.use_cases.ports import (
+    AbstractQRCodeRenderer,
+    QRCodeImage,
+    QRCodeImageRepository,
+)
 from payment_api.domain.entities import PaymentIn, PaymentOut, Product
 from payment_api.domain.exceptions import PaymentCreationError
-from payment_api.domain.ports import PaymentGateway, PaymentRepository
+from payment_api.domain.ports import PaymentGateway, PaymentRepository, SaveMode
 from payment_api.domain.value_objects import PaymentStatus
 
 logger = logging.getLogger(__name__)
@@ -19,13 +24,22 @@ class CreatePaymentFromOrderUseCase:
         self,
         payment_repository: PaymentRepository,
         payment_gateway: PaymentGateway,
+        qr_code_renderer: AbstractQRCodeRenderer | None = None,
+        qr_code_image_repository: QRCodeImageRepository | None = None,
     ):
         self.payment_repository = payment_repository
         self.payment_gateway = payment_gateway
+        self.qr_code_renderer = qr_code_renderer
+        self.qr_code_image_repository = qr_code_image_repository
 
     async def execute(self, command: CreatePaymentFromOrderCommand) -> PaymentOut:
         """Execute the use case to create a new payment
 
+        When a QR code renderer and image repository are given, the QR code of
+        the created payment is rendered and stored too, so it does not have to
+        be rendered when it is first requested. Failing to do so does not fail
+        the payment creation.
+
         :param command: command containing the details for payment creation
         :type command: CreatePaymentFromOrderCommand
         :return: PaymentOut entity representing the created payment
@@ -67,4 +81,35 @@ class CreatePaymentFromOrderUseCase:
         payment = await self.payment_gateway.create(payment=payment, products=products)
 
         # save payment in repository
-        return await self.payment_repository.save(payment=payment)
+        saved_payment = await self.payment_repository.save(
+            payment=payment, mode=SaveMode.INSERT
+        )
+
+        # pre-render QR code
+        await self._pre_render_qr_code(payment=saved_payment)
+        return saved_payment
+
+    async def _pre_render_qr_code(self, payment: PaymentOut) -> None:
+        if (
+            self.qr_code_renderer is None
+            or self.qr_code_image_repository is None
+            or not payment.qr_code
+        ):
+            return
+
+        try:
+            image = QRCodeImage(
+                digest=self.qr_code_renderer.digest(data=payment.qr_code),
+                content=await self.qr_code_renderer.render_async(data=payment.qr_code),
+            )
+
+            await self.qr_code_image_repository.save(payment_id=payment.id, image=image)
+
+        # Pre-rendering is optional, so no renderer or storage failure may fail
+        # the creation of a payment that is already committed
+        except Exception:  # pylint: disable=W0718
+            logger.warning(
+                "Failed to pre-render the QR code of payment ID %s",
+                payment.id,
+                exc_info=True,
+            )
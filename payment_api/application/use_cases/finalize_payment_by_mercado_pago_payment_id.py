@@ -7,11 +7,12 @@ from payment_api.application.commands import (
 )
 from payment_api.application.use_cases.ports import (
     AbstractMercadoPagoClient,
+    MercadoPagoPOSLeaseManager,
     MPOrderStatus,
 )
 from payment_api.domain.entities import PaymentIn, PaymentOut
 from payment_api.domain.events import PaymentClosedEvent
-from payment_api.domain.ports import PaymentClosedPublisher, PaymentRepository
+from payment_api.domain.ports import PaymentClosedOutbox, PaymentRepository
 from payment_api.domain.value_objects import PaymentStatus
 
 logger = logging.getLogger(__name__)
@@ -24,17 +25,24 @@ class FinalizePaymentByMercadoPagoPaymentIdUseCase:
         self,
         payment_repository: PaymentRepository,
         mercado_pago_client: AbstractMercadoPagoClient,
-        payment_closed_publisher: PaymentClosedPublisher,
+        payment_closed_outbox: PaymentClosedOutbox,
+        pos_lease_manager: MercadoPagoPOSLeaseManager | None = None,
     ):
         self.payment_repository = payment_repository
         self.mercado_pago_client = mercado_pago_client
-        self.payment_closed_publisher = payment_closed_publisher
+        self.payment_closed_outbox = payment_closed_outbox
+        self.pos_lease_manager = pos_lease_manager
 
     async def execute(
         self, command: FinalizePaymentByMercadoPagoPaymentIdCommand
     ) -> PaymentOut:
         """Finalize a payment using Mercado Pago payment ID
 
+        When a point of sale lease manager is given, the point of sale leased to
+        the payment is released once the payment is closed or expired. Failing to
+        do so does not fail the finalization, as the lease ends when the order
+        expires anyway.
+
         :param command: command containing the Mercado Pago payment ID
         :type command: FinalizePaymentByMercadoPagoPaymentIdCommand
         :return: Finalized Payment
@@ -42,10 +50,9 @@ class FinalizePaymentByMercadoPagoPaymentIdUseCase:
         :raises NotFound: if the payment is not found
         :raises PersistenceError: if there is an error during data persistence to
             the repository
-        :raises ValueError: if the payment cannot be finalized due to its current status
+        :raises ValueError: if the payment cannot be finalized due to its current status,
+            or because the Mercado Pago order is still opened
         :raises MPClientError: if there is an error communicating with Mercado Pago
-        :raises EventPublishingError: if there is an error publishing the payment
-            closed event
         """
 
         logger.info(
@@ -63,17 +70,28 @@ class FinalizePaymentByMercadoPagoPaymentIdUseCase:
             order_id=int(mp_payment.order.id)
         )
 
-        # validate if payment with Mercado Pago ID already exists
         order_id = mp_order.external_reference
         external_id = str(mp_order.id)
-        if await self.payment_repository.exists_by_external_id(external_id=external_id):
-            raise ValueError(f"Payment with external ID {external_id} already exists")
-
-        # finalize payment in repository
-        payment = await self.payment_repository.find_by_id(payment_id=order_id)
-        payment.external_id = external_id
-        payment.finalize(
-            self._convert_mp_order_status_to_domain_status(mp_order.status)
+        payment_status = self._convert_mp_order_status_to_domain_status(mp_order.status)
+
+        # reject non-final statuses before touching the repository, which still
+        # guards against concurrent finalizations with its compare-and-set
+        PaymentIn.check_final_status(payment_status)
+
+        # stage payment closed event to be committed along with the payment, or
+        # discarded with the transaction if the payment cannot be finalized
+        if payment_status == PaymentStatus.CLOSED:
+            await self.payment_closed_outbox.add(
+                PaymentClosedEvent(payment_id=order_id)
+            )
+
+            logger.info("Added PaymentClosedEvent for payment %s to outbox", order_id)
+
+        # finalize payment in repository only if it is still opened
+        payment = await self.payment_repository.finalize_if_open(
+            payment_id=order_id,
+            external_id=external_id,
+            payment_status=payment_status,
         )
 
         logger.info(
@@ -83,19 +101,23 @@ class FinalizePaymentByMercadoPagoPaymentIdUseCase:
             payment.payment_status.value,
         )
 
-        payment = await self.payment_repository.save(
-            payment=PaymentIn.model_validate(payment.model_dump())
-        )
+        await self._release_pos(payment_id=payment.id)
+        return payment
 
-        # publish payment closed event if payment is closed
-        if payment.payment_status == PaymentStatus.CLOSED:
-            await self.payment_closed_publisher.publish(
-                PaymentClosedEvent(payment_id=payment.id)
-            )
+    async def _release_pos(self, payment_id: str) -> None:
+        if self.pos_lease_manager is None:
+            return
 
-            logger.info("Published PaymentClosedEvent for payment %s", payment.id)
+        try:
+            await self.pos_lease_manager.release(payment_id=payment_id)
+            logger.info("Released the point of sale leased to payment %s", payment_id)
 
-        return payment
+        except Exception:  # pylint: disable=W0718
+            logger.warning(
+                "Failed to release the point of sale leased to payment %s",
+                payment_id,
+                exc_info=True,
+            )
 
     def _convert_mp_order_status_to_domain_status(
         self, mp_order_status: MPOrderStatus
@@ -0,0 +1,37 @@
+"""Use case for finding the version of a payment"""
+
+import logging
+
+from payment_api.application.commands import FindPaymentByIdCommand
+from payment_api.domain.entities import PaymentVersion
+from payment_api.domain.ports import PaymentRepository
+
+logger = logging.getLogger(__name__)
+
+
+class FindPaymentVersionByIdUseCase:
+    """Use case to handle the finding of a payment version by the payment ID"""
+
+    def __init__(self, payment_repository: PaymentRepository):
+        self.payment_repository = payment_repository
+
+    async def execute(self, command: FindPaymentByIdCommand) -> PaymentVersion:
+        """Execute the use case to find the version of a payment by its ID
+
+        :param command: command containing payment ID
+        :type command: FindPaymentByIdCommand
+        :return: Version of the payment corresponding to the given ID
+        :rtype: PaymentVersion
+        :raises NotFound: if payment is not found
+        :raises PersistenceError: if there is an error during data retrieval from
+            the repository
+        """
+
+        logger.info(
+            "Called the use case to find the version of payment with ID %s",
+            command.payment_id,
+        )
+
+        return await self.payment_repository.find_version_by_id(
+            payment_id=command.payment_id
+        )
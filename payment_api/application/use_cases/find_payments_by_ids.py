@@ -0,0 +1,43 @@
+"""Use case for finding many payments by their IDs"""
+
+import logging
+
+from payment_api.application.commands import FindPaymentsByIdsCommand
+from payment_api.domain.entities import PaymentOut
+from payment_api.domain.ports import PaymentRepository
+
+logger = logging.getLogger(__name__)
+
+
+class FindPaymentsByIdsUseCase:
+    """Use case to handle the finding of many payments by their IDs"""
+
+    def __init__(self, payment_repository: PaymentRepository):
+        self.payment_repository = payment_repository
+
+    async def execute(self, command: FindPaymentsByIdsCommand) -> list[PaymentOut]:
+        """Execute the use case to find many payments by their IDs
+
+        Duplicated IDs are looked up once and IDs without a payment are skipped.
+
+        :param command: command containing the payment IDs
+        :type command: FindPaymentsByIdsCommand
+        :return: Payments found, in the order of the given IDs
+        :rtype: list[PaymentOut]
+        :raises PersistenceError: if there is an error during data retrieval from
+            the repository
+        """
+
+        payment_ids = list(dict.fromkeys(command.payment_ids))
+        logger.info("Called the use case to find %s payments by ID", len(payment_ids))
+
+        payments = {
+            payment.id: payment
+            for payment in await self.payment_repository.find_many_by_ids(
+                payment_ids=payment_ids
+            )
+        }
+
+        return [
+            payments[payment_id] for payment_id in payment_ids if payment_id in payments
+        ]
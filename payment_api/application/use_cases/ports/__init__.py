@@ -1,6 +1,13 @@
 """Ports for the use cases"""
 
-from .abstract_qr_code_renderer import AbstractQRCodeRenderer
+from .abstract_qr_code_renderer import (
+    AbstractQRCodeRenderer,
+    QRCodeErrorCorrection,
+    QRCodeFormat,
+    QRCodeImage,
+    QRCodeOptions,
+    QRCodeRendererUnavailable,
+)
 from .mercado_pago_client import (
     AbstractMercadoPagoClient,
     MPClientError,
@@ -9,13 +16,40 @@ from .mercado_pago_client import (
     MPPayment,
     MPPaymentOrder,
 )
+from .mercado_pago_notification_deduplicator import (
+    AbstractMercadoPagoNotificationDeduplicator,
+)
+from .mercado_pago_notification_inbox import (
+    MercadoPagoNotification,
+    MercadoPagoNotificationInbox,
+    MercadoPagoNotificationStatus,
+)
+from .mercado_pago_pos_lease_manager import (
+    MercadoPagoPOSLeaseManager,
+    MercadoPagoPOSLeaseStrategy,
+)
+from .qr_code_file_store import QRCodeFileStore
+from .qr_code_image_repository import QRCodeImageRepository
 
 __all__ = [
     "AbstractQRCodeRenderer",
+    "QRCodeImage",
+    "QRCodeOptions",
+    "QRCodeFormat",
+    "QRCodeErrorCorrection",
+    "QRCodeRendererUnavailable",
+    "QRCodeImageRepository",
+    "QRCodeFileStore",
     "AbstractMercadoPagoClient",
     "MPClientError",
     "MPOrderStatus",
     "MPOrder",
     "MPPayment",
     "MPPaymentOrder",
+    "MercadoPagoNotification",
+    "MercadoPagoNotificationInbox",
+    "MercadoPagoNotificationStatus",
+    "AbstractMercadoPagoNotificationDeduplicator",
+    "MercadoPagoPOSLeaseManager",
+    "MercadoPagoPOSLeaseStrategy",
 ]
@@ -1,17 +1,122 @@
 """Port interface for QR code rendering use case"""
 
+import hashlib
 from abc import ABC, abstractmethod
+from enum import Enum
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from payment_api.domain.value_objects import QRCodeFormat
+
+
+class QRCodeErrorCorrection(str, Enum):
+    """Error correction levels of a QR code, from the smallest code that
+    tolerates the least damage (L, about 7%) to the largest one (H, about 30%)"""
+
+    L = "L"
+    M = "M"
+    Q = "Q"
+    H = "H"
+
+
+class QRCodeOptions(BaseModel):
+    """Options of a rendered QR code image"""
+
+    model_config = ConfigDict(frozen=True)
+
+    format: QRCodeFormat = Field(
+        QRCodeFormat.PNG, description="Image format of the QR code"
+    )
+    box_size: int = Field(10, ge=1, description="Size in pixels of each module")
+    border: int = Field(4, ge=0, description="Width in modules of the quiet zone")
+    error_correction: QRCodeErrorCorrection = Field(
+        QRCodeErrorCorrection.M, description="Error correction level of the code"
+    )
+
+
+class QRCodeImage(BaseModel):
+    """A QR code image, identified by the digest of the data it encodes"""
+
+    digest: str = Field(..., description="Digest of the data encoded in the image")
+    content: bytes | None = Field(
+        None, description="The rendered image, or None if it was not rendered"
+    )
+    file_name: str | None = Field(
+        None, description="Name of the image file in the file store, if stored"
+    )
+
+
+class QRCodeRendererUnavailable(Exception):
+    """Raised when a QR code cannot be rendered in time because the renderer is
+    overloaded."""
 
 
 class AbstractQRCodeRenderer(ABC):
     """Interface for rendering QR codes."""
 
     @abstractmethod
-    def render(self, data: str) -> bytes:
+    def render(self, data: str, options: QRCodeOptions | None = None) -> bytes:
         """Render a QR code from the given data string.
 
         :param data: The data to encode in the QR code.
         :type data: str
+        :param options: The options of the image, or None for the defaults.
+        :type options: QRCodeOptions | None
         :return: The rendered QR code as a byte array.
         :rtype: bytes
         """
+
+    async def render_async(
+        self, data: str, options: QRCodeOptions | None = None
+    ) -> bytes:
+        """Render a QR code from the given data string without blocking the event
+        loop.
+
+        Renderers that do not offload the work render it in place.
+
+        :param data: The data to encode in the QR code.
+        :type data: str
+        :param options: The options of the image, or None for the defaults.
+        :type options: QRCodeOptions | None
+        :return: The rendered QR code as a byte array.
+        :rtype: bytes
+        :raises QRCodeRendererUnavailable: If the renderer is overloaded.
+        """
+
+        return self.render(data, options)
+
+    async def close(self) -> None:
+        """Release the resources held by the renderer."""
+
+    def digest(self, data: str, options: QRCodeOptions | None = None) -> str:
+        """Return a digest that identifies the QR code of the given data string.
+
+        The same data and options always render the same image, so the digest
+        identifies the image without rendering it.
+
+        :param data: The data to encode in the QR code.
+        :type data: str
+        :param options: The options of the image, or None for the defaults.
+        :type options: QRCodeOptions | None
+        :return: The hex digest of the data and options.
+        :rtype: str
+        """
+
+        options = options or QRCodeOptions()
+        key = f"{options.model_dump_json()}\n{data}"
+        return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+
+    def cached(
+        self, data: str, options: QRCodeOptions | None = None  # pylint: disable=W0613
+    ) -> bytes | None:
+        """Return the QR code of the given data string if it was already rendered.
+
+        :param data: The data to encode in the QR code.
+        :type data: str
+        :param options: The options of the image, or None for the defaults.
+        :type options: QRCodeOptions | None
+        :return: The rendered QR code, or None if it is not available.
+        :rtype: bytes | None
+        """
+
+        return None
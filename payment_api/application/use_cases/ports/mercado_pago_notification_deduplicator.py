@@ -0,0 +1,38 @@
+"""Port interface for deduplicating Mercado Pago notifications"""
+
+from abc import ABC, abstractmethod
+
+
+class AbstractMercadoPagoNotificationDeduplicator(ABC):
+    """Interface for detecting Mercado Pago notifications that were already
+    handled."""
+
+    @abstractmethod
+    async def is_duplicate(self, resource_id: str) -> bool:
+        """Check if a notification for the resource was already handled.
+
+        :param resource_id: The ID of the resource in Mercado Pago.
+        :type resource_id: str
+        :return: True if the notification is a duplicate.
+        :rtype: bool
+        :raises PersistenceError: If an error occurs while reading the processed
+            record.
+        """
+
+    @abstractmethod
+    def remember(self, resource_id: str) -> None:
+        """Remember a notification that was accepted but may not be processed yet.
+
+        :param resource_id: The ID of the resource in Mercado Pago.
+        :type resource_id: str
+        """
+
+    @abstractmethod
+    async def mark_processed(self, resource_id: str) -> None:
+        """Record a notification as processed.
+
+        :param resource_id: The ID of the resource in Mercado Pago.
+        :type resource_id: str
+        :raises PersistenceError: If an error occurs while recording the
+            notification.
+        """
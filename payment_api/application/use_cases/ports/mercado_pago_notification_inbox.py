@@ -0,0 +1,96 @@
+"""Port interface and related schemas for the Mercado Pago notification inbox"""
+
+from abc import ABC, abstractmethod
+from enum import Enum, unique
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+@unique
+class MercadoPagoNotificationStatus(str, Enum):
+    """Enumeration of possible statuses of a notification in the inbox."""
+
+    PENDING = "PENDING"
+    PROCESSING = "PROCESSING"
+    PROCESSED = "PROCESSED"
+    FAILED = "FAILED"
+
+
+class MercadoPagoNotification(BaseModel):
+    """Schema representing a Mercado Pago notification stored in the inbox."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    resource_id: str = Field(..., description="The ID of the resource in Mercado Pago.")
+    status: MercadoPagoNotificationStatus = Field(
+        ..., description="Processing status of the notification."
+    )
+    attempts: int = Field(..., description="Number of processing attempts.")
+
+
+class MercadoPagoNotificationInbox(ABC):
+    """Durable inbox of Mercado Pago notifications waiting to be processed."""
+
+    @abstractmethod
+    async def enqueue(self, resource_id: str) -> bool:
+        """Store a notification in the inbox.
+
+        :param resource_id: The ID of the resource in Mercado Pago.
+        :type resource_id: str
+        :return: True if the notification was stored, False if a notification for
+            the same resource is already in the inbox.
+        :rtype: bool
+        :raises PersistenceError: If an error occurs while storing the notification.
+        """
+
+    @abstractmethod
+    async def claim(self, limit: int) -> list[MercadoPagoNotification]:
+        """Claim pending notifications to be processed.
+
+        Claimed notifications are skipped by concurrent claims until they are
+        marked as processed or failed, or until their lock times out. Timed out
+        notifications without attempts left are failed instead of claimed.
+
+        :param limit: The maximum number of notifications to claim.
+        :type limit: int
+        :return: The claimed notifications.
+        :rtype: list[MercadoPagoNotification]
+        :raises PersistenceError: If an error occurs while claiming notifications.
+        """
+
+    @abstractmethod
+    async def is_processed(self, resource_id: str) -> bool:
+        """Check if a notification was already processed.
+
+        :param resource_id: The ID of the resource in Mercado Pago.
+        :type resource_id: str
+        :return: True if a notification for the resource was processed.
+        :rtype: bool
+        :raises PersistenceError: If an error occurs while reading the notification.
+        """
+
+    @abstractmethod
+    async def mark_processed(self, resource_id: str) -> None:
+        """Mark a notification as processed.
+
+        The notification is recorded as processed even if it was never stored in
+        the inbox, so notifications finalized outside the inbox are also known.
+
+        :param resource_id: The ID of the resource in Mercado Pago.
+        :type resource_id: str
+        :raises PersistenceError: If an error occurs while updating the notification.
+        """
+
+    @abstractmethod
+    async def mark_failed(self, resource_id: str, error: str, retry: bool) -> None:
+        """Mark a notification as failed.
+
+        :param resource_id: The ID of the resource in Mercado Pago.
+        :type resource_id: str
+        :param error: The description of the error.
+        :type error: str
+        :param retry: Whether the notification should be processed again, as long
+            as it has attempts left.
+        :type retry: bool
+        :raises PersistenceError: If an error occurs while updating the notification.
+        """
@@ -0,0 +1,48 @@
+"""Port interface for leasing Mercado Pago points of sale to payments"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from enum import Enum, unique
+
+
+@unique
+class MercadoPagoPOSLeaseStrategy(str, Enum):
+    """Strategies to pick a free point of sale from the pool."""
+
+    ROUND_ROBIN = "round_robin"
+    LEAST_LOADED = "least_loaded"
+
+
+class MercadoPagoPOSLeaseManager(ABC):
+    """Lease manager for a pool of Mercado Pago points of sale.
+
+    A point of sale holds a single active dynamic QR order, so each point of sale
+    is leased to one payment at a time, until the lease is released or until the
+    order it holds expires.
+    """
+
+    @abstractmethod
+    async def acquire(self, payment_id: str, expires_at: datetime) -> str | None:
+        """Lease a free point of sale to a payment.
+
+        :param payment_id: The ID of the payment.
+        :type payment_id: str
+        :param expires_at: When the order created in the point of sale expires,
+            after which the point of sale is free again.
+        :type expires_at: datetime
+        :return: The external ID of the leased point of sale, or None if no point
+            of sale is free.
+        :rtype: str | None
+        :raises PersistenceError: If an error occurs while leasing the point of
+            sale.
+        """
+
+    @abstractmethod
+    async def release(self, payment_id: str) -> None:
+        """Release the point of sale leased to a payment, if any.
+
+        :param payment_id: The ID of the payment.
+        :type payment_id: str
+        :raises PersistenceError: If an error occurs while releasing the point of
+            sale.
+        """
@@ -0,0 +1,40 @@
+"""Port interface for storing rendered QR code images as files"""
+
+from abc import ABC, abstractmethod
+
+from .abstract_qr_code_renderer import QRCodeFormat
+
+
+class QRCodeFileStore(ABC):
+    """Interface for storing rendered QR code images as files served without
+    reading them into the application."""
+
+    @abstractmethod
+    async def find(self, digest: str, image_format: QRCodeFormat) -> str | None:
+        """Find the stored file of a QR code image.
+
+        :param digest: The digest of the image.
+        :type digest: str
+        :param image_format: The format of the image.
+        :type image_format: QRCodeFormat
+        :return: The name of the file relative to the store, or None if the
+            image is not stored.
+        :rtype: str | None
+        """
+
+    @abstractmethod
+    async def save(
+        self, digest: str, image_format: QRCodeFormat, content: bytes
+    ) -> str:
+        """Store a QR code image as a file, replacing any stored file.
+
+        :param digest: The digest of the image.
+        :type digest: str
+        :param image_format: The format of the image.
+        :type image_format: QRCodeFormat
+        :param content: The rendered image.
+        :type content: bytes
+        :return: The name of the file relative to the store.
+        :rtype: str
+        :raises PersistenceError: If an error occurs while storing the file.
+        """
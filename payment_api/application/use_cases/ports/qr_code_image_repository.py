@@ -0,0 +1,31 @@
+"""Port interface for storing pre-rendered QR code images"""
+
+from abc import ABC, abstractmethod
+
+from .abstract_qr_code_renderer import QRCodeImage
+
+
+class QRCodeImageRepository(ABC):
+    """Interface for storing the rendered QR code images of payments."""
+
+    @abstractmethod
+    async def find(self, payment_id: str) -> QRCodeImage | None:
+        """Find the stored QR code image of a payment.
+
+        :param payment_id: The ID of the payment.
+        :type payment_id: str
+        :return: The stored image, or None if the payment has no stored image.
+        :rtype: QRCodeImage | None
+        :raises PersistenceError: If an error occurs while retrieving the image.
+        """
+
+    @abstractmethod
+    async def save(self, payment_id: str, image: QRCodeImage) -> None:
+        """Store the QR code image of a payment, replacing any stored image.
+
+        :param payment_id: The ID of the payment.
+        :type payment_id: str
+        :param image: The rendered image.
+        :type image: QRCodeImage
+        :raises PersistenceError: If an error occurs while storing the image.
+        """
@@ -3,7 +3,15 @@
 import logging
 
 from payment_api.application.commands import RenderQRCodeCommand
-from payment_api.application.use_cases.ports import AbstractQRCodeRenderer
+from payment_api.application.use_cases.ports import (
+    AbstractQRCodeRenderer,
+    QRCodeFileStore,
+    QRCodeFormat,
+    QRCodeImage,
+    QRCodeImageRepository,
+    QRCodeOptions,
+)
+from payment_api.domain.exceptions import PersistenceError
 from payment_api.domain.ports import PaymentRepository
 
 logger = logging.getLogger(__name__)
@@ -16,21 +24,33 @@ class RenderQRCodeUseCase:
         self,
         payment_repository: PaymentRepository,
         qr_code_renderer: AbstractQRCodeRenderer,
+        qr_code_image_repository: QRCodeImageRepository | None = None,
+        qr_code_file_store: QRCodeFileStore | None = None,
     ):
         self.payment_repository = payment_repository
         self.qr_code_renderer = qr_code_renderer
+        self.qr_code_image_repository = qr_code_image_repository
+        self.qr_code_file_store = qr_code_file_store
 
-    async def execute(self, command: RenderQRCodeCommand) -> bytes:
+    async def execute(self, command: RenderQRCodeCommand) -> QRCodeImage:
         """Execute the use case to render a QR code
 
+        QR codes already rendered by the renderer or stored in the image
+        repository with the same options are returned without rendering them
+        again. With a file store, images are stored as files and, once stored,
+        returned by file name only.
+
         :param command: command containing payment ID
         :type command: RenderQRCodeCommand
-        :return: bytes representing the QR code image
-        :rtype: bytes
+        :return: the digest of the QR code and, unless rendering was skipped and
+            the image was not rendered before, the image bytes or the name of
+            its file in the file store
+        :rtype: QRCodeImage
         :raises NotFound: if payment is not found
         :raises PersistenceError: if there is an error during data retrieval from
             the repository
         :raises ValueError: if the payment does not have an associated QR code
+        :raises QRCodeRendererUnavailable: if the renderer is overloaded
         """
 
         logger.info(
@@ -46,4 +66,67 @@ class RenderQRCodeUseCase:
         if not payment.qr_code:
             raise ValueError("Payment does not have an associated QR code.")
 
-        return self.qr_code_renderer.render(data=payment.qr_code)
+        options = QRCodeOptions.model_validate(command.options.model_dump())
+        digest = self.qr_code_renderer.digest(data=payment.qr_code, options=options)
+        if self.qr_code_file_store is not None:
+            file_name = await self.qr_code_file_store.find(
+                digest=digest, image_format=options.format
+            )
+            if file_name is not None:
+                return QRCodeImage(digest=digest, file_name=file_name)
+
+        content = self.qr_code_renderer.cached(data=payment.qr_code, options=options)
+        if content is None:
+            content = await self._find_stored_image(payment.id, digest)
+
+        if content is None and command.render:
+            content = await self.qr_code_renderer.render_async(
+                data=payment.qr_code, options=options
+            )
+
+        if content is None:
+            return QRCodeImage(digest=digest)
+
+        return QRCodeImage(
+            digest=digest,
+            content=content,
+            file_name=await self._store_file(digest, options.format, content),
+        )
+
+    async def _store_file(
+        self, digest: str, image_format: QRCodeFormat, content: bytes
+    ) -> str | None:
+        if self.qr_code_file_store is None:
+            return None
+
+        try:
+            return await self.qr_code_file_store.save(
+                digest=digest, image_format=image_format, content=content
+            )
+        except PersistenceError:
+            logger.warning(
+                "Failed to store the QR code file %s, returning it inline",
+                digest,
+                exc_info=True,
+            )
+            return None
+
+    async def _find_stored_image(self, payment_id: str, digest: str) -> bytes | None:
+        if self.qr_code_image_repository is None:
+            return None
+
+        try:
+            image = await self.qr_code_image_repository.find(payment_id=payment_id)
+        except PersistenceError:
+            logger.warning(
+                "Failed to read the stored QR code of payment ID %s, rendering it",
+                payment_id,
+                exc_info=True,
+            )
+            return None
+
+        # Images rendered from previous QR data are outdated
+        if image is None or image.digest != digest:
+            return None
+
+        return image.content
@@ -1,6 +1,6 @@
 """ "Domain entities package"""
 
-from .payment import PaymentIn, PaymentOut
+from .payment import PaymentIn, PaymentOut, PaymentVersion
 from .product import Product
 
-__all__ = ["PaymentIn", "PaymentOut", "Product"]
+__all__ = ["PaymentIn", "PaymentOut", "PaymentVersion", "Product"]
@@ -33,6 +33,24 @@ class PaymentIn(BaseModel):
         self.payment_status = payment_status
         return self
 
+    @staticmethod
+    def check_final_status(payment_status: PaymentStatus) -> PaymentStatus:
+        """Check if a payment can be finalized with the given status, whatever
+        its current status.
+
+        :param payment_status: The final payment status.
+        :rtype: PaymentStatus
+        :return: The final payment status if valid.
+        :raises ValueError: If the status is not a final status.
+        """
+
+        if payment_status == PaymentStatus.OPENED:
+            raise ValueError(
+                f"Unable to finalize a payment with status {payment_status.value}"
+            )
+
+        return payment_status
+
     def _check_if_is_valid_to_finalize(
         self, new_payment_status: PaymentStatus
     ) -> "PaymentIn":
@@ -61,3 +79,13 @@ class PaymentOut(PaymentIn):
 
     created_at: datetime = Field(description="Creation date and time of the payment")
     timestamp: datetime = Field(description="Last update date and time of the payment")
+
+
+class PaymentVersion(BaseModel):
+    """Version of a payment, which changes whenever the payment is updated"""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: str = Field(description="Unique identifier for the payment")
+    payment_status: PaymentStatus = Field(description="Current status of the payment")
+    timestamp: datetime = Field(description="Last update date and time of the payment")
@@ -1,7 +1,15 @@
 """Domain ports package"""
 
-from .payment_closed_publisher import PaymentClosedPublisher
+from .payment_closed_outbox import PaymentClosedOutbox
+from .payment_closed_publisher import PaymentClosedPublisher, PublishResult
 from .payment_gateway import PaymentGateway
-from .payment_repository import PaymentRepository
+from .payment_repository import PaymentRepository, SaveMode
 
-__all__ = ["PaymentRepository", "PaymentGateway", "PaymentClosedPublisher"]
+__all__ = [
+    "PaymentRepository",
+    "PaymentGateway",
+    "PaymentClosedPublisher",
+    "PaymentClosedOutbox",
+    "PublishResult",
+    "SaveMode",
+]
@@ -0,0 +1,66 @@
+"""Payment closed outbox port"""
+
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+from payment_api.domain.events import PaymentClosedEvent
+
+
+class PaymentClosedOutbox(ABC):
+    """Port for storing payment closed events until they are published"""
+
+    @abstractmethod
+    async def add(self, event: PaymentClosedEvent) -> None:
+        """Add a payment closed event to the outbox
+
+        The event is staged in the current transaction and persisted together with
+        the next change committed by the payment repository.
+
+        :param event: The payment closed event to store
+        :return: None
+        :raises PersistenceError: If an error occurs while storing the event
+        """
+
+    @abstractmethod
+    async def claim(self, limit: int) -> list[PaymentClosedEvent]:
+        """Claim pending payment closed events to be published
+
+        Claimed events are skipped by concurrent claims until they are marked as
+        sent or failed, or until their lock times out. Timed out events without
+        attempts left are failed instead of claimed.
+
+        :param limit: The maximum number of events to claim
+        :return: The claimed events, oldest first
+        :raises PersistenceError: If an error occurs while claiming the events
+        """
+
+    @abstractmethod
+    async def mark_sent(self, event_ids: list[UUID]) -> None:
+        """Mark payment closed events as sent
+
+        :param event_ids: The IDs of the sent events
+        :return: None
+        :raises PersistenceError: If an error occurs while updating the events
+        """
+
+    @abstractmethod
+    async def purge_sent(self, limit: int) -> int:
+        """Delete payment closed events sent longer ago than the retention period
+
+        :param limit: The maximum number of events to delete
+        :return: The number of deleted events
+        :raises PersistenceError: If an error occurs while deleting the events
+        """
+
+    @abstractmethod
+    async def mark_failed(self, event_id: UUID, error: str) -> None:
+        """Mark a payment closed event as failed
+
+        The event is claimed again after its lock times out, as long as it has
+        attempts left.
+
+        :param event_id: The ID of the event that could not be published
+        :param error: The description of the error
+        :return: None
+        :raises PersistenceError: If an error occurs while updating the event
+        """
@@ -1,8 +1,27 @@
 """Payment closed publisher port"""
 
 from abc import ABC, abstractmethod
+from uuid import UUID
+
+from pydantic import BaseModel, Field
 
 from payment_api.domain.events import PaymentClosedEvent
+from payment_api.domain.exceptions import EventPublishingError
+
+
+class PublishResult(BaseModel):
+    """Result of publishing one event in a batch"""
+
+    event_id: UUID = Field(description="Unique identifier of the published event")
+    error: str | None = Field(
+        description="Description of the error if the event was not published",
+        default=None,
+    )
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether the event was published"""
+        return self.error is None
 
 
 class PaymentClosedPublisher(ABC):
@@ -16,3 +35,30 @@ class PaymentClosedPublisher(ABC):
         :return: None
         :raises EventPublishingError: If an error occurs while publishing the event
         """
+
+    async def publish_many(
+        self, events: list[PaymentClosedEvent]
+    ) -> list[PublishResult]:
+        """Publish several payment closed events
+
+        Failures are reported per event instead of raised, so the events that
+        were published are not retried.
+
+        :param events: The payment closed events to publish
+        :return: One result per event, in the same order as the events
+        """
+        results = []
+        for event in events:
+            try:
+                await self.publish(event)
+                results.append(PublishResult(event_id=event.id))
+            except EventPublishingError as error:
+                results.append(PublishResult(event_id=event.id, error=str(error)))
+
+        return results
+
+    async def close(self) -> None:
+        """Release the resources held by the publisher
+
+        :return: None
+        """
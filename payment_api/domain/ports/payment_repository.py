@@ -1,8 +1,23 @@
 """Payment repository interface."""
 
 from abc import ABC, abstractmethod
+from enum import Enum
 
-from payment_api.domain.entities import PaymentIn, PaymentOut
+from payment_api.domain.entities import PaymentIn, PaymentOut, PaymentVersion
+from payment_api.domain.value_objects import PaymentStatus
+
+
+class SaveMode(str, Enum):
+    """How a payment is saved
+
+    - UPSERT: insert the payment, or update it if it already exists.
+    - INSERT: insert the payment, failing if it already exists.
+    - UPDATE: update the payment, failing if it does not exist.
+    """
+
+    UPSERT = "upsert"
+    INSERT = "insert"
+    UPDATE = "update"
 
 
 class PaymentRepository(ABC):
@@ -18,6 +33,28 @@ class PaymentRepository(ABC):
         :raises PersistenceError: If an error occurs while retrieving the payment.
         """
 
+    @abstractmethod
+    async def find_many_by_ids(self, payment_ids: list[str]) -> list[PaymentOut]:
+        """Find the payments with the given IDs.
+
+        IDs without a payment are skipped, so fewer payments than IDs may be
+        returned, in no particular order.
+
+        :param payment_ids: The IDs of the payments.
+        :return: The payments found.
+        :raises PersistenceError: If an error occurs while retrieving the payments.
+        """
+
+    @abstractmethod
+    async def find_version_by_id(self, payment_id: str) -> PaymentVersion:
+        """Find the version of a payment by its ID, without loading the payment.
+
+        :param payment_id: The ID of the payment.
+        :return: The payment version.
+        :raises NotFound: If the payment is not found.
+        :raises PersistenceError: If an error occurs while retrieving the version.
+        """
+
     @abstractmethod
     async def exists_by_id(self, payment_id: str) -> bool:
         """Check if a payment exists by its ID.
@@ -38,9 +75,30 @@ class PaymentRepository(ABC):
         """
 
     @abstractmethod
-    async def save(self, payment: PaymentIn) -> PaymentOut:
+    async def save(
+        self, payment: PaymentIn, mode: SaveMode = SaveMode.UPSERT
+    ) -> PaymentOut:
         """Save a payment entity.
         :param payment: The payment entity to be saved.
+        :param mode: Whether the payment is inserted, updated or either.
         :return: The saved payment entity.
-        :raises PersistenceError: If an error occurs while saving the payment.
+        :raises NotFound: If the payment does not exist and mode is UPDATE.
+        :raises PersistenceError: If an error occurs while saving the payment,
+            including when the payment already exists and mode is INSERT.
+        """
+
+    @abstractmethod
+    async def finalize_if_open(
+        self, payment_id: str, external_id: str, payment_status: PaymentStatus
+    ) -> PaymentOut:
+        """Finalize a payment in a single atomic step, only if it is still opened.
+
+        :param payment_id: The ID of the payment.
+        :param external_id: The external ID to set on the payment.
+        :param payment_status: The final status of the payment.
+        :return: The finalized payment entity.
+        :raises NotFound: If the payment is not found.
+        :raises ValueError: If the payment is not opened anymore, if the final
+            status is OPENED or if another payment has the external ID.
+        :raises PersistenceError: If an error occurs while finalizing the payment.
         """
@@ -1,5 +1,6 @@
 """ "Domain value objects package"""
 
 from .payment_status import PaymentStatus
+from .qr_code_format import QRCodeFormat
 
-__all__ = ["PaymentStatus"]
+__all__ = ["PaymentStatus", "QRCodeFormat"]
@@ -0,0 +1,11 @@
+"""QR code format value object module"""
+
+from enum import Enum, unique
+
+
+@unique
+class QRCodeFormat(str, Enum):
+    """Image formats QR codes can be rendered in"""
+
+    PNG = "image/png"
+    SVG = "image/svg+xml"
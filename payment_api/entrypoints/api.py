@@ -5,15 +5,19 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
+from payment_api.adapters.inbound.rest.internal import internal_router
 from payment_api.adapters.inbound.rest.v1 import payment_router_v1
 from payment_api.infrastructure import factory
 from payment_api.infrastructure.config import (
     APPSettings,
-    AWSSettings,
     DatabaseSettings,
     HTTPClientSettings,
+    MercadoPagoNotificationInboxSettings,
     MercadoPagoSettings,
-    PaymentClosedPublisherSettings,
+    PaymentCacheSettings,
+    PaymentClosedOutboxSettings,
+    PaymentEventsSettings,
+    QRCodeSettings,
 )
 
 logger = logging.getLogger(__name__)
@@ -26,6 +30,8 @@ def create_api() -> FastAPI:
     app_instance = FastAPI(lifespan=fastapi_lifespan)
     logger.info("Including payment router v1")
     app_instance.include_router(payment_router_v1)
+    logger.info("Including internal router")
+    app_instance.include_router(internal_router)
     return app_instance
 
 
@@ -42,12 +48,18 @@ async def fastapi_lifespan(app_instance: FastAPI):
     app_instance.state.http_client_settings = HTTPClientSettings()
     logger.info("Loading MercadoPago settings")
     app_instance.state.mercado_pago_settings = MercadoPagoSettings()
-    logger.info("Loading AWS settings")
-    app_instance.state.aws_settings = AWSSettings()
-    logger.info("Loading PaymentClosedPublisher settings")
-    app_instance.state.payment_closed_publisher_settings = (
-        PaymentClosedPublisherSettings()
+    logger.info("Loading MercadoPago notification inbox settings")
+    app_instance.state.mercado_pago_notification_inbox_settings = (
+        MercadoPagoNotificationInboxSettings()
     )
+    logger.info("Loading PaymentClosed outbox settings")
+    app_instance.state.payment_closed_outbox_settings = PaymentClosedOutboxSettings()
+    logger.info("Loading payment cache settings")
+    app_instance.state.payment_cache_settings = PaymentCacheSettings()
+    logger.info("Loading payment events settings")
+    app_instance.state.payment_events_settings = PaymentEventsSettings()
+    logger.info("Loading QR code settings")
+    app_instance.state.qr_code_settings = QRCodeSettings()
 
     app_instance.title = app_instance.state.app_settings.TITLE
     app_instance.version = app_instance.state.app_settings.VERSION
@@ -64,6 +76,43 @@ async def fastapi_lifespan(app_instance: FastAPI):
         settings=app_instance.state.database_settings
     )
 
+    logger.info("Starting payment cache")
+    app_instance.state.payment_cache = factory.get_payment_cache(
+        settings=app_instance.state.payment_cache_settings,
+        session_manager=app_instance.state.session_manager,
+    )
+
+    app_instance.state.payment_status_notifications = (
+        factory.get_payment_status_notifications(
+            settings=app_instance.state.payment_events_settings,
+            database_settings=app_instance.state.database_settings,
+        )
+    )
+
+    if app_instance.state.payment_status_notifications is not None:
+        logger.info("Starting payment status notifications listener")
+        await app_instance.state.payment_status_notifications.start()
+
+    logger.info("Starting QR code renderer")
+    app_instance.state.qr_code_renderer = factory.get_qr_code_renderer(
+        settings=app_instance.state.qr_code_settings
+    )
+
+    app_instance.state.qr_code_file_store = factory.get_qr_code_file_store(
+        settings=app_instance.state.qr_code_settings
+    )
+
+    if app_instance.state.qr_code_file_store is not None:
+        logger.info("Starting QR code file store eviction")
+        await app_instance.state.qr_code_file_store.start()
+
+    logger.info("Starting recently seen Mercado Pago notifications set")
+    app_instance.state.recently_seen_notifications = (
+        factory.get_recently_seen_notifications(
+            settings=app_instance.state.mercado_pago_notification_inbox_settings
+        )
+    )
+
     logger.info("Starting HTTP client")
     app_instance.state.http_client = factory.get_http_client(
         settings=app_instance.state.http_client_settings
@@ -71,6 +120,20 @@ async def fastapi_lifespan(app_instance: FastAPI):
 
     # Application state teardown
     yield
+    if app_instance.state.payment_status_notifications is not None:
+        logger.info("Closing payment status notifications listener")
+        await app_instance.state.payment_status_notifications.close()
+
+    if app_instance.state.payment_cache is not None:
+        logger.info("Closing payment cache")
+        await app_instance.state.payment_cache.close()
+
+    if app_instance.state.qr_code_file_store is not None:
+        logger.info("Closing QR code file store")
+        await app_instance.state.qr_code_file_store.close()
+
+    logger.info("Closing QR code renderer")
+    await app_instance.state.qr_code_renderer.close()
     logger.info("Closing session manager")
     await app_instance.state.session_manager.close()
     logger.info("Closing HTTP client")
@@ -0,0 +1,19 @@
+"""Graceful shutdown handling for long running entrypoints"""
+
+import logging
+import signal
+
+logger = logging.getLogger(__name__)
+
+
+class GracefulShutdown:
+    """Handles graceful shutdown on SIGTERM and SIGINT signals"""
+
+    def __init__(self):
+        self.shutdown = False
+        signal.signal(signal.SIGTERM, self._exit_gracefully)
+        signal.signal(signal.SIGINT, self._exit_gracefully)
+
+    def _exit_gracefully(self, signum, frame):
+        logger.info("Received shutdown signal %d", signum)
+        self.shutdown = True
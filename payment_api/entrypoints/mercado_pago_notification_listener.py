@@ -0,0 +1,75 @@
+"""Mercado Pago notification inbox listener entrypoint module"""
+
+import asyncio
+import logging
+
+from httpx import AsyncClient
+
+from payment_api.entrypoints.graceful_shutdown import GracefulShutdown
+from payment_api.infrastructure import factory
+from payment_api.infrastructure.config import (
+    DatabaseSettings,
+    HTTPClientSettings,
+    MercadoPagoNotificationInboxSettings,
+    MercadoPagoSettings,
+    PaymentClosedOutboxSettings,
+)
+from payment_api.infrastructure.orm import SessionManager
+
+logger = logging.getLogger(__name__)
+
+
+async def main():
+    """Run the Mercado Pago notification inbox listener"""
+
+    shutdown_handler = GracefulShutdown()
+    session_manager: SessionManager | None = None
+    http_client: AsyncClient | None = None
+    try:
+        logger.info("Loading database settings")
+        db_settings = DatabaseSettings()
+        logger.info("Loading HTTP client settings")
+        http_client_settings = HTTPClientSettings()
+        logger.info("Loading Mercado Pago settings")
+        mercado_pago_settings = MercadoPagoSettings()
+        logger.info("Loading PaymentClosed outbox settings")
+        payment_closed_outbox_settings = PaymentClosedOutboxSettings()
+        logger.info("Loading Mercado Pago notification inbox settings")
+        inbox_settings = MercadoPagoNotificationInboxSettings()
+        logger.info("Starting session manager")
+        session_manager = factory.get_session_manager(settings=db_settings)
+        logger.info("Starting HTTP client")
+        http_client = factory.get_http_client(settings=http_client_settings)
+        logger.info("Creating Mercado Pago notification handler")
+        handler = factory.get_mercado_pago_notification_handler(
+            session_manager=session_manager,
+            mercado_pago_settings=mercado_pago_settings,
+            http_client=http_client,
+            payment_closed_outbox_settings=payment_closed_outbox_settings,
+            inbox_settings=inbox_settings,
+        )
+
+        logger.info("Creating Mercado Pago notification listener")
+        listener = factory.create_mercado_pago_notification_listener(
+            session_manager=session_manager,
+            handler=handler,
+            settings=inbox_settings,
+        )
+
+        logger.info("Starting Mercado Pago notification listener")
+        await listener.listen(shutdown_event=shutdown_handler)
+    finally:
+        if session_manager is not None:
+            logger.info("Closing session manager")
+            await session_manager.close()
+
+        if http_client is not None:
+            logger.info("Closing HTTP client")
+            await http_client.aclose()
+
+
+if __name__ == "__main__":
+    import logging.config
+
+    logging.config.fileConfig("logging.ini", disable_existing_loggers=False)
+    asyncio.run(main())
@@ -2,37 +2,34 @@
 
 import asyncio
 import logging
-import signal
 
+from httpx import AsyncClient
+
+from payment_api.application.use_cases.ports import AbstractQRCodeRenderer
+from payment_api.entrypoints.graceful_shutdown import GracefulShutdown
 from payment_api.infrastructure import factory
+from payment_api.infrastructure.aws import AWSClients
 from payment_api.infrastructure.config import (
     AWSSettings,
     DatabaseSettings,
     HTTPClientSettings,
     MercadoPagoSettings,
     OrderCreatedListenerSettings,
+    QRCodeSettings,
 )
+from payment_api.infrastructure.orm import SessionManager
 
 logger = logging.getLogger(__name__)
 
 
-class GracefulShutdown:
-    """Handles graceful shutdown on SIGTERM and SIGINT signals"""
-
-    def __init__(self):
-        self.shutdown = False
-        signal.signal(signal.SIGTERM, self._exit_gracefully)
-        signal.signal(signal.SIGINT, self._exit_gracefully)
-
-    def _exit_gracefully(self, signum, frame):
-        logger.info("Received shutdown signal %d", signum)
-        self.shutdown = True
-
-
 async def main():
     """Run the order created event listener"""
 
     shutdown_handler = GracefulShutdown()
+    session_manager: SessionManager | None = None
+    http_client: AsyncClient | None = None
+    aws_clients: AWSClients | None = None
+    qr_code_renderer: AbstractQRCodeRenderer | None = None
     try:
         logger.info("Loading database settings")
         db_settings = DatabaseSettings()
@@ -42,24 +39,29 @@ async def main():
         aws_settings = AWSSettings()
         logger.info("Loading Mercado Pago settings")
         mercado_pago_settings = MercadoPagoSettings()
+        logger.info("Loading QR code settings")
+        qr_code_settings = QRCodeSettings()
         logger.info("Loading order created listener settings")
         order_created_listener_settings = OrderCreatedListenerSettings()
         logger.info("Starting session manager")
         session_manager = factory.get_session_manager(settings=db_settings)
         logger.info("Starting HTTP client")
         http_client = factory.get_http_client(settings=http_client_settings)
-        logger.info("Starting AWS session")
-        aws_session = factory.get_aws_session(settings=aws_settings)
+        logger.info("Starting AWS clients")
+        aws_clients = await factory.get_aws_clients(settings=aws_settings).start()
+        logger.info("Creating QR code pre-renderer")
+        qr_code_renderer = factory.get_qr_code_pre_renderer(settings=qr_code_settings)
         logger.info("Creating order created handler")
         handler = factory.get_order_created_handler(
             session_manager=session_manager,
             mercado_pago_settings=mercado_pago_settings,
             http_client=http_client,
+            qr_code_renderer=qr_code_renderer,
         )
 
         logger.info("Creating order created event listener")
         listener = factory.create_order_created_listener(
-            session=aws_session,
+            aws_clients=aws_clients,
             handler=handler,
             settings=order_created_listener_settings,
         )
@@ -67,10 +69,21 @@ async def main():
         logger.info("Starting order created event listener")
         await listener.listen(shutdown_event=shutdown_handler)
     finally:
-        logger.info("Closing session manager")
-        await session_manager.close()
-        logger.info("Closing HTTP client")
-        await http_client.aclose()
+        if qr_code_renderer is not None:
+            logger.info("Closing QR code pre-renderer")
+            await qr_code_renderer.close()
+
+        if aws_clients is not None:
+            logger.info("Closing AWS clients")
+            await aws_clients.close()
+
+        if session_manager is not None:
+            logger.info("Closing session manager")
+            await session_manager.close()
+
+        if http_client is not None:
+            logger.info("Closing HTTP client")
+            await http_client.aclose()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,74 @@
+"""PaymentClosed outbox relay entrypoint module"""
+
+import asyncio
+import logging
+
+from payment_api.domain.ports import PaymentClosedPublisher
+from payment_api.entrypoints.graceful_shutdown import GracefulShutdown
+from payment_api.infrastructure import factory
+from payment_api.infrastructure.aws import AWSClients
+from payment_api.infrastructure.config import (
+    AWSSettings,
+    DatabaseSettings,
+    PaymentClosedOutboxSettings,
+    PaymentClosedPublisherSettings,
+)
+from payment_api.infrastructure.orm import SessionManager
+
+logger = logging.getLogger(__name__)
+
+
+async def main():
+    """Run the PaymentClosed outbox relay"""
+
+    shutdown_handler = GracefulShutdown()
+    session_manager: SessionManager | None = None
+    aws_clients: AWSClients | None = None
+    publisher: PaymentClosedPublisher | None = None
+    try:
+        logger.info("Loading database settings")
+        db_settings = DatabaseSettings()
+        logger.info("Loading AWS settings")
+        aws_settings = AWSSettings()
+        logger.info("Loading PaymentClosedPublisher settings")
+        payment_closed_publisher_settings = PaymentClosedPublisherSettings()
+        logger.info("Loading PaymentClosed outbox settings")
+        payment_closed_outbox_settings = PaymentClosedOutboxSettings()
+        logger.info("Starting session manager")
+        session_manager = factory.get_session_manager(settings=db_settings)
+        logger.info("Starting AWS clients")
+        aws_clients = await factory.get_aws_clients(settings=aws_settings).start()
+        logger.info("Creating PaymentClosed publisher")
+        publisher = factory.get_payment_closed_publisher(
+            settings=payment_closed_publisher_settings,
+            aws_clients=aws_clients,
+        )
+
+        logger.info("Creating PaymentClosed outbox relay")
+        relay = factory.create_payment_closed_outbox_relay(
+            session_manager=session_manager,
+            publisher=publisher,
+            settings=payment_closed_outbox_settings,
+        )
+
+        logger.info("Starting PaymentClosed outbox relay")
+        await relay.run(shutdown_event=shutdown_handler)
+    finally:
+        if publisher is not None:
+            logger.info("Closing PaymentClosed publisher")
+            await publisher.close()
+
+        if aws_clients is not None:
+            logger.info("Closing AWS clients")
+            await aws_clients.close()
+
+        if session_manager is not None:
+            logger.info("Closing session manager")
+            await session_manager.close()
+
+
+if __name__ == "__main__":
+    import logging.config
+
+    logging.config.fileConfig("logging.ini", disable_existing_loggers=False)
+    asyncio.run(main())
@@ -45,7 +45,7 @@ def run_migrations_offline() -> None:
     script output.
 
     """
-    url = settings.DSN
+    url = settings.DIRECT_DSN or settings.DSN
     context.configure(
         url=url,
         target_metadata=target_metadata,
@@ -71,7 +71,7 @@ async def run_async_migrations() -> None:
     """
 
     configuration = config.get_section(config.config_ini_section, {})
-    configuration["sqlalchemy.url"] = settings.DSN
+    configuration["sqlalchemy.url"] = settings.DIRECT_DSN or settings.DSN
     connectable = async_engine_from_config(
         configuration,
         prefix="sqlalchemy.",
@@ -0,0 +1,88 @@
+"""Long-lived AWS clients shared by the application components"""
+
+import logging
+from contextlib import AsyncExitStack
+from typing import Any
+
+from aioboto3 import Session as AIOBoto3Session
+from aiobotocore.config import AioConfig
+
+logger = logging.getLogger(__name__)
+
+
+class AWSClients:
+    """Registry of the AWS clients used by the application
+
+    The clients are created once, when the registry is started, and reused
+    until it is closed. This way service models, credentials and the HTTP
+    connection pool are loaded once per process instead of once per call.
+    SQS is exposed as a resource, whose underlying client is pooled the same
+    way, because the order created listener works with resource messages.
+    """
+
+    def __init__(self, session: AIOBoto3Session, max_pool_connections: int = 10):
+        self.session = session
+        self.config = AioConfig(max_pool_connections=max_pool_connections)
+        self._exit_stack: AsyncExitStack | None = None
+        self._sns: Any | None = None
+        self._sqs: Any | None = None
+
+    @property
+    def sns(self):
+        """The long-lived SNS client
+
+        :raises RuntimeError: If the registry was not started
+        """
+        if self._sns is None:
+            raise RuntimeError("The AWS clients registry was not started")
+
+        return self._sns
+
+    @property
+    def sqs(self):
+        """The long-lived SQS resource
+
+        :raises RuntimeError: If the registry was not started
+        """
+        if self._sqs is None:
+            raise RuntimeError("The AWS clients registry was not started")
+
+        return self._sqs
+
+    async def start(self) -> "AWSClients":
+        """Create the AWS clients
+
+        :return: The started registry
+        """
+        if self._exit_stack is not None:
+            return self
+
+        exit_stack = AsyncExitStack()
+        try:
+            self._sns = await exit_stack.enter_async_context(
+                self.session.client("sns", config=self.config)
+            )
+            self._sqs = await exit_stack.enter_async_context(
+                self.session.resource("sqs", config=self.config)
+            )
+        except BaseException:
+            self._sns = self._sqs = None
+            await exit_stack.aclose()
+            raise
+
+        self._exit_stack = exit_stack
+        logger.info("AWS clients started")
+        return self
+
+    async def close(self) -> None:
+        """Close the AWS clients and their connection pools
+
+        :return: None
+        """
+        if self._exit_stack is None:
+            return
+
+        exit_stack, self._exit_stack = self._exit_stack, None
+        self._sns = self._sqs = None
+        await exit_stack.aclose()
+        logger.info("AWS clients closed")
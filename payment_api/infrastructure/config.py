@@ -1,5 +1,8 @@
 """Application configuration module"""
 
+from typing import Literal, Self
+
+from pydantic import model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -27,17 +30,47 @@ class DatabaseSettings(BaseSettings):
 
     DSN: str
     ECHO: bool = False
-
-
-class TestDatabaseSettings(BaseSettings):
+    POOL_SIZE: int = 5
+    MAX_OVERFLOW: int = 10
+    POOL_TIMEOUT: float = 30.0  # seconds
+    POOL_RECYCLE: int = 1800  # seconds, -1 to never recycle
+    POOL_PRE_PING: bool = False
+    # Connections allowed across the processes sharing the database, split evenly
+    # between PROCESSES and capping POOL_SIZE and MAX_OVERFLOW, 0 for no budget
+    CONNECTION_BUDGET: int = 0
+    PROCESSES: int = 1
+    # Read-only sessions are spread between these replicas, each with its own pool
+    REPLICA_DSNS: list[str] = []
+    # Connections to the primary reserved for background work, 0 to share the pool
+    BACKGROUND_POOL_SIZE: int = 0
+    # Statements asyncpg keeps prepared on each connection, 0 to prepare every time
+    PREPARED_STATEMENT_CACHE_SIZE: int = 100
+    # Whether DSN points to PgBouncer in transaction pooling mode
+    PGBOUNCER: bool = False
+    # Postgres DSN for the session-level LISTEN connection and the migrations,
+    # required when DSN points to PgBouncer, DSN is used when empty otherwise
+    DIRECT_DSN: str = ""
+
+    @model_validator(mode="after")
+    def check_direct_dsn(self) -> Self:
+        """Require DIRECT_DSN when DSN points to PgBouncer, as the LISTEN
+        connection and the migrations cannot go through transaction pooling"""
+        if self.PGBOUNCER and not self.DIRECT_DSN:
+            raise ValueError("DIRECT_DSN is required when PGBOUNCER is enabled")
+
+        return self
+
+
+class TestDatabaseSettings(DatabaseSettings):
     """Test Database specific settings"""
 
     model_config = SettingsConfigDict(
-        env_file="settings/test_database.env", env_file_encoding="utf-8"
+        env_file="settings/test_database.env", env_file_encoding="utf-8", env_prefix=""
     )
 
-    DSN: str
-    ECHO: bool = False
+    # PgBouncer in transaction pooling mode in front of the test database, the
+    # PgBouncer integration tests are skipped when empty
+    PGBOUNCER_DSN: str = ""
 
 
 class HTTPClientSettings(BaseSettings):
@@ -65,6 +98,8 @@ class MercadoPagoSettings(BaseSettings):
     ACCESS_TOKEN: str
     USER_ID: str
     POS: str
+    POS_POOL: list[str] = []
+    POS_LEASE_STRATEGY: Literal["round_robin", "least_loaded"] = "round_robin"
     CALLBACK_URL: str
     WEBHOOK_KEY: str
 
@@ -80,6 +115,7 @@ class AWSSettings(BaseSettings):
     ACCOUNT_ID: str
     ACCESS_KEY_ID: str
     SECRET_ACCESS_KEY: str
+    MAX_POOL_CONNECTIONS: int = 10
 
 
 class OrderCreatedListenerSettings(BaseSettings):
@@ -108,3 +144,104 @@ class PaymentClosedPublisherSettings(BaseSettings):
 
     TOPIC_ARN: str
     GROUP_ID: str
+    GROUP_STRATEGY: Literal["constant", "payment_id", "hashed"] = "constant"
+    GROUP_BUCKETS: int = 16
+    DEDUPLICATION_STRATEGY: Literal["event_id", "payment_id"] = "event_id"
+    BATCH_SIZE: int = 10
+    BUFFER_ENABLED: bool = False
+    BUFFER_FLUSH_INTERVAL_SECONDS: float = 0.005
+
+
+class PaymentClosedOutboxSettings(BaseSettings):
+    """Payment Closed outbox and relay settings"""
+
+    model_config = SettingsConfigDict(
+        env_file="settings/payment_closed_outbox.env",
+        env_file_encoding="utf-8",
+        env_prefix="PAYMENT_CLOSED_OUTBOX_",
+    )
+
+    BATCH_SIZE: int = 10
+    POLL_INTERVAL_SECONDS: float = 1.0
+    LOCK_TIMEOUT_SECONDS: float = 30.0
+    MAX_ATTEMPTS: int = 10
+    SENT_RETENTION_SECONDS: float = 7 * 24 * 3600.0
+    PURGE_INTERVAL_SECONDS: float = 3600.0
+    PURGE_BATCH_SIZE: int = 1000
+
+
+class PaymentCacheSettings(BaseSettings):
+    """In-process payment cache settings"""
+
+    model_config = SettingsConfigDict(
+        env_file="settings/payment_cache.env",
+        env_file_encoding="utf-8",
+        env_prefix="PAYMENT_CACHE_",
+    )
+
+    ENABLED: bool = False
+    MAX_SIZE: int = 10000
+    OPENED_TTL_SECONDS: float = 1.0
+    TERMINAL_TTL_SECONDS: float = 3600.0
+    NOT_FOUND_TTL_SECONDS: float = 2.0
+    STALE_TTL_SECONDS: float = 5.0
+
+
+class PaymentEventsSettings(BaseSettings):
+    """Payment status server-sent events settings"""
+
+    model_config = SettingsConfigDict(
+        env_file="settings/payment_events.env",
+        env_file_encoding="utf-8",
+        env_prefix="PAYMENT_EVENTS_",
+    )
+
+    ENABLED: bool = False
+    SUBSCRIBER_QUEUE_SIZE: int = 16
+    KEEPALIVE_INTERVAL_SECONDS: float = 15.0
+    RECONNECT_INTERVAL_SECONDS: float = 1.0
+
+
+class MercadoPagoNotificationInboxSettings(BaseSettings):
+    """Mercado Pago notification inbox settings"""
+
+    model_config = SettingsConfigDict(
+        env_file="settings/mercado_pago_notification_inbox.env",
+        env_file_encoding="utf-8",
+        env_prefix="MERCADO_PAGO_NOTIFICATION_INBOX_",
+    )
+
+    ENABLED: bool = False
+    BATCH_SIZE: int = 10
+    CONCURRENCY: int = 5
+    POLL_INTERVAL_SECONDS: float = 1.0
+    LOCK_TIMEOUT_SECONDS: float = 60.0
+    MAX_ATTEMPTS: int = 5
+    RECENTLY_SEEN_MAX_SIZE: int = 10000
+    RECENTLY_SEEN_TTL_SECONDS: float = 900.0
+
+
+class QRCodeSettings(BaseSettings):
+    """QR code rendering settings"""
+
+    model_config = SettingsConfigDict(
+        env_file="settings/qr_code.env",
+        env_file_encoding="utf-8",
+        env_prefix="QR_CODE_",
+    )
+
+    CACHE_ENABLED: bool = True
+    CACHE_MAX_BYTES: int = 16 * 1024 * 1024
+    EXECUTOR: Literal["inline", "thread", "process", "interpreter"] = "thread"
+    EXECUTOR_MAX_WORKERS: int = 4
+    MAX_PENDING_RENDERS: int = 64
+    RENDER_TIMEOUT_SECONDS: float = 5.0
+    PRE_RENDER_ENABLED: bool = False
+    PNG_COMPRESSION_LEVEL: int = 9
+    FILE_STORE_ENABLED: bool = False
+    FILE_STORE_DIRECTORY: str = "/var/cache/payment-api/qr"
+    FILE_STORE_MAX_AGE_SECONDS: float = 7 * 24 * 3600.0
+    FILE_STORE_MAX_BYTES: int = 256 * 1024 * 1024
+    FILE_STORE_EVICTION_INTERVAL_SECONDS: float = 300.0
+    FILE_STORE_DELIVERY: Literal["sendfile", "x-accel-redirect"] = "sendfile"
+    FILE_STORE_ACCEL_REDIRECT_PREFIX: str = "/internal/qr/"
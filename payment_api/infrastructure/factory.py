@@ -6,44 +6,85 @@ from typing import AsyncIterator
 
 from aioboto3 import Session as AIOBoto3Session
 from httpx import AsyncClient
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from payment_api.adapters.inbound.listeners import (
+    MercadoPagoNotificationHandler,
+    MercadoPagoNotificationListener,
     OrderCreatedHandler,
     OrderCreatedListener,
+    PaymentClosedOutboxRelay,
 )
 from payment_api.adapters.out import (
     BotoPaymentClosedPublisher,
+    BufferedPaymentClosedPublisher,
+    CachedPaymentRepository,
+    LocalQRCodeFileStore,
     MPPaymentGateway,
+    SAMercadoPagoNotificationInbox,
+    SAMercadoPagoPOSLeaseManager,
+    SAPaymentClosedOutbox,
     SAPaymentRepository,
+    SAQRCodeImageRepository,
 )
 from payment_api.application.use_cases import (
     CreatePaymentFromOrderUseCase,
     FinalizePaymentByMercadoPagoPaymentIdUseCase,
     FindPaymentByIdUseCase,
+    FindPaymentsByIdsUseCase,
+    FindPaymentVersionByIdUseCase,
     RenderQRCodeUseCase,
 )
 from payment_api.application.use_cases.ports import (
     AbstractMercadoPagoClient,
+    AbstractMercadoPagoNotificationDeduplicator,
     AbstractQRCodeRenderer,
+    MercadoPagoNotificationInbox,
+    MercadoPagoPOSLeaseManager,
+    MercadoPagoPOSLeaseStrategy,
+    QRCodeFileStore,
+    QRCodeImageRepository,
 )
+from payment_api.domain.entities import PaymentOut
 from payment_api.domain.ports import (
+    PaymentClosedOutbox,
     PaymentClosedPublisher,
     PaymentGateway,
     PaymentRepository,
 )
+from payment_api.infrastructure.aws import AWSClients
 from payment_api.infrastructure.config import (
     AWSSettings,
     DatabaseSettings,
     HTTPClientSettings,
+    MercadoPagoNotificationInboxSettings,
     MercadoPagoSettings,
     OrderCreatedListenerSettings,
+    PaymentCacheSettings,
+    PaymentClosedOutboxSettings,
     PaymentClosedPublisherSettings,
+    PaymentEventsSettings,
+    QRCodeSettings,
+)
+from payment_api.infrastructure.mercado_pago import (
+    MercadoPagoAPIClient,
+    MercadoPagoNotificationDeduplicator,
+    RecentlySeenNotifications,
 )
-from payment_api.infrastructure.mercado_pago import MercadoPagoAPIClient
 from payment_api.infrastructure.mercado_pago_client import MercadoPagoClient
 from payment_api.infrastructure.orm import SessionManager
-from payment_api.infrastructure.qr_code_renderer import QRCodeRenderer
+from payment_api.infrastructure.payment_cache import PaymentCache
+from payment_api.infrastructure.payment_status_notifications import (
+    PaymentStatusNotifications,
+)
+from payment_api.infrastructure.qr_code_renderer import (
+    CachedQRCodeRenderer,
+    ExecutorQRCodeRenderer,
+    QRCodeExecutor,
+    QRCodeRenderer,
+    create_qr_code_executor,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -55,11 +96,14 @@ def get_session_manager(settings: DatabaseSettings) -> SessionManager:
 
 @asynccontextmanager
 async def get_db_session(
-    session_manager: SessionManager,
+    session_manager: SessionManager, readonly: bool = False, background: bool = False
 ) -> AsyncIterator[AsyncSession]:
-    """Get a database session"""
+    """Get a database session, read-only sessions may be bound to a read replica
+    and background sessions to the background pool"""
 
-    async with session_manager.session() as session:
+    async with session_manager.session(
+        readonly=readonly, background=background
+    ) as session:
         yield session
 
 
@@ -73,21 +117,135 @@ def get_aws_session(settings: AWSSettings) -> AIOBoto3Session:
     )
 
 
+def get_aws_clients(settings: AWSSettings) -> AWSClients:
+    """Return an AWSClients registry, which must be started before use"""
+    return AWSClients(
+        session=get_aws_session(settings=settings),
+        max_pool_connections=settings.MAX_POOL_CONNECTIONS,
+    )
+
+
 def get_http_client(settings: HTTPClientSettings) -> AsyncClient:
     """Return an AsyncClient instance"""
     return AsyncClient(timeout=settings.TIMEOUT)
 
 
-def get_payment_repository(session: AsyncSession) -> PaymentRepository:
-    """Return a PaymentRepository instance"""
-    return SAPaymentRepository(session=session)
+def get_payment_repository(
+    session: AsyncSession, payment_cache: PaymentCache | None = None
+) -> PaymentRepository:
+    """Return a PaymentRepository instance, cached if a PaymentCache is given"""
+    repository = SAPaymentRepository(session=session)
+    if payment_cache is None:
+        return repository
+
+    return CachedPaymentRepository(repository=repository, cache=payment_cache)
+
+
+def get_payment_cache(
+    settings: PaymentCacheSettings, session_manager: SessionManager
+) -> PaymentCache | None:
+    """Return a PaymentCache instance, or None if the payment cache is disabled"""
+    if not settings.ENABLED:
+        return None
+
+    async def load(payment_id: str) -> PaymentOut:
+        async with session_manager.session(readonly=True, background=True) as session:
+            return await get_payment_repository(session=session).find_by_id(payment_id)
+
+    return PaymentCache(
+        loader=load,
+        max_size=settings.MAX_SIZE,
+        opened_ttl=settings.OPENED_TTL_SECONDS,
+        terminal_ttl=settings.TERMINAL_TTL_SECONDS,
+        not_found_ttl=settings.NOT_FOUND_TTL_SECONDS,
+        stale_ttl=settings.STALE_TTL_SECONDS,
+    )
+
+
+def get_payment_closed_outbox(
+    session: AsyncSession, settings: PaymentClosedOutboxSettings
+) -> PaymentClosedOutbox:
+    """Return a PaymentClosedOutbox instance"""
+    return SAPaymentClosedOutbox(
+        session=session,
+        lock_timeout=settings.LOCK_TIMEOUT_SECONDS,
+        max_attempts=settings.MAX_ATTEMPTS,
+        sent_retention=settings.SENT_RETENTION_SECONDS,
+    )
+
+
+def get_payment_status_notifications(
+    settings: PaymentEventsSettings, database_settings: DatabaseSettings
+) -> PaymentStatusNotifications | None:
+    """Return a PaymentStatusNotifications instance, which must be started before
+    use, or None if the payment events are disabled"""
+    if not settings.ENABLED:
+        return None
+
+    # LISTEN is session-level state, so it cannot go through PgBouncer
+    dsn = make_url(database_settings.DIRECT_DSN or database_settings.DSN)
+    dsn = dsn.set(drivername="postgresql")
+    return PaymentStatusNotifications(
+        dsn=dsn.render_as_string(hide_password=False),
+        queue_size=settings.SUBSCRIBER_QUEUE_SIZE,
+        keepalive_interval=settings.KEEPALIVE_INTERVAL_SECONDS,
+        reconnect_interval=settings.RECONNECT_INTERVAL_SECONDS,
+    )
+
+
+def get_mercado_pago_notification_inbox(
+    session: AsyncSession, settings: MercadoPagoNotificationInboxSettings
+) -> MercadoPagoNotificationInbox:
+    """Return a MercadoPagoNotificationInbox instance"""
+    return SAMercadoPagoNotificationInbox(
+        session=session,
+        lock_timeout=settings.LOCK_TIMEOUT_SECONDS,
+        max_attempts=settings.MAX_ATTEMPTS,
+    )
+
+
+def get_recently_seen_notifications(
+    settings: MercadoPagoNotificationInboxSettings,
+) -> RecentlySeenNotifications:
+    """Return a RecentlySeenNotifications instance"""
+    return RecentlySeenNotifications(
+        max_size=settings.RECENTLY_SEEN_MAX_SIZE,
+        ttl=settings.RECENTLY_SEEN_TTL_SECONDS,
+    )
+
+
+def get_mercado_pago_notification_deduplicator(
+    inbox: MercadoPagoNotificationInbox,
+    recently_seen: RecentlySeenNotifications,
+) -> AbstractMercadoPagoNotificationDeduplicator:
+    """Return a MercadoPagoNotificationDeduplicator instance"""
+    return MercadoPagoNotificationDeduplicator(inbox=inbox, recently_seen=recently_seen)
+
+
+def get_mercado_pago_pos_lease_manager(
+    session: AsyncSession, settings: MercadoPagoSettings
+) -> MercadoPagoPOSLeaseManager | None:
+    """Return a MercadoPagoPOSLeaseManager instance, or None if no point of sale
+    pool is configured"""
+    if not settings.POS_POOL:
+        return None
+
+    return SAMercadoPagoPOSLeaseManager(
+        session=session,
+        pos_ids=settings.POS_POOL,
+        strategy=MercadoPagoPOSLeaseStrategy(settings.POS_LEASE_STRATEGY),
+    )
 
 
 def get_mercado_pago_api_client(
-    settings: MercadoPagoSettings, http_client: AsyncClient
+    settings: MercadoPagoSettings,
+    http_client: AsyncClient,
+    pos_lease_manager: MercadoPagoPOSLeaseManager | None = None,
 ) -> MercadoPagoAPIClient:
     """Return a MercadoPagoAPIClient instance"""
-    return MercadoPagoAPIClient(settings=settings, http_client=http_client)
+    return MercadoPagoAPIClient(
+        settings=settings, http_client=http_client, pos_lease_manager=pos_lease_manager
+    )
 
 
 def get_payment_gateway(
@@ -99,17 +257,78 @@ def get_payment_gateway(
 
 def get_payment_closed_publisher(
     settings: PaymentClosedPublisherSettings,
-    aio_boto3_session: AIOBoto3Session,
+    aws_clients: AWSClients,
 ) -> PaymentClosedPublisher:
-    """Return a PaymentClosedPublisher instance"""
-    return BotoPaymentClosedPublisher(
-        aio_boto3_session=aio_boto3_session, settings=settings
+    """Return a PaymentClosedPublisher instance, buffered into batches if
+    enabled in the settings"""
+    publisher = BotoPaymentClosedPublisher(
+        sns_client=aws_clients.sns, settings=settings
+    )
+
+    if not settings.BUFFER_ENABLED:
+        return publisher
+
+    return BufferedPaymentClosedPublisher(
+        publisher=publisher,
+        max_batch_size=settings.BATCH_SIZE,
+        flush_interval=settings.BUFFER_FLUSH_INTERVAL_SECONDS,
+    )
+
+
+def get_executor_qr_code_renderer(
+    settings: QRCodeSettings,
+) -> AbstractQRCodeRenderer:
+    """Return a QRCodeRenderer instance rendering on the executor configured in
+    the settings"""
+    return ExecutorQRCodeRenderer(
+        renderer=QRCodeRenderer(compress_level=settings.PNG_COMPRESSION_LEVEL),
+        executor=create_qr_code_executor(
+            executor=QRCodeExecutor(settings.EXECUTOR),
+            max_workers=settings.EXECUTOR_MAX_WORKERS,
+        ),
+        max_pending=settings.MAX_PENDING_RENDERS,
+        timeout=settings.RENDER_TIMEOUT_SECONDS,
     )
 
 
-def get_qr_code_renderer() -> AbstractQRCodeRenderer:
-    """Return a QRCodeRenderer instance"""
-    return QRCodeRenderer()
+def get_qr_code_renderer(settings: QRCodeSettings) -> AbstractQRCodeRenderer:
+    """Return a QRCodeRenderer instance rendering on the executor configured in
+    the settings, caching the rendered QR codes if enabled"""
+    renderer = get_executor_qr_code_renderer(settings=settings)
+    if not settings.CACHE_ENABLED:
+        return renderer
+
+    return CachedQRCodeRenderer(renderer=renderer, max_bytes=settings.CACHE_MAX_BYTES)
+
+
+def get_qr_code_pre_renderer(
+    settings: QRCodeSettings,
+) -> AbstractQRCodeRenderer | None:
+    """Return a QRCodeRenderer instance to pre-render the QR codes of created
+    payments, or None if pre-rendering is disabled in the settings"""
+    if not settings.PRE_RENDER_ENABLED:
+        return None
+
+    return get_executor_qr_code_renderer(settings=settings)
+
+
+def get_qr_code_image_repository(session: AsyncSession) -> QRCodeImageRepository:
+    """Return a SAQRCodeImageRepository instance"""
+    return SAQRCodeImageRepository(session=session)
+
+
+def get_qr_code_file_store(settings: QRCodeSettings) -> LocalQRCodeFileStore | None:
+    """Return a LocalQRCodeFileStore instance, or None if storing QR codes as
+    files is disabled in the settings"""
+    if not settings.FILE_STORE_ENABLED:
+        return None
+
+    return LocalQRCodeFileStore(
+        directory=settings.FILE_STORE_DIRECTORY,
+        max_age=settings.FILE_STORE_MAX_AGE_SECONDS,
+        max_bytes=settings.FILE_STORE_MAX_BYTES,
+        eviction_interval=settings.FILE_STORE_EVICTION_INTERVAL_SECONDS,
+    )
 
 
 def get_mercado_pago_client(
@@ -122,11 +341,15 @@ def get_mercado_pago_client(
 def get_create_payment_from_order_use_case(
     payment_repository: PaymentRepository,
     payment_gateway: PaymentGateway,
+    qr_code_renderer: AbstractQRCodeRenderer | None = None,
+    qr_code_image_repository: QRCodeImageRepository | None = None,
 ) -> CreatePaymentFromOrderUseCase:
     """Return a CreatePaymentFromOrderUseCase instance"""
     return CreatePaymentFromOrderUseCase(
         payment_repository=payment_repository,
         payment_gateway=payment_gateway,
+        qr_code_renderer=qr_code_renderer,
+        qr_code_image_repository=qr_code_image_repository,
     )
 
 
@@ -137,39 +360,66 @@ def get_find_payment_by_id_use_case(
     return FindPaymentByIdUseCase(payment_repository=payment_repository)
 
 
+def get_find_payment_version_by_id_use_case(
+    payment_repository: PaymentRepository,
+) -> FindPaymentVersionByIdUseCase:
+    """Return a FindPaymentVersionByIdUseCase instance"""
+    return FindPaymentVersionByIdUseCase(payment_repository=payment_repository)
+
+
+def get_find_payments_by_ids_use_case(
+    payment_repository: PaymentRepository,
+) -> FindPaymentsByIdsUseCase:
+    """Return a FindPaymentsByIdsUseCase instance"""
+    return FindPaymentsByIdsUseCase(payment_repository=payment_repository)
+
+
 def get_render_qr_code_use_case(
     payment_repository: PaymentRepository,
     qr_code_renderer: AbstractQRCodeRenderer,
+    qr_code_image_repository: QRCodeImageRepository | None = None,
+    qr_code_file_store: QRCodeFileStore | None = None,
 ) -> RenderQRCodeUseCase:
     """Return a RenderQRCodeUseCase instance"""
     return RenderQRCodeUseCase(
-        payment_repository=payment_repository, qr_code_renderer=qr_code_renderer
+        payment_repository=payment_repository,
+        qr_code_renderer=qr_code_renderer,
+        qr_code_image_repository=qr_code_image_repository,
+        qr_code_file_store=qr_code_file_store,
     )
 
 
 def get_finalize_payment_by_mercado_pago_payment_id_use_case(
     payment_repository: PaymentRepository,
     mercado_pago_client: AbstractMercadoPagoClient,
-    payment_closed_publisher: PaymentClosedPublisher,
+    payment_closed_outbox: PaymentClosedOutbox,
+    pos_lease_manager: MercadoPagoPOSLeaseManager | None = None,
 ) -> FinalizePaymentByMercadoPagoPaymentIdUseCase:
     """Return a FinalizePaymentByMercadoPagoPaymentIdUseCase instance"""
     return FinalizePaymentByMercadoPagoPaymentIdUseCase(
         payment_repository=payment_repository,
         mercado_pago_client=mercado_pago_client,
-        payment_closed_publisher=payment_closed_publisher,
+        payment_closed_outbox=payment_closed_outbox,
+        pos_lease_manager=pos_lease_manager,
     )
 
 
 def create_payment_from_order_use_case_factory(
     mercado_pago_settings: MercadoPagoSettings,
     http_client: AsyncClient,
+    qr_code_renderer: AbstractQRCodeRenderer | None = None,
 ):
-    """Create a factory function for creating use cases with sessions"""
+    """Create a factory function for creating use cases with sessions, which
+    pre-render the QR codes of created payments if a renderer is given"""
 
     def use_case_factory(session: AsyncSession) -> CreatePaymentFromOrderUseCase:
         repository = get_payment_repository(session=session)
         mp_api_client = get_mercado_pago_api_client(
-            settings=mercado_pago_settings, http_client=http_client
+            settings=mercado_pago_settings,
+            http_client=http_client,
+            pos_lease_manager=get_mercado_pago_pos_lease_manager(
+                session=session, settings=mercado_pago_settings
+            ),
         )
 
         gateway = get_payment_gateway(
@@ -180,6 +430,12 @@ def create_payment_from_order_use_case_factory(
         return get_create_payment_from_order_use_case(
             payment_repository=repository,
             payment_gateway=gateway,
+            qr_code_renderer=qr_code_renderer,
+            qr_code_image_repository=(
+                get_qr_code_image_repository(session=session)
+                if qr_code_renderer is not None
+                else None
+            ),
         )
 
     return use_case_factory
@@ -189,20 +445,127 @@ def get_order_created_handler(
     session_manager: SessionManager,
     mercado_pago_settings: MercadoPagoSettings,
     http_client: AsyncClient,
+    qr_code_renderer: AbstractQRCodeRenderer | None = None,
 ) -> OrderCreatedHandler:
     """Create an OrderCreatedHandler instance"""
     return OrderCreatedHandler(
         session_manager=session_manager,
         use_case_factory=create_payment_from_order_use_case_factory(
-            mercado_pago_settings=mercado_pago_settings, http_client=http_client
+            mercado_pago_settings=mercado_pago_settings,
+            http_client=http_client,
+            qr_code_renderer=qr_code_renderer,
         ),
     )
 
 
 def create_order_created_listener(
-    session: AIOBoto3Session,
+    aws_clients: AWSClients,
     handler: OrderCreatedHandler,
     settings: OrderCreatedListenerSettings,
 ) -> OrderCreatedListener:
     """Create an OrderCreatedListener instance"""
-    return OrderCreatedListener(session=session, handler=handler, settings=settings)
+    return OrderCreatedListener(sqs=aws_clients.sqs, handler=handler, settings=settings)
+
+
+def mercado_pago_notification_inbox_factory(
+    settings: MercadoPagoNotificationInboxSettings,
+):
+    """Create a factory function for creating notification inboxes with sessions"""
+
+    def inbox_factory(session: AsyncSession) -> MercadoPagoNotificationInbox:
+        return get_mercado_pago_notification_inbox(session=session, settings=settings)
+
+    return inbox_factory
+
+
+def finalize_payment_by_mercado_pago_payment_id_use_case_factory(
+    mercado_pago_settings: MercadoPagoSettings,
+    http_client: AsyncClient,
+    payment_closed_outbox_settings: PaymentClosedOutboxSettings,
+    payment_cache: PaymentCache | None = None,
+):
+    """Create a factory function for creating use cases with sessions"""
+
+    def use_case_factory(
+        session: AsyncSession,
+    ) -> FinalizePaymentByMercadoPagoPaymentIdUseCase:
+        repository = get_payment_repository(
+            session=session, payment_cache=payment_cache
+        )
+        mp_api_client = get_mercado_pago_api_client(
+            settings=mercado_pago_settings, http_client=http_client
+        )
+
+        outbox = get_payment_closed_outbox(
+            session=session, settings=payment_closed_outbox_settings
+        )
+
+        return get_finalize_payment_by_mercado_pago_payment_id_use_case(
+            payment_repository=repository,
+            mercado_pago_client=get_mercado_pago_client(
+                mercado_pago_api_client=mp_api_client
+            ),
+            payment_closed_outbox=outbox,
+            pos_lease_manager=get_mercado_pago_pos_lease_manager(
+                session=session, settings=mercado_pago_settings
+            ),
+        )
+
+    return use_case_factory
+
+
+def get_mercado_pago_notification_handler(
+    session_manager: SessionManager,
+    mercado_pago_settings: MercadoPagoSettings,
+    http_client: AsyncClient,
+    payment_closed_outbox_settings: PaymentClosedOutboxSettings,
+    inbox_settings: MercadoPagoNotificationInboxSettings,
+) -> MercadoPagoNotificationHandler:
+    """Create a MercadoPagoNotificationHandler instance"""
+    return MercadoPagoNotificationHandler(
+        session_manager=session_manager,
+        use_case_factory=finalize_payment_by_mercado_pago_payment_id_use_case_factory(
+            mercado_pago_settings=mercado_pago_settings,
+            http_client=http_client,
+            payment_closed_outbox_settings=payment_closed_outbox_settings,
+        ),
+        inbox_factory=mercado_pago_notification_inbox_factory(settings=inbox_settings),
+    )
+
+
+def create_mercado_pago_notification_listener(
+    session_manager: SessionManager,
+    handler: MercadoPagoNotificationHandler,
+    settings: MercadoPagoNotificationInboxSettings,
+) -> MercadoPagoNotificationListener:
+    """Create a MercadoPagoNotificationListener instance"""
+    return MercadoPagoNotificationListener(
+        session_manager=session_manager,
+        handler=handler,
+        inbox_factory=mercado_pago_notification_inbox_factory(settings=settings),
+        settings=settings,
+    )
+
+
+def payment_closed_outbox_factory(settings: PaymentClosedOutboxSettings):
+    """Create a factory function for creating payment closed outboxes with
+    sessions"""
+
+    def outbox_factory(session: AsyncSession) -> PaymentClosedOutbox:
+        return get_payment_closed_outbox(session=session, settings=settings)
+
+    return outbox_factory
+
+
+def create_payment_closed_outbox_relay(
+    session_manager: SessionManager,
+    publisher: PaymentClosedPublisher,
+    settings: PaymentClosedOutboxSettings,
+) -> PaymentClosedOutboxRelay:
+    """Create a PaymentClosedOutboxRelay instance"""
+    return PaymentClosedOutboxRelay(
+        session_manager=session_manager,
+        outbox_factory=payment_closed_outbox_factory(settings=settings),
+        publisher=publisher,
+        settings=settings,
+    )
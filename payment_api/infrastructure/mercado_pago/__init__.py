@@ -2,6 +2,10 @@
 
 from .client import MercadoPagoAPIClient
 from .exceptions import MPClientError, MPNotFoundError
+from .notification_deduplicator import (
+    MercadoPagoNotificationDeduplicator,
+    RecentlySeenNotifications,
+)
 from .schemas import (
     MPCreateOrderIn,
     MPCreateOrderOut,
@@ -21,4 +25,6 @@ __all__ = [
     "MPCreateOrderOut",
     "MPOrder",
     "MPPayment",
+    "MercadoPagoNotificationDeduplicator",
+    "RecentlySeenNotifications",
 ]
@@ -1,11 +1,13 @@
 """Client for interacting with the Mercado Pago API."""
 
 import logging
+from datetime import datetime
 from typing import NoReturn, TypeVar
 
 from httpx import AsyncClient, HTTPError, HTTPStatusError
 from pydantic import BaseModel
 
+from payment_api.application.use_cases.ports import MercadoPagoPOSLeaseManager
 from payment_api.infrastructure.config import MercadoPagoSettings
 from payment_api.infrastructure.mercado_pago.exceptions import (
     MPClientError,
@@ -26,26 +28,64 @@ T = TypeVar("T", bound=BaseModel)
 class MercadoPagoAPIClient:
     """Client for interacting with the Mercado Pago API."""
 
-    def __init__(self, settings: MercadoPagoSettings, http_client: AsyncClient):
+    def __init__(
+        self,
+        settings: MercadoPagoSettings,
+        http_client: AsyncClient,
+        pos_lease_manager: MercadoPagoPOSLeaseManager | None = None,
+    ):
         self.access_token = settings.ACCESS_TOKEN
         self.user_id = settings.USER_ID
         self.pos = settings.POS
         self.base_url = settings.URL
         self.http_client = http_client
+        self.pos_lease_manager = pos_lease_manager
 
     async def create_dynamic_qr_order(
         self, order_data: MPCreateOrderIn
     ) -> MPCreateOrderOut:
         """Create a dynamic QR code order in Mercado Pago.
 
+        When a point of sale lease manager is given, the order is created in a
+        point of sale leased to the order until it expires, and the lease is
+        released if the creation fails for any reason.
+
         :param order_data: Data required to create the order.
         :return: Response containing the QR code data.
-        :raises MPClientError: If there is an error with the Mercado Pago API.
+        :raises MPClientError: If there is an error with the Mercado Pago API, or
+            if no point of sale is free.
+        :raises PersistenceError: If there is an error leasing the point of sale.
         """
 
+        if self.pos_lease_manager is None:
+            return await self._create_dynamic_qr_order(
+                pos=self.pos, order_data=order_data
+            )
+
+        lease_manager = self.pos_lease_manager
+        reference = order_data.external_reference
+        pos = await lease_manager.acquire(
+            payment_id=reference,
+            expires_at=datetime.fromisoformat(order_data.expiration_date),
+        )
+
+        if pos is None:
+            raise MPClientError(
+                f"No point of sale is free to create the order {reference}"
+            )
+
+        try:
+            return await self._create_dynamic_qr_order(pos=pos, order_data=order_data)
+        except BaseException:
+            await self._release_pos(lease_manager=lease_manager, reference=reference)
+            raise
+
+    async def _create_dynamic_qr_order(
+        self, pos: str, order_data: MPCreateOrderIn
+    ) -> MPCreateOrderOut:
         url = (
             f"{self.base_url}/instore/orders/qr/seller/collectors/{self.user_id}"
-            f"/pos/{self.pos}/qrs"
+            f"/pos/{pos}/qrs"
         )
 
         return await self._make_request(
@@ -55,6 +95,21 @@ class MercadoPagoAPIClient:
             response_model=MPCreateOrderOut,
         )
 
+    async def _release_pos(
+        self, lease_manager: MercadoPagoPOSLeaseManager, reference: str
+    ) -> None:
+        """Release the point of sale leased to an order whose creation failed,
+        which is otherwise freed when the order expires."""
+
+        try:
+            await lease_manager.release(payment_id=reference)
+        except Exception:  # pylint: disable=W0718
+            logger.warning(
+                "Failed to release the point of sale leased to order %s",
+                reference,
+                exc_info=True,
+            )
+
     async def find_order_by_id(self, order_id: int) -> MPOrder:
         """Find an order in Mercado Pago by its ID.
 
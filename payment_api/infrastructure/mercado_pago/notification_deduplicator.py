@@ -0,0 +1,123 @@
+"""Deduplication of Mercado Pago notifications delivered more than once."""
+
+import logging
+import time
+from collections import OrderedDict
+
+from payment_api.application.use_cases.ports import (
+    AbstractMercadoPagoNotificationDeduplicator,
+    MercadoPagoNotificationInbox,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class RecentlySeenNotifications:
+    """Bounded in-memory set of recently seen notification resource IDs.
+
+    Entries expire after a time to live and the oldest entries are evicted when
+    the set is full. The set lives in memory, so it is scoped to the process that
+    created it.
+    """
+
+    def __init__(self, max_size: int = 10000, ttl: float = 900.0):
+        if max_size <= 0:
+            raise ValueError("The recently seen notifications size must be positive")
+
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[str, float] = OrderedDict()
+
+    def seen(self, resource_id: str) -> bool:
+        """Check if a notification resource ID was seen and has not expired.
+
+        :param resource_id: The ID of the resource in Mercado Pago.
+        :type resource_id: str
+        :return: True if the resource ID was seen within the time to live.
+        :rtype: bool
+        """
+
+        expires_at = self._entries.get(resource_id)
+        if expires_at is None:
+            return False
+
+        if expires_at <= time.monotonic():
+            del self._entries[resource_id]
+            return False
+
+        return True
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, resource_id: str) -> None:
+        """Remember a notification resource ID.
+
+        :param resource_id: The ID of the resource in Mercado Pago.
+        :type resource_id: str
+        """
+
+        self._entries[resource_id] = time.monotonic() + self.ttl
+        self._entries.move_to_end(resource_id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+
+class MercadoPagoNotificationDeduplicator(AbstractMercadoPagoNotificationDeduplicator):
+    """Detects Mercado Pago notifications that were already handled.
+
+    Notifications are looked up in the recently seen set first, so duplicates
+    within its time to live are answered without touching the database. On a miss
+    the processed record in the inbox is checked.
+    """
+
+    def __init__(
+        self,
+        inbox: MercadoPagoNotificationInbox,
+        recently_seen: RecentlySeenNotifications,
+    ):
+        self.inbox = inbox
+        self.recently_seen = recently_seen
+
+    async def is_duplicate(self, resource_id: str) -> bool:
+        """Check if a notification for the resource was already handled.
+
+        :param resource_id: The ID of the resource in Mercado Pago.
+        :type resource_id: str
+        :return: True if the notification is a duplicate.
+        :rtype: bool
+        :raises PersistenceError: If an error occurs while reading the processed
+            record.
+        """
+
+        if self.recently_seen.seen(resource_id):
+            logger.debug("Notification %s found in recently seen set", resource_id)
+            return True
+
+        if await self.inbox.is_processed(resource_id):
+            logger.debug("Notification %s found in processed records", resource_id)
+            self.recently_seen.add(resource_id)
+            return True
+
+        return False
+
+    def remember(self, resource_id: str) -> None:
+        """Remember a notification that was accepted but may not be processed yet.
+
+        :param resource_id: The ID of the resource in Mercado Pago.
+        :type resource_id: str
+        """
+
+        self.recently_seen.add(resource_id)
+
+    async def mark_processed(self, resource_id: str) -> None:
+        """Record a notification as processed.
+
+        :param resource_id: The ID of the resource in Mercado Pago.
+        :type resource_id: str
+        :raises PersistenceError: If an error occurs while recording the
+            notification.
+        """
+
+        self.recently_seen.add(resource_id)
+        await self.inbox.mark_processed(resource_id)
@@ -1,6 +1,18 @@
 """Payment ORM models"""
 
 from .base import BaseModel
+from .mercado_pago_notification import MercadoPagoNotification
+from .mercado_pago_pos_lease import MercadoPagoPOSLease
 from .payment import Payment
+from .payment_closed_outbox import OutboxEventStatus, PaymentClosedOutboxEvent
+from .payment_qr_code_image import PaymentQRCodeImage
 
-__all__ = ["Payment", "BaseModel"]
+__all__ = [
+    "Payment",
+    "MercadoPagoNotification",
+    "MercadoPagoPOSLease",
+    "PaymentClosedOutboxEvent",
+    "OutboxEventStatus",
+    "PaymentQRCodeImage",
+    "BaseModel",
+]
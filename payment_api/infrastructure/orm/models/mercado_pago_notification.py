@@ -0,0 +1,53 @@
+from datetime import datetime
+
+from sqlalchemy import func, types
+from sqlalchemy.orm import Mapped, mapped_column
+
+from payment_api.application.use_cases.ports import MercadoPagoNotificationStatus
+
+from .base import BaseModel
+
+
+class MercadoPagoNotification(BaseModel):
+    """The Mercado Pago notification inbox ORM model"""
+
+    __tablename__ = "tb_notificacao_mercado_pago"
+
+    resource_id: Mapped[str] = mapped_column(
+        types.String, name="id_recurso", primary_key=True, unique=True, nullable=False
+    )
+
+    status: Mapped[MercadoPagoNotificationStatus] = mapped_column(
+        types.Enum(MercadoPagoNotificationStatus, native_enum=False),
+        name="st_notificacao",
+        nullable=False,
+        index=True,
+    )
+
+    attempts: Mapped[int] = mapped_column(
+        types.Integer, name="nu_tentativas", default=0, nullable=False
+    )
+
+    error: Mapped[str | None] = mapped_column(types.Text, name="ds_erro", nullable=True)
+
+    locked_at: Mapped[datetime | None] = mapped_column(
+        types.TIMESTAMP, name="dt_bloqueio", nullable=True
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        types.TIMESTAMP,
+        name="dt_inclusao",
+        default=func.now(),  # pylint: disable=E1102
+        nullable=False,
+    )
+
+    timestamp: Mapped[datetime] = mapped_column(
+        types.TIMESTAMP,
+        name="timestamp",
+        default=func.now(),  # pylint: disable=E1102
+        onupdate=func.now(),  # pylint: disable=E1102
+        nullable=False,
+    )
+
+    def __repr__(self):
+        return f"{type(self).__name__}[{self.resource_id}]"
@@ -0,0 +1,47 @@
+from datetime import datetime
+
+from sqlalchemy import func, types
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import BaseModel
+
+
+class MercadoPagoPOSLease(BaseModel):
+    """The Mercado Pago point of sale lease ORM model"""
+
+    __tablename__ = "tb_lease_ponto_venda_mercado_pago"
+
+    pos: Mapped[str] = mapped_column(
+        types.String,
+        name="id_ponto_venda",
+        primary_key=True,
+        unique=True,
+        nullable=False,
+    )
+
+    payment_id: Mapped[str | None] = mapped_column(
+        types.String, name="id_pagamento", nullable=True, index=True
+    )
+
+    leases: Mapped[int] = mapped_column(
+        types.Integer, name="nu_leases", default=0, nullable=False
+    )
+
+    leased_at: Mapped[datetime | None] = mapped_column(
+        types.TIMESTAMP, name="dt_lease", nullable=True
+    )
+
+    expires_at: Mapped[datetime | None] = mapped_column(
+        types.TIMESTAMP, name="dt_expiracao", nullable=True
+    )
+
+    timestamp: Mapped[datetime] = mapped_column(
+        types.TIMESTAMP,
+        name="timestamp",
+        default=func.now(),  # pylint: disable=E1102
+        onupdate=func.now(),  # pylint: disable=E1102
+        nullable=False,
+    )
+
+    def __repr__(self):
+        return f"{type(self).__name__}[{self.pos}]"
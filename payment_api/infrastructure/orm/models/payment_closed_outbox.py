@@ -0,0 +1,72 @@
+from datetime import datetime
+from enum import Enum, unique
+
+from sqlalchemy import func, types
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import BaseModel
+
+
+@unique
+class OutboxEventStatus(str, Enum):
+    """Enumeration of possible statuses of an event in the outbox."""
+
+    PENDING = "PENDING"
+    SENT = "SENT"
+    FAILED = "FAILED"
+
+
+class PaymentClosedOutboxEvent(BaseModel):
+    """The payment closed outbox ORM model"""
+
+    __tablename__ = "tb_outbox_pagamento_fechado"
+
+    id: Mapped[str] = mapped_column(
+        types.String, name="id_evento", primary_key=True, unique=True, nullable=False
+    )
+
+    payment_id: Mapped[str] = mapped_column(
+        types.String, name="id_pagamento", nullable=False
+    )
+
+    payload: Mapped[str] = mapped_column(types.Text, name="ds_payload", nullable=False)
+
+    status: Mapped[OutboxEventStatus] = mapped_column(
+        types.Enum(OutboxEventStatus, native_enum=False),
+        name="st_evento",
+        default=OutboxEventStatus.PENDING,
+        nullable=False,
+        index=True,
+    )
+
+    attempts: Mapped[int] = mapped_column(
+        types.Integer, name="nu_tentativas", default=0, nullable=False
+    )
+
+    error: Mapped[str | None] = mapped_column(types.Text, name="ds_erro", nullable=True)
+
+    locked_at: Mapped[datetime | None] = mapped_column(
+        types.TIMESTAMP, name="dt_bloqueio", nullable=True
+    )
+
+    sent_at: Mapped[datetime | None] = mapped_column(
+        types.TIMESTAMP, name="dt_envio", nullable=True
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        types.TIMESTAMP,
+        name="dt_inclusao",
+        default=func.now(),  # pylint: disable=E1102
+        nullable=False,
+    )
+
+    timestamp: Mapped[datetime] = mapped_column(
+        types.TIMESTAMP,
+        name="timestamp",
+        default=func.now(),  # pylint: disable=E1102
+        onupdate=func.now(),  # pylint: disable=E1102
+        nullable=False,
+    )
+
+    def __repr__(self):
+        return f"{type(self).__name__}[{self.id}]"
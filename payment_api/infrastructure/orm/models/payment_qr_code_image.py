@@ -0,0 +1,36 @@
+from datetime import datetime
+
+from sqlalchemy import ForeignKey, func, types
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import BaseModel
+
+
+class PaymentQRCodeImage(BaseModel):
+    """The pre-rendered payment QR code image ORM model"""
+
+    __tablename__ = "tb_imagem_qr_code_pagamento"
+
+    payment_id: Mapped[str] = mapped_column(
+        types.String,
+        ForeignKey("tb_pagamento.id", ondelete="CASCADE"),
+        name="id_pagamento",
+        primary_key=True,
+        nullable=False,
+    )
+
+    digest: Mapped[str] = mapped_column(types.String, name="cd_digest", nullable=False)
+
+    content: Mapped[bytes] = mapped_column(
+        types.LargeBinary, name="bn_imagem", nullable=False
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        types.TIMESTAMP,
+        name="dt_inclusao",
+        default=func.now(),  # pylint: disable=E1102
+        nullable=False,
+    )
+
+    def __repr__(self):
+        return f"{type(self).__name__}[{self.payment_id}]"
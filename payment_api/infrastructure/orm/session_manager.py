@@ -1,15 +1,24 @@
 """The database session manager"""
 
 import contextlib
+import itertools
+import time
+import uuid
+from contextvars import ContextVar
 from typing import AsyncIterator
 
+from pydantic import BaseModel, Field
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.ext.asyncio import (
     AsyncConnection,
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
 
 from payment_api.infrastructure.config import DatabaseSettings
 
@@ -23,20 +32,190 @@ class SessionManagerNotInitializedError(Exception):
         super().__init__(message)
 
 
+class PoolStats(BaseModel):
+    """Counters of a database connection pool"""
+
+    size: int = Field(..., description="Connections kept open by the pool.")
+    max_overflow: int = Field(..., description="Connections allowed over the size.")
+    checked_in: int = Field(..., description="Idle connections in the pool.")
+    checked_out: int = Field(..., description="Connections in use.")
+    overflow: int = Field(..., description="Connections open over the size.")
+    checkouts: int = Field(..., description="Connections handed out by the pool.")
+    timeouts: int = Field(..., description="Checkouts that timed out waiting.")
+    wait_time: float = Field(..., description="Seconds spent waiting for checkouts.")
+    max_wait_time: float = Field(..., description="Longest checkout wait in seconds.")
+
+    @property
+    def average_wait_time(self) -> float:
+        """Average seconds spent waiting for a checkout"""
+        return self.wait_time / self.checkouts if self.checkouts else 0.0
+
+
+class MeteredQueuePool(AsyncAdaptedQueuePool):
+    """An AsyncAdaptedQueuePool that measures how long checkouts wait
+
+    The wait includes opening a new connection when the pool is not full, so a
+    growing wait time means either an exhausted pool or a slow database.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_time = 0.0
+        self.max_wait_time = 0.0
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started_at = time.monotonic()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            waited = time.monotonic() - started_at
+            self.checkouts += 1
+            self.wait_time += waited
+            self.max_wait_time = max(self.max_wait_time, waited)
+
+
+def pool_limits(settings: DatabaseSettings) -> tuple[int, int]:
+    """Return the pool size and max overflow of the primary pool of each process
+
+    When a connection budget is set, each process gets an even share of it. The
+    background pool is reserved from the share first, and the rest is used for
+    the pool size and then for the overflow.
+
+    :param settings: The database settings
+    :return: The pool size and the max overflow
+    :raises ValueError: If the budget does not allow a connection per process
+    """
+    if settings.CONNECTION_BUDGET <= 0:
+        return settings.POOL_SIZE, settings.MAX_OVERFLOW
+
+    share = settings.CONNECTION_BUDGET // max(settings.PROCESSES, 1)
+    share -= settings.BACKGROUND_POOL_SIZE
+    if share < 1:
+        raise ValueError(
+            f"A budget of {settings.CONNECTION_BUDGET} connections is not enough "
+            f"for {settings.PROCESSES} processes"
+        )
+
+    pool_size = min(settings.POOL_SIZE, share)
+    return pool_size, min(settings.MAX_OVERFLOW, share - pool_size)
+
+
+def _create_engine(
+    settings: DatabaseSettings, dsn: str, pool_size: int, max_overflow: int
+) -> AsyncEngine:
+    return create_async_engine(
+        dsn,
+        echo=settings.ECHO,
+        poolclass=MeteredQueuePool,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=settings.POOL_TIMEOUT,
+        pool_recycle=settings.POOL_RECYCLE,
+        pool_pre_ping=settings.POOL_PRE_PING,
+        connect_args=_connect_args(settings),
+    )
+
+
+def _connect_args(settings: DatabaseSettings) -> dict:
+    if not settings.PGBOUNCER:
+        return {"prepared_statement_cache_size": settings.PREPARED_STATEMENT_CACHE_SIZE}
+
+    # PgBouncer in transaction pooling mode hands each transaction whichever
+    # server connection is free, so statements prepared by a client may already
+    # exist on it or be missing from it. Statements are prepared under unique
+    # names for every execution and never reused.
+    return {
+        "prepared_statement_cache_size": 0,
+        "statement_cache_size": 0,
+        "prepared_statement_name_func": _unique_statement_name,
+    }
+
+
+def _unique_statement_name() -> str:
+    return f"__asyncpg_{uuid.uuid4().hex}__"
+
+
+# Whether the current request or task committed on the primary, so its next
+# read-only sessions read their own writes from it instead of a lagging replica
+_wrote_to_primary: ContextVar[bool] = ContextVar("wrote_to_primary", default=False)
+
+
+def _mark_wrote_to_primary(_session) -> None:
+    _wrote_to_primary.set(True)
+
+
 class SessionManager:
-    """The database session manager"""
+    """The database session manager
+
+    Sessions are bound to the primary unless they are read-only or background
+    sessions. Read-only sessions are spread between the read replicas, or bound
+    to the primary when there are none or when the current request or task has
+    already committed on the primary. Background sessions are bound to a
+    separate pool on the primary, so background work cannot exhaust the pool
+    serving requests, or to the primary pool when there is no background pool.
+    """
 
     def __init__(self, settings: DatabaseSettings):
-        self._engine = create_async_engine(settings.DSN, echo=settings.ECHO)
+        pool_size, max_overflow = pool_limits(settings)
+        self._engine = _create_engine(settings, settings.DSN, pool_size, max_overflow)
+        self._replica_engines = [
+            _create_engine(settings, dsn, settings.POOL_SIZE, settings.MAX_OVERFLOW)
+            for dsn in settings.REPLICA_DSNS
+        ]
+        self._background_engine = (
+            _create_engine(settings, settings.DSN, settings.BACKGROUND_POOL_SIZE, 0)
+            if settings.BACKGROUND_POOL_SIZE > 0
+            else None
+        )
+        self._replicas = itertools.cycle(self._replica_engines)
         self._sessionmaker = async_sessionmaker(autocommit=False, bind=self._engine)
 
+    @property
+    def pool_names(self) -> list[str]:
+        """The names of the connection pools, as accepted by pool_stats"""
+        return list(self._engines())
+
+    def pool_stats(self, name: str = "primary") -> PoolStats:
+        """Return the counters of a connection pool
+
+        :param name: The name of the pool, primary, background or replica-<n>
+        :return: The pool counters
+        :raises SessionManagerNotInitializedError: If the manager is closed
+        :raises KeyError: If there is no pool with the given name
+        """
+        if self._engine is None:
+            raise SessionManagerNotInitializedError()
+
+        pool: MeteredQueuePool = self._engines()[name].pool  # type: ignore
+        return PoolStats(
+            size=pool.size(),
+            max_overflow=pool._max_overflow,  # pylint: disable=W0212
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            # The overflow counts down from -size until the pool is full
+            overflow=max(pool.overflow(), 0),
+            checkouts=pool.checkouts,
+            timeouts=pool.timeouts,
+            wait_time=pool.wait_time,
+            max_wait_time=pool.max_wait_time,
+        )
+
     async def close(self):
         """Close the database connection"""
         if self._engine is None:
             raise SessionManagerNotInitializedError()
-        await self._engine.dispose()
+
+        for engine in self._engines().values():
+            await engine.dispose()
 
         self._engine = None
+        self._replica_engines = []
+        self._background_engine = None
         self._sessionmaker = None
 
     @contextlib.asynccontextmanager
@@ -53,12 +232,30 @@ class SessionManager:
                 raise
 
     @contextlib.asynccontextmanager
-    async def session(self) -> AsyncIterator[AsyncSession]:
-        """Get a database session"""
+    async def session(
+        self, readonly: bool = False, background: bool = False
+    ) -> AsyncIterator[AsyncSession]:
+        """Get a database session
+
+        :param readonly: Whether the session only reads, so it may be bound to a
+            read replica
+        :param background: Whether the session runs background work, so it is
+            bound to the background pool
+        """
         if self._sessionmaker is None:
             raise SessionManagerNotInitializedError()
 
-        session = self._sessionmaker()
+        if readonly and self._replica_engines and not _wrote_to_primary.get():
+            session = self._sessionmaker(bind=next(self._replicas))
+        elif background and self._background_engine is not None:
+            session = self._sessionmaker(bind=self._background_engine)
+        else:
+            session = self._sessionmaker()
+            if self._replica_engines:
+                event.listen(
+                    session.sync_session, "after_commit", _mark_wrote_to_primary
+                )
+
         try:
             yield session
         except Exception:
@@ -66,3 +263,13 @@ class SessionManager:
             raise
         finally:
             await session.close()
+
+    def _engines(self) -> dict[str, AsyncEngine]:
+        engines = {"primary": self._engine}
+        if self._background_engine is not None:
+            engines["background"] = self._background_engine
+
+        for index, engine in enumerate(self._replica_engines):
+            engines[f"replica-{index}"] = engine
+
+        return engines
@@ -0,0 +1,240 @@
+"""In-process cache of payments read from the repository."""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from payment_api.domain.entities import PaymentOut
+from payment_api.domain.exceptions import NotFound
+from payment_api.domain.value_objects import PaymentStatus
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_STATUSES = frozenset({PaymentStatus.CLOSED, PaymentStatus.EXPIRED})
+
+
+class PaymentCacheEntry(BaseModel):
+    """A cached payment lookup."""
+
+    model_config = ConfigDict(frozen=True)
+
+    payment_id: str = Field(..., description="ID of the looked up payment.")
+    payment: PaymentOut | None = Field(
+        None, description="The payment, or None if the payment was not found."
+    )
+    fresh_until: float = Field(
+        ..., description="Monotonic time until the entry is served as is."
+    )
+    stale_until: float = Field(
+        ..., description="Monotonic time until the entry is served while revalidated."
+    )
+
+    @property
+    def is_fresh(self) -> bool:
+        """Whether the entry can be served without revalidation."""
+        return time.monotonic() < self.fresh_until
+
+
+class PaymentCacheStats(BaseModel):
+    """Counters of a payment cache."""
+
+    size: int = Field(..., description="Number of cached entries.")
+    max_size: int = Field(..., description="Maximum number of cached entries.")
+    hits: int = Field(..., description="Lookups served by fresh entries.")
+    stale_hits: int = Field(..., description="Lookups served by stale entries.")
+    misses: int = Field(..., description="Lookups not served by the cache.")
+    evictions: int = Field(..., description="Entries evicted because of the size.")
+    invalidations: int = Field(..., description="Entries invalidated by writes.")
+
+    @property
+    def hit_ratio(self) -> float:
+        """Share of the lookups served by the cache."""
+        lookups = self.hits + self.stale_hits + self.misses
+        return (self.hits + self.stale_hits) / lookups if lookups else 0.0
+
+
+class PaymentCache:
+    """Bounded LRU cache of payment lookups with status-aware TTLs.
+
+    Opened payments change when they are finalized, so they are cached for a short
+    time, while closed and expired payments never change and are cached for long.
+    Lookups of missing payments are cached briefly too. An expired entry is still
+    served for stale_ttl seconds while it is reloaded in the background with the
+    loader. The cache lives in memory, so it is scoped to the process that created
+    it and writes made by other processes are only seen once the entries expire.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[str], Awaitable[PaymentOut]],
+        max_size: int = 10000,
+        opened_ttl: float = 1.0,
+        terminal_ttl: float = 3600.0,
+        not_found_ttl: float = 2.0,
+        stale_ttl: float = 5.0,
+    ):
+        if max_size <= 0:
+            raise ValueError("The payment cache size must be positive")
+
+        self.loader = loader
+        self.max_size = max_size
+        self.opened_ttl = opened_ttl
+        self.terminal_ttl = terminal_ttl
+        self.not_found_ttl = not_found_ttl
+        self.stale_ttl = stale_ttl
+        self._entries: OrderedDict[str, PaymentCacheEntry] = OrderedDict()
+        self._revalidations: dict[str, asyncio.Task] = {}
+        self._hits = 0
+        self._stale_hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, payment_id: str) -> PaymentCacheEntry | None:
+        """Get the cached lookup of a payment.
+
+        Stale entries are returned too and their revalidation is scheduled.
+
+        :param payment_id: The ID of the payment.
+        :type payment_id: str
+        :return: The cached entry, or None if there is no entry that can be served.
+        :rtype: PaymentCacheEntry | None
+        """
+
+        entry = self._entries.get(payment_id)
+        now = time.monotonic()
+        if entry is None or entry.stale_until <= now:
+            if entry is not None:
+                del self._entries[payment_id]
+
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(payment_id)
+        if now < entry.fresh_until:
+            self._hits += 1
+        else:
+            self._stale_hits += 1
+            self._revalidate(entry)
+
+        return entry
+
+    def put(self, payment: PaymentOut) -> None:
+        """Cache a payment.
+
+        :param payment: The payment to cache.
+        :type payment: PaymentOut
+        """
+
+        ttl = (
+            self.terminal_ttl
+            if payment.payment_status in TERMINAL_STATUSES
+            else self.opened_ttl
+        )
+
+        now = time.monotonic()
+        self._store(
+            PaymentCacheEntry(
+                payment_id=payment.id,
+                payment=payment,
+                fresh_until=now + ttl,
+                stale_until=now + ttl + self.stale_ttl,
+            )
+        )
+
+    def put_not_found(self, payment_id: str) -> None:
+        """Cache the lookup of a missing payment.
+
+        Missing payments are not served stale, as they may be created at any time.
+
+        :param payment_id: The ID of the payment that was not found.
+        :type payment_id: str
+        """
+
+        expires_at = time.monotonic() + self.not_found_ttl
+        self._store(
+            PaymentCacheEntry(
+                payment_id=payment_id, fresh_until=expires_at, stale_until=expires_at
+            )
+        )
+
+    def invalidate(self, payment_id: str) -> None:
+        """Drop the cached lookup of a payment.
+
+        :param payment_id: The ID of the payment.
+        :type payment_id: str
+        """
+
+        if self._entries.pop(payment_id, None) is not None:
+            self._invalidations += 1
+
+    def stats(self) -> PaymentCacheStats:
+        """Return the counters of the cache.
+
+        :return: The cache counters.
+        :rtype: PaymentCacheStats
+        """
+
+        return PaymentCacheStats(
+            size=len(self._entries),
+            max_size=self.max_size,
+            hits=self._hits,
+            stale_hits=self._stale_hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            invalidations=self._invalidations,
+        )
+
+    async def close(self) -> None:
+        """Cancel the revalidations in progress."""
+
+        revalidations = list(self._revalidations.values())
+        for revalidation in revalidations:
+            revalidation.cancel()
+
+        await asyncio.gather(*revalidations, return_exceptions=True)
+
+    def _store(self, entry: PaymentCacheEntry) -> None:
+        self._entries[entry.payment_id] = entry
+        self._entries.move_to_end(entry.payment_id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def _revalidate(self, entry: PaymentCacheEntry) -> None:
+        if entry.payment_id in self._revalidations:
+            return
+
+        task = asyncio.create_task(self._reload(entry))
+        self._revalidations[entry.payment_id] = task
+        task.add_done_callback(
+            lambda _: self._revalidations.pop(entry.payment_id, None)
+        )
+
+    async def _reload(self, stale_entry: PaymentCacheEntry) -> None:
+        payment_id = stale_entry.payment_id
+        try:
+            payment = await self.loader(payment_id)
+        except NotFound:
+            payment = None
+        except Exception:  # pylint: disable=W0718
+            logger.warning("Failed to revalidate payment %s", payment_id, exc_info=True)
+            return
+
+        # Entries invalidated or replaced while reloading are newer than the load
+        if self._entries.get(payment_id) is not stale_entry:
+            return
+
+        if payment is None:
+            self.put_not_found(payment_id)
+        else:
+            self.put(payment)
+
+        logger.debug("Revalidated cached payment %s", payment_id)
@@ -0,0 +1,150 @@
+"""In-process fan-out of payment status changes notified by Postgres."""
+
+import asyncio
+import logging
+
+import asyncpg
+from pydantic import ValidationError
+
+from payment_api.domain.entities import PaymentVersion
+
+logger = logging.getLogger(__name__)
+
+PAYMENT_STATUS_CHANNEL = "payment_status"
+
+
+class PaymentStatusNotifications:
+    """Listens to payment status notifications and fans them out to subscribers.
+
+    One Postgres connection per process runs LISTEN on the payment status channel,
+    and every notification is delivered to the queues subscribed to its payment.
+    Queues are bounded: when a subscriber falls behind, its oldest change is
+    dropped. Changes notified while the connection is down are lost, so
+    subscribers should read the current version of the payment after subscribing.
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        queue_size: int = 16,
+        keepalive_interval: float = 15.0,
+        reconnect_interval: float = 1.0,
+    ):
+        if queue_size <= 0:
+            raise ValueError("The subscriber queue size must be positive")
+
+        self.dsn = dsn
+        self.queue_size = queue_size
+        self.keepalive_interval = keepalive_interval
+        self.reconnect_interval = reconnect_interval
+        self._subscribers: dict[str, set[asyncio.Queue]] = {}
+        self._connection: asyncpg.Connection | None = None
+        self._reconnection: asyncio.Task | None = None
+        self._closing = False
+
+    def __len__(self) -> int:
+        return sum(len(queues) for queues in self._subscribers.values())
+
+    async def start(self) -> None:
+        """Open the listener connection."""
+
+        self._closing = False
+        await self._connect()
+        logger.info("Listening to channel %s", PAYMENT_STATUS_CHANNEL)
+
+    async def close(self) -> None:
+        """Close the listener connection."""
+
+        self._closing = True
+        if self._reconnection is not None:
+            self._reconnection.cancel()
+            self._reconnection = None
+
+        if self._connection is not None:
+            connection, self._connection = self._connection, None
+            await connection.close()
+
+    def subscribe(self, payment_id: str) -> asyncio.Queue:
+        """Subscribe to the status changes of a payment.
+
+        :param payment_id: The ID of the payment.
+        :type payment_id: str
+        :return: The queue where the changes of the payment are put.
+        :rtype: asyncio.Queue
+        """
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.setdefault(payment_id, set()).add(queue)
+        return queue
+
+    def unsubscribe(self, payment_id: str, queue: asyncio.Queue) -> None:
+        """Stop delivering the status changes of a payment to a queue.
+
+        :param payment_id: The ID of the payment.
+        :type payment_id: str
+        :param queue: The queue returned by subscribe.
+        :type queue: asyncio.Queue
+        """
+
+        queues = self._subscribers.get(payment_id)
+        if queues is None:
+            return
+
+        queues.discard(queue)
+        if not queues:
+            del self._subscribers[payment_id]
+
+    def publish(self, version: PaymentVersion) -> None:
+        """Deliver a payment status change to the subscribers of the payment.
+
+        :param version: The new version of the payment.
+        :type version: PaymentVersion
+        """
+
+        for queue in self._subscribers.get(version.id, ()):
+            if queue.full():
+                queue.get_nowait()
+
+            queue.put_nowait(version)
+
+    async def _connect(self) -> None:
+        connection = await asyncpg.connect(self.dsn)
+        connection.add_termination_listener(self._on_termination)
+        await connection.add_listener(PAYMENT_STATUS_CHANNEL, self._on_notification)
+        self._connection = connection
+
+    def _on_notification(self, _connection, _pid, _channel, payload: str) -> None:
+        try:
+            version = PaymentVersion.model_validate_json(payload)
+        except ValidationError:
+            logger.warning(
+                "Discarding invalid payment status notification: %s", payload
+            )
+            return
+
+        self.publish(version)
+
+    def _on_termination(self, _connection) -> None:
+        self._connection = None
+        if self._closing or self._reconnection is not None:
+            return
+
+        logger.warning("Lost the payment status listener connection, reconnecting")
+        self._reconnection = asyncio.create_task(self._reconnect())
+
+    async def _reconnect(self) -> None:
+        try:
+            while not self._closing:
+                await asyncio.sleep(self.reconnect_interval)
+                try:
+                    await self._connect()
+                except (OSError, asyncpg.PostgresError):
+                    logger.warning(
+                        "Failed to reconnect the payment status listener", exc_info=True
+                    )
+                    continue
+
+                logger.info("Reconnected the payment status listener")
+                return
+        finally:
+            self._reconnection = None
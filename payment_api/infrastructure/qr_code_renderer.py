@@ -1,26 +1,322 @@
 """Module for rendering QR codes"""
 
-from io import BytesIO
+import asyncio
+import concurrent.futures
+import logging
+import struct
+import zlib
+from collections import OrderedDict
+from enum import Enum
 
-from qrcode import QRCode
-from qrcode.image.pil import PilImage
+from qrcode import QRCode, constants
 
-from payment_api.application.use_cases.ports import AbstractQRCodeRenderer
+from payment_api.application.use_cases.ports import (
+    AbstractQRCodeRenderer,
+    QRCodeErrorCorrection,
+    QRCodeFormat,
+    QRCodeOptions,
+    QRCodeRendererUnavailable,
+)
+
+logger = logging.getLogger(__name__)
+
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+ERROR_CORRECTION_LEVELS = {
+    QRCodeErrorCorrection.L: constants.ERROR_CORRECT_L,
+    QRCodeErrorCorrection.M: constants.ERROR_CORRECT_M,
+    QRCodeErrorCorrection.Q: constants.ERROR_CORRECT_Q,
+    QRCodeErrorCorrection.H: constants.ERROR_CORRECT_H,
+}
 
 
 class QRCodeRenderer(AbstractQRCodeRenderer):
-    """Concrete implementation of QR code rendering."""
+    """Concrete implementation of QR code rendering.
+
+    Images are written straight from the QR code modules, without an imaging
+    library: PNGs as 1-bit grayscale compressed with the given zlib level, and
+    SVGs as a single path with one subpath per run of dark modules.
+    """
 
-    def render(self, data: str) -> bytes:
+    def __init__(self, compress_level: int = 9):
+        if not 0 <= compress_level <= 9:
+            raise ValueError("The PNG compression level must be between 0 and 9")
+
+        self.compress_level = compress_level
+
+    def render(self, data: str, options: QRCodeOptions | None = None) -> bytes:
         """Render a QR code from the given data string.
 
         :data: str - The data to encode in the QR code.
+        :options: QRCodeOptions | None - The options of the image.
         :return: bytes - The rendered QR code as a byte array.
         """
 
-        qr_code = QRCode(image_factory=PilImage)
+        options = options or QRCodeOptions()
+        qr_code = QRCode(
+            error_correction=ERROR_CORRECTION_LEVELS[options.error_correction],
+            box_size=options.box_size,
+            border=options.border,
+        )
         qr_code.add_data(data)
-        image = qr_code.make_image()
-        img_buffer = BytesIO()
-        image.save(img_buffer, format="PNG")
-        return img_buffer.getvalue()
+        qr_code.make(fit=True)
+        modules = qr_code.get_matrix()
+        if options.format == QRCodeFormat.SVG:
+            return self._svg(modules, options.box_size)
+
+        return self._png(modules, options.box_size)
+
+    def _png(self, modules: list[list[bool]], box_size: int) -> bytes:
+        width = len(modules) * box_size
+        scanlines = bytearray()
+        for row in modules:
+            # Each scanline starts with filter type 0, and white pixels are 1
+            bits = "".join(
+                "0" if dark else "1" for dark in row for _ in range(box_size)
+            )
+            bits = bits.ljust(-(-width // 8) * 8, "1")
+            scanline = b"\x00" + int(bits, 2).to_bytes(len(bits) // 8, "big")
+            scanlines += scanline * box_size
+
+        header = struct.pack(">IIBBBBB", width, width, 1, 0, 0, 0, 0)
+        return b"".join(
+            (
+                PNG_SIGNATURE,
+                _png_chunk(b"IHDR", header),
+                _png_chunk(b"IDAT", zlib.compress(scanlines, self.compress_level)),
+                _png_chunk(b"IEND", b""),
+            )
+        )
+
+    @staticmethod
+    def _svg(modules: list[list[bool]], box_size: int) -> bytes:
+        size = len(modules)
+        path = []
+        for y, row in enumerate(modules):
+            x = 0
+            while x < size:
+                if not row[x]:
+                    x += 1
+                    continue
+
+                run = 1
+                while x + run < size and row[x + run]:
+                    run += 1
+
+                path.append(f"M{x} {y}h{run}v1h-{run}z")
+                x += run
+
+        return (
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{size * box_size}" '
+            f'height="{size * box_size}" viewBox="0 0 {size} {size}" '
+            f'shape-rendering="crispEdges"><rect width="100%" height="100%" '
+            f'fill="#fff"/><path d="{"".join(path)}"/></svg>'
+        ).encode()
+
+
+def _png_chunk(chunk_type: bytes, data: bytes) -> bytes:
+    return b"".join(
+        (
+            struct.pack(">I", len(data)),
+            chunk_type,
+            data,
+            struct.pack(">I", zlib.crc32(chunk_type + data)),
+        )
+    )
+
+
+class CachedQRCodeRenderer(AbstractQRCodeRenderer):
+    """Keeps the most recently rendered QR codes of a renderer in memory.
+
+    The QR code of a payment never changes once the payment is created, so the
+    rendered images are cached by the digest of their data and evicted, least
+    recently used first, when their total size exceeds max_bytes. Images larger
+    than max_bytes are not cached.
+    """
+
+    def __init__(self, renderer: AbstractQRCodeRenderer, max_bytes: int):
+        if max_bytes <= 0:
+            raise ValueError("The QR code cache size must be positive")
+
+        self.renderer = renderer
+        self.max_bytes = max_bytes
+        self._images: OrderedDict[str, bytes] = OrderedDict()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._images)
+
+    @property
+    def size(self) -> int:
+        """Total size in bytes of the cached images."""
+        return self._size
+
+    def render(self, data: str, options: QRCodeOptions | None = None) -> bytes:
+        image = self.cached(data, options)
+        if image is not None:
+            return image
+
+        image = self.renderer.render(data, options)
+        self._store(self.digest(data, options), image)
+        return image
+
+    async def render_async(
+        self, data: str, options: QRCodeOptions | None = None
+    ) -> bytes:
+        image = self.cached(data, options)
+        if image is not None:
+            return image
+
+        image = await self.renderer.render_async(data, options)
+        self._store(self.digest(data, options), image)
+        return image
+
+    async def close(self) -> None:
+        await self.renderer.close()
+
+    def digest(self, data: str, options: QRCodeOptions | None = None) -> str:
+        return self.renderer.digest(data, options)
+
+    def cached(self, data: str, options: QRCodeOptions | None = None) -> bytes | None:
+        digest = self.digest(data, options)
+        image = self._images.get(digest)
+        if image is not None:
+            self._images.move_to_end(digest)
+
+        return image
+
+    def _store(self, digest: str, image: bytes) -> None:
+        if len(image) > self.max_bytes:
+            return
+
+        previous = self._images.pop(digest, None)
+        if previous is not None:
+            self._size -= len(previous)
+
+        self._images[digest] = image
+        self._size += len(image)
+        while self._size > self.max_bytes:
+            _, evicted = self._images.popitem(last=False)
+            self._size -= len(evicted)
+
+
+class QRCodeExecutor(str, Enum):
+    """Executors that QR codes can be rendered on
+
+    - INLINE: render on the event loop, blocking it while rendering.
+    - THREAD: render on a thread pool. Building the QR code matrix and packing
+      the pixels are pure Python and hold the GIL, only zlib compression
+      releases it, so threads keep the event loop responsive but scale poorly.
+    - PROCESS: render on a process pool. Renders run in parallel, at the cost of
+      pickling the data and the image between processes.
+    - INTERPRETER: render on a pool of subinterpreters, available from Python
+      3.14. Renders run in parallel within the process, each interpreter with
+      its own GIL.
+    """
+
+    INLINE = "inline"
+    THREAD = "thread"
+    PROCESS = "process"
+    INTERPRETER = "interpreter"
+
+
+def create_qr_code_executor(
+    executor: QRCodeExecutor, max_workers: int
+) -> concurrent.futures.Executor | None:
+    """Create the executor pool that QR codes are rendered on
+
+    :param executor: The kind of executor.
+    :type executor: QRCodeExecutor
+    :param max_workers: The number of workers of the pool.
+    :type max_workers: int
+    :return: The executor pool, or None to render on the event loop.
+    :rtype: concurrent.futures.Executor | None
+    :raises RuntimeError: If the executor is not available in this Python version.
+    """
+
+    match QRCodeExecutor(executor):
+        case QRCodeExecutor.INLINE:
+            return None
+        case QRCodeExecutor.THREAD:
+            return concurrent.futures.ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="qr-code-renderer"
+            )
+        case QRCodeExecutor.PROCESS:
+            return concurrent.futures.ProcessPoolExecutor(max_workers=max_workers)
+        case QRCodeExecutor.INTERPRETER:
+            pool = getattr(concurrent.futures, "InterpreterPoolExecutor", None)
+            if pool is None:
+                raise RuntimeError(
+                    "The interpreter executor requires Python 3.14 or newer"
+                )
+
+            return pool(max_workers=max_workers)
+
+
+class ExecutorQRCodeRenderer(AbstractQRCodeRenderer):
+    """Renders QR codes of a renderer on an executor pool.
+
+    At most max_pending renders are submitted to the pool at once, including
+    the ones still running after their caller timed out, and further renders
+    are rejected until a slot frees up. Without an executor, QR codes are
+    rendered on the event loop.
+    """
+
+    def __init__(
+        self,
+        renderer: AbstractQRCodeRenderer,
+        executor: concurrent.futures.Executor | None,
+        max_pending: int = 64,
+        timeout: float = 5.0,
+    ):
+        if max_pending <= 0:
+            raise ValueError("The maximum of pending renders must be positive")
+
+        self.renderer = renderer
+        self.executor = executor
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        """Number of renders submitted to the executor and not finished yet."""
+        return self._pending
+
+    def render(self, data: str, options: QRCodeOptions | None = None) -> bytes:
+        return self.renderer.render(data, options)
+
+    async def render_async(
+        self, data: str, options: QRCodeOptions | None = None
+    ) -> bytes:
+        if self.executor is None:
+            return self.renderer.render(data, options)
+
+        if self._pending >= self.max_pending:
+            raise QRCodeRendererUnavailable(
+                f"Too many pending QR code renders: {self._pending}"
+            )
+
+        loop = asyncio.get_running_loop()
+        future = self.executor.submit(self.renderer.render, data, options)
+        self._pending += 1
+        future.add_done_callback(lambda _: loop.call_soon_threadsafe(self._release))
+
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), self.timeout)
+        except TimeoutError as error:
+            raise QRCodeRendererUnavailable(
+                f"QR code rendering timed out after {self.timeout} seconds"
+            ) from error
+
+    async def close(self) -> None:
+        if self.executor is not None:
+            await asyncio.to_thread(self.executor.shutdown, cancel_futures=True)
+
+        await self.renderer.close()
+
+    def digest(self, data: str, options: QRCodeOptions | None = None) -> str:
+        return self.renderer.digest(data, options)
+
+    def _release(self) -> None:
+        self._pending -= 1
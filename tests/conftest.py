@@ -0,0 +1,35 @@
+# pylint: disable=W0621
+
+"""Test configuration fixtures shared by the unit and integration tests"""
+
+from datetime import UTC, datetime
+from typing import Callable
+
+import pytest
+
+from payment_api.domain.entities import PaymentIn, PaymentOut
+from payment_api.domain.value_objects import PaymentStatus
+
+
+@pytest.fixture
+def make_payment() -> Callable[..., PaymentIn]:
+    """Fixture to provide a factory of payments with the given ID and status,
+    built as PaymentOut unless another payment entity is given"""
+
+    def make(
+        payment_id: str = "A048",
+        payment_status: PaymentStatus = PaymentStatus.OPENED,
+        entity: type[PaymentIn] = PaymentOut,
+    ) -> PaymentIn:
+        return entity(
+            id=payment_id,
+            external_id=f"MP-{payment_id}",
+            payment_status=payment_status,
+            total_order_value=100.0,
+            qr_code=f"qr-{payment_id}",
+            expiration=datetime(2024, 12, 31, 23, 59, 59),
+            created_at=datetime(2024, 1, 1, 12, 0, 0, tzinfo=UTC),
+            timestamp=datetime(2024, 1, 2, 12, 0, 0, tzinfo=UTC),
+        )
+
+    return make
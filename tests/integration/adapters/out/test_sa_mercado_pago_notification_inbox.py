@@ -0,0 +1,287 @@
+# pylint: disable=W0621
+
+"""Test for SQL Alchemy Mercado Pago Notification Inbox implementation"""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from payment_api.adapters.out.sa_mercado_pago_notification_inbox import (
+    SAMercadoPagoNotificationInbox,
+)
+from payment_api.application.use_cases.ports import MercadoPagoNotificationStatus
+from payment_api.infrastructure.orm.models import (
+    MercadoPagoNotification as MercadoPagoNotificationModel,
+)
+
+
+@pytest.fixture(autouse=True)
+async def create_scenario(db_session: AsyncSession):
+    """Fixture to create test scenario before each test"""
+    notifications = [
+        {
+            "resource_id": "MP001",
+            "status": MercadoPagoNotificationStatus.PENDING,
+            "attempts": 0,
+            "created_at": datetime(2023, 1, 1, 0, 0, 0),
+            "timestamp": datetime(2023, 1, 1, 0, 0, 0),
+        },
+        {
+            "resource_id": "MP002",
+            "status": MercadoPagoNotificationStatus.PROCESSING,
+            "attempts": 1,
+            "locked_at": datetime(2023, 1, 1, 0, 0, 0),
+            "created_at": datetime(2023, 1, 1, 0, 1, 0),
+            "timestamp": datetime(2023, 1, 1, 0, 1, 0),
+        },
+        {
+            "resource_id": "MP003",
+            "status": MercadoPagoNotificationStatus.PROCESSED,
+            "attempts": 1,
+            "created_at": datetime(2023, 1, 1, 0, 2, 0),
+            "timestamp": datetime(2023, 1, 1, 0, 2, 0),
+        },
+    ]
+
+    await db_session.execute(insert(MercadoPagoNotificationModel), notifications)
+    await db_session.commit()
+
+
+@pytest.fixture
+def inbox(db_session: AsyncSession) -> SAMercadoPagoNotificationInbox:
+    """Fixture to create an instance of SAMercadoPagoNotificationInbox"""
+    return SAMercadoPagoNotificationInbox(
+        session=db_session, lock_timeout=60.0, max_attempts=2
+    )
+
+
+async def _get_notification(
+    db_session: AsyncSession, resource_id: str
+) -> MercadoPagoNotificationModel:
+    db_session.expire_all()
+    result = await db_session.execute(
+        select(MercadoPagoNotificationModel).where(
+            MercadoPagoNotificationModel.resource_id == resource_id
+        )
+    )
+    return result.scalar_one()
+
+
+async def test_should_enqueue_new_notification(
+    inbox: SAMercadoPagoNotificationInbox, db_session: AsyncSession
+):
+    """Given a notification not yet in the inbox
+    When enqueuing it
+    Then it should be stored as pending and True returned
+    """
+
+    # When
+    enqueued = await inbox.enqueue(resource_id="MP004")
+
+    # Then
+    assert enqueued is True
+    notification = await _get_notification(db_session, "MP004")
+    assert notification.status == MercadoPagoNotificationStatus.PENDING
+    assert notification.attempts == 0
+
+
+async def test_should_not_enqueue_duplicated_notification(
+    inbox: SAMercadoPagoNotificationInbox, db_session: AsyncSession
+):
+    """Given a notification already in the inbox
+    When enqueuing it again
+    Then it should not be changed and False returned
+    """
+
+    # When
+    enqueued = await inbox.enqueue(resource_id="MP003")
+
+    # Then
+    assert enqueued is False
+    notification = await _get_notification(db_session, "MP003")
+    assert notification.status == MercadoPagoNotificationStatus.PROCESSED
+
+
+async def test_should_claim_pending_and_stale_notifications(
+    inbox: SAMercadoPagoNotificationInbox,
+):
+    """Given pending, stale processing and processed notifications in the inbox
+    When claiming notifications
+    Then only pending and stale processing notifications should be claimed
+    """
+
+    # When
+    notifications = await inbox.claim(limit=10)
+
+    # Then
+    assert sorted(n.resource_id for n in notifications) == ["MP001", "MP002"]
+    assert all(
+        n.status == MercadoPagoNotificationStatus.PROCESSING for n in notifications
+    )
+    assert {n.resource_id: n.attempts for n in notifications} == {
+        "MP001": 1,
+        "MP002": 2,
+    }
+
+
+async def test_should_fail_stale_notifications_without_attempts_left(
+    inbox: SAMercadoPagoNotificationInbox, db_session: AsyncSession
+):
+    """Given a stale processing notification that used all its attempts
+    When claiming notifications
+    Then it should not be claimed and be marked as failed
+    """
+
+    # Given
+    await db_session.execute(
+        insert(MercadoPagoNotificationModel),
+        [
+            {
+                "resource_id": "MP004",
+                "status": MercadoPagoNotificationStatus.PROCESSING,
+                "attempts": 2,
+                "locked_at": datetime(2023, 1, 1, 0, 0, 0),
+                "created_at": datetime(2023, 1, 1, 0, 3, 0),
+                "timestamp": datetime(2023, 1, 1, 0, 3, 0),
+            }
+        ],
+    )
+    await db_session.commit()
+
+    # When
+    notifications = await inbox.claim(limit=10)
+
+    # Then
+    assert "MP004" not in [n.resource_id for n in notifications]
+    notification = await _get_notification(db_session, "MP004")
+    assert notification.status == MercadoPagoNotificationStatus.FAILED
+    assert notification.locked_at is None
+    assert notification.error
+
+
+async def test_should_not_claim_already_claimed_notifications(
+    inbox: SAMercadoPagoNotificationInbox,
+):
+    """Given notifications claimed by a previous call
+    When claiming notifications again
+    Then no notification should be returned
+    """
+
+    # Given
+    await inbox.claim(limit=10)
+
+    # When
+    notifications = await inbox.claim(limit=10)
+
+    # Then
+    assert not notifications
+
+
+async def test_should_mark_notification_as_processed(
+    inbox: SAMercadoPagoNotificationInbox, db_session: AsyncSession
+):
+    """Given a claimed notification
+    When marking it as processed
+    Then its status should be processed and its lock released
+    """
+
+    # Given
+    await inbox.claim(limit=1)
+
+    # When
+    await inbox.mark_processed(resource_id="MP001")
+
+    # Then
+    notification = await _get_notification(db_session, "MP001")
+    assert notification.status == MercadoPagoNotificationStatus.PROCESSED
+    assert notification.locked_at is None
+
+
+async def test_should_return_notification_to_pending_when_it_has_attempts_left(
+    inbox: SAMercadoPagoNotificationInbox, db_session: AsyncSession
+):
+    """Given a claimed notification with attempts left
+    When marking it as failed to be retried
+    Then it should be pending again with the error recorded
+    """
+
+    # Given
+    await inbox.claim(limit=1)
+
+    # When
+    await inbox.mark_failed(resource_id="MP001", error="timeout", retry=True)
+
+    # Then
+    notification = await _get_notification(db_session, "MP001")
+    assert notification.status == MercadoPagoNotificationStatus.PENDING
+    assert notification.error == "timeout"
+
+
+async def test_should_fail_notification_when_attempts_are_exhausted(
+    inbox: SAMercadoPagoNotificationInbox, db_session: AsyncSession
+):
+    """Given a claimed notification on its last attempt
+    When marking it as failed to be retried
+    Then it should be failed
+    """
+
+    # Given
+    await inbox.claim(limit=10)
+
+    # When
+    await inbox.mark_failed(resource_id="MP002", error="timeout", retry=True)
+
+    # Then
+    notification = await _get_notification(db_session, "MP002")
+    assert notification.status == MercadoPagoNotificationStatus.FAILED
+
+
+async def test_should_fail_notification_when_it_should_not_be_retried(
+    inbox: SAMercadoPagoNotificationInbox, db_session: AsyncSession
+):
+    """Given a claimed notification with attempts left
+    When marking it as failed without retries
+    Then it should be failed
+    """
+
+    # Given
+    await inbox.claim(limit=1)
+
+    # When
+    await inbox.mark_failed(resource_id="MP001", error="not found", retry=False)
+
+    # Then
+    notification = await _get_notification(db_session, "MP001")
+    assert notification.status == MercadoPagoNotificationStatus.FAILED
+
+
+async def test_should_check_if_notification_is_processed(
+    inbox: SAMercadoPagoNotificationInbox,
+):
+    """Given processed and pending notifications in the inbox
+    When checking if they are processed
+    Then only the processed notification should be reported as processed
+    """
+
+    # When / Then
+    assert await inbox.is_processed(resource_id="MP003") is True
+    assert await inbox.is_processed(resource_id="MP001") is False
+    assert await inbox.is_processed(resource_id="MP999") is False
+
+
+async def test_should_record_processed_notification_not_in_inbox(
+    inbox: SAMercadoPagoNotificationInbox, db_session: AsyncSession
+):
+    """Given a notification never stored in the inbox
+    When marking it as processed
+    Then it should be recorded as processed
+    """
+
+    # When
+    await inbox.mark_processed(resource_id="MP004")
+
+    # Then
+    notification = await _get_notification(db_session, "MP004")
+    assert notification.status == MercadoPagoNotificationStatus.PROCESSED
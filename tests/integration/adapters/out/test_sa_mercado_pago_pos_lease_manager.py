@@ -0,0 +1,149 @@
+# pylint: disable=W0621
+
+"""Test for SQL Alchemy Mercado Pago point of sale lease manager implementation"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from payment_api.adapters.out.sa_mercado_pago_pos_lease_manager import (
+    SAMercadoPagoPOSLeaseManager,
+)
+from payment_api.application.use_cases.ports import MercadoPagoPOSLeaseStrategy
+from payment_api.infrastructure.orm.models import (
+    MercadoPagoPOSLease as MercadoPagoPOSLeaseModel,
+)
+
+IN_TEN_MINUTES = datetime.now(timezone.utc) + timedelta(minutes=10)
+
+
+@pytest.fixture
+def lease_manager(db_session: AsyncSession) -> SAMercadoPagoPOSLeaseManager:
+    """Fixture to create an instance of SAMercadoPagoPOSLeaseManager"""
+    return SAMercadoPagoPOSLeaseManager(session=db_session, pos_ids=["POS1", "POS2"])
+
+
+async def _get_lease(db_session: AsyncSession, pos: str) -> MercadoPagoPOSLeaseModel:
+    db_session.expire_all()
+    result = await db_session.execute(
+        select(MercadoPagoPOSLeaseModel).where(MercadoPagoPOSLeaseModel.pos == pos)
+    )
+    return result.scalar_one()
+
+
+async def test_should_lease_each_pos_to_a_single_payment(
+    lease_manager: SAMercadoPagoPOSLeaseManager, db_session: AsyncSession
+):
+    """Given a pool of two free points of sale
+    When leasing points of sale to three payments
+    Then each of the first two payments should lease a different point of sale
+    and the third should lease none
+    """
+
+    # When
+    first = await lease_manager.acquire(payment_id="A001", expires_at=IN_TEN_MINUTES)
+    second = await lease_manager.acquire(payment_id="A002", expires_at=IN_TEN_MINUTES)
+    third = await lease_manager.acquire(payment_id="A003", expires_at=IN_TEN_MINUTES)
+
+    # Then
+    assert {first, second} == {"POS1", "POS2"}
+    assert third is None
+    assert (await _get_lease(db_session, first)).payment_id == "A001"
+    assert (await _get_lease(db_session, second)).payment_id == "A002"
+
+
+async def test_should_lease_pos_again_when_it_is_released(
+    lease_manager: SAMercadoPagoPOSLeaseManager, db_session: AsyncSession
+):
+    """Given a pool whose points of sale are all leased
+    When releasing the point of sale leased to a payment
+    Then it should be leased to the next payment
+    """
+
+    # Given
+    pos = await lease_manager.acquire(payment_id="A001", expires_at=IN_TEN_MINUTES)
+    await lease_manager.acquire(payment_id="A002", expires_at=IN_TEN_MINUTES)
+
+    # When
+    await lease_manager.release(payment_id="A001")
+    released = await _get_lease(db_session, pos)
+    next_pos = await lease_manager.acquire(payment_id="A003", expires_at=IN_TEN_MINUTES)
+
+    # Then
+    assert released.payment_id is None
+    assert released.expires_at is None
+    assert next_pos == pos
+
+
+async def test_should_lease_pos_again_when_its_order_expired(
+    lease_manager: SAMercadoPagoPOSLeaseManager, db_session: AsyncSession
+):
+    """Given a pool with a point of sale holding an expired order and another one
+    holding a live order
+    When leasing a point of sale to a payment
+    Then the point of sale holding the expired order should be leased
+    """
+
+    # Given
+    await db_session.execute(
+        insert(MercadoPagoPOSLeaseModel),
+        [
+            {
+                "pos": "POS1",
+                "payment_id": "A001",
+                "leases": 1,
+                "leased_at": datetime(2023, 1, 1, 0, 0, 0),
+                "expires_at": datetime(2023, 1, 1, 0, 10, 0),
+            },
+            {
+                "pos": "POS2",
+                "payment_id": "A002",
+                "leases": 1,
+                "leased_at": datetime(2023, 1, 1, 0, 0, 0),
+                "expires_at": datetime(2999, 1, 1, 0, 0, 0),
+            },
+        ],
+    )
+    await db_session.commit()
+
+    # When
+    pos = await lease_manager.acquire(payment_id="A003", expires_at=IN_TEN_MINUTES)
+
+    # Then
+    lease = await _get_lease(db_session, "POS1")
+    assert pos == "POS1"
+    assert lease.payment_id == "A003"
+    assert lease.leases == 2
+    assert lease.expires_at == IN_TEN_MINUTES.replace(tzinfo=None)
+
+
+async def test_should_lease_least_loaded_pos_when_strategy_is_least_loaded(
+    db_session: AsyncSession,
+):
+    """Given a pool of free points of sale leased a different number of times
+    When leasing a point of sale with the least loaded strategy
+    Then the point of sale leased the fewest times should be leased
+    """
+
+    # Given
+    await db_session.execute(
+        insert(MercadoPagoPOSLeaseModel),
+        [
+            {"pos": "POS1", "leases": 3, "leased_at": datetime(2023, 1, 1, 0, 0, 0)},
+            {"pos": "POS2", "leases": 1, "leased_at": datetime(2023, 1, 1, 0, 5, 0)},
+        ],
+    )
+    await db_session.commit()
+    lease_manager = SAMercadoPagoPOSLeaseManager(
+        session=db_session,
+        pos_ids=["POS1", "POS2"],
+        strategy=MercadoPagoPOSLeaseStrategy.LEAST_LOADED,
+    )
+
+    # When
+    pos = await lease_manager.acquire(payment_id="A001", expires_at=IN_TEN_MINUTES)
+
+    # Then
+    assert pos == "POS2"
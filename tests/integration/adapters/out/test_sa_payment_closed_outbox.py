@@ -0,0 +1,235 @@
+# pylint: disable=W0621
+
+"""Test for SQL Alchemy PaymentClosed Outbox implementation"""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from payment_api.adapters.out.sa_payment_closed_outbox import SAPaymentClosedOutbox
+from payment_api.domain.events import PaymentClosedEvent
+from payment_api.infrastructure.orm.models import (
+    OutboxEventStatus,
+)
+from payment_api.infrastructure.orm.models import (
+    PaymentClosedOutboxEvent as PaymentClosedOutboxEventModel,
+)
+
+PENDING_EVENT = PaymentClosedEvent(payment_id="A001")
+SENT_EVENT = PaymentClosedEvent(payment_id="A002")
+
+
+@pytest.fixture(autouse=True)
+async def create_scenario(db_session: AsyncSession):
+    """Fixture to create test scenario before each test"""
+    events = [
+        {
+            "id": str(PENDING_EVENT.id),
+            "payment_id": PENDING_EVENT.payment_id,
+            "payload": PENDING_EVENT.model_dump_json(),
+            "status": OutboxEventStatus.PENDING,
+            "attempts": 0,
+            "created_at": datetime(2023, 1, 1, 0, 0, 0),
+            "timestamp": datetime(2023, 1, 1, 0, 0, 0),
+        },
+        {
+            "id": str(SENT_EVENT.id),
+            "payment_id": SENT_EVENT.payment_id,
+            "payload": SENT_EVENT.model_dump_json(),
+            "status": OutboxEventStatus.SENT,
+            "attempts": 1,
+            "created_at": datetime(2023, 1, 1, 0, 1, 0),
+            "timestamp": datetime(2023, 1, 1, 0, 1, 0),
+        },
+    ]
+
+    await db_session.execute(insert(PaymentClosedOutboxEventModel), events)
+    await db_session.commit()
+
+
+@pytest.fixture
+def outbox(db_session: AsyncSession) -> SAPaymentClosedOutbox:
+    """Fixture to create an instance of SAPaymentClosedOutbox"""
+    return SAPaymentClosedOutbox(session=db_session, lock_timeout=60.0, max_attempts=1)
+
+
+async def _get_event(
+    db_session: AsyncSession, event_id: str
+) -> PaymentClosedOutboxEventModel:
+    db_session.expire_all()
+    result = await db_session.execute(
+        select(PaymentClosedOutboxEventModel).where(
+            PaymentClosedOutboxEventModel.id == event_id
+        )
+    )
+    return result.scalar_one()
+
+
+async def test_should_add_event_only_when_transaction_is_committed(
+    outbox: SAPaymentClosedOutbox, db_session: AsyncSession
+):
+    """Given a new PaymentClosedEvent
+    When adding it to the outbox and rolling back the transaction
+    Then the event should not be stored
+    """
+
+    # Given
+    event = PaymentClosedEvent(payment_id="A003")
+
+    # When
+    await outbox.add(event)
+    await db_session.rollback()
+
+    # Then
+    result = await db_session.execute(
+        select(PaymentClosedOutboxEventModel).where(
+            PaymentClosedOutboxEventModel.id == str(event.id)
+        )
+    )
+    assert result.scalar_one_or_none() is None
+
+
+async def test_should_store_added_event_when_transaction_is_committed(
+    outbox: SAPaymentClosedOutbox, db_session: AsyncSession
+):
+    """Given a new PaymentClosedEvent
+    When adding it to the outbox and committing the transaction
+    Then the event should be stored as pending
+    """
+
+    # Given
+    event = PaymentClosedEvent(payment_id="A003")
+
+    # When
+    await outbox.add(event)
+    await db_session.commit()
+
+    # Then
+    stored = await _get_event(db_session, str(event.id))
+    assert stored.status == OutboxEventStatus.PENDING
+    assert PaymentClosedEvent.model_validate_json(stored.payload) == event
+
+
+async def test_should_claim_only_pending_events(outbox: SAPaymentClosedOutbox):
+    """Given pending and sent events in the outbox
+    When claiming events
+    Then only the pending event should be claimed, and only once
+    """
+
+    # When
+    claimed = await outbox.claim(limit=10)
+    claimed_again = await outbox.claim(limit=10)
+
+    # Then
+    assert claimed == [PENDING_EVENT]
+    assert not claimed_again
+
+
+async def test_should_mark_events_as_sent(
+    outbox: SAPaymentClosedOutbox, db_session: AsyncSession
+):
+    """Given a claimed event
+    When marking it as sent
+    Then its status should be sent
+    """
+
+    # Given
+    await outbox.claim(limit=10)
+
+    # When
+    await outbox.mark_sent([PENDING_EVENT.id])
+
+    # Then
+    stored = await _get_event(db_session, str(PENDING_EVENT.id))
+    assert stored.status == OutboxEventStatus.SENT
+    assert stored.sent_at is not None
+
+
+async def test_should_fail_event_when_attempts_are_exhausted(
+    outbox: SAPaymentClosedOutbox, db_session: AsyncSession
+):
+    """Given a claimed event on its last attempt
+    When marking it as failed
+    Then its status should be failed with the error recorded
+    """
+
+    # Given
+    await outbox.claim(limit=10)
+
+    # When
+    await outbox.mark_failed(PENDING_EVENT.id, error="SNS down")
+
+    # Then
+    stored = await _get_event(db_session, str(PENDING_EVENT.id))
+    assert stored.status == OutboxEventStatus.FAILED
+    assert stored.error == "SNS down"
+
+
+async def test_should_fail_stale_events_without_attempts_left(
+    outbox: SAPaymentClosedOutbox, db_session: AsyncSession
+):
+    """Given a claimed event whose lock timed out after it used all its attempts
+    When claiming events
+    Then it should not be claimed and be marked as failed
+    """
+
+    # Given
+    stale_event = PaymentClosedEvent(payment_id="A003")
+    await db_session.execute(
+        insert(PaymentClosedOutboxEventModel),
+        [
+            {
+                "id": str(stale_event.id),
+                "payment_id": stale_event.payment_id,
+                "payload": stale_event.model_dump_json(),
+                "status": OutboxEventStatus.PENDING,
+                "attempts": 1,
+                "locked_at": datetime(2023, 1, 1, 0, 0, 0),
+                "created_at": datetime(2022, 12, 31, 0, 0, 0),
+                "timestamp": datetime(2023, 1, 1, 0, 0, 0),
+            }
+        ],
+    )
+    await db_session.commit()
+
+    # When
+    claimed = await outbox.claim(limit=10)
+
+    # Then
+    assert claimed == [PENDING_EVENT]
+    stored = await _get_event(db_session, str(stale_event.id))
+    assert stored.status == OutboxEventStatus.FAILED
+    assert stored.locked_at is None
+    assert stored.error
+
+
+async def test_should_purge_only_events_sent_before_retention(
+    db_session: AsyncSession,
+):
+    """Given an event sent long ago and an event sent just now
+    When purging sent events
+    Then only the event sent long ago should be deleted
+    """
+
+    # Given
+    outbox = SAPaymentClosedOutbox(session=db_session, sent_retention=3600.0)
+    recent_event = PaymentClosedEvent(payment_id="A003")
+    await db_session.execute(
+        update(PaymentClosedOutboxEventModel)
+        .where(PaymentClosedOutboxEventModel.id == str(SENT_EVENT.id))
+        .values(sent_at=datetime(2023, 1, 1, 0, 2, 0))
+    )
+    await outbox.add(recent_event)
+    await db_session.commit()
+    await outbox.claim(limit=10)
+    await outbox.mark_sent([recent_event.id])
+
+    # When
+    purged = await outbox.purge_sent(limit=10)
+
+    # Then
+    assert purged == 1
+    result = await db_session.execute(select(PaymentClosedOutboxEventModel.id))
+    assert set(result.scalars()) == {str(PENDING_EVENT.id), str(recent_event.id)}
@@ -2,18 +2,23 @@
 
 """Test for SQL Alchemy Payment Repository implementation"""
 
+import asyncio
 from datetime import datetime
+from typing import Callable
 
 import pytest
 from pytest_mock import MockerFixture
-from sqlalchemy import insert
+from sqlalchemy import event, insert, select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from payment_api.adapters.out.sa_payment_repository import SAPaymentRepository
-from payment_api.domain.entities import PaymentIn, PaymentOut
+from payment_api.domain.entities import PaymentIn, PaymentOut, PaymentVersion
 from payment_api.domain.exceptions import NotFound, PersistenceError
+from payment_api.domain.ports import SaveMode
 from payment_api.domain.value_objects import PaymentStatus
+from payment_api.infrastructure import factory
+from payment_api.infrastructure.orm import SessionManager
 from payment_api.infrastructure.orm.models import Payment as PaymentModel
 
 
@@ -43,6 +48,20 @@ def repository(db_session: AsyncSession) -> SAPaymentRepository:
     return SAPaymentRepository(session=db_session)
 
 
+@pytest.fixture
+def statements(db_session: AsyncSession):
+    """Fixture to record the statements sent to the database by the session"""
+    executed = []
+
+    def record(_conn, _cursor, statement, _parameters, _context, _executemany):
+        executed.append(statement)
+
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", record)
+    yield executed
+    event.remove(engine, "before_cursor_execute", record)
+
+
 async def test_should_return_payment_by_id(
     repository: SAPaymentRepository,
 ):
@@ -70,6 +89,68 @@ async def test_should_return_payment_by_id(
     )
 
 
+async def test_should_return_payments_found_by_ids(
+    repository: SAPaymentRepository,
+):
+    """Given an existing and a non-existing payment id
+    When calling the repository to get the payments by ids
+    Then only the existing payment should be returned
+    """
+
+    # When
+    payments = await repository.find_many_by_ids(payment_ids=["A001", "NONEXISTENT"])
+
+    # Then
+    assert [payment.id for payment in payments] == ["A001"]
+
+
+async def test_should_return_no_payments_when_no_ids_are_given(
+    repository: SAPaymentRepository,
+):
+    """Given no payment ids
+    When calling the repository to get the payments by ids
+    Then no payments should be returned
+    """
+
+    # When
+    payments = await repository.find_many_by_ids(payment_ids=[])
+
+    # Then
+    assert not payments
+
+
+async def test_should_return_payment_version_by_id(
+    repository: SAPaymentRepository,
+):
+    """Given a payment id
+    When calling the repository to get the payment version by id
+    Then only the status and last update of the payment should be returned
+    """
+
+    # When
+    version = await repository.find_version_by_id(payment_id="A001")
+
+    # Then
+    assert version == PaymentVersion(
+        id="A001",
+        payment_status=PaymentStatus.OPENED,
+        timestamp="2023-01-01T00:00:00",
+    )
+
+
+async def test_should_raise_not_found_when_payment_version_does_not_exist(
+    repository: SAPaymentRepository,
+):
+    """Given a non-existing payment id
+    When calling the repository to get the payment version by id
+    Then a NotFound exception should be raised
+    """
+
+    # When / Then
+    with pytest.raises(NotFound):
+        await repository.find_version_by_id(payment_id="NONEXISTENT")
+
+
 async def test_should_raise_not_found_when_payment_id_does_not_exist(
     repository: SAPaymentRepository,
 ):
@@ -317,8 +398,6 @@ async def test_should_raise_persistence_error_on_insert_db_issue(
         expiration=datetime(2023, 1, 1, 0, 25, 0),
     )
 
-    # Mock exists_by_id to return False (so it tries to insert)
-    mocker.patch.object(repository, "exists_by_id", return_value=False)
     mocker.patch.object(
         repository.session,
         "execute",
@@ -327,7 +406,7 @@ async def test_should_raise_persistence_error_on_insert_db_issue(
 
     # When / Then
     with pytest.raises(PersistenceError) as exc_info:
-        await repository.save(payment=payment)
+        await repository.save(payment=payment, mode=SaveMode.INSERT)
 
     assert "Insert constraint violation" in str(exc_info.value)
 
@@ -351,8 +430,6 @@ async def test_should_raise_persistence_error_on_update_db_issue(
         expiration=datetime(2023, 1, 1, 0, 20, 0),
     )
 
-    # Mock exists_by_id to return True (so it tries to update)
-    mocker.patch.object(repository, "exists_by_id", return_value=True)
     mocker.patch.object(
         repository.session,
         "execute",
@@ -361,6 +438,186 @@ async def test_should_raise_persistence_error_on_update_db_issue(
 
     # When / Then
     with pytest.raises(PersistenceError) as exc_info:
-        await repository.save(payment=payment)
+        await repository.save(payment=payment, mode=SaveMode.UPDATE)
 
     assert "Update constraint violation" in str(exc_info.value)
+
+
+@pytest.mark.parametrize(
+    "payment_id, mode",
+    [
+        ("B001", SaveMode.UPSERT),
+        ("A001", SaveMode.UPSERT),
+        ("B001", SaveMode.INSERT),
+        ("A001", SaveMode.UPDATE),
+    ],
+)
+async def test_should_save_payment_with_a_single_statement(
+    repository: SAPaymentRepository,
+    statements: list[str],
+    payment_id: str,
+    mode: SaveMode,
+    make_payment: Callable[..., PaymentIn],
+):
+    """Given a new or an existing payment
+    When calling the repository to save the payment in a mode that allows it
+    Then the payment should be saved with a single statement
+    """
+
+    # Given
+    payment = make_payment(payment_id, PaymentStatus.CLOSED, entity=PaymentIn)
+
+    # When
+    saved_payment = await repository.save(payment=payment, mode=mode)
+
+    # Then
+    assert saved_payment.id == payment_id
+    assert saved_payment.payment_status == PaymentStatus.CLOSED
+    assert len(statements) == 1
+
+
+async def test_should_raise_persistence_error_when_inserting_existing_payment(
+    repository: SAPaymentRepository,
+    make_payment: Callable[..., PaymentIn],
+):
+    """Given an existing payment
+    When calling the repository to insert it
+    Then a PersistenceError should be raised
+    """
+
+    # When / Then
+    with pytest.raises(PersistenceError):
+        await repository.save(
+            payment=make_payment("A001", entity=PaymentIn), mode=SaveMode.INSERT
+        )
+
+
+async def test_should_raise_not_found_when_updating_missing_payment(
+    repository: SAPaymentRepository,
+    make_payment: Callable[..., PaymentIn],
+):
+    """Given a payment that does not exist
+    When calling the repository to update it
+    Then a NotFound error should be raised
+    """
+
+    # When / Then
+    with pytest.raises(NotFound):
+        await repository.save(
+            payment=make_payment("B001", entity=PaymentIn), mode=SaveMode.UPDATE
+        )
+
+
+async def test_should_upsert_same_payment_from_concurrent_sessions(
+    db_session_manager: SessionManager,
+    db_session: AsyncSession,
+    make_payment: Callable[..., PaymentIn],
+):
+    """Given two sessions saving the same new payment at the same time
+    When both upsert the payment
+    Then both saves should succeed and a single payment should be stored
+    """
+
+    # Given
+    async def upsert(payment_status: PaymentStatus) -> PaymentOut:
+        async with factory.get_db_session(db_session_manager) as session:
+            return await SAPaymentRepository(session=session).save(
+                payment=make_payment("B001", payment_status, entity=PaymentIn)
+            )
+
+    # When
+    saved_payments = await asyncio.gather(
+        upsert(PaymentStatus.OPENED), upsert(PaymentStatus.CLOSED)
+    )
+
+    # Then
+    assert {payment.id for payment in saved_payments} == {"B001"}
+    result = await db_session.execute(
+        select(PaymentModel).where(PaymentModel.id == "B001")
+    )
+    assert len(result.scalars().all()) == 1
+
+
+async def test_should_finalize_opened_payment_with_a_single_statement(
+    repository: SAPaymentRepository, statements: list[str]
+):
+    """Given an opened payment
+    When calling the repository to finalize it
+    Then the payment should be closed with a single statement
+    """
+
+    # When
+    payment = await repository.finalize_if_open(
+        payment_id="A001", external_id="MP-A001", payment_status=PaymentStatus.CLOSED
+    )
+
+    # Then
+    assert payment.external_id == "MP-A001"
+    assert payment.payment_status == PaymentStatus.CLOSED
+    assert len(statements) == 1
+
+
+async def test_should_not_finalize_payment_that_is_not_opened(
+    repository: SAPaymentRepository,
+):
+    """Given a closed payment
+    When calling the repository to finalize it again
+    Then a ValueError should be raised
+    """
+
+    # Given
+    await repository.finalize_if_open(
+        payment_id="A001", external_id="MP-A001", payment_status=PaymentStatus.CLOSED
+    )
+
+    # When / Then
+    with pytest.raises(ValueError):
+        await repository.finalize_if_open(
+            payment_id="A001",
+            external_id="MP-A002",
+            payment_status=PaymentStatus.EXPIRED,
+        )
+
+
+async def test_should_raise_not_found_when_finalizing_missing_payment(
+    repository: SAPaymentRepository,
+):
+    """Given a payment that does not exist
+    When calling the repository to finalize it
+    Then a NotFound error should be raised
+    """
+
+    # When / Then
+    with pytest.raises(NotFound):
+        await repository.finalize_if_open(
+            payment_id="B001",
+            external_id="MP-B001",
+            payment_status=PaymentStatus.CLOSED,
+        )
+
+
+async def test_should_finalize_payment_once_from_concurrent_sessions(
+    db_session_manager: SessionManager,
+):
+    """Given two sessions finalizing the same opened payment at the same time
+    When both finalize the payment
+    Then only one finalization should succeed
+    """
+
+    # Given
+    async def finalize(external_id: str) -> PaymentOut:
+        async with factory.get_db_session(db_session_manager) as session:
+            return await SAPaymentRepository(session=session).finalize_if_open(
+                payment_id="A001",
+                external_id=external_id,
+                payment_status=PaymentStatus.CLOSED,
+            )
+
+    # When
+    results = await asyncio.gather(
+        finalize("MP-A001"), finalize("MP-A002"), return_exceptions=True
+    )
+
+    # Then
+    assert len([result for result in results if isinstance(result, PaymentOut)]) == 1
+    assert len([result for result in results if isinstance(result, ValueError)]) == 1
@@ -0,0 +1,84 @@
+# pylint: disable=W0621
+
+"""Test for SQL Alchemy Payment Repository through PgBouncer in transaction
+pooling mode"""
+
+import asyncio
+from typing import AsyncGenerator, Callable
+
+import pytest
+
+from payment_api.adapters.out.sa_payment_repository import SAPaymentRepository
+from payment_api.domain.entities import PaymentIn
+from payment_api.domain.ports import SaveMode
+from payment_api.domain.value_objects import PaymentStatus
+from payment_api.infrastructure import factory
+from payment_api.infrastructure.config import TestDatabaseSettings
+from payment_api.infrastructure.orm import SessionManager
+
+CONCURRENT_SESSIONS = 10
+
+
+@pytest.fixture
+async def pgbouncer_session_manager(
+    test_db_settings: TestDatabaseSettings, db_session_manager: SessionManager
+) -> AsyncGenerator[SessionManager]:
+    """Fixture to create a session manager connected through PgBouncer, once the
+    schema was created directly on the test database"""
+    if not test_db_settings.PGBOUNCER_DSN:
+        pytest.skip("PGBOUNCER_DSN is not configured")
+
+    settings = test_db_settings.model_copy(
+        update={
+            "DSN": test_db_settings.PGBOUNCER_DSN,
+            "PGBOUNCER": True,
+            "DIRECT_DSN": test_db_settings.DSN,
+            "POOL_SIZE": CONCURRENT_SESSIONS,
+        }
+    )
+
+    session_manager = factory.get_session_manager(settings=settings)
+    yield session_manager
+    await session_manager.close()
+
+
+async def test_should_run_repository_statements_through_pgbouncer(
+    pgbouncer_session_manager: SessionManager,
+    make_payment: Callable[..., PaymentIn],
+):
+    """Given more client sessions than PgBouncer server connections
+    When every session inserts, finds, checks and finalizes payments at once
+    Then every statement should succeed, even though the server connections
+    are shared between the sessions transaction by transaction
+    """
+
+    # Given
+    async def lifecycle(index: int) -> PaymentStatus:
+        payment_id = f"P{index:03d}"
+        for _ in range(3):
+            async with factory.get_db_session(pgbouncer_session_manager) as session:
+                repository = SAPaymentRepository(session=session)
+                if not await repository.exists_by_id(payment_id):
+                    await repository.save(
+                        payment=make_payment(payment_id, entity=PaymentIn),
+                        mode=SaveMode.INSERT,
+                    )
+
+                await repository.find_by_id(payment_id)
+
+        async with factory.get_db_session(pgbouncer_session_manager) as session:
+            payment = await SAPaymentRepository(session=session).finalize_if_open(
+                payment_id=payment_id,
+                external_id=f"MP-{payment_id}",
+                payment_status=PaymentStatus.CLOSED,
+            )
+
+        return payment.payment_status
+
+    # When
+    statuses = await asyncio.gather(
+        *(lifecycle(index) for index in range(CONCURRENT_SESSIONS))
+    )
+
+    # Then
+    assert statuses == [PaymentStatus.CLOSED] * CONCURRENT_SESSIONS
@@ -0,0 +1,95 @@
+# pylint: disable=W0621
+
+"""Test for SQL Alchemy QR code image repository implementation"""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from payment_api.adapters.out import SAQRCodeImageRepository
+from payment_api.application.use_cases.ports import QRCodeImage
+from payment_api.domain.value_objects import PaymentStatus
+from payment_api.infrastructure.orm.models import Payment as PaymentModel
+
+
+@pytest.fixture(autouse=True)
+async def create_scenario(db_session: AsyncSession):
+    """Fixture to create test scenario before each test"""
+    await db_session.execute(
+        insert(PaymentModel),
+        [
+            {
+                "id": "A001",
+                "external_id": "empty-A001",
+                "payment_status": PaymentStatus.OPENED,
+                "total_order_value": 100.0,
+                "qr_code": "qr-A001",
+                "expiration": datetime(2023, 1, 1, 0, 10, 0),
+                "created_at": datetime(2023, 1, 1, 0, 0, 0),
+                "timestamp": datetime(2023, 1, 1, 0, 0, 0),
+            }
+        ],
+    )
+    await db_session.commit()
+
+
+@pytest.fixture
+def repository(db_session: AsyncSession) -> SAQRCodeImageRepository:
+    """Fixture to create an instance of SAQRCodeImageRepository"""
+    return SAQRCodeImageRepository(session=db_session)
+
+
+async def test_should_save_and_find_qr_code_image(
+    repository: SAQRCodeImageRepository,
+):
+    """Given a rendered QR code image of a payment
+    When saving it and finding it by the payment ID
+    Then the stored image should be returned
+    """
+
+    # Given
+    image = QRCodeImage(digest="abc123", content=b"png")
+
+    # When
+    await repository.save(payment_id="A001", image=image)
+
+    # Then
+    assert await repository.find(payment_id="A001") == image
+
+
+async def test_should_replace_stored_qr_code_image(
+    repository: SAQRCodeImageRepository,
+):
+    """Given a payment with a stored QR code image
+    When saving a new image for the payment
+    Then the new image should replace the stored one
+    """
+
+    # Given
+    await repository.save(
+        payment_id="A001", image=QRCodeImage(digest="old", content=b"old")
+    )
+
+    # When
+    await repository.save(
+        payment_id="A001", image=QRCodeImage(digest="new", content=b"new")
+    )
+
+    # Then
+    assert await repository.find(payment_id="A001") == QRCodeImage(
+        digest="new", content=b"new"
+    )
+
+
+async def test_should_return_none_when_payment_has_no_stored_image(
+    repository: SAQRCodeImageRepository,
+):
+    """Given a payment without a stored QR code image
+    When finding its image
+    Then None should be returned
+    """
+
+    # When / Then
+    assert await repository.find(payment_id="A001") is None
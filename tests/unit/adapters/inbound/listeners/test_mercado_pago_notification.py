@@ -0,0 +1,263 @@
+# pylint: disable=W0621
+
+"""Unit tests for Mercado Pago Notification Listener and Handler"""
+
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_mock import MockerFixture
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from payment_api.adapters.inbound.listeners.mercado_pago_notification import (
+    MercadoPagoNotificationHandler,
+    MercadoPagoNotificationListener,
+)
+from payment_api.application.commands import (
+    FinalizePaymentByMercadoPagoPaymentIdCommand,
+)
+from payment_api.application.use_cases import (
+    FinalizePaymentByMercadoPagoPaymentIdUseCase,
+)
+from payment_api.application.use_cases.ports import (
+    MercadoPagoNotification,
+    MercadoPagoNotificationInbox,
+    MercadoPagoNotificationStatus,
+    MPClientError,
+)
+from payment_api.domain.exceptions import (
+    NotFound,
+    PersistenceError,
+)
+from payment_api.infrastructure.config import MercadoPagoNotificationInboxSettings
+from payment_api.infrastructure.orm import SessionManager
+
+
+@pytest.fixture
+def mock_db_session(mocker: MockerFixture) -> MagicMock:
+    """Mock AsyncSession for testing"""
+    return mocker.Mock(spec=AsyncSession)
+
+
+@pytest.fixture
+def mock_session_manager(
+    mock_db_session: MagicMock, mocker: MockerFixture
+) -> MagicMock:
+    """Mock SessionManager for testing"""
+    mock_session_manager = mocker.Mock(spec=SessionManager)
+
+    async_context_manager = mocker.AsyncMock()
+    async_context_manager.__aenter__ = mocker.AsyncMock(return_value=mock_db_session)
+    async_context_manager.__aexit__ = mocker.AsyncMock(return_value=None)
+    mock_session_manager.session.return_value = async_context_manager
+
+    return mock_session_manager
+
+
+@pytest.fixture
+def mock_use_case(mocker: MockerFixture) -> MagicMock:
+    """Mock FinalizePaymentByMercadoPagoPaymentIdUseCase for testing"""
+    return mocker.Mock(spec=FinalizePaymentByMercadoPagoPaymentIdUseCase)
+
+
+@pytest.fixture
+def mock_inbox(mocker: MockerFixture) -> MagicMock:
+    """Mock MercadoPagoNotificationInbox for testing"""
+    return mocker.Mock(spec=MercadoPagoNotificationInbox)
+
+
+@pytest.fixture
+def handler(
+    mock_session_manager: MagicMock,
+    mock_use_case: MagicMock,
+    mock_inbox: MagicMock,
+) -> MercadoPagoNotificationHandler:
+    """MercadoPagoNotificationHandler instance for testing"""
+    return MercadoPagoNotificationHandler(
+        session_manager=mock_session_manager,
+        use_case_factory=lambda _: mock_use_case,
+        inbox_factory=lambda _: mock_inbox,
+    )
+
+
+@pytest.fixture
+def notification() -> MercadoPagoNotification:
+    """Sample claimed Mercado Pago notification for testing"""
+    return MercadoPagoNotification(
+        resource_id="MP123456",
+        status=MercadoPagoNotificationStatus.PROCESSING,
+        attempts=1,
+    )
+
+
+class TestMercadoPagoNotificationHandler:
+    """Test cases for MercadoPagoNotificationHandler"""
+
+    async def test_should_finalize_payment_and_mark_notification_as_processed(
+        self,
+        handler: MercadoPagoNotificationHandler,
+        notification: MercadoPagoNotification,
+        mock_use_case: MagicMock,
+        mock_inbox: MagicMock,
+    ):
+        """Given a claimed notification
+        When the handler processes it
+        Then the payment should be finalized and the notification marked as processed
+        """
+
+        # When
+        await handler.handle(notification=notification)
+
+        # Then
+        mock_use_case.execute.assert_awaited_once_with(
+            command=FinalizePaymentByMercadoPagoPaymentIdCommand(payment_id="MP123456")
+        )
+        mock_inbox.mark_processed.assert_awaited_once_with("MP123456")
+        mock_inbox.mark_failed.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "error",
+        [NotFound("Payment not found"), ValueError("Invalid payment")],
+    )
+    async def test_should_discard_notification_on_non_retryable_errors(
+        self,
+        handler: MercadoPagoNotificationHandler,
+        notification: MercadoPagoNotification,
+        mock_use_case: MagicMock,
+        mock_inbox: MagicMock,
+        mock_db_session: MagicMock,
+        error: Exception,
+    ):
+        """Given a claimed notification
+        When the use case fails with a non-retryable error
+        Then the session should be rolled back and the notification marked as failed
+        without retries
+        """
+
+        # Given
+        mock_use_case.execute.side_effect = error
+
+        # When
+        await handler.handle(notification=notification)
+
+        # Then
+        mock_db_session.rollback.assert_awaited_once()
+        mock_inbox.mark_failed.assert_awaited_once_with(
+            "MP123456", error=str(error), retry=False
+        )
+        mock_inbox.mark_processed.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "error",
+        [MPClientError("Mercado Pago unavailable"), PersistenceError("DB down")],
+    )
+    async def test_should_retry_notification_on_transient_errors(
+        self,
+        handler: MercadoPagoNotificationHandler,
+        notification: MercadoPagoNotification,
+        mock_use_case: MagicMock,
+        mock_inbox: MagicMock,
+        mock_db_session: MagicMock,
+        error: Exception,
+    ):
+        """Given a claimed notification
+        When the use case fails with a transient error
+        Then the session should be rolled back and the notification marked as failed
+        to be retried
+        """
+
+        # Given
+        mock_use_case.execute.side_effect = error
+
+        # When
+        await handler.handle(notification=notification)
+
+        # Then
+        mock_db_session.rollback.assert_awaited_once()
+        mock_inbox.mark_failed.assert_awaited_once_with(
+            "MP123456", error=str(error), retry=True
+        )
+        mock_inbox.mark_processed.assert_not_called()
+
+
+class TestMercadoPagoNotificationListener:
+    """Test cases for MercadoPagoNotificationListener"""
+
+    async def test_should_handle_every_claimed_notification(
+        self,
+        mock_session_manager: MagicMock,
+        mock_inbox: MagicMock,
+        mocker: MockerFixture,
+    ):
+        """Given notifications waiting in the inbox
+        When the listener consumes a batch
+        Then every claimed notification should be handled
+        """
+
+        # Given
+        notifications = [
+            MercadoPagoNotification(
+                resource_id=f"MP{index}",
+                status=MercadoPagoNotificationStatus.PROCESSING,
+                attempts=1,
+            )
+            for index in range(3)
+        ]
+        mock_inbox.claim.return_value = notifications
+        mock_handler = mocker.Mock(spec=MercadoPagoNotificationHandler)
+
+        listener = MercadoPagoNotificationListener(
+            session_manager=mock_session_manager,
+            handler=mock_handler,
+            inbox_factory=lambda _: mock_inbox,
+            settings=MercadoPagoNotificationInboxSettings(BATCH_SIZE=3, CONCURRENCY=2),
+        )
+
+        # When
+        consumed = await listener._consume(  # pylint: disable=W0212
+            semaphore=mocker.MagicMock()
+        )
+
+        # Then
+        assert consumed == notifications
+        mock_inbox.claim.assert_awaited_once_with(limit=3)
+        assert mock_handler.handle.await_count == 3
+
+    async def test_should_keep_consuming_when_handler_raises(
+        self,
+        mock_session_manager: MagicMock,
+        mock_inbox: MagicMock,
+        mocker: MockerFixture,
+    ):
+        """Given notifications waiting in the inbox
+        When handling one of them raises an unexpected error
+        Then the remaining notifications should still be handled
+        """
+
+        # Given
+        notifications = [
+            MercadoPagoNotification(
+                resource_id=f"MP{index}",
+                status=MercadoPagoNotificationStatus.PROCESSING,
+                attempts=1,
+            )
+            for index in range(2)
+        ]
+        mock_inbox.claim.return_value = notifications
+        mock_handler = mocker.Mock(spec=MercadoPagoNotificationHandler)
+        mock_handler.handle.side_effect = [RuntimeError("Unexpected"), None]
+
+        listener = MercadoPagoNotificationListener(
+            session_manager=mock_session_manager,
+            handler=mock_handler,
+            inbox_factory=lambda _: mock_inbox,
+            settings=MercadoPagoNotificationInboxSettings(),
+        )
+
+        # When
+        consumed = await listener._consume(  # pylint: disable=W0212
+            semaphore=mocker.MagicMock()
+        )
+
+        # Then
+        assert consumed == notifications
+        assert mock_handler.handle.await_count == 2
@@ -102,16 +102,11 @@ def listener_settings(mocker: MockerFixture) -> Mock:
 
 
 @pytest.fixture
-def mock_aio_boto3_session(mocker: MockerFixture) -> MagicMock:
-    """Mock AIOBoto3Session for testing"""
-    session = mocker.MagicMock()
-    mock_sqs_client = mocker.MagicMock()
-    mock_queue = mocker.MagicMock()
-
-    session.resource.return_value.__aenter__.return_value = mock_sqs_client
-    session.resource.return_value.__aexit__.return_value = None
-    mock_sqs_client.get_queue_by_name = mocker.AsyncMock(return_value=mock_queue)
-    return session
+def mock_sqs(mocker: MockerFixture) -> MagicMock:
+    """Mock long-lived SQS resource for testing"""
+    sqs = mocker.MagicMock()
+    sqs.get_queue_by_name = mocker.AsyncMock(return_value=mocker.MagicMock())
+    return sqs
 
 
 class TestOrderCreatedHandler:
@@ -167,7 +162,7 @@ class TestOrderCreatedListener:
 
     async def test_should_initialize_listener_with_correct_settings(
         self,
-        mock_aio_boto3_session: MagicMock,
+        mock_sqs: MagicMock,
         listener_settings: Mock,
         mocker: MockerFixture,
     ):
@@ -181,7 +176,7 @@ class TestOrderCreatedListener:
 
         # When
         listener = OrderCreatedListener(
-            session=mock_aio_boto3_session,
+            sqs=mock_sqs,
             handler=mock_handler,
             settings=listener_settings,
         )
@@ -194,7 +189,7 @@ class TestOrderCreatedListener:
 
     async def test_should_consume_messages_successfully(
         self,
-        mock_aio_boto3_session: MagicMock,
+        mock_sqs: MagicMock,
         listener_settings: Mock,
         mock_sqs_message: MagicMock,
         mocker: MockerFixture,
@@ -212,7 +207,7 @@ class TestOrderCreatedListener:
         mock_queue.receive_messages = mocker.AsyncMock(return_value=[mock_sqs_message])
 
         listener = OrderCreatedListener(
-            session=mock_aio_boto3_session,
+            sqs=mock_sqs,
             handler=mock_handler,
             settings=listener_settings,
         )
@@ -233,7 +228,7 @@ class TestOrderCreatedListener:
 
     async def test_should_handle_sqs_client_error_during_consume(
         self,
-        mock_aio_boto3_session: MagicMock,
+        mock_sqs: MagicMock,
         listener_settings: Mock,
         mocker: MockerFixture,
     ):
@@ -253,7 +248,7 @@ class TestOrderCreatedListener:
 
         mock_queue.receive_messages = mocker.AsyncMock(side_effect=client_error)
         listener = OrderCreatedListener(
-            session=mock_aio_boto3_session,
+            sqs=mock_sqs,
             handler=mock_handler,
             settings=listener_settings,
         )
@@ -264,7 +259,7 @@ class TestOrderCreatedListener:
 
     async def test_should_handle_message_processing_failure_and_delete_message(
         self,
-        mock_aio_boto3_session: MagicMock,
+        mock_sqs: MagicMock,
         listener_settings: Mock,
         mock_sqs_message: MagicMock,
         mocker: MockerFixture,
@@ -284,7 +279,7 @@ class TestOrderCreatedListener:
         mock_queue.receive_messages = mocker.AsyncMock(return_value=[mock_sqs_message])
 
         listener = OrderCreatedListener(
-            session=mock_aio_boto3_session,
+            sqs=mock_sqs,
             handler=mock_handler,
             settings=listener_settings,
         )
@@ -299,7 +294,7 @@ class TestOrderCreatedListener:
 
     async def test_should_handle_empty_message_queue(
         self,
-        mock_aio_boto3_session: MagicMock,
+        mock_sqs: MagicMock,
         listener_settings: Mock,
         mocker: MockerFixture,
     ):
@@ -315,7 +310,7 @@ class TestOrderCreatedListener:
         mock_queue.receive_messages = mocker.AsyncMock(return_value=[])
 
         listener = OrderCreatedListener(
-            session=mock_aio_boto3_session,
+            sqs=mock_sqs,
             handler=mock_handler,
             settings=listener_settings,
         )
@@ -329,7 +324,7 @@ class TestOrderCreatedListener:
 
     async def test_should_stop_listening_on_shutdown_signal(
         self,
-        mock_aio_boto3_session: MagicMock,
+        mock_sqs: MagicMock,
         listener_settings: Mock,
         mocker: MockerFixture,
     ):
@@ -345,18 +340,8 @@ class TestOrderCreatedListener:
         mock_shutdown_handler = mocker.MagicMock()
         mock_shutdown_handler.shutdown = True  # Simulate shutdown signal
 
-        # Mock the SQS resource context manager
-        mock_sqs_client = mocker.MagicMock()
-        mock_queue = mocker.MagicMock()
-        mock_sqs_client.get_queue_by_name = mocker.AsyncMock(return_value=mock_queue)
-
-        mock_aio_boto3_session.resource.return_value.__aenter__.return_value = (
-            mock_sqs_client
-        )
-
-        mock_aio_boto3_session.resource.return_value.__aexit__.return_value = None
         listener = OrderCreatedListener(
-            session=mock_aio_boto3_session,
+            sqs=mock_sqs,
             handler=mock_handler,
             settings=listener_settings,
         )
@@ -366,9 +351,6 @@ class TestOrderCreatedListener:
 
         # Then
         # Should have attempted to get the queue but stopped due to shutdown
-        mock_aio_boto3_session.resource.assert_called_once_with("sqs")
-        mock_sqs_client.get_queue_by_name.assert_awaited_once_with(
-            QueueName="test-queue"
-        )
+        mock_sqs.get_queue_by_name.assert_awaited_once_with(QueueName="test-queue")
 
         mock_handler.handle.assert_not_awaited()
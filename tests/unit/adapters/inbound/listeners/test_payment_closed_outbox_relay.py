@@ -0,0 +1,280 @@
+# pylint: disable=W0621
+
+"""Unit tests for PaymentClosed Outbox Relay"""
+
+from unittest.mock import MagicMock
+
+import pytest
+from botocore.exceptions import EndpointConnectionError
+from pytest_mock import MockerFixture
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from payment_api.adapters.inbound.listeners.payment_closed_outbox_relay import (
+    PaymentClosedOutboxRelay,
+)
+from payment_api.adapters.out.boto_payment_closed_publisher import (
+    BotoPaymentClosedPublisher,
+)
+from payment_api.domain.events import PaymentClosedEvent
+from payment_api.domain.exceptions import PersistenceError
+from payment_api.domain.ports import (
+    PaymentClosedOutbox,
+    PaymentClosedPublisher,
+    PublishResult,
+)
+from payment_api.infrastructure.config import (
+    PaymentClosedOutboxSettings,
+    PaymentClosedPublisherSettings,
+)
+from payment_api.infrastructure.orm import SessionManager
+
+
+@pytest.fixture
+def mock_session_manager(mocker: MockerFixture) -> MagicMock:
+    """Mock SessionManager for testing"""
+    mock_session_manager = mocker.Mock(spec=SessionManager)
+
+    async_context_manager = mocker.AsyncMock()
+    async_context_manager.__aenter__ = mocker.AsyncMock(
+        return_value=mocker.Mock(spec=AsyncSession)
+    )
+    async_context_manager.__aexit__ = mocker.AsyncMock(return_value=None)
+    mock_session_manager.session.return_value = async_context_manager
+
+    return mock_session_manager
+
+
+@pytest.fixture
+def mock_outbox(mocker: MockerFixture) -> MagicMock:
+    """Mock PaymentClosedOutbox for testing"""
+    mock_outbox = mocker.Mock(spec=PaymentClosedOutbox)
+    mock_outbox.purge_sent.return_value = 0
+    return mock_outbox
+
+
+@pytest.fixture
+def mock_publisher(mocker: MockerFixture) -> MagicMock:
+    """Mock PaymentClosedPublisher for testing"""
+    return mocker.Mock(spec=PaymentClosedPublisher)
+
+
+@pytest.fixture
+def relay(
+    mock_session_manager: MagicMock,
+    mock_outbox: MagicMock,
+    mock_publisher: MagicMock,
+) -> PaymentClosedOutboxRelay:
+    """PaymentClosedOutboxRelay instance for testing"""
+    return PaymentClosedOutboxRelay(
+        session_manager=mock_session_manager,
+        outbox_factory=lambda _: mock_outbox,
+        publisher=mock_publisher,
+        settings=PaymentClosedOutboxSettings(BATCH_SIZE=5),
+    )
+
+
+async def test_should_publish_claimed_events_and_mark_them_as_sent(
+    relay: PaymentClosedOutboxRelay,
+    mock_outbox: MagicMock,
+    mock_publisher: MagicMock,
+):
+    """Given pending PaymentClosedEvents in the outbox
+    When the relay processes a batch
+    Then every event should be published and marked as sent
+    """
+
+    # Given
+    events = [
+        PaymentClosedEvent(payment_id="A001"),
+        PaymentClosedEvent(payment_id="A002"),
+    ]
+    mock_outbox.claim.return_value = events
+    mock_publisher.publish_many.return_value = [
+        PublishResult(event_id=event.id) for event in events
+    ]
+
+    # When
+    relayed = await relay._relay_batch()  # pylint: disable=W0212
+
+    # Then
+    assert relayed == 2
+    mock_outbox.claim.assert_awaited_once_with(limit=5)
+    mock_publisher.publish_many.assert_awaited_once_with(events)
+    mock_outbox.mark_sent.assert_awaited_once_with([event.id for event in events])
+    mock_outbox.mark_failed.assert_not_called()
+
+
+async def test_should_mark_event_as_failed_when_publishing_fails(
+    relay: PaymentClosedOutboxRelay,
+    mock_outbox: MagicMock,
+    mock_publisher: MagicMock,
+):
+    """Given pending PaymentClosedEvents in the outbox
+    When publishing one of them fails
+    Then the failed event should be marked as failed and the others as sent
+    """
+
+    # Given
+    failed_event = PaymentClosedEvent(payment_id="A001")
+    sent_event = PaymentClosedEvent(payment_id="A002")
+    mock_outbox.claim.return_value = [failed_event, sent_event]
+    mock_publisher.publish_many.return_value = [
+        PublishResult(event_id=failed_event.id, error="SNS down"),
+        PublishResult(event_id=sent_event.id),
+    ]
+
+    # When
+    await relay._relay_batch()  # pylint: disable=W0212
+
+    # Then
+    mock_outbox.mark_failed.assert_awaited_once_with(failed_event.id, error="SNS down")
+    mock_outbox.mark_sent.assert_awaited_once_with([sent_event.id])
+
+
+async def test_should_keep_running_when_outbox_fails(
+    relay: PaymentClosedOutboxRelay,
+    mock_outbox: MagicMock,
+    mocker: MockerFixture,
+):
+    """Given an outbox that fails to claim events
+    When the relay runs
+    Then it should wait for the next poll instead of stopping
+    """
+
+    # Given
+    shutdown_event = mocker.Mock()
+    type(shutdown_event).shutdown = mocker.PropertyMock(side_effect=[False, True])
+    mock_outbox.claim.side_effect = PersistenceError("DB down")
+    sleep = mocker.patch(
+        "payment_api.adapters.inbound.listeners.payment_closed_outbox_relay"
+        ".asyncio.sleep",
+        new_callable=mocker.AsyncMock,
+    )
+
+    # When
+    await relay.run(shutdown_event=shutdown_event)
+
+    # Then
+    mock_outbox.claim.assert_awaited_once()
+    sleep.assert_awaited_once_with(relay.poll_interval)
+
+
+async def test_should_keep_running_when_sns_is_unreachable(
+    mock_session_manager: MagicMock,
+    mock_outbox: MagicMock,
+    mocker: MockerFixture,
+):
+    """Given a pending PaymentClosedEvent and an SNS endpoint that cannot be
+    reached
+    When the relay runs
+    Then the event should be marked as failed and the relay keep polling
+    """
+
+    # Given
+    event = PaymentClosedEvent(payment_id="A001")
+    sns_client = mocker.Mock()
+    sns_client.publish_batch = mocker.AsyncMock(
+        side_effect=EndpointConnectionError(endpoint_url="https://sns.invalid")
+    )
+    relay = PaymentClosedOutboxRelay(
+        session_manager=mock_session_manager,
+        outbox_factory=lambda _: mock_outbox,
+        publisher=BotoPaymentClosedPublisher(
+            sns_client=sns_client,
+            settings=PaymentClosedPublisherSettings(
+                TOPIC_ARN="arn:aws:sns:us-east-1:123456789012:payment-closed",
+                GROUP_ID="payment-closed",
+            ),
+        ),
+        settings=PaymentClosedOutboxSettings(BATCH_SIZE=5),
+    )
+    shutdown_event = mocker.Mock()
+    type(shutdown_event).shutdown = mocker.PropertyMock(
+        side_effect=[False, False, True]
+    )
+    mock_outbox.claim.side_effect = [[event], []]
+    mocker.patch(
+        "payment_api.adapters.inbound.listeners.payment_closed_outbox_relay"
+        ".asyncio.sleep",
+        new_callable=mocker.AsyncMock,
+    )
+
+    # When
+    await relay.run(shutdown_event=shutdown_event)
+
+    # Then
+    assert mock_outbox.claim.await_count == 2
+    mock_outbox.mark_failed.assert_awaited_once()
+    assert mock_outbox.mark_failed.await_args.args[0] == event.id
+
+
+async def test_should_purge_sent_events_in_batches_when_outbox_is_idle(
+    mock_session_manager: MagicMock,
+    mock_outbox: MagicMock,
+    mock_publisher: MagicMock,
+    mocker: MockerFixture,
+):
+    """Given an idle outbox with more expired sent events than a purge batch
+    When the relay polls the outbox twice within the purge interval
+    Then the expired sent events should be purged in batches only once
+    """
+
+    # Given
+    relay = PaymentClosedOutboxRelay(
+        session_manager=mock_session_manager,
+        outbox_factory=lambda _: mock_outbox,
+        publisher=mock_publisher,
+        settings=PaymentClosedOutboxSettings(
+            PURGE_BATCH_SIZE=2, PURGE_INTERVAL_SECONDS=3600.0
+        ),
+    )
+    shutdown_event = mocker.Mock()
+    type(shutdown_event).shutdown = mocker.PropertyMock(
+        side_effect=[False, False, True]
+    )
+    mock_outbox.claim.return_value = []
+    mock_outbox.purge_sent.side_effect = [2, 1]
+    mocker.patch(
+        "payment_api.adapters.inbound.listeners.payment_closed_outbox_relay"
+        ".asyncio.sleep",
+        new_callable=mocker.AsyncMock,
+    )
+
+    # When
+    await relay.run(shutdown_event=shutdown_event)
+
+    # Then
+    assert mock_outbox.claim.await_count == 2
+    assert mock_outbox.purge_sent.await_args_list == [
+        mocker.call(limit=2),
+        mocker.call(limit=2),
+    ]
+
+
+async def test_should_keep_running_when_purging_sent_events_fails(
+    relay: PaymentClosedOutboxRelay,
+    mock_outbox: MagicMock,
+    mocker: MockerFixture,
+):
+    """Given an idle outbox that fails to purge sent events
+    When the relay runs
+    Then it should wait for the next poll instead of stopping
+    """
+
+    # Given
+    shutdown_event = mocker.Mock()
+    type(shutdown_event).shutdown = mocker.PropertyMock(side_effect=[False, True])
+    mock_outbox.claim.return_value = []
+    mock_outbox.purge_sent.side_effect = PersistenceError("DB down")
+    sleep = mocker.patch(
+        "payment_api.adapters.inbound.listeners.payment_closed_outbox_relay"
+        ".asyncio.sleep",
+        new_callable=mocker.AsyncMock,
+    )
+
+    # When
+    await relay.run(shutdown_event=shutdown_event)
+
+    # Then
+    mock_outbox.purge_sent.assert_awaited_once()
+    sleep.assert_awaited_once_with(relay.poll_interval)
@@ -12,11 +12,18 @@ from payment_api.adapters.inbound.rest.dependencies.auth import (
     validate_mercado_pago_notification,
 )
 from payment_api.adapters.inbound.rest.dependencies.core import (
+    LazyDependency,
     finalize_payment_by_mercado_pago_payment_id_use_case,
     find_payment_by_id_use_case,
+    find_payment_version_by_id_use_case,
+    find_payments_by_ids_use_case,
+    mercado_pago_notification_deduplicator,
+    mercado_pago_notification_inbox,
+    qr_code_settings,
     render_qr_code_use_case,
 )
 from payment_api.entrypoints.api import app
+from payment_api.infrastructure.config import QRCodeSettings
 
 
 @pytest.fixture
@@ -24,22 +31,51 @@ def payment_use_cases_mock(mocker: MockerFixture):
     """Fixture to provide a mock for payment use cases called in the REST API"""
     return {
         "find_by_id": mocker.MagicMock(),
+        "find_version_by_id": mocker.MagicMock(),
+        "find_many_by_ids": mocker.MagicMock(),
         "render_qr_code": mocker.MagicMock(),
         "finalize_by_mercado_pago_payment_id": mocker.MagicMock(),
     }
 
 
+@pytest.fixture
+def notification_deduplicator_mock(mocker: MockerFixture):
+    """Fixture to provide a mock for the Mercado Pago notification deduplicator"""
+    deduplicator = mocker.MagicMock()
+    deduplicator.is_duplicate = mocker.AsyncMock(return_value=False)
+    deduplicator.mark_processed = mocker.AsyncMock()
+    return deduplicator
+
+
+def lazy(mocker: MockerFixture, value) -> LazyDependency:
+    """Wrap a mock in a LazyDependency"""
+    return LazyDependency(mocker.AsyncMock(return_value=value))
+
+
 @pytest.fixture
 async def test_app_client(
     payment_use_cases_mock: dict,
+    notification_deduplicator_mock,
+    mocker: MockerFixture,
 ) -> AsyncGenerator[AsyncClient, None]:
     """Fixture to provide an AsyncClient for testing FastAPI endpoints"""
     app.dependency_overrides = {
         validate_mercado_pago_notification: lambda: None,
         find_payment_by_id_use_case: lambda: payment_use_cases_mock["find_by_id"],
+        find_payment_version_by_id_use_case: lambda: payment_use_cases_mock[
+            "find_version_by_id"
+        ],
+        find_payments_by_ids_use_case: lambda: payment_use_cases_mock[
+            "find_many_by_ids"
+        ],
         render_qr_code_use_case: lambda: payment_use_cases_mock["render_qr_code"],
-        finalize_payment_by_mercado_pago_payment_id_use_case: (
-            lambda: payment_use_cases_mock["finalize_by_mercado_pago_payment_id"]
+        qr_code_settings: lambda: QRCodeSettings(),  # pylint: disable=W0108
+        finalize_payment_by_mercado_pago_payment_id_use_case: lambda: lazy(
+            mocker, payment_use_cases_mock["finalize_by_mercado_pago_payment_id"]
+        ),
+        mercado_pago_notification_inbox: lambda: None,
+        mercado_pago_notification_deduplicator: lambda: lazy(
+            mocker, notification_deduplicator_mock
         ),
     }
 
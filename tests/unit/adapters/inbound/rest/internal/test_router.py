@@ -0,0 +1,139 @@
+# pylint: disable=W0621
+
+"""Unit tests for the internal routes"""
+
+from httpx import AsyncClient
+from pytest_mock import MockerFixture
+
+from payment_api.adapters.inbound.rest.dependencies.core import (
+    payment_cache,
+    session_manager,
+)
+from payment_api.entrypoints.api import app
+from payment_api.infrastructure.orm.session_manager import PoolStats
+from payment_api.infrastructure.payment_cache import PaymentCache
+
+
+class TestPaymentCacheStatsRoute:
+    """Test cases for the GET /internal/metrics/payment-cache route"""
+
+    async def test_should_return_payment_cache_stats(
+        self,
+        test_app_client: AsyncClient,
+        mocker: MockerFixture,
+    ):
+        """Given the payment cache is enabled
+        When requesting its stats
+        Then the counters and the hit ratio should be returned
+        """
+
+        # Given
+        cache = PaymentCache(loader=mocker.AsyncMock(), max_size=10)
+        cache.get("A001")
+        app.dependency_overrides[payment_cache] = lambda: cache
+
+        # When
+        response = await test_app_client.get("/internal/metrics/payment-cache")
+
+        # Then
+        assert response.status_code == 200
+        assert response.json() == {
+            "size": 0,
+            "max_size": 10,
+            "hits": 0,
+            "stale_hits": 0,
+            "misses": 1,
+            "evictions": 0,
+            "invalidations": 0,
+            "hit_ratio": 0.0,
+        }
+
+    async def test_should_return_404_when_payment_cache_is_disabled(
+        self,
+        test_app_client: AsyncClient,
+    ):
+        """Given the payment cache is disabled
+        When requesting its stats
+        Then a 404 response should be returned
+        """
+
+        # Given
+        app.dependency_overrides[payment_cache] = lambda: None
+
+        # When
+        response = await test_app_client.get("/internal/metrics/payment-cache")
+
+        # Then
+        assert response.status_code == 404
+
+
+class TestDatabasePoolStatsRoute:
+    """Test cases for the GET /internal/metrics/database-pool route"""
+
+    async def test_should_return_database_pool_stats(
+        self,
+        test_app_client: AsyncClient,
+        mocker: MockerFixture,
+    ):
+        """Given a database pool that handed out connections
+        When requesting its stats
+        Then the counters and the average wait time should be returned
+        """
+
+        # Given
+        manager = mocker.MagicMock()
+        manager.pool_names = ["primary"]
+        manager.pool_stats.return_value = PoolStats(
+            size=5,
+            max_overflow=10,
+            checked_in=3,
+            checked_out=2,
+            overflow=0,
+            checkouts=4,
+            timeouts=0,
+            wait_time=0.2,
+            max_wait_time=0.1,
+        )
+        app.dependency_overrides[session_manager] = lambda: manager
+
+        # When
+        response = await test_app_client.get("/internal/metrics/database-pool")
+
+        # Then
+        assert response.status_code == 200
+        assert response.json() == {
+            "size": 5,
+            "max_overflow": 10,
+            "checked_in": 3,
+            "checked_out": 2,
+            "overflow": 0,
+            "checkouts": 4,
+            "timeouts": 0,
+            "wait_time": 0.2,
+            "max_wait_time": 0.1,
+            "average_wait_time": 0.05,
+        }
+
+    async def test_should_return_404_for_unknown_database_pool(
+        self,
+        test_app_client: AsyncClient,
+        mocker: MockerFixture,
+    ):
+        """Given a session manager without read replicas
+        When requesting the stats of a replica pool
+        Then a 404 response should be returned
+        """
+
+        # Given
+        manager = mocker.MagicMock()
+        manager.pool_names = ["primary"]
+        app.dependency_overrides[session_manager] = lambda: manager
+
+        # When
+        response = await test_app_client.get(
+            "/internal/metrics/database-pool", params={"pool": "replica-0"}
+        )
+
+        # Then
+        assert response.status_code == 404
+        manager.pool_stats.assert_not_called()
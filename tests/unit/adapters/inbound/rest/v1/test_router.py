@@ -2,22 +2,45 @@
 
 """Unit tests for Payment API v1 routes"""
 
+from pathlib import Path
+from typing import Callable
+
 from httpx import AsyncClient
 from pytest_mock import MockerFixture
 
+from payment_api.adapters.inbound.rest.dependencies.core import (
+    LazyDependency,
+    finalize_payment_by_mercado_pago_payment_id_use_case,
+    mercado_pago_notification_deduplicator,
+    mercado_pago_notification_inbox,
+    payment_status_notifications,
+    payment_version_reader,
+    qr_code_settings,
+)
+from payment_api.adapters.inbound.rest.v1.schemas import MAX_BATCH_LOOKUP_SIZE
 from payment_api.application.commands import (
     FinalizePaymentByMercadoPagoPaymentIdCommand,
     FindPaymentByIdCommand,
+    FindPaymentsByIdsCommand,
+    QRCodeOptionsDTO,
     RenderQRCodeCommand,
 )
-from payment_api.application.use_cases.ports import MPClientError
-from payment_api.domain.entities import PaymentOut
+from payment_api.application.use_cases.ports import (
+    MPClientError,
+    QRCodeImage,
+    QRCodeRendererUnavailable,
+)
+from payment_api.domain.entities import PaymentOut, PaymentVersion
 from payment_api.domain.exceptions import (
-    EventPublishingError,
     NotFound,
     PersistenceError,
 )
 from payment_api.domain.value_objects import PaymentStatus
+from payment_api.entrypoints.api import app
+from payment_api.infrastructure.config import QRCodeSettings
+from payment_api.infrastructure.payment_status_notifications import (
+    PaymentStatusNotifications,
+)
 
 
 class TestFindPaymentByIdRoute:
@@ -126,6 +149,182 @@ class TestFindPaymentByIdRoute:
             command=expected_command
         )
 
+    async def test_should_return_etag_and_long_cache_control_for_closed_payment(
+        self,
+        test_app_client: AsyncClient,
+        payment_use_cases_mock: dict,
+        mocker: MockerFixture,
+        make_payment: Callable[..., PaymentOut],
+    ):
+        """Given a closed payment
+        When requesting it via GET endpoint
+        Then the response should carry an ETag and a long-lived Cache-Control
+        """
+
+        # Given
+        payment_use_cases_mock["find_by_id"].execute = mocker.AsyncMock(
+            return_value=make_payment(payment_status=PaymentStatus.CLOSED)
+        )
+
+        # When
+        response = await test_app_client.get("/v1/payment/A048")
+
+        # Then
+        assert response.status_code == 200
+        assert response.headers["etag"].startswith('"')
+        assert response.headers["cache-control"] == "public, max-age=86400, immutable"
+
+    async def test_should_return_304_when_if_none_match_matches_version(
+        self,
+        test_app_client: AsyncClient,
+        payment_use_cases_mock: dict,
+        mocker: MockerFixture,
+        make_payment: Callable[..., PaymentOut],
+    ):
+        """Given the ETag of an opened payment that was not modified
+        When requesting the payment with If-None-Match
+        Then 304 should be returned without loading the payment
+        """
+
+        # Given
+        payment = make_payment(payment_status=PaymentStatus.OPENED)
+        payment_use_cases_mock["find_by_id"].execute = mocker.AsyncMock(
+            return_value=payment
+        )
+
+        payment_use_cases_mock["find_version_by_id"].execute = mocker.AsyncMock(
+            return_value=PaymentVersion.model_validate(payment)
+        )
+
+        etag = (await test_app_client.get("/v1/payment/A048")).headers["etag"]
+        payment_use_cases_mock["find_by_id"].execute.reset_mock()
+
+        # When
+        response = await test_app_client.get(
+            "/v1/payment/A048", headers={"If-None-Match": f"W/{etag}"}
+        )
+
+        # Then
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+        assert response.headers["cache-control"] == "no-cache"
+        payment_use_cases_mock["find_by_id"].execute.assert_not_called()
+
+    async def test_should_return_payment_when_if_none_match_is_outdated(
+        self,
+        test_app_client: AsyncClient,
+        payment_use_cases_mock: dict,
+        mocker: MockerFixture,
+        make_payment: Callable[..., PaymentOut],
+    ):
+        """Given an ETag of a previous version of the payment
+        When requesting the payment with If-None-Match
+        Then the current payment should be returned with status 200
+        """
+
+        # Given
+        payment = make_payment(payment_status=PaymentStatus.CLOSED)
+        payment_use_cases_mock["find_by_id"].execute = mocker.AsyncMock(
+            return_value=payment
+        )
+
+        payment_use_cases_mock["find_version_by_id"].execute = mocker.AsyncMock(
+            return_value=PaymentVersion.model_validate(payment)
+        )
+
+        # When
+        response = await test_app_client.get(
+            "/v1/payment/A048", headers={"If-None-Match": '"outdated"'}
+        )
+
+        # Then
+        assert response.status_code == 200
+        assert response.json()["payment_status"] == PaymentStatus.CLOSED.value
+        assert response.headers["etag"] != '"outdated"'
+
+
+class TestBatchLookupRoute:
+    """Test cases for the POST /v1/payment/batch-lookup route"""
+
+    async def test_should_return_found_payments_and_missing_ids(
+        self,
+        test_app_client: AsyncClient,
+        payment_use_cases_mock: dict,
+        mocker: MockerFixture,
+        make_payment: Callable[..., PaymentOut],
+    ):
+        """Given a batch of payment IDs where one payment does not exist
+        When looking up the batch
+        Then the found payments and the missing ID should be returned
+        """
+
+        # Given
+        payment_use_cases_mock["find_many_by_ids"].execute = mocker.AsyncMock(
+            return_value=[make_payment(payment_status=PaymentStatus.OPENED)]
+        )
+
+        # When
+        response = await test_app_client.post(
+            "/v1/payment/batch-lookup", json={"ids": ["A048", "A049", "A048"]}
+        )
+
+        # Then
+        assert response.status_code == 200
+        assert [payment["id"] for payment in response.json()["found"]] == ["A048"]
+        assert response.json()["missing"] == ["A049"]
+        payment_use_cases_mock["find_many_by_ids"].execute.assert_awaited_once_with(
+            command=FindPaymentsByIdsCommand(payment_ids=["A048", "A049", "A048"])
+        )
+
+    async def test_should_return_422_when_batch_is_too_large(
+        self,
+        test_app_client: AsyncClient,
+        payment_use_cases_mock: dict,
+        mocker: MockerFixture,
+    ):
+        """Given a batch with more payment IDs than allowed
+        When looking up the batch
+        Then a 422 response should be returned without querying payments
+        """
+
+        # Given
+        payment_use_cases_mock["find_many_by_ids"].execute = mocker.AsyncMock()
+        payment_ids = [f"A{index:03}" for index in range(MAX_BATCH_LOOKUP_SIZE + 1)]
+
+        # When
+        response = await test_app_client.post(
+            "/v1/payment/batch-lookup", json={"ids": payment_ids}
+        )
+
+        # Then
+        assert response.status_code == 422
+        payment_use_cases_mock["find_many_by_ids"].execute.assert_not_called()
+
+    async def test_should_return_500_when_persistence_error_occurs(
+        self,
+        test_app_client: AsyncClient,
+        payment_use_cases_mock: dict,
+        mocker: MockerFixture,
+    ):
+        """Given a batch of payment IDs
+        When looking up the batch and a persistence error occurs
+        Then a 500 response should be returned
+        """
+
+        # Given
+        payment_use_cases_mock["find_many_by_ids"].execute = mocker.AsyncMock(
+            side_effect=PersistenceError("Database connection failed")
+        )
+
+        # When
+        response = await test_app_client.post(
+            "/v1/payment/batch-lookup", json={"ids": ["A048"]}
+        )
+
+        # Then
+        assert response.status_code == 500
+
 
 class TestRenderQRCodeRoute:
     """Test cases for the GET /v1/payment/{payment_id}/qr route"""
@@ -145,7 +344,7 @@ class TestRenderQRCodeRoute:
         payment_id = "A048"
         qr_code_bytes = b"fake_png_data"
         payment_use_cases_mock["render_qr_code"].execute = mocker.AsyncMock(
-            return_value=qr_code_bytes
+            return_value=QRCodeImage(digest="abc123", content=qr_code_bytes)
         )
 
         # When
@@ -154,12 +353,378 @@ class TestRenderQRCodeRoute:
         # Then
         assert response.status_code == 200
         assert response.headers["content-type"] == "image/png"
+        assert response.headers["etag"] == '"abc123"'
+        assert response.headers["cache-control"] == (
+            "public, max-age=31536000, immutable"
+        )
+        assert response.headers["content-length"] == str(len(qr_code_bytes))
         assert response.content == qr_code_bytes
         expected_command = RenderQRCodeCommand(payment_id=payment_id)
         payment_use_cases_mock["render_qr_code"].execute.assert_awaited_once_with(
             command=expected_command
         )
 
+    async def test_should_send_stored_qr_code_file(
+        self,
+        test_app_client: AsyncClient,
+        payment_use_cases_mock: dict,
+        mocker: MockerFixture,
+        tmp_path: Path,
+    ):
+        """Given a QR code stored as a file
+        When requesting the QR code via GET endpoint
+        Then the file should be sent with the QR code headers
+        """
+
+        # Given
+        (tmp_path / "ab").mkdir()
+        (tmp_path / "ab" / "abc123.png").write_bytes(b"stored_png_data")
+        app.dependency_overrides[qr_code_settings] = lambda: QRCodeSettings(
+            FILE_STORE_DIRECTORY=str(tmp_path)
+        )
+        payment_use_cases_mock["render_qr_code"].execute = mocker.AsyncMock(
+            return_value=QRCodeImage(digest="abc123", file_name="ab/abc123.png")
+        )
+
+        # When
+        response = await test_app_client.get("/v1/payment/A048/qr")
+
+        # Then
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "image/png"
+        assert response.headers["etag"] == '"abc123"'
+        assert response.headers["content-length"] == str(len(b"stored_png_data"))
+        assert response.content == b"stored_png_data"
+
+    async def test_should_redirect_stored_qr_code_file_to_nginx(
+        self,
+        test_app_client: AsyncClient,
+        payment_use_cases_mock: dict,
+        mocker: MockerFixture,
+        tmp_path: Path,
+    ):
+        """Given a QR code stored as a file delivered through X-Accel-Redirect
+        When requesting the QR code via GET endpoint
+        Then an empty response without length should point nginx to the internal
+        file location
+        """
+
+        # Given
+        (tmp_path / "ab").mkdir()
+        (tmp_path / "ab" / "abc123.png").write_bytes(b"png")
+        app.dependency_overrides[qr_code_settings] = lambda: QRCodeSettings(
+            FILE_STORE_DIRECTORY=str(tmp_path),
+            FILE_STORE_DELIVERY="x-accel-redirect",
+            FILE_STORE_ACCEL_REDIRECT_PREFIX="/internal/qr/",
+        )
+        payment_use_cases_mock["render_qr_code"].execute = mocker.AsyncMock(
+            return_value=QRCodeImage(
+                digest="abc123", content=b"png", file_name="ab/abc123.png"
+            )
+        )
+
+        # When
+        response = await test_app_client.get("/v1/payment/A048/qr")
+
+        # Then
+        assert response.status_code == 200
+        assert response.headers["x-accel-redirect"] == "/internal/qr/ab/abc123.png"
+        assert response.headers["content-type"] == "image/png"
+        assert response.headers["etag"] == '"abc123"'
+        assert "content-length" not in response.headers
+        assert response.content == b""
+
+    async def test_should_send_qr_code_inline_when_its_file_was_evicted(
+        self,
+        test_app_client: AsyncClient,
+        payment_use_cases_mock: dict,
+        mocker: MockerFixture,
+        tmp_path: Path,
+    ):
+        """Given a QR code found as a file that is evicted before it is sent
+        When requesting the QR code via GET endpoint
+        Then the QR code should be rendered again and sent inline
+        """
+
+        # Given
+        app.dependency_overrides[qr_code_settings] = lambda: QRCodeSettings(
+            FILE_STORE_DIRECTORY=str(tmp_path)
+        )
+        payment_use_cases_mock["render_qr_code"].execute = mocker.AsyncMock(
+            side_effect=[
+                QRCodeImage(digest="abc123", file_name="ab/abc123.png"),
+                QRCodeImage(digest="abc123", content=b"png", file_name="ab/abc123.png"),
+            ]
+        )
+
+        # When
+        response = await test_app_client.get("/v1/payment/A048/qr")
+
+        # Then
+        assert response.status_code == 200
+        assert response.headers["etag"] == '"abc123"'
+        assert response.headers["content-length"] == "3"
+        assert response.content == b"png"
+        assert payment_use_cases_mock["render_qr_code"].execute.await_count == 2
+
+    async def test_should_return_503_when_qr_code_file_is_evicted_again(
+        self,
+        test_app_client: AsyncClient,
+        payment_use_cases_mock: dict,
+        mocker: MockerFixture,
+        tmp_path: Path,
+    ):
+        """Given a QR code found as a file that is evicted every time it is found
+        When requesting the QR code via GET endpoint
+        Then a 503 response should ask the client to retry
+        """
+
+        # Given
+        app.dependency_overrides[qr_code_settings] = lambda: QRCodeSettings(
+            FILE_STORE_DIRECTORY=str(tmp_path)
+        )
+        payment_use_cases_mock["render_qr_code"].execute = mocker.AsyncMock(
+            return_value=QRCodeImage(digest="abc123", file_name="ab/abc123.png")
+        )
+
+        # When
+        response = await test_app_client.get("/v1/payment/A048/qr")
+
+        # Then
+        assert response.status_code == 503
+        assert response.headers["retry-after"] == "1"
+        assert payment_use_cases_mock["render_qr_code"].execute.await_count == 2
+
+    async def test_should_return_304_without_rendering_when_etag_matches(
+        self,
+        test_app_client: AsyncClient,
+        payment_use_cases_mock: dict,
+        mocker: MockerFixture,
+    ):
+        """Given the ETag of a QR code previously returned
+        When requesting the QR code with a matching If-None-Match header
+        Then a 304 response should be returned without rendering the QR code
+        """
+
+        # Given
+        payment_use_cases_mock["render_qr_code"].execute = mocker.AsyncMock(
+            return_value=QRCodeImage(digest="abc123")
+        )
+
+        # When
+        response = await test_app_client.get(
+            "/v1/payment/A048/qr", headers={"If-None-Match": '"abc123"'}
+        )
+
+        # Then
+        assert response.status_code == 304
+        assert response.headers["etag"] == '"abc123"'
+        assert not response.content
+        payment_use_cases_mock["render_qr_code"].execute.assert_awaited_once_with(
+            command=RenderQRCodeCommand(payment_id="A048", render=False)
+        )
+
+    async def test_should_render_qr_code_when_etag_does_not_match(
+        self,
+        test_app_client: AsyncClient,
+        payment_use_cases_mock: dict,
+        mocker: MockerFixture,
+    ):
+        """Given an outdated ETag
+        When requesting the QR code with it in the If-None-Match header
+        Then the QR code should be rendered and returned
+        """
+
+        # Given
+        payment_use_cases_mock["render_qr_code"].execute = mocker.AsyncMock(
+            side_effect=[
+                QRCodeImage(digest="abc123"),
+                QRCodeImage(digest="abc123", content=b"fake_png_data"),
+            ]
+        )
+
+        # When
+        response = await test_app_client.get(
+            "/v1/payment/A048/qr", headers={"If-None-Match": '"outdated"'}
+        )
+
+        # Then
+        assert response.status_code == 200
+        assert response.content == b"fake_png_data"
+        payment_use_cases_mock["render_qr_code"].execute.assert_awaited_with(
+            command=RenderQRCodeCommand(payment_id="A048")
+        )
+
+    async def test_should_answer_head_request_without_rendering(
+        self,
+        test_app_client: AsyncClient,
+        payment_use_cases_mock: dict,
+        mocker: MockerFixture,
+    ):
+        """Given a QR code that was already rendered
+        When requesting it via HEAD endpoint
+        Then its headers should be returned without rendering it again
+        """
+
+        # Given
+        payment_use_cases_mock["render_qr_code"].execute = mocker.AsyncMock(
+            return_value=QRCodeImage(digest="abc123", content=b"fake_png_data")
+        )
+
+        # When
+        response = await test_app_client.head("/v1/payment/A048/qr")
+
+        # Then
+        assert response.status_code == 200
+        assert response.headers["etag"] == '"abc123"'
+        assert response.headers["content-length"] == str(len(b"fake_png_data"))
+        assert not response.content
+        payment_use_cases_mock["render_qr_code"].execute.assert_awaited_once_with(
+            command=RenderQRCodeCommand(payment_id="A048", render=False)
+        )
+
+    async def test_should_answer_head_request_with_stored_qr_code_file_length(
+        self,
+        test_app_client: AsyncClient,
+        payment_use_cases_mock: dict,
+        mocker: MockerFixture,
+        tmp_path: Path,
+    ):
+        """Given a QR code stored as a file
+        When requesting it via HEAD endpoint
+        Then the length of its file should be returned without rendering it
+        """
+
+        # Given
+        (tmp_path / "ab").mkdir()
+        (tmp_path / "ab" / "abc123.png").write_bytes(b"stored_png_data")
+        app.dependency_overrides[qr_code_settings] = lambda: QRCodeSettings(
+            FILE_STORE_DIRECTORY=str(tmp_path)
+        )
+        payment_use_cases_mock["render_qr_code"].execute = mocker.AsyncMock(
+            return_value=QRCodeImage(digest="abc123", file_name="ab/abc123.png")
+        )
+
+        # When
+        response = await test_app_client.head("/v1/payment/A048/qr")
+
+        # Then
+        assert response.status_code == 200
+        assert response.headers["content-length"] == str(len(b"stored_png_data"))
+        assert not response.content
+        payment_use_cases_mock["render_qr_code"].execute.assert_awaited_once_with(
+            command=RenderQRCodeCommand(payment_id="A048", render=False)
+        )
+
+    async def test_should_render_qr_code_for_head_request_when_length_is_unknown(
+        self,
+        test_app_client: AsyncClient,
+        payment_use_cases_mock: dict,
+        mocker: MockerFixture,
+    ):
+        """Given a QR code that was never rendered
+        When requesting it via HEAD endpoint
+        Then it should be rendered to return its real length
+        """
+
+        # Given
+        payment_use_cases_mock["render_qr_code"].execute = mocker.AsyncMock(
+            side_effect=[
+                QRCodeImage(digest="abc123"),
+                QRCodeImage(digest="abc123", content=b"fake_png_data"),
+            ]
+        )
+
+        # When
+        response = await test_app_client.head("/v1/payment/A048/qr")
+
+        # Then
+        assert response.status_code == 200
+        assert response.headers["content-length"] == str(len(b"fake_png_data"))
+        assert not response.content
+        payment_use_cases_mock["render_qr_code"].execute.assert_awaited_with(
+            command=RenderQRCodeCommand(payment_id="A048")
+        )
+
+    async def test_should_render_svg_with_requested_options_when_preferred(
+        self,
+        test_app_client: AsyncClient,
+        payment_use_cases_mock: dict,
+        mocker: MockerFixture,
+    ):
+        """Given an Accept header preferring SVG and custom image options
+        When requesting the QR code via GET endpoint
+        Then the QR code should be rendered as SVG with those options
+        """
+
+        # Given
+        payment_use_cases_mock["render_qr_code"].execute = mocker.AsyncMock(
+            return_value=QRCodeImage(digest="abc123", content=b"<svg/>")
+        )
+
+        # When
+        response = await test_app_client.get(
+            "/v1/payment/A048/qr?size=4&border=1&error_correction=H",
+            headers={"Accept": "image/png;q=0.5, image/svg+xml"},
+        )
+
+        # Then
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "image/svg+xml"
+        assert response.headers["vary"] == "Accept"
+        payment_use_cases_mock["render_qr_code"].execute.assert_awaited_once_with(
+            command=RenderQRCodeCommand(
+                payment_id="A048",
+                options=QRCodeOptionsDTO(
+                    format="image/svg+xml", box_size=4, border=1, error_correction="H"
+                ),
+            )
+        )
+
+    async def test_should_return_422_when_qr_code_size_exceeds_cap(
+        self,
+        test_app_client: AsyncClient,
+        payment_use_cases_mock: dict,
+        mocker: MockerFixture,
+    ):
+        """Given a QR code size above the allowed maximum
+        When requesting the QR code via GET endpoint
+        Then a 422 response should be returned without rendering
+        """
+
+        # Given
+        payment_use_cases_mock["render_qr_code"].execute = mocker.AsyncMock()
+
+        # When
+        response = await test_app_client.get("/v1/payment/A048/qr?size=1000")
+
+        # Then
+        assert response.status_code == 422
+        payment_use_cases_mock["render_qr_code"].execute.assert_not_called()
+
+    async def test_should_return_503_when_qr_code_renderer_is_unavailable(
+        self,
+        test_app_client: AsyncClient,
+        payment_use_cases_mock: dict,
+        mocker: MockerFixture,
+    ):
+        """Given the QR code renderer is overloaded
+        When requesting the QR code via GET endpoint
+        Then a 503 response asking to retry should be returned
+        """
+
+        # Given
+        payment_use_cases_mock["render_qr_code"].execute = mocker.AsyncMock(
+            side_effect=QRCodeRendererUnavailable("Too many pending QR code renders")
+        )
+
+        # When
+        response = await test_app_client.get("/v1/payment/A048/qr")
+
+        # Then
+        assert response.status_code == 503
+        assert response.headers["retry-after"] == "1"
+
     async def test_should_return_404_when_payment_not_found_for_qr(
         self,
         test_app_client: AsyncClient,
@@ -188,65 +753,192 @@ class TestRenderQRCodeRoute:
             command=expected_command
         )
 
-    async def test_should_return_500_when_persistence_error_occurs_for_qr(
+    async def test_should_return_500_when_persistence_error_occurs_for_qr(
+        self,
+        test_app_client: AsyncClient,
+        payment_use_cases_mock: dict,
+        mocker: MockerFixture,
+    ):
+        """Given a valid payment ID
+        When requesting the QR code via GET endpoint and a persistence error occurs
+        Then a 500 error should be returned
+        """
+
+        # Given
+        payment_id = "A048"
+        payment_use_cases_mock["render_qr_code"].execute = mocker.AsyncMock(
+            side_effect=PersistenceError("Database connection failed")
+        )
+
+        # When
+        response = await test_app_client.get(f"/v1/payment/{payment_id}/qr")
+
+        # Then
+        assert response.status_code == 500
+        assert (
+            response.json()["detail"] == "An error occurred while rendering the QR code"
+        )
+
+        expected_command = RenderQRCodeCommand(payment_id=payment_id)
+        payment_use_cases_mock["render_qr_code"].execute.assert_awaited_once_with(
+            command=expected_command
+        )
+
+    async def test_should_return_400_when_value_error_occurs_for_qr(
+        self,
+        test_app_client: AsyncClient,
+        payment_use_cases_mock: dict,
+        mocker: MockerFixture,
+    ):
+        """Given a valid payment ID
+        When requesting the QR code via GET endpoint and a value error occurs
+        Then a 400 error should be returned
+        """
+
+        # Given
+        payment_id = "A048"
+        error_message = "Payment does not have an associated QR code"
+        payment_use_cases_mock["render_qr_code"].execute = mocker.AsyncMock(
+            side_effect=ValueError(error_message)
+        )
+
+        # When
+        response = await test_app_client.get(f"/v1/payment/{payment_id}/qr")
+
+        # Then
+        assert response.status_code == 400
+        assert response.json()["detail"] == error_message
+        expected_command = RenderQRCodeCommand(payment_id=payment_id)
+        payment_use_cases_mock["render_qr_code"].execute.assert_awaited_once_with(
+            command=expected_command
+        )
+
+
+class TestPaymentEventsRoute:
+    """Test cases for the GET /v1/payment/{payment_id}/events route"""
+
+    @staticmethod
+    def events(response) -> list[PaymentVersion]:
+        """Parse the payment status events of a server-sent events response"""
+        return [
+            PaymentVersion.model_validate_json(line.removeprefix("data: "))
+            for line in response.text.splitlines()
+            if line.startswith("data: ")
+        ]
+
+    async def test_should_stream_current_status_and_stop_when_payment_is_closed(
+        self,
+        test_app_client: AsyncClient,
+        mocker: MockerFixture,
+        make_payment: Callable[..., PaymentOut],
+    ):
+        """Given a closed payment
+        When streaming its events
+        Then only its current status should be sent before the stream ends
+        """
+
+        # Given
+        notifications = PaymentStatusNotifications(dsn="postgresql://test")
+        read_version = mocker.AsyncMock(
+            return_value=PaymentVersion.model_validate(
+                make_payment(payment_status=PaymentStatus.CLOSED)
+            )
+        )
+        app.dependency_overrides[payment_status_notifications] = lambda: notifications
+        app.dependency_overrides[payment_version_reader] = lambda: read_version
+
+        # When
+        response = await test_app_client.get("/v1/payment/A048/events")
+
+        # Then
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert [event.payment_status for event in self.events(response)] == [
+            PaymentStatus.CLOSED
+        ]
+        read_version.assert_awaited_once_with("A048")
+        assert len(notifications) == 0
+
+    async def test_should_stream_status_changes_until_payment_is_closed(
+        self,
+        test_app_client: AsyncClient,
+        mocker: MockerFixture,
+        make_payment: Callable[..., PaymentOut],
+    ):
+        """Given an opened payment that is closed right after being read
+        When streaming its events
+        Then the opened and the closed statuses should be sent
+        """
+
+        # Given
+        notifications = PaymentStatusNotifications(dsn="postgresql://test")
+
+        async def read_version(_payment_id: str) -> PaymentVersion:
+            notifications.publish(
+                PaymentVersion.model_validate(
+                    make_payment(payment_status=PaymentStatus.CLOSED)
+                )
+            )
+            return PaymentVersion.model_validate(
+                make_payment(payment_status=PaymentStatus.OPENED)
+            )
+
+        app.dependency_overrides[payment_status_notifications] = lambda: notifications
+        app.dependency_overrides[payment_version_reader] = lambda: read_version
+
+        # When
+        response = await test_app_client.get("/v1/payment/A048/events")
+
+        # Then
+        assert response.status_code == 200
+        assert [event.payment_status for event in self.events(response)] == [
+            PaymentStatus.OPENED,
+            PaymentStatus.CLOSED,
+        ]
+        assert len(notifications) == 0
+
+    async def test_should_return_404_when_payment_does_not_exist(
         self,
         test_app_client: AsyncClient,
-        payment_use_cases_mock: dict,
         mocker: MockerFixture,
     ):
-        """Given a valid payment ID
-        When requesting the QR code via GET endpoint and a persistence error occurs
-        Then a 500 error should be returned
+        """Given a payment ID that does not exist
+        When streaming its events
+        Then a 404 response should be returned and the subscription dropped
         """
 
         # Given
-        payment_id = "A048"
-        payment_use_cases_mock["render_qr_code"].execute = mocker.AsyncMock(
-            side_effect=PersistenceError("Database connection failed")
-        )
+        notifications = PaymentStatusNotifications(dsn="postgresql://test")
+        read_version = mocker.AsyncMock(side_effect=NotFound("Payment not found"))
+        app.dependency_overrides[payment_status_notifications] = lambda: notifications
+        app.dependency_overrides[payment_version_reader] = lambda: read_version
 
         # When
-        response = await test_app_client.get(f"/v1/payment/{payment_id}/qr")
+        response = await test_app_client.get("/v1/payment/A048/events")
 
         # Then
-        assert response.status_code == 500
-        assert (
-            response.json()["detail"] == "An error occurred while rendering the QR code"
-        )
-
-        expected_command = RenderQRCodeCommand(payment_id=payment_id)
-        payment_use_cases_mock["render_qr_code"].execute.assert_awaited_once_with(
-            command=expected_command
-        )
+        assert response.status_code == 404
+        assert len(notifications) == 0
 
-    async def test_should_return_400_when_value_error_occurs_for_qr(
+    async def test_should_return_404_when_payment_events_are_disabled(
         self,
         test_app_client: AsyncClient,
-        payment_use_cases_mock: dict,
         mocker: MockerFixture,
     ):
-        """Given a valid payment ID
-        When requesting the QR code via GET endpoint and a value error occurs
-        Then a 400 error should be returned
+        """Given payment events are disabled
+        When streaming the events of a payment
+        Then a 404 response should be returned
         """
 
         # Given
-        payment_id = "A048"
-        error_message = "Payment does not have an associated QR code"
-        payment_use_cases_mock["render_qr_code"].execute = mocker.AsyncMock(
-            side_effect=ValueError(error_message)
-        )
+        app.dependency_overrides[payment_status_notifications] = lambda: None
+        app.dependency_overrides[payment_version_reader] = lambda: mocker.AsyncMock()
 
         # When
-        response = await test_app_client.get(f"/v1/payment/{payment_id}/qr")
+        response = await test_app_client.get("/v1/payment/A048/events")
 
         # Then
-        assert response.status_code == 400
-        assert response.json()["detail"] == error_message
-        expected_command = RenderQRCodeCommand(payment_id=payment_id)
-        payment_use_cases_mock["render_qr_code"].execute.assert_awaited_once_with(
-            command=expected_command
-        )
+        assert response.status_code == 404
 
 
 class TestMercadoPagoWebhookRoute:
@@ -386,6 +1078,42 @@ class TestMercadoPagoWebhookRoute:
             "finalize_by_mercado_pago_payment_id"
         ].execute.assert_not_called()
 
+    async def test_should_not_build_dependencies_for_discarded_webhook(
+        self,
+        test_app_client: AsyncClient,
+        mocker: MockerFixture,
+    ):
+        """Given a MercadoPago webhook that is discarded by its action
+        When posting to the webhook endpoint
+        Then neither the use case nor the deduplicator should be built
+        """
+
+        # Given
+        webhook_payload = {
+            "action": "payment.updated",
+            "type": "payment",
+            "data": {"id": "MP123456"},
+        }
+
+        build_use_case = mocker.AsyncMock()
+        build_deduplicator = mocker.AsyncMock()
+        app.dependency_overrides[
+            finalize_payment_by_mercado_pago_payment_id_use_case
+        ] = lambda: LazyDependency(build_use_case)
+        app.dependency_overrides[mercado_pago_notification_deduplicator] = lambda: (
+            LazyDependency(build_deduplicator)
+        )
+
+        # When
+        response = await test_app_client.post(
+            "/v1/payment/notifications/mercado-pago", json=webhook_payload
+        )
+
+        # Then
+        assert response.status_code == 204
+        build_use_case.assert_not_awaited()
+        build_deduplicator.assert_not_awaited()
+
     async def test_should_return_404_when_payment_not_found_in_webhook(
         self,
         test_app_client: AsyncClient,
@@ -503,15 +1231,15 @@ class TestMercadoPagoWebhookRoute:
             "finalize_by_mercado_pago_payment_id"
         ].execute.assert_awaited_once_with(command=expected_command)
 
-    async def test_should_return_204_when_event_publishing_error_occurs_in_webhook(
+    async def test_should_return_400_when_value_error_occurs_in_webhook(
         self,
         test_app_client: AsyncClient,
         payment_use_cases_mock: dict,
         mocker: MockerFixture,
     ):
         """Given a valid MercadoPago webhook payload
-        When posting to the webhook endpoint and an event publishing error occurs
-        Then a 204 response should be returned to avoid retries
+        When posting to the webhook endpoint and a value error occurs
+        Then a 400 error should be returned
         """
 
         # Given
@@ -520,10 +1248,10 @@ class TestMercadoPagoWebhookRoute:
             "type": "payment",
             "data": {"id": "MP123456"},
         }
+
+        error_message = "Payment with external ID MP123456 already exists"
         payment_use_cases_mock["finalize_by_mercado_pago_payment_id"].execute = (
-            mocker.AsyncMock(
-                side_effect=EventPublishingError("Failed to publish event")
-            )
+            mocker.AsyncMock(side_effect=ValueError(error_message))
         )
 
         # When
@@ -532,7 +1260,7 @@ class TestMercadoPagoWebhookRoute:
         )
 
         # Then
-        assert response.status_code == 204
+        assert response.status_code == 400
         expected_command = FinalizePaymentByMercadoPagoPaymentIdCommand(
             payment_id="MP123456"
         )
@@ -541,15 +1269,55 @@ class TestMercadoPagoWebhookRoute:
             "finalize_by_mercado_pago_payment_id"
         ].execute.assert_awaited_once_with(command=expected_command)
 
-    async def test_should_return_400_when_value_error_occurs_in_webhook(
+
+class TestMercadoPagoWebhookRouteDeduplication:
+    """Test cases for duplicated notifications in the POST
+    /v1/payment/notifications/mercado-pago route"""
+
+    async def test_should_answer_duplicated_webhook_without_finalizing_payment(
+        self,
+        test_app_client: AsyncClient,
+        payment_use_cases_mock: dict,
+        notification_deduplicator_mock,
+    ):
+        """Given a MercadoPago webhook that was already handled
+        When posting it again to the webhook endpoint
+        Then 200 should be returned without finalizing the payment
+        """
+
+        # Given
+        webhook_payload = {
+            "action": "payment.created",
+            "type": "payment",
+            "data": {"id": "MP123456"},
+        }
+
+        notification_deduplicator_mock.is_duplicate.return_value = True
+
+        # When
+        response = await test_app_client.post(
+            "/v1/payment/notifications/mercado-pago", json=webhook_payload
+        )
+
+        # Then
+        assert response.status_code == 200
+        notification_deduplicator_mock.is_duplicate.assert_awaited_once_with(
+            resource_id="MP123456"
+        )
+        payment_use_cases_mock[
+            "finalize_by_mercado_pago_payment_id"
+        ].execute.assert_not_called()
+
+    async def test_should_mark_webhook_as_processed_after_finalizing_payment(
         self,
         test_app_client: AsyncClient,
         payment_use_cases_mock: dict,
+        notification_deduplicator_mock,
         mocker: MockerFixture,
     ):
-        """Given a valid MercadoPago webhook payload
-        When posting to the webhook endpoint and a value error occurs
-        Then a 400 error should be returned
+        """Given a MercadoPago webhook not handled yet
+        When posting it to the webhook endpoint and processing succeeds
+        Then the webhook should be recorded as processed
         """
 
         # Given
@@ -559,9 +1327,19 @@ class TestMercadoPagoWebhookRoute:
             "data": {"id": "MP123456"},
         }
 
-        error_message = "Payment with external ID MP123456 already exists"
         payment_use_cases_mock["finalize_by_mercado_pago_payment_id"].execute = (
-            mocker.AsyncMock(side_effect=ValueError(error_message))
+            mocker.AsyncMock(
+                return_value=PaymentOut(
+                    id="A048",
+                    external_id="MP123456",
+                    payment_status=PaymentStatus.CLOSED,
+                    total_order_value=100.0,
+                    qr_code="sample-qr-code",
+                    expiration="2024-12-31T23:59:59",
+                    created_at="2024-01-01T12:00:00Z",
+                    timestamp="2024-01-02T12:00:00Z",
+                )
+            )
         )
 
         # When
@@ -570,11 +1348,191 @@ class TestMercadoPagoWebhookRoute:
         )
 
         # Then
-        assert response.status_code == 400
-        expected_command = FinalizePaymentByMercadoPagoPaymentIdCommand(
-            payment_id="MP123456"
+        assert response.status_code == 200
+        notification_deduplicator_mock.mark_processed.assert_awaited_once_with(
+            resource_id="MP123456"
+        )
+
+    async def test_should_not_mark_webhook_as_processed_when_processing_fails(
+        self,
+        test_app_client: AsyncClient,
+        payment_use_cases_mock: dict,
+        notification_deduplicator_mock,
+        mocker: MockerFixture,
+    ):
+        """Given a MercadoPago webhook not handled yet
+        When posting it to the webhook endpoint and Mercado Pago fails
+        Then the webhook should not be recorded as processed so it can be retried
+        """
+
+        # Given
+        webhook_payload = {
+            "action": "payment.created",
+            "type": "payment",
+            "data": {"id": "MP123456"},
+        }
+
+        payment_use_cases_mock["finalize_by_mercado_pago_payment_id"].execute = (
+            mocker.AsyncMock(side_effect=MPClientError("Mercado Pago unavailable"))
+        )
+
+        # When
+        response = await test_app_client.post(
+            "/v1/payment/notifications/mercado-pago", json=webhook_payload
+        )
+
+        # Then
+        assert response.status_code == 502
+        notification_deduplicator_mock.mark_processed.assert_not_called()
+
+    async def test_should_return_500_when_duplicate_check_fails(
+        self,
+        test_app_client: AsyncClient,
+        payment_use_cases_mock: dict,
+        notification_deduplicator_mock,
+    ):
+        """Given a valid MercadoPago webhook payload
+        When posting it to the webhook endpoint and the duplicate check fails
+        Then a 500 error should be returned without finalizing the payment
+        """
+
+        # Given
+        webhook_payload = {
+            "action": "payment.created",
+            "type": "payment",
+            "data": {"id": "MP123456"},
+        }
+
+        notification_deduplicator_mock.is_duplicate.side_effect = PersistenceError(
+            "Database connection failed"
         )
 
+        # When
+        response = await test_app_client.post(
+            "/v1/payment/notifications/mercado-pago", json=webhook_payload
+        )
+
+        # Then
+        assert response.status_code == 500
         payment_use_cases_mock[
             "finalize_by_mercado_pago_payment_id"
-        ].execute.assert_awaited_once_with(command=expected_command)
+        ].execute.assert_not_called()
+
+
+class TestMercadoPagoWebhookRouteWithInbox:
+    """Test cases for the POST /v1/payment/notifications/mercado-pago route when
+    the notification inbox is enabled"""
+
+    async def test_should_store_webhook_in_inbox_without_finalizing_payment(
+        self,
+        test_app_client: AsyncClient,
+        payment_use_cases_mock: dict,
+        notification_deduplicator_mock,
+        mocker: MockerFixture,
+    ):
+        """Given a valid MercadoPago webhook payload and the inbox enabled
+        When posting to the webhook endpoint
+        Then the notification should be stored in the inbox and 200 returned without
+        finalizing the payment
+        """
+
+        # Given
+        webhook_payload = {
+            "action": "payment.created",
+            "type": "payment",
+            "data": {"id": "MP123456"},
+        }
+
+        inbox_mock = mocker.Mock()
+        inbox_mock.enqueue = mocker.AsyncMock(return_value=True)
+        app.dependency_overrides[mercado_pago_notification_inbox] = lambda: (
+            LazyDependency(mocker.AsyncMock(return_value=inbox_mock))
+        )
+
+        # When
+        response = await test_app_client.post(
+            "/v1/payment/notifications/mercado-pago", json=webhook_payload
+        )
+
+        # Then
+        assert response.status_code == 200
+        inbox_mock.enqueue.assert_awaited_once_with(resource_id="MP123456")
+        notification_deduplicator_mock.remember.assert_called_once_with(
+            resource_id="MP123456"
+        )
+        payment_use_cases_mock[
+            "finalize_by_mercado_pago_payment_id"
+        ].execute.assert_not_called()
+
+    async def test_should_return_200_when_webhook_is_already_in_inbox(
+        self,
+        test_app_client: AsyncClient,
+        payment_use_cases_mock: dict,
+        mocker: MockerFixture,
+    ):
+        """Given a MercadoPago webhook already stored in the inbox
+        When posting the same webhook to the webhook endpoint
+        Then 200 should be returned without finalizing the payment
+        """
+
+        # Given
+        webhook_payload = {
+            "action": "payment.created",
+            "type": "payment",
+            "data": {"id": "MP123456"},
+        }
+
+        inbox_mock = mocker.Mock()
+        inbox_mock.enqueue = mocker.AsyncMock(return_value=False)
+        app.dependency_overrides[mercado_pago_notification_inbox] = lambda: (
+            LazyDependency(mocker.AsyncMock(return_value=inbox_mock))
+        )
+
+        # When
+        response = await test_app_client.post(
+            "/v1/payment/notifications/mercado-pago", json=webhook_payload
+        )
+
+        # Then
+        assert response.status_code == 200
+        inbox_mock.enqueue.assert_awaited_once_with(resource_id="MP123456")
+        payment_use_cases_mock[
+            "finalize_by_mercado_pago_payment_id"
+        ].execute.assert_not_called()
+
+    async def test_should_return_500_when_inbox_fails_to_store_webhook(
+        self,
+        test_app_client: AsyncClient,
+        mocker: MockerFixture,
+    ):
+        """Given a valid MercadoPago webhook payload and the inbox enabled
+        When posting to the webhook endpoint and the inbox fails to store it
+        Then a 500 error should be returned so Mercado Pago retries it
+        """
+
+        # Given
+        webhook_payload = {
+            "action": "payment.created",
+            "type": "payment",
+            "data": {"id": "MP123456"},
+        }
+
+        inbox_mock = mocker.Mock()
+        inbox_mock.enqueue = mocker.AsyncMock(
+            side_effect=PersistenceError("Database connection failed")
+        )
+        app.dependency_overrides[mercado_pago_notification_inbox] = lambda: (
+            LazyDependency(mocker.AsyncMock(return_value=inbox_mock))
+        )
+
+        # When
+        response = await test_app_client.post(
+            "/v1/payment/notifications/mercado-pago", json=webhook_payload
+        )
+
+        # Then
+        assert response.status_code == 500
+        assert (
+            response.json()["detail"]
+            == "An error occurred while processing the webhook"
+        )
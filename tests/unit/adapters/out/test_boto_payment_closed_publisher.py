@@ -4,6 +4,7 @@
 
 import pytest
 from botocore.exceptions import ClientError as BotoCoreClientError
+from botocore.exceptions import EndpointConnectionError
 from pytest_mock import MockerFixture
 
 from payment_api.adapters.out.boto_payment_closed_publisher import (
@@ -11,6 +12,7 @@ from payment_api.adapters.out.boto_payment_closed_publisher import (
 )
 from payment_api.domain.events import PaymentClosedEvent
 from payment_api.domain.exceptions import EventPublishingError
+from payment_api.domain.ports import PublishResult
 
 
 @pytest.fixture
@@ -19,20 +21,24 @@ def publisher_settings(mocker: MockerFixture):
     mock_settings = mocker.Mock()
     mock_settings.TOPIC_ARN = "arn:aws:sns:us-east-1:123456789012:payment-closed-topic"
     mock_settings.GROUP_ID = "payment-closed-group"
+    mock_settings.GROUP_STRATEGY = "constant"
+    mock_settings.GROUP_BUCKETS = 4
+    mock_settings.DEDUPLICATION_STRATEGY = "event_id"
+    mock_settings.BATCH_SIZE = 2
     return mock_settings
 
 
 @pytest.fixture
-def aio_boto3_session(mocker: MockerFixture):
-    """Fixture to create a mock AIOBoto3Session"""
+def sns_client(mocker: MockerFixture):
+    """Fixture to create a mock long-lived SNS client"""
     return mocker.Mock()
 
 
 @pytest.fixture
-def publisher(aio_boto3_session, publisher_settings) -> BotoPaymentClosedPublisher:
+def publisher(sns_client, publisher_settings) -> BotoPaymentClosedPublisher:
     """Fixture to create BotoPaymentClosedPublisher with mocked dependencies"""
     return BotoPaymentClosedPublisher(
-        aio_boto3_session=aio_boto3_session, settings=publisher_settings
+        sns_client=sns_client, settings=publisher_settings
     )
 
 
@@ -45,7 +51,7 @@ def payment_closed_event() -> PaymentClosedEvent:
 async def test_should_publish_event_when_sns_responds_successfully(
     mocker: MockerFixture,
     publisher: BotoPaymentClosedPublisher,
-    aio_boto3_session,
+    sns_client,
     payment_closed_event: PaymentClosedEvent,
 ):
     """Given a valid payment closed event
@@ -55,38 +61,16 @@ async def test_should_publish_event_when_sns_responds_successfully(
 
     # Given
     expected_message_id = "12345678-1234-1234-1234-123456789012"
-    mock_sns_resource = mocker.AsyncMock()
-    mock_topic = mocker.AsyncMock()
-    mock_topic.arn = "arn:aws:sns:us-east-1:123456789012:payment-closed-topic"
-    mock_topic.publish = mocker.AsyncMock(
+    sns_client.publish = mocker.AsyncMock(
         return_value={"MessageId": expected_message_id}
     )
 
-    # Configure the async context manager for SNS resource
-    aio_boto3_session.resource.return_value.__aenter__ = mocker.AsyncMock(
-        return_value=mock_sns_resource
-    )
-    aio_boto3_session.resource.return_value.__aexit__ = mocker.AsyncMock(
-        return_value=None
-    )
-
-    # Configure SNS resource to return the topic
-    mock_sns_resource.Topic.return_value = mock_topic
-
     # When
     await publisher.publish(event=payment_closed_event)
 
     # Then
-    # Verify SNS resource was created correctly
-    aio_boto3_session.resource.assert_called_once_with("sns")
-
-    # Verify Topic was created with correct ARN
-    mock_sns_resource.Topic.assert_called_once_with(
-        "arn:aws:sns:us-east-1:123456789012:payment-closed-topic"
-    )
-
-    # Verify publish was called with correct parameters
-    mock_topic.publish.assert_awaited_once_with(
+    sns_client.publish.assert_awaited_once_with(
+        TopicArn="arn:aws:sns:us-east-1:123456789012:payment-closed-topic",
         Subject="payment-closed",
         Message=payment_closed_event.model_dump_json(),
         MessageGroupId="payment-closed-group",
@@ -97,7 +81,7 @@ async def test_should_publish_event_when_sns_responds_successfully(
 async def test_should_raise_event_publishing_error_when_sns_fails(
     mocker: MockerFixture,
     publisher: BotoPaymentClosedPublisher,
-    aio_boto3_session,
+    sns_client,
     payment_closed_event: PaymentClosedEvent,
 ):
     """Given a valid payment closed event
@@ -107,9 +91,7 @@ async def test_should_raise_event_publishing_error_when_sns_fails(
 
     # Given
     error_message = "Access denied to SNS topic"
-    mock_sns_resource = mocker.AsyncMock()
-    mock_topic = mocker.AsyncMock()
-    mock_topic.publish = mocker.AsyncMock(
+    sns_client.publish = mocker.AsyncMock(
         side_effect=BotoCoreClientError(
             error_response={
                 "Error": {"Code": "AccessDenied", "Message": error_message}
@@ -118,17 +100,6 @@ async def test_should_raise_event_publishing_error_when_sns_fails(
         )
     )
 
-    # Configure the async context manager for SNS resource
-    aio_boto3_session.resource.return_value.__aenter__ = mocker.AsyncMock(
-        return_value=mock_sns_resource
-    )
-    aio_boto3_session.resource.return_value.__aexit__ = mocker.AsyncMock(
-        return_value=None
-    )
-
-    # Configure SNS resource to return the topic
-    mock_sns_resource.Topic.return_value = mock_topic
-
     # When / Then
     with pytest.raises(EventPublishingError) as exc_info:
         await publisher.publish(event=payment_closed_event)
@@ -136,9 +107,238 @@ async def test_should_raise_event_publishing_error_when_sns_fails(
     assert str(exc_info.value) == "Error publishing message to SNS topic"
 
     # Verify the publish method was called before failing
-    mock_topic.publish.assert_awaited_once_with(
+    sns_client.publish.assert_awaited_once_with(
+        TopicArn="arn:aws:sns:us-east-1:123456789012:payment-closed-topic",
         Subject="payment-closed",
         Message=payment_closed_event.model_dump_json(),
         MessageGroupId="payment-closed-group",
         MessageDeduplicationId=str(payment_closed_event.id),
     )
+
+
+async def test_should_publish_events_in_batches_and_report_failures_per_entry(
+    mocker: MockerFixture,
+    publisher: BotoPaymentClosedPublisher,
+    sns_client,
+):
+    """Given more payment closed events than the batch size
+    When publishing them and SNS rejects one entry
+    Then the events should be sent in PublishBatch calls and only the rejected
+    entry reported as failed
+    """
+
+    # Given
+    events = [PaymentClosedEvent(payment_id=f"A00{index}") for index in range(3)]
+    sns_client.publish_batch = mocker.AsyncMock(
+        side_effect=[
+            {
+                "Successful": [{"Id": str(events[0].id), "MessageId": "1"}],
+                "Failed": [
+                    {
+                        "Id": str(events[1].id),
+                        "Code": "InternalError",
+                        "Message": "Try again",
+                        "SenderFault": False,
+                    }
+                ],
+            },
+            {"Successful": [{"Id": str(events[2].id), "MessageId": "3"}]},
+        ]
+    )
+
+    # When
+    results = await publisher.publish_many(events)
+
+    # Then
+    assert results == [
+        PublishResult(event_id=events[0].id),
+        PublishResult(event_id=events[1].id, error="InternalError: Try again"),
+        PublishResult(event_id=events[2].id),
+    ]
+
+    calls = sns_client.publish_batch.await_args_list
+    assert [len(call.kwargs["PublishBatchRequestEntries"]) for call in calls] == [2, 1]
+    assert calls[0].kwargs["TopicArn"] == (
+        "arn:aws:sns:us-east-1:123456789012:payment-closed-topic"
+    )
+    assert calls[0].kwargs["PublishBatchRequestEntries"][0] == {
+        "Id": str(events[0].id),
+        "Subject": "payment-closed",
+        "Message": events[0].model_dump_json(),
+        "MessageGroupId": "payment-closed-group",
+        "MessageDeduplicationId": str(events[0].id),
+    }
+
+
+async def test_should_report_every_entry_as_failed_when_batch_call_fails(
+    mocker: MockerFixture,
+    publisher: BotoPaymentClosedPublisher,
+    sns_client,
+):
+    """Given payment closed events
+    When the PublishBatch call raises a BotoCoreClientError
+    Then every event of the batch should be reported as failed
+    """
+
+    # Given
+    events = [
+        PaymentClosedEvent(payment_id="A001"),
+        PaymentClosedEvent(payment_id="A002"),
+    ]
+    sns_client.publish_batch = mocker.AsyncMock(
+        side_effect=BotoCoreClientError(
+            error_response={"Error": {"Code": "Throttling", "Message": "Slow down"}},
+            operation_name="PublishBatch",
+        )
+    )
+
+    # When
+    results = await publisher.publish_many(events)
+
+    # Then
+    assert [result.event_id for result in results] == [event.id for event in events]
+    assert not any(result.succeeded for result in results)
+
+
+async def test_should_report_every_entry_as_failed_when_sns_is_unreachable(
+    mocker: MockerFixture,
+    publisher: BotoPaymentClosedPublisher,
+    sns_client,
+):
+    """Given payment closed events
+    When the PublishBatch call cannot connect to SNS
+    Then every event of the batch should be reported as failed
+    """
+
+    # Given
+    events = [PaymentClosedEvent(payment_id="A001")]
+    sns_client.publish_batch = mocker.AsyncMock(
+        side_effect=EndpointConnectionError(endpoint_url="https://sns.invalid")
+    )
+
+    # When
+    results = await publisher.publish_many(events)
+
+    # Then
+    assert [result.event_id for result in results] == [event.id for event in events]
+    assert not any(result.succeeded for result in results)
+
+
+async def test_should_raise_event_publishing_error_when_sns_is_unreachable(
+    mocker: MockerFixture,
+    publisher: BotoPaymentClosedPublisher,
+    sns_client,
+    payment_closed_event: PaymentClosedEvent,
+):
+    """Given a payment closed event
+    When the Publish call cannot connect to SNS
+    Then an EventPublishingError should be raised
+    """
+
+    # Given
+    sns_client.publish = mocker.AsyncMock(
+        side_effect=EndpointConnectionError(endpoint_url="https://sns.invalid")
+    )
+
+    # When / Then
+    with pytest.raises(EventPublishingError):
+        await publisher.publish(payment_closed_event)
+
+
+async def test_should_use_one_message_group_per_payment(
+    mocker: MockerFixture,
+    sns_client,
+    publisher_settings,
+):
+    """Given the payment_id message group strategy
+    When publishing events of different payments
+    Then each payment should get its own message group
+    """
+
+    # Given
+    publisher_settings.GROUP_STRATEGY = "payment_id"
+    sns_client.publish = mocker.AsyncMock(return_value={"MessageId": "1"})
+    publisher = BotoPaymentClosedPublisher(
+        sns_client=sns_client, settings=publisher_settings
+    )
+
+    # When
+    await publisher.publish(PaymentClosedEvent(payment_id="A001"))
+    await publisher.publish(PaymentClosedEvent(payment_id="A002"))
+
+    # Then
+    group_ids = [
+        call.kwargs["MessageGroupId"] for call in sns_client.publish.await_args_list
+    ]
+    assert group_ids == ["payment-closed-group-A001", "payment-closed-group-A002"]
+
+
+async def test_should_hash_payments_into_a_stable_message_group_bucket(
+    mocker: MockerFixture,
+    sns_client,
+    publisher_settings,
+):
+    """Given the hashed message group strategy
+    When publishing several events of many payments
+    Then the events of a payment should always share one of the bucket groups
+    """
+
+    # Given
+    publisher_settings.GROUP_STRATEGY = "hashed"
+    sns_client.publish = mocker.AsyncMock(return_value={"MessageId": "1"})
+    publisher = BotoPaymentClosedPublisher(
+        sns_client=sns_client, settings=publisher_settings
+    )
+
+    payment_ids = [f"A{index:03d}" for index in range(20)]
+
+    # When
+    for payment_id in payment_ids * 2:
+        await publisher.publish(PaymentClosedEvent(payment_id=payment_id))
+
+    # Then
+    group_ids = [
+        call.kwargs["MessageGroupId"] for call in sns_client.publish.await_args_list
+    ]
+    assert group_ids[:20] == group_ids[20:]
+    assert set(group_ids) <= {f"payment-closed-group-{bucket}" for bucket in range(4)}
+    assert len(set(group_ids)) > 1
+
+
+async def test_should_deduplicate_by_payment_id_when_configured(
+    mocker: MockerFixture,
+    sns_client,
+    publisher_settings,
+    payment_closed_event: PaymentClosedEvent,
+):
+    """Given the payment_id deduplication strategy
+    When publishing an event
+    Then the payment ID should be used as the deduplication ID
+    """
+
+    # Given
+    publisher_settings.DEDUPLICATION_STRATEGY = "payment_id"
+    sns_client.publish = mocker.AsyncMock(return_value={"MessageId": "1"})
+    publisher = BotoPaymentClosedPublisher(
+        sns_client=sns_client, settings=publisher_settings
+    )
+
+    # When
+    await publisher.publish(payment_closed_event)
+
+    # Then
+    assert sns_client.publish.await_args.kwargs["MessageDeduplicationId"] == "A048"
+
+
+def test_should_reject_invalid_number_of_group_buckets(sns_client, publisher_settings):
+    """Given settings with no message group buckets
+    When creating the publisher
+    Then a ValueError should be raised
+    """
+
+    # Given
+    publisher_settings.GROUP_BUCKETS = 0
+
+    # When / Then
+    with pytest.raises(ValueError):
+        BotoPaymentClosedPublisher(sns_client=sns_client, settings=publisher_settings)
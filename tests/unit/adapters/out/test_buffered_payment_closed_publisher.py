@@ -0,0 +1,125 @@
+# pylint: disable=W0621
+
+"""Unit tests for BufferedPaymentClosedPublisher"""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from payment_api.adapters.out.buffered_payment_closed_publisher import (
+    BufferedPaymentClosedPublisher,
+)
+from payment_api.domain.events import PaymentClosedEvent
+from payment_api.domain.exceptions import EventPublishingError
+from payment_api.domain.ports import PaymentClosedPublisher, PublishResult
+
+
+@pytest.fixture
+def inner_publisher(mocker: MockerFixture) -> MagicMock:
+    """Mock PaymentClosedPublisher that publishes every event successfully"""
+    publisher = mocker.Mock(spec=PaymentClosedPublisher)
+    publisher.publish_many.side_effect = lambda events: [
+        PublishResult(event_id=event.id) for event in events
+    ]
+    return publisher
+
+
+async def test_should_group_concurrent_events_into_one_batch(
+    inner_publisher: MagicMock,
+):
+    """Given a buffered publisher
+    When several events are published concurrently
+    Then they should be sent in a single publish_many call
+    """
+
+    # Given
+    publisher = BufferedPaymentClosedPublisher(
+        publisher=inner_publisher, max_batch_size=10, flush_interval=0.01
+    )
+    events = [PaymentClosedEvent(payment_id=f"A00{index}") for index in range(3)]
+
+    # When
+    await asyncio.gather(*(publisher.publish(event) for event in events))
+
+    # Then
+    inner_publisher.publish_many.assert_awaited_once_with(events)
+
+
+async def test_should_flush_when_buffer_is_full(inner_publisher: MagicMock):
+    """Given a buffered publisher with a long flush interval
+    When more events than the batch size are published
+    Then full batches should be flushed without waiting for the timer
+    """
+
+    # Given
+    publisher = BufferedPaymentClosedPublisher(
+        publisher=inner_publisher, max_batch_size=2, flush_interval=60.0
+    )
+    events = [PaymentClosedEvent(payment_id=f"A00{index}") for index in range(4)]
+
+    # When
+    results = await asyncio.wait_for(publisher.publish_many(events), timeout=1.0)
+
+    # Then
+    assert all(result.succeeded for result in results)
+    assert [call.args[0] for call in inner_publisher.publish_many.await_args_list] == [
+        events[:2],
+        events[2:],
+    ]
+
+
+async def test_should_raise_only_for_the_failed_event(inner_publisher: MagicMock):
+    """Given a buffered publisher
+    When one event of a batch fails to be published
+    Then only the caller of the failed event should receive an error
+    """
+
+    # Given
+    failed_event = PaymentClosedEvent(payment_id="A001")
+    sent_event = PaymentClosedEvent(payment_id="A002")
+    inner_publisher.publish_many.side_effect = lambda events: [
+        PublishResult(
+            event_id=event.id, error="Throttling" if event == failed_event else None
+        )
+        for event in events
+    ]
+
+    publisher = BufferedPaymentClosedPublisher(
+        publisher=inner_publisher, max_batch_size=10, flush_interval=0.01
+    )
+
+    # When
+    results = await asyncio.gather(
+        publisher.publish(failed_event),
+        publisher.publish(sent_event),
+        return_exceptions=True,
+    )
+
+    # Then
+    assert isinstance(results[0], EventPublishingError)
+    assert results[1] is None
+
+
+async def test_should_flush_buffered_events_on_close(inner_publisher: MagicMock):
+    """Given a buffered publisher with a pending event
+    When the publisher is closed
+    Then the pending event should be flushed and the wrapped publisher closed
+    """
+
+    # Given
+    publisher = BufferedPaymentClosedPublisher(
+        publisher=inner_publisher, max_batch_size=10, flush_interval=60.0
+    )
+    event = PaymentClosedEvent(payment_id="A001")
+    pending = asyncio.create_task(publisher.publish(event))
+    await asyncio.sleep(0)
+
+    # When
+    await publisher.close()
+
+    # Then
+    await asyncio.wait_for(pending, timeout=1.0)
+    inner_publisher.publish_many.assert_awaited_once_with([event])
+    inner_publisher.close.assert_awaited_once()
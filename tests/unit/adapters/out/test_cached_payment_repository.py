@@ -0,0 +1,172 @@
+# pylint: disable=W0621
+
+"""Unit tests for CachedPaymentRepository"""
+
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from payment_api.adapters.out import CachedPaymentRepository
+from payment_api.domain.entities import PaymentOut
+from payment_api.domain.exceptions import NotFound
+from payment_api.domain.ports import PaymentRepository, SaveMode
+from payment_api.domain.value_objects import PaymentStatus
+from payment_api.infrastructure.payment_cache import PaymentCache
+
+
+@pytest.fixture
+def payment() -> PaymentOut:
+    """Sample closed payment"""
+    return PaymentOut(
+        id="A001",
+        external_id="MP123456",
+        payment_status=PaymentStatus.CLOSED,
+        total_order_value=100.0,
+        qr_code="sample-qr-code",
+        expiration="2024-12-31T23:59:59",
+        created_at="2024-01-01T12:00:00Z",
+        timestamp="2024-01-02T12:00:00Z",
+    )
+
+
+@pytest.fixture
+def mock_repository(mocker: MockerFixture) -> MagicMock:
+    """Mock PaymentRepository for testing"""
+    return mocker.Mock(spec=PaymentRepository)
+
+
+@pytest.fixture
+def cache(mocker: MockerFixture) -> PaymentCache:
+    """PaymentCache instance for testing"""
+    return PaymentCache(loader=mocker.AsyncMock(), terminal_ttl=60.0)
+
+
+@pytest.fixture
+def repository(
+    mock_repository: MagicMock, cache: PaymentCache
+) -> CachedPaymentRepository:
+    """CachedPaymentRepository instance for testing"""
+    return CachedPaymentRepository(repository=mock_repository, cache=cache)
+
+
+async def test_should_read_through_and_serve_next_lookup_from_cache(
+    repository: CachedPaymentRepository,
+    mock_repository: MagicMock,
+    payment: PaymentOut,
+):
+    """Given a payment that is not cached
+    When it is looked up twice
+    Then only the first lookup should reach the wrapped repository
+    """
+
+    # Given
+    mock_repository.find_by_id.return_value = payment
+
+    # When
+    first = await repository.find_by_id("A001")
+    second = await repository.find_by_id("A001")
+
+    # Then
+    assert first == second == payment
+    mock_repository.find_by_id.assert_awaited_once_with("A001")
+
+
+async def test_should_cache_not_found_lookups(
+    repository: CachedPaymentRepository,
+    mock_repository: MagicMock,
+):
+    """Given a payment that does not exist
+    When it is looked up twice
+    Then both lookups should raise NotFound and only the first reach the repository
+    """
+
+    # Given
+    mock_repository.find_by_id.side_effect = NotFound("No payment found")
+
+    # When / Then
+    with pytest.raises(NotFound):
+        await repository.find_by_id("A001")
+
+    with pytest.raises(NotFound):
+        await repository.find_by_id("A001")
+
+    mock_repository.find_by_id.assert_awaited_once_with("A001")
+
+
+async def test_should_invalidate_cached_payment_on_save(
+    repository: CachedPaymentRepository,
+    mock_repository: MagicMock,
+    cache: PaymentCache,
+    payment: PaymentOut,
+):
+    """Given a cached payment
+    When the payment is saved
+    Then it should be dropped from the cache
+    """
+
+    # Given
+    cache.put(payment)
+    mock_repository.save.return_value = payment
+
+    # When
+    await repository.save(payment)
+
+    # Then
+    mock_repository.save.assert_awaited_once_with(payment, SaveMode.UPSERT)
+    assert cache.get("A001") is None
+
+
+async def test_should_look_up_only_uncached_payments_in_batch(
+    repository: CachedPaymentRepository,
+    mock_repository: MagicMock,
+    cache: PaymentCache,
+    payment: PaymentOut,
+):
+    """Given a cached payment and two uncached IDs, one of them missing
+    When the three payments are looked up in a batch
+    Then only the uncached IDs should reach the repository and the missing one
+    should be cached as not found
+    """
+
+    # Given
+    cache.put(payment)
+    other_payment = payment.model_copy(update={"id": "A002"})
+    mock_repository.find_many_by_ids.return_value = [other_payment]
+
+    # When
+    payments = await repository.find_many_by_ids(["A001", "A002", "A003"])
+
+    # Then
+    assert payments == [payment, other_payment]
+    mock_repository.find_many_by_ids.assert_awaited_once_with(["A002", "A003"])
+    assert cache.get("A002").payment == other_payment
+    assert cache.get("A003").payment is None
+
+
+async def test_should_invalidate_cached_payment_when_finalization_fails(
+    repository: CachedPaymentRepository,
+    mock_repository: MagicMock,
+    cache: PaymentCache,
+    payment: PaymentOut,
+):
+    """Given a cached payment
+    When finalizing the payment fails
+    Then it should be dropped from the cache anyway
+    """
+
+    # Given
+    cache.put(payment)
+    mock_repository.finalize_if_open.side_effect = ValueError(
+        "Unable to update a payment status from closed to closed"
+    )
+
+    # When
+    with pytest.raises(ValueError):
+        await repository.finalize_if_open("A001", "MP123456", PaymentStatus.CLOSED)
+
+    # Then
+    mock_repository.finalize_if_open.assert_awaited_once_with(
+        "A001", "MP123456", PaymentStatus.CLOSED
+    )
+    assert cache.get("A001") is None
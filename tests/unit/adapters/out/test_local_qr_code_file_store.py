@@ -0,0 +1,138 @@
+# pylint: disable=W0621
+
+"""Unit tests for LocalQRCodeFileStore"""
+
+import os
+import stat
+import time
+from pathlib import Path
+
+import pytest
+
+from payment_api.adapters.out import LocalQRCodeFileStore
+from payment_api.application.use_cases.ports import QRCodeFormat
+from payment_api.domain.exceptions import PersistenceError
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> LocalQRCodeFileStore:
+    """LocalQRCodeFileStore instance on a temporary directory"""
+    return LocalQRCodeFileStore(directory=str(tmp_path), max_bytes=1024)
+
+
+async def test_should_find_saved_files_by_digest_and_format(
+    store: LocalQRCodeFileStore, tmp_path: Path
+):
+    """Given a QR code image saved as PNG
+    When looking up its file as PNG and as SVG
+    Then only the PNG file should be found, named after the digest
+    """
+
+    # Given
+    file_name = await store.save(
+        digest="abc123", image_format=QRCodeFormat.PNG, content=b"png"
+    )
+
+    # When
+    png_file_name = await store.find(digest="abc123", image_format=QRCodeFormat.PNG)
+    svg_file_name = await store.find(digest="abc123", image_format=QRCodeFormat.SVG)
+
+    # Then
+    assert file_name == png_file_name == "ab/abc123.png"
+    assert svg_file_name is None
+    assert (tmp_path / "ab" / "abc123.png").read_bytes() == b"png"
+    assert os.listdir(tmp_path / "ab") == ["abc123.png"]
+
+
+async def test_should_save_files_readable_by_other_users(
+    store: LocalQRCodeFileStore, tmp_path: Path
+):
+    """Given a QR code image
+    When saving it
+    Then its file should be readable by other users, such as a fronting nginx
+    """
+
+    # When
+    await store.save(digest="abc123", image_format=QRCodeFormat.PNG, content=b"png")
+
+    # Then
+    mode = (tmp_path / "ab" / "abc123.png").stat().st_mode
+    assert stat.S_IMODE(mode) == 0o644
+
+
+async def test_should_raise_persistence_error_when_file_cannot_be_written(
+    tmp_path: Path,
+):
+    """Given a file store whose directory is a regular file
+    When saving a QR code image
+    Then a PersistenceError should be raised
+    """
+
+    # Given
+    directory = tmp_path / "not-a-directory"
+    directory.write_bytes(b"")
+    store = LocalQRCodeFileStore(directory=str(directory))
+
+    # When / Then
+    with pytest.raises(PersistenceError):
+        await store.save(digest="abc123", image_format=QRCodeFormat.PNG, content=b"")
+
+
+async def test_should_evict_expired_files_and_oldest_files_over_max_bytes(
+    store: LocalQRCodeFileStore, tmp_path: Path
+):
+    """Given an expired file and three recent files exceeding max bytes
+    When evicting files
+    Then the expired file and the oldest recent file should be evicted
+    """
+
+    # Given
+    now = time.time()
+    ages = {"aa01": store.max_age + 60, "bb02": 30, "cc03": 20, "dd04": 10}
+    for digest, age in ages.items():
+        await store.save(
+            digest=digest, image_format=QRCodeFormat.PNG, content=b"x" * 400
+        )
+        path = tmp_path / digest[:2] / f"{digest}.png"
+        os.utime(path, (now - age, now - age))
+
+    # When
+    evicted = await store.evict()
+
+    # Then
+    assert evicted == 2
+    assert [
+        digest
+        for digest in ages
+        if await store.find(digest=digest, image_format=QRCodeFormat.PNG)
+    ] == ["cc03", "dd04"]
+
+
+async def test_should_keep_recently_found_files_when_evicting(
+    store: LocalQRCodeFileStore, tmp_path: Path
+):
+    """Given three old files exceeding max bytes, the oldest of them found again
+    When evicting files
+    Then the least recently used file should be evicted instead of the one found
+    """
+
+    # Given
+    now = time.time()
+    ages = {"aa01": 300, "bb02": 200, "cc03": 100}
+    for digest, age in ages.items():
+        await store.save(
+            digest=digest, image_format=QRCodeFormat.PNG, content=b"x" * 400
+        )
+        path = tmp_path / digest[:2] / f"{digest}.png"
+        os.utime(path, (now - age, now - age))
+
+    await store.find(digest="aa01", image_format=QRCodeFormat.PNG)
+
+    # When
+    evicted = await store.evict()
+
+    # Then
+    assert evicted == 1
+    assert not (tmp_path / "bb" / "bb02.png").exists()
+    assert (tmp_path / "aa" / "aa01.png").exists()
+    assert (tmp_path / "cc" / "cc03.png").exists()
@@ -8,8 +8,10 @@ from pytest_mock import MockerFixture
 
 from payment_api.application.commands import CreatePaymentFromOrderCommand, ProductDTO
 from payment_api.application.use_cases import CreatePaymentFromOrderUseCase
+from payment_api.application.use_cases.ports import QRCodeImage
 from payment_api.domain.entities import PaymentIn, PaymentOut, Product
-from payment_api.domain.exceptions import PaymentCreationError
+from payment_api.domain.exceptions import PaymentCreationError, PersistenceError
+from payment_api.domain.ports import SaveMode
 from payment_api.domain.value_objects import PaymentStatus
 
 
@@ -90,7 +92,9 @@ async def test_should_create_payment_from_order_when_it_does_not_exist(
         products=[Product.model_validate(p.model_dump()) for p in command.products],
     )
 
-    use_case.payment_repository.save.assert_awaited_once_with(payment=payment_in_mock)
+    use_case.payment_repository.save.assert_awaited_once_with(
+        payment=payment_in_mock, mode=SaveMode.INSERT
+    )
 
 
 async def test_should_not_create_payment_when_it_already_exists(
@@ -123,3 +127,105 @@ async def test_should_not_create_payment_when_it_already_exists(
 
     use_case.payment_gateway.create.assert_not_awaited()
     use_case.payment_repository.save.assert_not_awaited()
+
+
+@pytest.mark.parametrize(
+    "image_repository_error", [None, PersistenceError("Database connection failed")]
+)
+async def test_should_pre_render_qr_code_of_created_payment(
+    mocker: MockerFixture,
+    command: CreatePaymentFromOrderCommand,
+    image_repository_error: PersistenceError | None,
+):
+    """Given a use case configured to pre-render QR codes
+    When creating a payment with a QR code
+    Then its QR code should be rendered and stored, and failing to store it
+    should not fail the payment creation
+    """
+
+    # Given
+    payment = PaymentOut(
+        id="A048",
+        external_id="MP123456",
+        payment_status=PaymentStatus.OPENED,
+        total_order_value=45.0,
+        qr_code="sample-qr-code",
+        expiration="2024-01-01T12:15:00",
+        created_at="2024-01-01T12:00:00",
+        timestamp="2024-01-01T12:00:00",
+    )
+
+    payment_repository = mocker.Mock()
+    payment_repository.exists_by_id = mocker.AsyncMock(return_value=False)
+    payment_repository.save = mocker.AsyncMock(return_value=payment)
+    payment_gateway = mocker.Mock()
+    payment_gateway.create = mocker.AsyncMock(side_effect=lambda payment, **_: payment)
+    qr_code_renderer = mocker.Mock()
+    qr_code_renderer.digest = mocker.Mock(return_value="abc123")
+    qr_code_renderer.render_async = mocker.AsyncMock(return_value=b"png")
+    qr_code_image_repository = mocker.Mock()
+    qr_code_image_repository.save = mocker.AsyncMock(side_effect=image_repository_error)
+
+    use_case = CreatePaymentFromOrderUseCase(
+        payment_repository=payment_repository,
+        payment_gateway=payment_gateway,
+        qr_code_renderer=qr_code_renderer,
+        qr_code_image_repository=qr_code_image_repository,
+    )
+
+    # When
+    created_payment = await use_case.execute(command=command)
+
+    # Then
+    assert created_payment == payment
+    qr_code_renderer.render_async.assert_awaited_once_with(data="sample-qr-code")
+    qr_code_image_repository.save.assert_awaited_once_with(
+        payment_id="A048", image=QRCodeImage(digest="abc123", content=b"png")
+    )
+
+
+@freeze_time("2024-01-01T12:00:00Z")
+async def test_should_create_payment_when_qr_code_cannot_be_rendered(
+    mocker: MockerFixture, command: CreatePaymentFromOrderCommand
+):
+    """Given a use case configured to pre-render QR codes
+    When the renderer fails to render the QR code of the created payment
+    Then the created payment should still be returned and no image stored
+    """
+
+    # Given
+    payment = PaymentOut(
+        id="A048",
+        external_id="MP123456",
+        payment_status=PaymentStatus.OPENED,
+        total_order_value=45.0,
+        qr_code="sample-qr-code",
+        expiration="2024-01-01T12:15:00",
+        created_at="2024-01-01T12:00:00",
+        timestamp="2024-01-01T12:00:00",
+    )
+
+    payment_repository = mocker.Mock()
+    payment_repository.exists_by_id = mocker.AsyncMock(return_value=False)
+    payment_repository.save = mocker.AsyncMock(return_value=payment)
+    payment_gateway = mocker.Mock()
+    payment_gateway.create = mocker.AsyncMock(side_effect=lambda payment, **_: payment)
+    qr_code_renderer = mocker.Mock()
+    qr_code_renderer.digest = mocker.Mock(return_value="abc123")
+    qr_code_renderer.render_async = mocker.AsyncMock(side_effect=ValueError("glog(0)"))
+    qr_code_image_repository = mocker.Mock()
+    qr_code_image_repository.save = mocker.AsyncMock()
+
+    use_case = CreatePaymentFromOrderUseCase(
+        payment_repository=payment_repository,
+        payment_gateway=payment_gateway,
+        qr_code_renderer=qr_code_renderer,
+        qr_code_image_repository=qr_code_image_repository,
+    )
+
+    # When
+    created_payment = await use_case.execute(command=command)
+
+    # Then
+    assert created_payment == payment
+    qr_code_image_repository.save.assert_not_awaited()
@@ -18,7 +18,8 @@ from payment_api.application.use_cases.ports import (
     MPPayment,
     MPPaymentOrder,
 )
-from payment_api.domain.entities import PaymentIn, PaymentOut
+from payment_api.domain.entities import PaymentOut
+from payment_api.domain.exceptions import PersistenceError
 from payment_api.domain.value_objects import PaymentStatus
 
 
@@ -29,11 +30,14 @@ def use_case(mocker: MockerFixture) -> FinalizePaymentByMercadoPagoPaymentIdUseC
     """
     payment_repository = mocker.Mock()
     mercado_pago_client = mocker.Mock()
-    payment_closed_publisher = mocker.Mock()
+    payment_closed_outbox = mocker.Mock()
+    pos_lease_manager = mocker.Mock()
+    pos_lease_manager.release = mocker.AsyncMock()
     return FinalizePaymentByMercadoPagoPaymentIdUseCase(
         payment_repository=payment_repository,
         mercado_pago_client=mercado_pago_client,
-        payment_closed_publisher=payment_closed_publisher,
+        payment_closed_outbox=payment_closed_outbox,
+        pos_lease_manager=pos_lease_manager,
     )
 
 
@@ -63,23 +67,15 @@ async def test_should_finalize_payment_by_mercado_pago_payment_id_when_payment_e
         status="approved",
     )
 
-    payment_mock = PaymentOut(
+    finalized_payment_mock = PaymentOut(
         id="A048",
-        external_id="empty-A048",
-        payment_status=PaymentStatus.OPENED,
+        external_id="123",
+        payment_status=PaymentStatus.CLOSED,
         total_order_value=100.0,
         qr_code="qr-sample",
         expiration="2024-01-01T12:15:00",
         created_at="2024-01-01T12:00:00Z",
-        timestamp="2024-01-01T12:00:00Z",
-    )
-
-    payment_save_mock = PaymentIn.model_validate(
-        {
-            **payment_mock.model_dump(),
-            "payment_status": PaymentStatus.CLOSED,
-            "external_id": "123",
-        }
+        timestamp="2024-01-01T12:01:00Z",
     )
 
     use_case.mercado_pago_client.find_payment_by_id = mocker.AsyncMock(
@@ -90,13 +86,14 @@ async def test_should_finalize_payment_by_mercado_pago_payment_id_when_payment_e
         return_value=mp_order_mock
     )
 
-    use_case.payment_repository.exists_by_external_id = mocker.AsyncMock(
-        return_value=False
+    use_case.payment_repository.finalize_if_open = mocker.AsyncMock(
+        return_value=finalized_payment_mock
     )
-
-    use_case.payment_repository.find_by_id = mocker.AsyncMock(return_value=payment_mock)
-    use_case.payment_repository.save = mocker.AsyncMock(return_value=payment_save_mock)
-    use_case.payment_closed_publisher.publish = mocker.AsyncMock()
+    use_case.payment_closed_outbox.add = mocker.AsyncMock()
+    calls = mocker.Mock()
+    calls.attach_mock(use_case.payment_closed_outbox.add, "add")
+    calls.attach_mock(use_case.payment_repository.finalize_if_open, "finalize")
+    calls.attach_mock(use_case.pos_lease_manager.release, "release")
 
     # When
     finalized_payment = await use_case.execute(command=command)
@@ -114,21 +111,27 @@ async def test_should_finalize_payment_by_mercado_pago_payment_id_when_payment_e
         order_id=mp_order_mock.id
     )
 
-    use_case.payment_repository.exists_by_external_id.assert_awaited_once_with(
-        external_id="123"
+    use_case.payment_repository.finalize_if_open.assert_awaited_once_with(
+        payment_id="A048", external_id="123", payment_status=PaymentStatus.CLOSED
     )
+    use_case.payment_closed_outbox.add.assert_awaited_once()
+    event = use_case.payment_closed_outbox.add.await_args.args[0]
+    assert event.payment_id == "A048"
+
+    use_case.pos_lease_manager.release.assert_awaited_once_with(payment_id="A048")
 
-    use_case.payment_repository.find_by_id.assert_awaited_once_with(payment_id="A048")
-    use_case.payment_repository.save.assert_awaited_once_with(payment=payment_save_mock)
-    use_case.payment_closed_publisher.publish.assert_awaited_once()
+    # the event must be staged before the finalization commits the transaction,
+    # and the point of sale released only after the payment is finalized
+    assert [name for name, _, _ in calls.mock_calls] == ["add", "finalize", "release"]
 
 
-async def test_should_not_finalize_payment_when_external_id_already_exists(
+async def test_should_not_finalize_payment_when_it_cannot_be_finalized(
     mocker: MockerFixture,
     use_case: FinalizePaymentByMercadoPagoPaymentIdUseCase,
 ):
     """Given a valid command to finalize a payment by Mercado Pago payment ID
-    When executing the use case and the payment with external ID already exists
+    When executing the use case and the repository refuses to finalize the
+    payment, as it is not opened anymore or its external ID is taken
     Then a ValueError should be raised
     """
 
@@ -156,8 +159,9 @@ async def test_should_not_finalize_payment_when_external_id_already_exists(
         return_value=mp_order_mock
     )
 
-    use_case.payment_repository.exists_by_external_id = mocker.AsyncMock(
-        return_value=True
+    use_case.payment_closed_outbox.add = mocker.AsyncMock()
+    use_case.payment_repository.finalize_if_open = mocker.AsyncMock(
+        side_effect=ValueError("Payment with external ID 123 already exists")
     )
 
     # When / Then
@@ -173,6 +177,96 @@ async def test_should_not_finalize_payment_when_external_id_already_exists(
         order_id=mp_order_mock.id
     )
 
-    use_case.payment_repository.exists_by_external_id.assert_awaited_once_with(
-        external_id="123"
+    use_case.payment_repository.finalize_if_open.assert_awaited_once_with(
+        payment_id="A048", external_id="123", payment_status=PaymentStatus.CLOSED
+    )
+    use_case.pos_lease_manager.release.assert_not_awaited()
+
+
+async def test_should_finalize_expired_payment_when_releasing_its_pos_fails(
+    mocker: MockerFixture,
+    use_case: FinalizePaymentByMercadoPagoPaymentIdUseCase,
+):
+    """Given a valid command to finalize an expired payment by Mercado Pago
+    payment ID
+    When executing the use case and releasing the point of sale leased to the
+    payment fails
+    Then the payment should still be finalized and returned
+    """
+
+    # Given
+    command = FinalizePaymentByMercadoPagoPaymentIdCommand(
+        payment_id="A048",
+    )
+
+    use_case.mercado_pago_client.find_payment_by_id = mocker.AsyncMock(
+        return_value=MPPayment(order=MPPaymentOrder(id="123"), status="rejected")
+    )
+
+    use_case.mercado_pago_client.find_order_by_id = mocker.AsyncMock(
+        return_value=MPOrder(
+            id=123, status=MPOrderStatus.EXPIRED, external_reference="A048"
+        )
+    )
+
+    expired_payment_mock = PaymentOut(
+        id="A048",
+        external_id="123",
+        payment_status=PaymentStatus.EXPIRED,
+        total_order_value=100.0,
+        qr_code="qr-sample",
+        expiration="2024-01-01T12:15:00",
+        created_at="2024-01-01T12:00:00Z",
+        timestamp="2024-01-01T12:16:00Z",
+    )
+
+    use_case.payment_closed_outbox.add = mocker.AsyncMock()
+    use_case.payment_repository.finalize_if_open = mocker.AsyncMock(
+        return_value=expired_payment_mock
     )
+    use_case.pos_lease_manager.release.side_effect = PersistenceError("DB is down")
+
+    # When
+    finalized_payment = await use_case.execute(command=command)
+
+    # Then
+    assert finalized_payment == expired_payment_mock
+    use_case.payment_closed_outbox.add.assert_not_awaited()
+    use_case.pos_lease_manager.release.assert_awaited_once_with(payment_id="A048")
+
+
+async def test_should_not_finalize_payment_when_order_is_still_opened(
+    mocker: MockerFixture,
+    use_case: FinalizePaymentByMercadoPagoPaymentIdUseCase,
+):
+    """Given a valid command to finalize a payment by Mercado Pago payment ID
+    When executing the use case and the Mercado Pago order is still opened
+    Then a ValueError should be raised without touching the outbox or repository
+    """
+
+    # Given
+    command = FinalizePaymentByMercadoPagoPaymentIdCommand(
+        payment_id="A048",
+    )
+
+    use_case.mercado_pago_client.find_payment_by_id = mocker.AsyncMock(
+        return_value=MPPayment(order=MPPaymentOrder(id="123"), status="pending")
+    )
+
+    use_case.mercado_pago_client.find_order_by_id = mocker.AsyncMock(
+        return_value=MPOrder(
+            id=123, status=MPOrderStatus.OPENED, external_reference="A048"
+        )
+    )
+
+    use_case.payment_closed_outbox.add = mocker.AsyncMock()
+    use_case.payment_repository.finalize_if_open = mocker.AsyncMock()
+
+    # When / Then
+    with pytest.raises(ValueError) as exc_info:
+        await use_case.execute(command=command)
+
+    assert str(exc_info.value) == "Unable to finalize a payment with status OPENED"
+    use_case.payment_closed_outbox.add.assert_not_awaited()
+    use_case.payment_repository.finalize_if_open.assert_not_awaited()
+    use_case.pos_lease_manager.release.assert_not_awaited()
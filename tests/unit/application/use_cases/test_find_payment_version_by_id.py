@@ -0,0 +1,50 @@
+# pylint: disable=W0621
+
+"""Unit tests for FindPaymentVersionByIdUseCase"""
+
+import pytest
+from pytest_mock import MockerFixture
+
+from payment_api.application.commands import FindPaymentByIdCommand
+from payment_api.application.use_cases import FindPaymentVersionByIdUseCase
+from payment_api.domain.entities import PaymentVersion
+from payment_api.domain.value_objects import PaymentStatus
+
+
+@pytest.fixture
+def use_case(mocker: MockerFixture) -> FindPaymentVersionByIdUseCase:
+    """Fixture to create an instance of FindPaymentVersionByIdUseCase with mocked
+    dependencies
+    """
+    payment_repository = mocker.Mock()
+    return FindPaymentVersionByIdUseCase(payment_repository=payment_repository)
+
+
+async def test_should_find_payment_version_by_id(
+    mocker: MockerFixture,
+    use_case: FindPaymentVersionByIdUseCase,
+):
+    """Given a valid command to find a payment version by ID
+    When executing the use case and the payment exists
+    Then the payment version should be returned
+    """
+
+    # Given
+    command = FindPaymentByIdCommand(payment_id="A048")
+    expected_version = PaymentVersion(
+        id="A048",
+        payment_status=PaymentStatus.OPENED,
+        timestamp="2024-01-02T12:00:00Z",
+    )
+    use_case.payment_repository.find_version_by_id = mocker.AsyncMock(
+        return_value=expected_version
+    )
+
+    # When
+    result = await use_case.execute(command)
+
+    # Then
+    use_case.payment_repository.find_version_by_id.assert_awaited_once_with(
+        payment_id="A048"
+    )
+    assert result == expected_version
@@ -0,0 +1,48 @@
+# pylint: disable=W0621
+
+"""Unit tests for FindPaymentsByIdsUseCase"""
+
+from typing import Callable
+
+import pytest
+from pytest_mock import MockerFixture
+
+from payment_api.application.commands import FindPaymentsByIdsCommand
+from payment_api.application.use_cases import FindPaymentsByIdsUseCase
+from payment_api.domain.entities import PaymentOut
+
+
+@pytest.fixture
+def use_case(mocker: MockerFixture) -> FindPaymentsByIdsUseCase:
+    """Fixture to create an instance of FindPaymentsByIdsUseCase with mocked
+    dependencies
+    """
+    payment_repository = mocker.Mock()
+    return FindPaymentsByIdsUseCase(payment_repository=payment_repository)
+
+
+async def test_should_find_payments_in_request_order_with_a_single_lookup(
+    mocker: MockerFixture,
+    use_case: FindPaymentsByIdsUseCase,
+    make_payment: Callable[..., PaymentOut],
+):
+    """Given a command with duplicated and missing payment IDs
+    When executing the use case
+    Then the repository should be called once with the unique IDs and the
+    payments found should be returned in the order of the command
+    """
+
+    # Given
+    command = FindPaymentsByIdsCommand(payment_ids=["A002", "A001", "A002", "A003"])
+    use_case.payment_repository.find_many_by_ids = mocker.AsyncMock(
+        return_value=[make_payment("A001"), make_payment("A002")]
+    )
+
+    # When
+    result = await use_case.execute(command)
+
+    # Then
+    use_case.payment_repository.find_many_by_ids.assert_awaited_once_with(
+        payment_ids=["A002", "A001", "A003"]
+    )
+    assert [payment.id for payment in result] == ["A002", "A001"]
@@ -5,9 +5,16 @@
 import pytest
 from pytest_mock import MockerFixture
 
-from payment_api.application.commands import RenderQRCodeCommand
+from payment_api.application.commands import QRCodeOptionsDTO, RenderQRCodeCommand
 from payment_api.application.use_cases import RenderQRCodeUseCase
+from payment_api.application.use_cases.ports import (
+    QRCodeErrorCorrection,
+    QRCodeFormat,
+    QRCodeImage,
+    QRCodeOptions,
+)
 from payment_api.domain.entities import PaymentOut
+from payment_api.domain.exceptions import PersistenceError
 from payment_api.domain.value_objects import PaymentStatus
 
 
@@ -48,15 +55,61 @@ async def test_should_render_qr_code_when_payment_has_qr_code(
     use_case.payment_repository.find_by_id = mocker.AsyncMock(return_value=payment)
 
     expected_qr_code_bytes = b"qr-code-bytes"
-    use_case.qr_code_renderer.render = mocker.Mock(return_value=expected_qr_code_bytes)
+    use_case.qr_code_renderer.digest = mocker.Mock(return_value="abc123")
+    use_case.qr_code_renderer.cached = mocker.Mock(return_value=None)
+    use_case.qr_code_renderer.render_async = mocker.AsyncMock(
+        return_value=expected_qr_code_bytes
+    )
 
     # When
     result = await use_case.execute(command)
 
     # Then
     use_case.payment_repository.find_by_id.assert_awaited_once_with(payment_id="A048")
-    use_case.qr_code_renderer.render.assert_called_once_with(data="sample-qr-code")
-    assert result == expected_qr_code_bytes
+    use_case.qr_code_renderer.render_async.assert_awaited_once_with(
+        data="sample-qr-code", options=QRCodeOptions()
+    )
+    assert result == QRCodeImage(
+        digest=use_case.qr_code_renderer.digest.return_value,
+        content=expected_qr_code_bytes,
+    )
+
+
+async def test_should_not_render_qr_code_when_rendering_is_skipped(
+    mocker: MockerFixture,
+    use_case: RenderQRCodeUseCase,
+):
+    """Given a command to describe a QR code without rendering it
+    When executing the use case and the QR code was not rendered before
+    Then only the digest of the QR code should be returned
+    """
+
+    # Given
+    command = RenderQRCodeCommand(payment_id="A048", render=False)
+    payment = PaymentOut(
+        id="A048",
+        external_id="A048",
+        payment_status=PaymentStatus.CLOSED,
+        total_order_value=100.0,
+        qr_code="sample-qr-code",
+        expiration="2024-12-31T23:59:59",
+        created_at="2024-01-01T12:00:00Z",
+        timestamp="2024-01-02T12:00:00Z",
+    )
+
+    use_case.payment_repository.find_by_id = mocker.AsyncMock(return_value=payment)
+    use_case.qr_code_renderer.digest = mocker.Mock(return_value="abc123")
+    use_case.qr_code_renderer.cached = mocker.Mock(return_value=None)
+
+    # When
+    result = await use_case.execute(command)
+
+    # Then
+    use_case.qr_code_renderer.render_async.assert_not_called()
+    use_case.qr_code_renderer.cached.assert_called_once_with(
+        data="sample-qr-code", options=QRCodeOptions()
+    )
+    assert result == QRCodeImage(digest="abc123")
 
 
 async def test_should_raise_value_error_when_payment_has_no_qr_code(
@@ -89,3 +142,212 @@ async def test_should_raise_value_error_when_payment_has_no_qr_code(
 
     use_case.payment_repository.find_by_id.assert_awaited_once_with(payment_id="A049")
     assert str(exc_info.value) == "Payment does not have an associated QR code."
+
+
+@pytest.mark.parametrize(
+    ("stored_digest", "expected_content"),
+    [("abc123", b"stored-png"), ("outdated", b"rendered-png")],
+)
+async def test_should_serve_stored_qr_code_only_when_its_digest_matches(
+    mocker: MockerFixture,
+    stored_digest: str,
+    expected_content: bytes,
+):
+    """Given a payment whose QR code image was stored when it was created
+    When executing the use case
+    Then the stored image should be returned if it was rendered from the current
+    QR data, and the QR code should be rendered otherwise
+    """
+
+    # Given
+    payment = PaymentOut(
+        id="A048",
+        external_id="A048",
+        payment_status=PaymentStatus.OPENED,
+        total_order_value=100.0,
+        qr_code="sample-qr-code",
+        expiration="2024-12-31T23:59:59",
+        created_at="2024-01-01T12:00:00Z",
+        timestamp="2024-01-02T12:00:00Z",
+    )
+
+    payment_repository = mocker.Mock()
+    payment_repository.find_by_id = mocker.AsyncMock(return_value=payment)
+    qr_code_renderer = mocker.Mock()
+    qr_code_renderer.digest = mocker.Mock(return_value="abc123")
+    qr_code_renderer.cached = mocker.Mock(return_value=None)
+    qr_code_renderer.render_async = mocker.AsyncMock(return_value=b"rendered-png")
+    qr_code_image_repository = mocker.Mock()
+    qr_code_image_repository.find = mocker.AsyncMock(
+        return_value=QRCodeImage(digest=stored_digest, content=b"stored-png")
+    )
+
+    use_case = RenderQRCodeUseCase(
+        payment_repository=payment_repository,
+        qr_code_renderer=qr_code_renderer,
+        qr_code_image_repository=qr_code_image_repository,
+    )
+
+    # When
+    result = await use_case.execute(RenderQRCodeCommand(payment_id="A048"))
+
+    # Then
+    qr_code_image_repository.find.assert_awaited_once_with(payment_id="A048")
+    assert result == QRCodeImage(digest="abc123", content=expected_content)
+
+
+async def test_should_render_qr_code_with_the_requested_options(
+    mocker: MockerFixture,
+    use_case: RenderQRCodeUseCase,
+):
+    """Given a command to render an SVG QR code with custom options
+    When executing the use case
+    Then the QR code should be identified and rendered with those options
+    """
+
+    # Given
+    command = RenderQRCodeCommand(
+        payment_id="A048",
+        options=QRCodeOptionsDTO(
+            format="image/svg+xml", box_size=4, border=1, error_correction="H"
+        ),
+    )
+    payment = PaymentOut(
+        id="A048",
+        external_id="A048",
+        payment_status=PaymentStatus.OPENED,
+        total_order_value=100.0,
+        qr_code="sample-qr-code",
+        expiration="2024-12-31T23:59:59",
+        created_at="2024-01-01T12:00:00Z",
+        timestamp="2024-01-02T12:00:00Z",
+    )
+
+    use_case.payment_repository.find_by_id = mocker.AsyncMock(return_value=payment)
+    use_case.qr_code_renderer.digest = mocker.Mock(return_value="abc123")
+    use_case.qr_code_renderer.cached = mocker.Mock(return_value=None)
+    use_case.qr_code_renderer.render_async = mocker.AsyncMock(return_value=b"<svg/>")
+
+    # When
+    result = await use_case.execute(command)
+
+    # Then
+    expected_options = QRCodeOptions(
+        format=QRCodeFormat.SVG,
+        box_size=4,
+        border=1,
+        error_correction=QRCodeErrorCorrection.H,
+    )
+    use_case.qr_code_renderer.digest.assert_called_once_with(
+        data="sample-qr-code", options=expected_options
+    )
+    use_case.qr_code_renderer.render_async.assert_awaited_once_with(
+        data="sample-qr-code", options=expected_options
+    )
+    assert result == QRCodeImage(digest="abc123", content=b"<svg/>")
+
+
+@pytest.mark.parametrize(
+    "stored_file_name, expected_image",
+    [
+        ("ab/abc123.png", QRCodeImage(digest="abc123", file_name="ab/abc123.png")),
+        (
+            None,
+            QRCodeImage(
+                digest="abc123", content=b"rendered-png", file_name="ab/abc123.png"
+            ),
+        ),
+    ],
+)
+async def test_should_serve_qr_code_files_and_store_rendered_ones(
+    mocker: MockerFixture,
+    stored_file_name: str | None,
+    expected_image: QRCodeImage,
+):
+    """Given a QR code file store
+    When executing the use case
+    Then a stored file should be returned without rendering, and a rendered QR
+    code should be stored as a file
+    """
+
+    # Given
+    payment = PaymentOut(
+        id="A048",
+        external_id="A048",
+        payment_status=PaymentStatus.OPENED,
+        total_order_value=100.0,
+        qr_code="sample-qr-code",
+        expiration="2024-12-31T23:59:59",
+        created_at="2024-01-01T12:00:00Z",
+        timestamp="2024-01-02T12:00:00Z",
+    )
+
+    payment_repository = mocker.Mock()
+    payment_repository.find_by_id = mocker.AsyncMock(return_value=payment)
+    qr_code_renderer = mocker.Mock()
+    qr_code_renderer.digest = mocker.Mock(return_value="abc123")
+    qr_code_renderer.cached = mocker.Mock(return_value=None)
+    qr_code_renderer.render_async = mocker.AsyncMock(return_value=b"rendered-png")
+    qr_code_file_store = mocker.Mock()
+    qr_code_file_store.find = mocker.AsyncMock(return_value=stored_file_name)
+    qr_code_file_store.save = mocker.AsyncMock(return_value="ab/abc123.png")
+
+    use_case = RenderQRCodeUseCase(
+        payment_repository=payment_repository,
+        qr_code_renderer=qr_code_renderer,
+        qr_code_file_store=qr_code_file_store,
+    )
+
+    # When
+    result = await use_case.execute(RenderQRCodeCommand(payment_id="A048"))
+
+    # Then
+    assert result == expected_image
+    qr_code_file_store.find.assert_awaited_once_with(
+        digest="abc123", image_format=QRCodeFormat.PNG
+    )
+    if stored_file_name is None:
+        qr_code_file_store.save.assert_awaited_once_with(
+            digest="abc123", image_format=QRCodeFormat.PNG, content=b"rendered-png"
+        )
+    else:
+        qr_code_renderer.render_async.assert_not_called()
+        qr_code_file_store.save.assert_not_called()
+
+
+async def test_should_return_qr_code_inline_when_file_cannot_be_stored(
+    mocker: MockerFixture,
+    use_case: RenderQRCodeUseCase,
+):
+    """Given a QR code file store that fails to store files
+    When executing the use case
+    Then the rendered QR code should be returned without a file
+    """
+
+    # Given
+    payment = PaymentOut(
+        id="A048",
+        external_id="A048",
+        payment_status=PaymentStatus.OPENED,
+        total_order_value=100.0,
+        qr_code="sample-qr-code",
+        expiration="2024-12-31T23:59:59",
+        created_at="2024-01-01T12:00:00Z",
+        timestamp="2024-01-02T12:00:00Z",
+    )
+
+    use_case.payment_repository.find_by_id = mocker.AsyncMock(return_value=payment)
+    use_case.qr_code_renderer.digest = mocker.Mock(return_value="abc123")
+    use_case.qr_code_renderer.cached = mocker.Mock(return_value=None)
+    use_case.qr_code_renderer.render_async = mocker.AsyncMock(return_value=b"png")
+    use_case.qr_code_file_store = mocker.Mock()
+    use_case.qr_code_file_store.find = mocker.AsyncMock(return_value=None)
+    use_case.qr_code_file_store.save = mocker.AsyncMock(
+        side_effect=PersistenceError("Disk full")
+    )
+
+    # When
+    result = await use_case.execute(RenderQRCodeCommand(payment_id="A048"))
+
+    # Then
+    assert result == QRCodeImage(digest="abc123", content=b"png")
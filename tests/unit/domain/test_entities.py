@@ -72,3 +72,32 @@ def test_should_not_allow_reopening_payment(payment: PaymentOut):
         payment.finalize(PaymentStatus.OPENED)
     except ValueError as e:
         assert str(e) == "Unable to update a payment status from OPENED to OPENED"
+
+
+def test_should_accept_closed_and_expired_as_final_statuses():
+    """Given the closed and expired statuses
+    When checking them as the final status of a payment
+    Then they should be accepted
+    """
+
+    # When
+    final_statuses = [
+        PaymentOut.check_final_status(PaymentStatus.CLOSED),
+        PaymentOut.check_final_status(PaymentStatus.EXPIRED),
+    ]
+
+    # Then
+    assert final_statuses == [PaymentStatus.CLOSED, PaymentStatus.EXPIRED]
+
+
+def test_should_reject_opened_as_final_status():
+    """Given the opened status
+    When checking it as the final status of a payment
+    Then a ValueError should be raised
+    """
+
+    # When / Then
+    with pytest.raises(ValueError) as exc_info:
+        PaymentOut.check_final_status(PaymentStatus.OPENED)
+
+    assert str(exc_info.value) == "Unable to finalize a payment with status OPENED"
@@ -0,0 +1,106 @@
+# pylint: disable=W0621
+
+"""Unit tests for the AWSClients registry"""
+
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from payment_api.infrastructure.aws import AWSClients
+
+
+def _async_context(mocker: MockerFixture, value) -> MagicMock:
+    context = mocker.MagicMock()
+    context.__aenter__ = mocker.AsyncMock(return_value=value)
+    context.__aexit__ = mocker.AsyncMock(return_value=None)
+    return context
+
+
+@pytest.fixture
+def sns_context(mocker: MockerFixture) -> MagicMock:
+    """Async context manager returned by session.client("sns")"""
+    return _async_context(mocker, mocker.sentinel.sns)
+
+
+@pytest.fixture
+def sqs_context(mocker: MockerFixture) -> MagicMock:
+    """Async context manager returned by session.resource("sqs")"""
+    return _async_context(mocker, mocker.sentinel.sqs)
+
+
+@pytest.fixture
+def aws_session(
+    mocker: MockerFixture, sns_context: MagicMock, sqs_context: MagicMock
+) -> MagicMock:
+    """Mock AIOBoto3Session for testing"""
+    session = mocker.MagicMock()
+    session.client.return_value = sns_context
+    session.resource.return_value = sqs_context
+    return session
+
+
+async def test_should_create_clients_once_and_reuse_them(
+    aws_session: MagicMock, mocker: MockerFixture
+):
+    """Given an AWSClients registry
+    When it is started more than once
+    Then the clients should be created only once and shared
+    """
+
+    # Given
+    aws_clients = AWSClients(session=aws_session, max_pool_connections=20)
+
+    # When
+    await aws_clients.start()
+    await aws_clients.start()
+
+    # Then
+    assert aws_clients.sns is mocker.sentinel.sns
+    assert aws_clients.sqs is mocker.sentinel.sqs
+    aws_session.client.assert_called_once_with("sns", config=aws_clients.config)
+    aws_session.resource.assert_called_once_with("sqs", config=aws_clients.config)
+    assert aws_clients.config.max_pool_connections == 20
+
+
+async def test_should_close_clients_on_close(
+    aws_session: MagicMock, sns_context: MagicMock, sqs_context: MagicMock
+):
+    """Given a started AWSClients registry
+    When it is closed
+    Then the clients should be closed and no longer available
+    """
+
+    # Given
+    aws_clients = await AWSClients(session=aws_session).start()
+
+    # When
+    await aws_clients.close()
+
+    # Then
+    sns_context.__aexit__.assert_awaited_once()
+    sqs_context.__aexit__.assert_awaited_once()
+    with pytest.raises(RuntimeError):
+        _ = aws_clients.sns
+
+
+async def test_should_close_created_clients_when_start_fails(
+    aws_session: MagicMock, sns_context: MagicMock, sqs_context: MagicMock
+):
+    """Given an SQS resource that fails to be created
+    When the registry is started
+    Then the SNS client already created should be closed
+    """
+
+    # Given
+    sqs_context.__aenter__.side_effect = ValueError("Invalid region")
+    aws_clients = AWSClients(session=aws_session)
+
+    # When
+    with pytest.raises(ValueError):
+        await aws_clients.start()
+
+    # Then
+    sns_context.__aexit__.assert_awaited_once()
+    with pytest.raises(RuntimeError):
+        _ = aws_clients.sqs
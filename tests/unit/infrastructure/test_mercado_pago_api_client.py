@@ -2,10 +2,14 @@
 
 """Unit tests for MercadoPagoAPIClient"""
 
+from datetime import datetime, timezone
+
 import pytest
 from httpx import HTTPError, HTTPStatusError, Request
+from pydantic import ValidationError
 from pytest_mock import MockerFixture
 
+from payment_api.application.use_cases.ports import MercadoPagoPOSLeaseManager
 from payment_api.infrastructure.mercado_pago.client import MercadoPagoAPIClient
 from payment_api.infrastructure.mercado_pago.exceptions import (
     MPClientError,
@@ -134,6 +138,150 @@ async def test_should_raise_mp_client_error_when_create_dynamic_qr_order_has_htt
     )
 
 
+@pytest.fixture
+def pos_lease_manager(mocker: MockerFixture):
+    """Fixture to create a mock MercadoPagoPOSLeaseManager"""
+    lease_manager = mocker.Mock(spec=MercadoPagoPOSLeaseManager)
+    lease_manager.acquire = mocker.AsyncMock(return_value="POS011")
+    lease_manager.release = mocker.AsyncMock()
+    return lease_manager
+
+
+async def test_should_create_dynamic_qr_order_in_leased_pos_when_lease_manager_is_set(
+    mocker: MockerFixture,
+    mp_settings,
+    pos_lease_manager,
+    create_order_input: MPCreateOrderIn,
+):
+    """Given a client with a point of sale lease manager
+    When creating a dynamic QR order
+    Then the order should be created in the point of sale leased to the order until
+    the order expires
+    """
+
+    # Given
+    client = MercadoPagoAPIClient(
+        settings=mp_settings,
+        http_client=mocker.Mock(),
+        pos_lease_manager=pos_lease_manager,
+    )
+
+    mock_response = mocker.Mock()
+    mock_response.status_code = 201
+    mock_response.json.return_value = {"qr_data": "sample-qr-data"}
+    mock_response.raise_for_status.return_value = None
+    client.http_client.request = mocker.AsyncMock(return_value=mock_response)
+
+    # When
+    await client.create_dynamic_qr_order(order_data=create_order_input)
+
+    # Then
+    pos_lease_manager.acquire.assert_awaited_once_with(
+        payment_id="A048",
+        expires_at=datetime(2024, 12, 31, 23, 59, 59, tzinfo=timezone.utc),
+    )
+
+    client.http_client.request.assert_awaited_once_with(
+        "POST",
+        "https://api.mercadopago.com/instore/orders/qr/seller/collectors/123456/"
+        "pos/POS011/qrs",
+        headers={"Authorization": "Bearer test-access-token"},
+        json=create_order_input.model_dump(),
+    )
+
+    pos_lease_manager.release.assert_not_awaited()
+
+
+async def test_should_release_leased_pos_when_create_dynamic_qr_order_fails(
+    mocker: MockerFixture,
+    mp_settings,
+    pos_lease_manager,
+    create_order_input: MPCreateOrderIn,
+):
+    """Given a client with a point of sale lease manager
+    When creating a dynamic QR order fails
+    Then the point of sale leased to the order should be released
+    """
+
+    # Given
+    client = MercadoPagoAPIClient(
+        settings=mp_settings,
+        http_client=mocker.Mock(),
+        pos_lease_manager=pos_lease_manager,
+    )
+
+    # When
+    await _test_http_generic_error(
+        mocker, client.create_dynamic_qr_order, {"order_data": create_order_input}
+    )
+
+    # Then
+    pos_lease_manager.release.assert_awaited_once_with(payment_id="A048")
+
+
+async def test_should_release_leased_pos_when_created_dynamic_qr_order_is_invalid(
+    mocker: MockerFixture,
+    mp_settings,
+    pos_lease_manager,
+    create_order_input: MPCreateOrderIn,
+):
+    """Given a client with a point of sale lease manager
+    When the Mercado Pago API responds with an invalid order
+    Then the validation error should be raised and the point of sale leased to the
+    order should be released
+    """
+
+    # Given
+    client = MercadoPagoAPIClient(
+        settings=mp_settings,
+        http_client=mocker.Mock(),
+        pos_lease_manager=pos_lease_manager,
+    )
+
+    mock_response = mocker.Mock()
+    mock_response.status_code = 201
+    mock_response.json.return_value = {}
+    mock_response.raise_for_status.return_value = None
+    client.http_client.request = mocker.AsyncMock(return_value=mock_response)
+
+    # When
+    with pytest.raises(ValidationError):
+        await client.create_dynamic_qr_order(order_data=create_order_input)
+
+    # Then
+    pos_lease_manager.release.assert_awaited_once_with(payment_id="A048")
+
+
+async def test_should_raise_mp_client_error_when_no_pos_is_free(
+    mocker: MockerFixture,
+    mp_settings,
+    pos_lease_manager,
+    create_order_input: MPCreateOrderIn,
+):
+    """Given a client with a point of sale lease manager without free points of sale
+    When creating a dynamic QR order
+    Then an MPClientError should be raised without calling the Mercado Pago API
+    """
+
+    # Given
+    pos_lease_manager.acquire.return_value = None
+    client = MercadoPagoAPIClient(
+        settings=mp_settings,
+        http_client=mocker.Mock(),
+        pos_lease_manager=pos_lease_manager,
+    )
+
+    client.http_client.request = mocker.AsyncMock()
+
+    # When
+    with pytest.raises(MPClientError, match="No point of sale is free"):
+        await client.create_dynamic_qr_order(order_data=create_order_input)
+
+    # Then
+    client.http_client.request.assert_not_awaited()
+    pos_lease_manager.release.assert_not_awaited()
+
+
 async def test_should_find_order_by_id_when_api_responds_successfully(
     mocker: MockerFixture,
     client: MercadoPagoAPIClient,
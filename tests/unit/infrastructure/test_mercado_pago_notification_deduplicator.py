@@ -0,0 +1,152 @@
+# pylint: disable=W0621
+
+"""Unit tests for MercadoPagoNotificationDeduplicator"""
+
+from unittest.mock import MagicMock
+
+import pytest
+from freezegun import freeze_time
+from pytest_mock import MockerFixture
+
+from payment_api.application.use_cases.ports import MercadoPagoNotificationInbox
+from payment_api.infrastructure.mercado_pago import (
+    MercadoPagoNotificationDeduplicator,
+    RecentlySeenNotifications,
+)
+
+
+@pytest.fixture
+def mock_inbox(mocker: MockerFixture) -> MagicMock:
+    """Mock MercadoPagoNotificationInbox for testing"""
+    inbox = mocker.Mock(spec=MercadoPagoNotificationInbox)
+    inbox.is_processed.return_value = False
+    return inbox
+
+
+def test_should_forget_notifications_after_ttl():
+    """Given a notification added to the recently seen set
+    When its time to live elapses
+    Then it should not be seen anymore
+    """
+
+    with freeze_time("2024-01-01T12:00:00Z") as frozen_time:
+        # Given
+        recently_seen = RecentlySeenNotifications(max_size=10, ttl=60.0)
+        recently_seen.add("MP001")
+        assert recently_seen.seen("MP001")
+
+        # When
+        frozen_time.tick(61)
+
+        # Then
+        assert not recently_seen.seen("MP001")
+        assert len(recently_seen) == 0
+
+
+def test_should_evict_oldest_notifications_when_full():
+    """Given a full recently seen set
+    When a new notification is added
+    Then the oldest notification should be evicted
+    """
+
+    # Given
+    recently_seen = RecentlySeenNotifications(max_size=2)
+    recently_seen.add("MP001")
+    recently_seen.add("MP002")
+
+    # When
+    recently_seen.add("MP003")
+
+    # Then
+    assert not recently_seen.seen("MP001")
+    assert recently_seen.seen("MP002")
+    assert recently_seen.seen("MP003")
+
+
+async def test_should_detect_recently_seen_duplicate_without_reading_inbox(
+    mock_inbox: MagicMock,
+):
+    """Given a notification in the recently seen set
+    When checking if it is a duplicate
+    Then it should be a duplicate without reading the inbox
+    """
+
+    # Given
+    recently_seen = RecentlySeenNotifications()
+    recently_seen.add("MP001")
+    deduplicator = MercadoPagoNotificationDeduplicator(
+        inbox=mock_inbox, recently_seen=recently_seen
+    )
+
+    # When
+    duplicated = await deduplicator.is_duplicate("MP001")
+
+    # Then
+    assert duplicated is True
+    mock_inbox.is_processed.assert_not_called()
+
+
+async def test_should_detect_processed_duplicate_and_remember_it(
+    mock_inbox: MagicMock,
+):
+    """Given a notification processed by another process
+    When checking if it is a duplicate
+    Then it should be a duplicate and be remembered in the recently seen set
+    """
+
+    # Given
+    mock_inbox.is_processed.return_value = True
+    recently_seen = RecentlySeenNotifications()
+    deduplicator = MercadoPagoNotificationDeduplicator(
+        inbox=mock_inbox, recently_seen=recently_seen
+    )
+
+    # When
+    duplicated = await deduplicator.is_duplicate("MP001")
+
+    # Then
+    assert duplicated is True
+    mock_inbox.is_processed.assert_awaited_once_with("MP001")
+    assert recently_seen.seen("MP001")
+
+
+async def test_should_not_detect_new_notification_as_duplicate(
+    mock_inbox: MagicMock,
+):
+    """Given a notification never handled before
+    When checking if it is a duplicate
+    Then it should not be a duplicate
+    """
+
+    # Given
+    recently_seen = RecentlySeenNotifications()
+    deduplicator = MercadoPagoNotificationDeduplicator(
+        inbox=mock_inbox, recently_seen=recently_seen
+    )
+
+    # When
+    duplicated = await deduplicator.is_duplicate("MP001")
+
+    # Then
+    assert duplicated is False
+    assert not recently_seen.seen("MP001")
+
+
+async def test_should_record_processed_notification(mock_inbox: MagicMock):
+    """Given a notification that was processed
+    When marking it as processed
+    Then it should be recorded in the inbox and in the recently seen set
+    """
+
+    # Given
+    recently_seen = RecentlySeenNotifications()
+    deduplicator = MercadoPagoNotificationDeduplicator(
+        inbox=mock_inbox, recently_seen=recently_seen
+    )
+
+    # When
+    await deduplicator.mark_processed("MP001")
+
+    # Then
+    mock_inbox.mark_processed.assert_awaited_once_with("MP001")
+    assert recently_seen.seen("MP001")
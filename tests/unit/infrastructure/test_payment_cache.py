@@ -0,0 +1,181 @@
+# pylint: disable=W0621
+
+"""Unit tests for PaymentCache"""
+
+import asyncio
+from typing import Callable
+
+import pytest
+from freezegun import freeze_time
+from pytest_mock import MockerFixture
+
+from payment_api.domain.entities import PaymentOut
+from payment_api.domain.exceptions import NotFound
+from payment_api.domain.value_objects import PaymentStatus
+from payment_api.infrastructure.payment_cache import PaymentCache
+
+
+@pytest.fixture
+def loader(mocker: MockerFixture):
+    """Mock loader used to revalidate stale entries"""
+    return mocker.AsyncMock()
+
+
+def test_should_cache_terminal_payments_longer_than_opened_ones(
+    loader, make_payment: Callable[..., PaymentOut]
+):
+    """Given an opened and a closed payment in the cache
+    When the opened TTL and its stale window elapse
+    Then only the closed payment should still be served
+    """
+
+    with freeze_time("2024-01-01T12:00:00Z") as frozen_time:
+        # Given
+        cache = PaymentCache(
+            loader=loader, opened_ttl=1.0, terminal_ttl=60.0, stale_ttl=2.0
+        )
+
+        cache.put(make_payment("A001"))
+        cache.put(make_payment("A002", PaymentStatus.CLOSED))
+
+        # When
+        frozen_time.tick(4)
+
+        # Then
+        assert cache.get("A001") is None
+        assert cache.get("A002").is_fresh
+
+
+def test_should_cache_not_found_lookups_without_stale_window(loader):
+    """Given a payment lookup cached as not found
+    When the not found TTL elapses
+    Then the lookup should not be served anymore
+    """
+
+    with freeze_time("2024-01-01T12:00:00Z") as frozen_time:
+        # Given
+        cache = PaymentCache(loader=loader, not_found_ttl=2.0, stale_ttl=10.0)
+        cache.put_not_found("A001")
+        assert cache.get("A001").payment is None
+
+        # When
+        frozen_time.tick(3)
+
+        # Then
+        assert cache.get("A001") is None
+
+
+def test_should_evict_least_recently_used_entries_and_count_stats(
+    loader, make_payment: Callable[..., PaymentOut]
+):
+    """Given a full cache
+    When an entry is looked up and a new one is added
+    Then the least recently used entry should be evicted and counted
+    """
+
+    # Given
+    cache = PaymentCache(loader=loader, max_size=2, terminal_ttl=60.0)
+    cache.put(make_payment("A001", PaymentStatus.CLOSED))
+    cache.put(make_payment("A002", PaymentStatus.CLOSED))
+
+    # When
+    cache.get("A001")
+    cache.put(make_payment("A003", PaymentStatus.CLOSED))
+
+    # Then
+    assert cache.get("A002") is None
+    assert cache.get("A001") is not None
+    stats = cache.stats()
+    assert stats.size == 2
+    assert stats.evictions == 1
+    assert stats.hits == 2
+    assert stats.misses == 1
+    assert stats.hit_ratio == pytest.approx(2 / 3)
+
+
+async def test_should_serve_stale_entry_while_revalidating(
+    loader, make_payment: Callable[..., PaymentOut]
+):
+    """Given an opened payment whose TTL elapsed within the stale window
+    When it is looked up
+    Then the stale entry should be served and replaced by the reloaded payment
+    """
+
+    with freeze_time("2024-01-01T12:00:00Z") as frozen_time:
+        # Given
+        cache = PaymentCache(loader=loader, opened_ttl=1.0, stale_ttl=5.0)
+        cache.put(make_payment("A001"))
+        loader.return_value = make_payment("A001", PaymentStatus.CLOSED)
+        frozen_time.tick(2)
+
+        # When
+        entry = cache.get("A001")
+        await asyncio.sleep(0)
+
+        # Then
+        assert entry.payment.payment_status == PaymentStatus.OPENED
+        assert cache.stats().stale_hits == 1
+        loader.assert_awaited_once_with("A001")
+        assert cache.get("A001").payment.payment_status == PaymentStatus.CLOSED
+
+
+async def test_should_cache_not_found_when_revalidation_does_not_find_payment(
+    loader,
+    make_payment: Callable[..., PaymentOut],
+):
+    """Given a stale payment that was removed from the repository
+    When it is revalidated
+    Then the lookup should be cached as not found
+    """
+
+    with freeze_time("2024-01-01T12:00:00Z") as frozen_time:
+        # Given
+        cache = PaymentCache(loader=loader, opened_ttl=1.0, stale_ttl=5.0)
+        cache.put(make_payment("A001"))
+        loader.side_effect = NotFound("No payment found with ID: A001")
+        frozen_time.tick(2)
+
+        # When
+        cache.get("A001")
+        await asyncio.sleep(0)
+
+        # Then
+        assert cache.get("A001").payment is None
+
+
+async def test_should_discard_revalidation_of_invalidated_entry(
+    loader,
+    mocker: MockerFixture,
+    make_payment: Callable[..., PaymentOut],
+):
+    """Given a stale entry being revalidated
+    When the entry is invalidated before the reload finishes
+    Then the reloaded payment should not be cached
+    """
+
+    with freeze_time("2024-01-01T12:00:00Z") as frozen_time:
+        # Given
+        cache = PaymentCache(loader=loader, opened_ttl=1.0, stale_ttl=5.0)
+        cache.put(make_payment("A001"))
+        reload_started = asyncio.Event()
+        finish_reload = asyncio.Event()
+
+        async def slow_load(_):
+            reload_started.set()
+            await finish_reload.wait()
+            return make_payment("A001")
+
+        loader.side_effect = slow_load
+        frozen_time.tick(2)
+        cache.get("A001")
+        await reload_started.wait()
+
+        # When
+        cache.invalidate("A001")
+        finish_reload.set()
+        await asyncio.sleep(0)
+
+        # Then
+        assert len(cache) == 0
+        assert cache.stats().invalidations == 1
+        assert mocker.call("A001") in loader.await_args_list
@@ -0,0 +1,127 @@
+# pylint: disable=W0621
+
+"""Unit tests for PaymentStatusNotifications"""
+
+import pytest
+
+from payment_api.domain.entities import PaymentVersion
+from payment_api.domain.value_objects import PaymentStatus
+from payment_api.infrastructure.payment_status_notifications import (
+    PAYMENT_STATUS_CHANNEL,
+    PaymentStatusNotifications,
+)
+
+
+def make_version(
+    payment_id: str, payment_status: PaymentStatus = PaymentStatus.CLOSED
+) -> PaymentVersion:
+    """Build a PaymentVersion with the given ID and status"""
+    return PaymentVersion(
+        id=payment_id,
+        payment_status=payment_status,
+        timestamp="2024-01-02T12:00:00Z",
+    )
+
+
+@pytest.fixture
+def notifications() -> PaymentStatusNotifications:
+    """PaymentStatusNotifications instance for testing"""
+    return PaymentStatusNotifications(dsn="postgresql://test", queue_size=2)
+
+
+def test_should_deliver_changes_only_to_subscribers_of_the_payment(
+    notifications: PaymentStatusNotifications,
+):
+    """Given subscribers of two payments
+    When a change of one payment is published
+    Then only the subscribers of that payment should receive it
+    """
+
+    # Given
+    first = notifications.subscribe("A001")
+    second = notifications.subscribe("A001")
+    other = notifications.subscribe("A002")
+
+    # When
+    notifications.publish(make_version("A001"))
+
+    # Then
+    assert first.get_nowait() == second.get_nowait() == make_version("A001")
+    assert other.empty()
+
+
+def test_should_drop_oldest_change_when_subscriber_falls_behind(
+    notifications: PaymentStatusNotifications,
+):
+    """Given a subscriber whose queue is full
+    When another change is published
+    Then the oldest change should be dropped
+    """
+
+    # Given
+    queue = notifications.subscribe("A001")
+    notifications.publish(make_version("A001", PaymentStatus.OPENED))
+    notifications.publish(make_version("A001", PaymentStatus.EXPIRED))
+
+    # When
+    notifications.publish(make_version("A001", PaymentStatus.CLOSED))
+
+    # Then
+    assert queue.get_nowait().payment_status == PaymentStatus.EXPIRED
+    assert queue.get_nowait().payment_status == PaymentStatus.CLOSED
+
+
+def test_should_stop_delivering_changes_after_unsubscribe(
+    notifications: PaymentStatusNotifications,
+):
+    """Given a subscriber of a payment
+    When it unsubscribes
+    Then it should not receive the changes of the payment anymore
+    """
+
+    # Given
+    queue = notifications.subscribe("A001")
+
+    # When
+    notifications.unsubscribe("A001", queue)
+    notifications.unsubscribe("A001", queue)
+    notifications.publish(make_version("A001"))
+
+    # Then
+    assert queue.empty()
+    assert len(notifications) == 0
+
+
+def test_should_publish_valid_notifications_and_discard_invalid_ones(
+    notifications: PaymentStatusNotifications,
+):
+    """Given a subscriber of a payment
+    When a valid and an invalid notification are received
+    Then only the valid one should be delivered
+    """
+
+    # Given
+    queue = notifications.subscribe("A001")
+
+    # When
+    notifications._on_notification(  # pylint: disable=W0212
+        None, 1, PAYMENT_STATUS_CHANNEL, "not-json"
+    )
+    notifications._on_notification(  # pylint: disable=W0212
+        None, 1, PAYMENT_STATUS_CHANNEL, make_version("A001").model_dump_json()
+    )
+
+    # Then
+    assert queue.get_nowait() == make_version("A001")
+    assert queue.empty()
+
+
+def test_should_reject_non_positive_queue_size():
+    """Given a non positive subscriber queue size
+    When creating the notifications
+    Then a ValueError should be raised
+    """
+
+    # When / Then
+    with pytest.raises(ValueError):
+        PaymentStatusNotifications(dsn="postgresql://test", queue_size=0)
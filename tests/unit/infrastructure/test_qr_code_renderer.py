@@ -2,11 +2,29 @@
 
 """Unit tests for QRCodeRenderer"""
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from xml.etree import ElementTree
+
 import pytest
+from PIL import Image
 from pytest_mock import MockerFixture
-from qrcode.image.pil import PilImage
+from qrcode import QRCode
 
-from payment_api.infrastructure.qr_code_renderer import QRCodeRenderer
+from payment_api.application.use_cases.ports import (
+    QRCodeErrorCorrection,
+    QRCodeFormat,
+    QRCodeOptions,
+    QRCodeRendererUnavailable,
+)
+from payment_api.infrastructure.qr_code_renderer import (
+    CachedQRCodeRenderer,
+    ExecutorQRCodeRenderer,
+    QRCodeExecutor,
+    QRCodeRenderer,
+    create_qr_code_executor,
+)
 
 
 @pytest.fixture
@@ -15,50 +33,234 @@ def renderer() -> QRCodeRenderer:
     return QRCodeRenderer()
 
 
-def test_should_render_qr_code_when_valid_data_is_provided(
-    mocker: MockerFixture,
+def test_should_render_qr_code_as_1_bit_png(renderer: QRCodeRenderer):
+    """Given a data string
+    When rendering its QR code with the default options
+    Then a 1-bit PNG with the QR code modules should be returned
+    """
+
+    # Given
+    data = "https://example.com/payment/A048"
+    qr_code = QRCode()
+    qr_code.add_data(data)
+    qr_code.make(fit=True)
+    modules = qr_code.get_matrix()
+
+    # When
+    image = Image.open(BytesIO(renderer.render(data=data)))
+
+    # Then
+    assert image.format == "PNG"
+    assert image.mode == "1"
+    assert image.size == (len(modules) * 10, len(modules) * 10)
+    assert all(
+        (image.getpixel((x * 10 + 5, y * 10 + 5)) == 0) == dark
+        for y, row in enumerate(modules)
+        for x, dark in enumerate(row)
+    )
+
+
+def test_should_render_qr_code_as_svg_with_requested_options(
     renderer: QRCodeRenderer,
 ):
-    """Given a valid data string
-    When rendering a QR code
-    Then the QR code should be generated and returned as bytes
+    """Given a data string and SVG options with custom size and border
+    When rendering its QR code
+    Then an SVG with the requested size should be returned
+    """
+
+    # Given
+    data = "https://example.com/payment/A048"
+    options = QRCodeOptions(
+        format=QRCodeFormat.SVG,
+        box_size=3,
+        border=1,
+        error_correction=QRCodeErrorCorrection.L,
+    )
+
+    # When
+    svg = ElementTree.fromstring(renderer.render(data=data, options=options))
+
+    # Then
+    modules = int(svg.get("viewBox").split()[2])
+    assert svg.tag == "{http://www.w3.org/2000/svg}svg"
+    assert svg.get("width") == svg.get("height") == str(modules * 3)
+    assert svg.find("{http://www.w3.org/2000/svg}path").get("d").startswith("M1 1h7")
+
+
+def test_should_reject_invalid_png_compression_level():
+    """Given a PNG compression level out of the zlib range
+    When creating the renderer
+    Then a ValueError should be raised
+    """
+
+    # When / Then
+    with pytest.raises(ValueError):
+        QRCodeRenderer(compress_level=10)
+
+
+def test_should_identify_qr_codes_by_the_digest_of_their_data(
+    renderer: QRCodeRenderer,
+):
+    """Given two data strings
+    When computing their digests
+    Then equal data and options should have equal digests and different data or
+    options different ones
+    """
+
+    # When / Then
+    assert renderer.digest("A048") == renderer.digest("A048", QRCodeOptions())
+    assert renderer.digest("A048") != renderer.digest("A049")
+    assert renderer.digest("A048") != renderer.digest(
+        "A048", QRCodeOptions(format=QRCodeFormat.SVG)
+    )
+
+
+def test_should_render_each_qr_code_once_when_cached(mocker: MockerFixture):
+    """Given a cached renderer
+    When rendering the same data twice
+    Then the wrapped renderer should render it only once
+    """
+
+    # Given
+    wrapped = mocker.Mock(spec=QRCodeRenderer)
+    wrapped.digest.side_effect = QRCodeRenderer().digest
+    wrapped.render.return_value = b"png"
+    cached_renderer = CachedQRCodeRenderer(renderer=wrapped, max_bytes=1024)
+    assert cached_renderer.cached("A048") is None
+
+    # When
+    first = cached_renderer.render("A048")
+    second = cached_renderer.render("A048")
+
+    # Then
+    assert first == second == cached_renderer.cached("A048") == b"png"
+    wrapped.render.assert_called_once_with("A048", None)
+
+
+def test_should_evict_least_recently_used_qr_codes_over_max_bytes(
+    mocker: MockerFixture,
+):
+    """Given a cached renderer full of images
+    When an image is used and a new one is rendered
+    Then the least recently used image should be evicted to stay within max bytes
+    """
+
+    # Given
+    wrapped = mocker.Mock(spec=QRCodeRenderer)
+    wrapped.digest.side_effect = QRCodeRenderer().digest
+    wrapped.render.side_effect = lambda data, _options: data.encode() * 4
+    cached_renderer = CachedQRCodeRenderer(renderer=wrapped, max_bytes=32)
+    cached_renderer.render("A001")
+    cached_renderer.render("A002")
+
+    # When
+    cached_renderer.cached("A001")
+    cached_renderer.render("A003")
+
+    # Then
+    assert cached_renderer.cached("A002") is None
+    assert cached_renderer.cached("A001") is not None
+    assert cached_renderer.size == 32
+    assert len(cached_renderer) == 2
+
+
+def test_should_not_cache_qr_codes_larger_than_max_bytes(mocker: MockerFixture):
+    """Given a cached renderer
+    When rendering an image larger than its max bytes
+    Then the image should be returned but not cached
+    """
+
+    # Given
+    wrapped = mocker.Mock(spec=QRCodeRenderer)
+    wrapped.digest.side_effect = QRCodeRenderer().digest
+    wrapped.render.return_value = b"x" * 64
+    cached_renderer = CachedQRCodeRenderer(renderer=wrapped, max_bytes=32)
+
+    # When
+    image = cached_renderer.render("A048")
+
+    # Then
+    assert image == b"x" * 64
+    assert len(cached_renderer) == 0
+
+
+async def test_should_render_qr_code_on_executor(mocker: MockerFixture):
+    """Given a renderer backed by a thread pool
+    When rendering a QR code asynchronously
+    Then it should be rendered on a worker thread
     """
 
     # Given
-    test_data = "https://example.com/payment/A048"
-    expected_qr_bytes = b"fake-qr-code-bytes"
-
-    # Mock the QRCode and related components
-    mock_qr_code = mocker.Mock()
-    mock_image = mocker.Mock()
-    mock_buffer = mocker.Mock()
-    mock_buffer.getvalue.return_value = expected_qr_bytes
-
-    # Mock the QRCode constructor and methods
-    mock_qr_code_class = mocker.patch(
-        "payment_api.infrastructure.qr_code_renderer.QRCode"
+    render_threads = []
+    wrapped = mocker.Mock(spec=QRCodeRenderer)
+    wrapped.render.side_effect = lambda data, _options: (
+        render_threads.append(threading.current_thread()) or data.encode()
     )
 
-    mock_qr_code_class.return_value = mock_qr_code
-    mock_qr_code.make_image.return_value = mock_image
+    renderer = ExecutorQRCodeRenderer(
+        renderer=wrapped, executor=ThreadPoolExecutor(max_workers=1)
+    )
+
+    # When
+    image = await renderer.render_async("A048")
+    await renderer.close()
+
+    # Then
+    assert image == b"A048"
+    assert render_threads != [threading.current_thread()]
+    assert renderer.pending == 0
+
+
+async def test_should_reject_renders_over_max_pending_until_they_finish(
+    mocker: MockerFixture,
+):
+    """Given a renderer whose only pending slot is taken by a render that timed out
+    When rendering another QR code
+    Then it should be rejected until the running render finishes
+    """
 
-    # Mock BytesIO
-    mock_bytes_io_class = mocker.patch(
-        "payment_api.infrastructure.qr_code_renderer.BytesIO"
+    # Given
+    release = threading.Event()
+    wrapped = mocker.Mock(spec=QRCodeRenderer)
+    wrapped.render.side_effect = lambda data, _options: (
+        release.wait() and data.encode()
+    )
+    renderer = ExecutorQRCodeRenderer(
+        renderer=wrapped,
+        executor=ThreadPoolExecutor(max_workers=1),
+        max_pending=1,
+        timeout=0.01,
     )
 
-    mock_bytes_io_class.return_value = mock_buffer
+    with pytest.raises(QRCodeRendererUnavailable):
+        await renderer.render_async("A001")
+
+    # When / Then
+    with pytest.raises(QRCodeRendererUnavailable):
+        await renderer.render_async("A002")
+
+    release.set()
+    await renderer.close()
+    assert renderer.pending == 0
+
+
+async def test_should_render_inline_without_executor(mocker: MockerFixture):
+    """Given a renderer without executor
+    When rendering a QR code asynchronously
+    Then it should be rendered in place
+    """
+
+    # Given
+    wrapped = mocker.Mock(spec=QRCodeRenderer)
+    wrapped.render.return_value = b"png"
+    renderer = ExecutorQRCodeRenderer(
+        renderer=wrapped,
+        executor=create_qr_code_executor(QRCodeExecutor.INLINE, max_workers=1),
+    )
 
     # When
-    result = renderer.render(data=test_data)
+    image = await renderer.render_async("A048")
 
     # Then
-    assert result == expected_qr_bytes
-    assert isinstance(result, bytes)
-
-    # Verify the QR code creation flow
-    mock_qr_code_class.assert_called_once_with(image_factory=PilImage)
-    mock_qr_code.add_data.assert_called_once_with(test_data)
-    mock_qr_code.make_image.assert_called_once()
-    mock_image.save.assert_called_once_with(mock_buffer, format="PNG")
-    mock_buffer.getvalue.assert_called_once()
+    assert image == b"png"
+    wrapped.render.assert_called_once_with("A048", None)